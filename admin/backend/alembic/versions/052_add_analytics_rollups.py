@@ -0,0 +1,123 @@
+"""Add conversation analytics rollups
+
+Revision ID: 052
+Revises: 051
+Create Date: 2026-10-16
+
+Adds conversation_analytics_rollups: per-minute and per-hour counts, error
+counts and log-scale latency histograms per event type. The analytics
+ingest path keeps it up to date (app.utils.latency_rollups), and the
+latency/pipeline dashboards read it instead of scanning
+conversation_analytics.
+
+Existing events are backfilled: minute buckets for the last 48 hours and
+hour buckets for the last 90 days (the default retentions).
+"""
+
+import math
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic
+revision = '052'
+down_revision = '051'
+branch_labels = None
+depends_on = None
+
+# Must match app.utils.latency_rollups (1% relative accuracy)
+RELATIVE_ACCURACY = 0.01
+LOG_GAMMA = math.log((1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY))
+
+
+def _latency_expr(key: str) -> str:
+    return (
+        f"CASE WHEN jsonb_typeof(metadata::jsonb -> '{key}') = 'number' "
+        f"AND (metadata::jsonb ->> '{key}')::double precision > 0 "
+        f"THEN (metadata::jsonb ->> '{key}')::double precision END"
+    )
+
+
+def _backfill(resolution: str, window: str):
+    latency = "COALESCE({})".format(", ".join(
+        _latency_expr(key) for key in ('total_latency_ms', 'latency_ms', 'duration_ms')
+    ))
+    op.execute(f"""
+        WITH events AS (
+            SELECT
+                event_type,
+                date_trunc('{resolution}', timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' AS bucket_start,
+                {latency} AS latency,
+                (COALESCE(metadata::jsonb ->> 'error', '') NOT IN ('', 'false', '0', '{{}}', '[]')
+                 OR metadata::jsonb ->> 'status' = 'error') AS is_error
+            FROM conversation_analytics
+            WHERE timestamp >= date_trunc('{resolution}', NOW() - INTERVAL '{window}')
+        ),
+        totals AS (
+            SELECT event_type, bucket_start,
+                   COUNT(*) AS count,
+                   COUNT(*) FILTER (WHERE is_error) AS error_count,
+                   COUNT(latency) AS latency_count,
+                   COALESCE(SUM(latency), 0) AS latency_sum,
+                   MIN(latency) AS latency_min,
+                   MAX(latency) AS latency_max
+            FROM events
+            GROUP BY event_type, bucket_start
+        ),
+        buckets AS (
+            SELECT event_type, bucket_start,
+                   CEIL(LN(latency) / {LOG_GAMMA!r})::int AS idx,
+                   COUNT(*) AS n
+            FROM events
+            WHERE latency IS NOT NULL
+            GROUP BY 1, 2, 3
+        ),
+        histograms AS (
+            SELECT event_type, bucket_start, jsonb_object_agg(idx::text, n) AS histogram
+            FROM buckets
+            GROUP BY event_type, bucket_start
+        )
+        INSERT INTO conversation_analytics_rollups
+            (resolution, bucket_start, event_type, count, error_count,
+             latency_count, latency_sum, latency_min, latency_max, histogram)
+        SELECT '{resolution}', t.bucket_start, t.event_type, t.count, t.error_count,
+               t.latency_count, t.latency_sum, t.latency_min, t.latency_max,
+               COALESCE(h.histogram, '{{}}'::jsonb)
+        FROM totals t
+        LEFT JOIN histograms h USING (event_type, bucket_start)
+    """)
+
+
+def upgrade():
+    """Create conversation_analytics_rollups and backfill it."""
+    op.create_table(
+        'conversation_analytics_rollups',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('resolution', sa.String(10), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('event_type', sa.String(50), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('error_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('latency_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('latency_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('latency_min', sa.Float(), nullable=True),
+        sa.Column('latency_max', sa.Float(), nullable=True),
+        sa.Column('histogram', JSONB, nullable=False, server_default='{}'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint('resolution', 'bucket_start', 'event_type', name='uq_analytics_rollup_bucket'),
+    )
+    op.create_index(
+        'idx_analytics_rollup_lookup',
+        'conversation_analytics_rollups',
+        ['resolution', 'event_type', 'bucket_start']
+    )
+
+    _backfill('minute', '48 hours')
+    _backfill('hour', '90 days')
+
+
+def downgrade():
+    """Remove conversation_analytics_rollups."""
+    op.drop_index('idx_analytics_rollup_lookup', table_name='conversation_analytics_rollups')
+    op.drop_table('conversation_analytics_rollups')
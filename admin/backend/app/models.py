@@ -1247,6 +1247,51 @@ class ConversationAnalytics(Base):
         }
 
 
+class ConversationAnalyticsRollup(Base):
+    """
+    Pre-aggregated conversation analytics per minute and per hour.
+
+    Maintained incrementally when analytics events are ingested (see
+    app.utils.latency_rollups) so dashboards read one row per bucket and
+    event type instead of every event. ``histogram`` maps log-scale latency
+    bucket indexes to counts; buckets merge by adding counts and give
+    quantiles within 1% relative error.
+    """
+    __tablename__ = 'conversation_analytics_rollups'
+
+    id = Column(Integer, primary_key=True)
+    resolution = Column(String(10), nullable=False)  # minute, hour
+    bucket_start = Column(DateTime(timezone=True), nullable=False)
+    event_type = Column(String(50), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)
+    latency_count = Column(Integer, nullable=False, default=0)
+    latency_sum = Column(Float, nullable=False, default=0.0)
+    latency_min = Column(Float, nullable=True)
+    latency_max = Column(Float, nullable=True)
+    histogram = Column(JSONB, nullable=False, default=dict)  # {"<bucket index>": count}
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('resolution', 'bucket_start', 'event_type', name='uq_analytics_rollup_bucket'),
+        Index('idx_analytics_rollup_lookup', 'resolution', 'event_type', 'bucket_start'),
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert rollup bucket to dictionary for API responses."""
+        return {
+            'resolution': self.resolution,
+            'bucket_start': self.bucket_start.isoformat() if self.bucket_start else None,
+            'event_type': self.event_type,
+            'count': self.count,
+            'error_count': self.error_count,
+            'latency_count': self.latency_count,
+            'latency_sum': self.latency_sum,
+            'latency_min': self.latency_min,
+            'latency_max': self.latency_max,
+        }
+
+
 class LLMBackend(Base):
     """
     LLM backend configuration for model routing.
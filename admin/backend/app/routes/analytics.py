@@ -8,18 +8,32 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc, and_
 from pydantic import BaseModel, Field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import asyncio
+import os
+import httpx
 import structlog
 import json
 
 from app.database import get_db
 from app.auth.oidc import get_current_user
 from app.models import User, ConversationAnalytics
+from app.utils.latency_rollups import bucket_value, load_window, merge_sketches, quantiles
 
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/api/analytics", tags=["analytics"])
 
+# Base URLs of every orchestrator/gateway replica serving /metrics/quantiles
+LATENCY_QUANTILE_SOURCES = [
+    url.strip().rstrip("/")
+    for url in os.getenv(
+        "LATENCY_QUANTILE_SOURCES",
+        f"{os.getenv('ORCHESTRATOR_URL', 'http://localhost:8001')},{os.getenv('GATEWAY_URL', 'http://localhost:8000')}"
+    ).split(",")
+    if url.strip()
+]
+
 
 # ============================================================================
 # Pydantic Models
@@ -249,7 +263,8 @@ async def get_latency_distribution(
     """
     Get latency distribution for voice pipeline components.
 
-    Returns histogram-style buckets and counts for the Voice Pipelines chart.
+    Returns histogram-style buckets and counts for the Voice Pipelines chart,
+    plus p50/p95/p99, computed from the pre-aggregated latency rollups.
     """
     # Parse period to get appropriate time range
     period_map = {
@@ -259,44 +274,35 @@ async def get_latency_distribution(
         "7d": timedelta(days=7)
     }
     time_range = period_map.get(period, timedelta(hours=1))
-    cutoff = datetime.utcnow() - time_range
+    cutoff = datetime.now(timezone.utc) - time_range
 
     # Histogram buckets (in ms)
     buckets = ['<100ms', '100-200ms', '200-500ms', '500ms-1s', '>1s']
     bucket_ranges = [(0, 100), (100, 200), (200, 500), (500, 1000), (1000, float('inf'))]
 
     try:
-        # Query for latency events from conversation analytics
-        logs = (
-            db.query(ConversationAnalytics)
-            .filter(
-                and_(
-                    ConversationAnalytics.event_type.in_(["stt_complete", "llm_complete", "tts_complete", "query_complete", "voice_response"]),
-                    ConversationAnalytics.timestamp >= cutoff
-                )
-            )
-            .order_by(ConversationAnalytics.timestamp)
-            .limit(1000)
-            .all()
+        window = load_window(
+            db,
+            ["stt_complete", "llm_complete", "tts_complete", "query_complete", "voice_response"],
+            cutoff
         )
 
-        # Count latencies into buckets
+        # Re-bin the log-scale histogram into the chart buckets
         counts = [0, 0, 0, 0, 0]
-
-        for log in logs:
-            metadata = json.loads(log.event_metadata) if isinstance(log.event_metadata, str) else (log.event_metadata or {})
-            latency = metadata.get("latency_ms") or metadata.get("duration_ms") or metadata.get("total_latency_ms")
-
-            if latency:
-                for i, (low, high) in enumerate(bucket_ranges):
-                    if low <= latency < high:
-                        counts[i] += 1
-                        break
-
+        for index, n in window["histogram"].items():
+            latency = bucket_value(index)
+            for i, (low, high) in enumerate(bucket_ranges):
+                if low <= latency < high:
+                    counts[i] += n
+                    break
+
+        p50, p95, p99 = quantiles(window["histogram"], [0.5, 0.95, 0.99])
         return {
             "period": period,
             "buckets": buckets,
-            "counts": counts
+            "counts": counts,
+            "count": window["latency_count"],
+            "percentiles": {"p50": p50, "p95": p95, "p99": p99}
         }
 
     except Exception as e:
@@ -305,7 +311,9 @@ async def get_latency_distribution(
         return {
             "period": period,
             "buckets": buckets,
-            "counts": [0, 0, 0, 0, 0]
+            "counts": [0, 0, 0, 0, 0],
+            "count": 0,
+            "percentiles": {"p50": None, "p95": None, "p99": None}
         }
 
 
@@ -318,7 +326,8 @@ async def get_pipeline_stats(
     """
     Get voice pipeline statistics for the dashboard.
 
-    Returns aggregate stats like request count, avg latency, error rate.
+    Returns aggregate stats like request count, avg/percentile latency and
+    error rate, computed from the pre-aggregated latency rollups.
     """
     period_map = {
         "1h": timedelta(hours=1),
@@ -327,41 +336,27 @@ async def get_pipeline_stats(
         "7d": timedelta(days=7)
     }
     time_range = period_map.get(period, timedelta(hours=1))
-    cutoff = datetime.utcnow() - time_range
+    cutoff = datetime.now(timezone.utc) - time_range
 
     try:
-        # Query for pipeline completion events
-        logs = (
-            db.query(ConversationAnalytics)
-            .filter(
-                and_(
-                    ConversationAnalytics.event_type.in_(["query_complete", "voice_response", "conversation_turn"]),
-                    ConversationAnalytics.timestamp >= cutoff
-                )
-            )
-            .all()
-        )
+        window = load_window(db, ["query_complete", "voice_response", "conversation_turn"], cutoff)
 
-        total_requests = len(logs)
-        total_latency = 0
-        error_count = 0
+        total_requests = window["count"]
+        error_count = window["error_count"]
+        latency_count = window["latency_count"]
 
-        for log in logs:
-            metadata = json.loads(log.event_metadata) if isinstance(log.event_metadata, str) else (log.event_metadata or {})
-            latency = metadata.get("total_latency_ms") or metadata.get("latency_ms") or metadata.get("duration_ms")
-            if latency:
-                total_latency += latency
-            if metadata.get("error") or metadata.get("status") == "error":
-                error_count += 1
-
-        avg_latency = round(total_latency / total_requests, 1) if total_requests > 0 else 0
+        avg_latency = round(window["latency_sum"] / latency_count, 1) if latency_count > 0 else 0
         error_rate = round((error_count / total_requests) * 100, 1) if total_requests > 0 else 0
         success_rate = round(100 - error_rate, 1)
+        p50, p95, p99 = quantiles(window["histogram"], [0.5, 0.95, 0.99])
 
         return {
             "period": period,
             "total_requests": total_requests,
             "avg_latency_ms": avg_latency,
+            "p50_latency_ms": p50,
+            "p95_latency_ms": p95,
+            "p99_latency_ms": p99,
             "success_rate": success_rate,
             "error_rate": error_rate,
             "error_count": error_count
@@ -373,7 +368,59 @@ async def get_pipeline_stats(
             "period": period,
             "total_requests": 0,
             "avg_latency_ms": 0,
+            "p50_latency_ms": None,
+            "p95_latency_ms": None,
+            "p99_latency_ms": None,
             "success_rate": 0,
             "error_rate": 0,
             "error_count": 0
         }
+
+
+@router.get("/latency-quantiles")
+async def get_latency_quantiles(
+    stage_prefix: Optional[str] = Query(default=None, description="Only stages starting with this (e.g. llm.)"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get live stage/model latency percentiles merged across replicas.
+
+    Fetches the latency sketches from /metrics/quantiles on every
+    LATENCY_QUANTILE_SOURCES replica and merges them, so percentiles cover
+    all replicas' traffic rather than one process. Unreachable replicas are
+    reported in ``sources`` and left out of the merge.
+    """
+    params = {"stage_prefix": stage_prefix} if stage_prefix else None
+
+    async with httpx.AsyncClient(timeout=3.0) as client:
+        results = await asyncio.gather(
+            *(client.get(f"{url}/metrics/quantiles", params=params) for url in LATENCY_QUANTILE_SOURCES),
+            return_exceptions=True
+        )
+
+    sources = []
+    snapshots = []
+    for url, result in zip(LATENCY_QUANTILE_SOURCES, results):
+        if isinstance(result, Exception):
+            sources.append({"url": url, "status": "error", "error": str(result)})
+            continue
+        if result.status_code != 200:
+            sources.append({"url": url, "status": "error", "error": f"HTTP {result.status_code}"})
+            continue
+        snapshot = result.json()
+        snapshots.append(snapshot)
+        sources.append({
+            "url": url,
+            "status": "ok",
+            "service": snapshot.get("service"),
+            "instance": snapshot.get("instance"),
+            "window_seconds": snapshot.get("window_seconds"),
+        })
+
+    if len(snapshots) < len(LATENCY_QUANTILE_SOURCES):
+        logger.warning("latency_quantile_sources_unavailable", failed=[s["url"] for s in sources if s["status"] != "ok"])
+
+    return {
+        "sources": sources,
+        "quantiles": merge_sketches(snapshots)
+    }
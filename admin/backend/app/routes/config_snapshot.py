@@ -0,0 +1,83 @@
+"""
+Config Snapshot API route.
+
+Serves the configuration services read on their request path (routing, LLM
+backends, tools, component models, gateway and voice config) as one versioned
+document, so a service loads it in a single request and keeps it in memory.
+Services refetch only the sections named in the config-changed notifications
+published by app.utils.config_version.
+Feature flags have their own ETag-validated endpoint, /api/features/snapshot.
+"""
+import asyncio
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+import structlog
+
+from app.database import SessionLocal, get_db
+from app.routes import (
+    component_models, gateway_config, intent_routing, llm_backends,
+    tool_calling, voice_config,
+)
+from app.utils.config_version import get_config_version, register_session_hooks
+
+logger = structlog.get_logger()
+
+router = APIRouter(prefix="/api/config-snapshot", tags=["config-snapshot"])
+
+register_session_hooks(SessionLocal)
+
+# Section -> builder; each reuses the public endpoint the section mirrors
+SECTION_BUILDERS = {
+    "intent_routing": lambda db: intent_routing.get_intent_routing_public(db=db),
+    "provider_routing": lambda db: intent_routing.get_provider_routing_public(db=db),
+    "llm_backends": lambda db: llm_backends.list_backends_public(enabled_only=False, db=db),
+    "tool_calling_settings": lambda db: tool_calling.get_settings_public(db=db),
+    "enabled_tools": lambda db: tool_calling.list_tools_public(
+        enabled_only=True, category=None, guest_mode_only=False, db=db
+    ),
+    "fallback_triggers": lambda db: tool_calling.list_triggers_public(enabled_only=True, db=db),
+    "component_models": lambda db: component_models.list_component_models_public(db=db),
+    "gateway_config": lambda db: gateway_config.get_gateway_config_public(db=db),
+    "voice_stt": lambda db: voice_config.internal_get_stt_config(db=db),
+    "voice_tts": lambda db: voice_config.internal_get_tts_config(db=db),
+    "voice_all": lambda db: voice_config.internal_get_all_voice_config(db=db),
+}
+
+
+@router.get("/public")
+async def get_config_snapshot_public(
+    sections: Optional[str] = Query(None, description="Comma-separated section names (default: all)"),
+    db: Session = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    Get the versioned config snapshot (public endpoint for services).
+
+    Query params:
+    - sections: Only build these sections (delta refresh after a change
+      notification)
+
+    Returns:
+        {"version": int, "sections": {name: data}}. A section that fails to
+        build is omitted so the service keeps its previous copy.
+    """
+    names = [s for s in sections.split(",") if s] if sections else list(SECTION_BUILDERS)
+    unknown = [s for s in names if s not in SECTION_BUILDERS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown config sections: {', '.join(unknown)}")
+
+    # Read the version before the data: a change committed in between is then
+    # reported again by its notification instead of being skipped
+    version = await asyncio.to_thread(get_config_version)
+
+    snapshot: Dict[str, Any] = {}
+    for name in names:
+        try:
+            snapshot[name] = jsonable_encoder(await SECTION_BUILDERS[name](db))
+        except Exception as e:
+            logger.error("config_snapshot_section_failed", section=name, error=str(e))
+
+    logger.debug("config_snapshot_served", version=version, sections=len(snapshot))
+    return {"version": version, "sections": snapshot}
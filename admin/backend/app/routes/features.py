@@ -6,8 +6,11 @@ Enables toggling features on/off and performing what-if analysis on system perfo
 """
 
 import asyncio
+import hashlib
+import json
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from pydantic import BaseModel, Field
@@ -35,21 +38,47 @@ CACHE_INVALIDATION_ENDPOINTS = [
 ]
 
 
-async def _notify_services_of_flag_change(flag_names: List[str]):
+def _flag_snapshot(db: Session) -> Dict[str, Any]:
     """
-    Notify Gateway and Orchestrator to invalidate their feature flag caches.
+    Build the flag snapshot served by /snapshot and pushed on changes.
 
-    This enables instant propagation of feature flag changes without waiting
-    for cache TTL expiration.
+    Returns:
+        {"etag": str, "flags": {name: {"enabled": bool, "config": dict}}}
+    """
+    flags = {
+        feature.name: {"enabled": bool(feature.enabled), "config": feature.config or {}}
+        for feature in db.query(Feature).all()
+    }
+    digest = hashlib.sha256(
+        json.dumps(flags, sort_keys=True, separators=(",", ":"), default=str).encode()
+    ).hexdigest()[:16]
+    return {"etag": f'"{digest}"', "flags": flags}
+
+
+async def _notify_services_of_flag_change(flag_names: List[str], snapshot: Optional[Dict[str, Any]] = None):
+    """
+    Push feature flag changes to Gateway and Orchestrator.
+
+    Services apply the pushed flag states to their in-process flag store
+    directly, so changes take effect without waiting for a refresh.
 
     Args:
         flag_names: List of flag names that changed
+        snapshot: Flag snapshot taken after the change (from _flag_snapshot);
+                  without it services only refetch
     """
+    payload: Dict[str, Any] = {"flags": flag_names}
+    if snapshot:
+        payload["etag"] = snapshot["etag"]
+        payload["changes"] = {
+            name: snapshot["flags"][name] for name in flag_names if name in snapshot["flags"]
+        }
+
     async with httpx.AsyncClient(timeout=2.0) as client:
         tasks = []
         for endpoint in CACHE_INVALIDATION_ENDPOINTS:
             tasks.append(
-                client.post(endpoint, json={"flags": flag_names})
+                client.post(endpoint, json=payload)
             )
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -163,6 +192,27 @@ async def list_features_public(
     return [FeatureResponse(**feature.to_dict()) for feature in features]
 
 
+@router.get("/snapshot")
+async def get_flag_snapshot(
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Get every feature flag's state in one response (public, no auth required).
+
+    Used by the services' in-process flag store. The response carries an
+    ETag; a request with a matching If-None-Match gets 304 Not Modified, so
+    periodic refreshes are cheap when nothing changed.
+
+    Returns:
+        {"etag": str, "flags": {name: {"enabled": bool, "config": dict}}}
+    """
+    snapshot = _flag_snapshot(db)
+    if if_none_match == snapshot["etag"]:
+        return Response(status_code=304, headers={"ETag": snapshot["etag"]})
+    return JSONResponse(snapshot, headers={"ETag": snapshot["etag"]})
+
+
 @router.get("", response_model=List[FeatureResponse])
 async def list_features(
     category: Optional[str] = None,
@@ -255,7 +305,7 @@ async def toggle_feature(
     )
 
     # Notify services to invalidate cache immediately
-    asyncio.create_task(_notify_services_of_flag_change([feature.name]))
+    asyncio.create_task(_notify_services_of_flag_change([feature.name], _flag_snapshot(db)))
     logger.info(
         "feature_flag_cache_invalidation_triggered",
         feature=feature.name,
@@ -315,7 +365,7 @@ async def service_toggle_feature(
     )
 
     # Notify services to invalidate cache immediately
-    asyncio.create_task(_notify_services_of_flag_change([feature.name]))
+    asyncio.create_task(_notify_services_of_flag_change([feature.name], _flag_snapshot(db)))
 
     return FeatureResponse(**feature.to_dict())
 
@@ -368,7 +418,7 @@ async def update_feature(
 
     # Notify services to invalidate cache if enabled state changed
     if enabled_changed:
-        asyncio.create_task(_notify_services_of_flag_change([feature.name]))
+        asyncio.create_task(_notify_services_of_flag_change([feature.name], _flag_snapshot(db)))
         logger.info(
             "feature_flag_cache_invalidation_triggered",
             feature=feature.name,
@@ -421,7 +471,7 @@ async def update_feature_config(
     )
 
     # Notify services to invalidate cache for config changes
-    asyncio.create_task(_notify_services_of_flag_change([feature.name]))
+    asyncio.create_task(_notify_services_of_flag_change([feature.name], _flag_snapshot(db)))
     logger.info(
         "feature_config_cache_invalidation_triggered",
         feature=feature.name,
@@ -6,6 +6,7 @@ per-model backend selection (Ollama, MLX, Auto) with performance tracking.
 """
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 import structlog
@@ -445,6 +446,65 @@ async def create_metric(
             detail=f"Failed to persist metric: {str(e)}"
         )
 
+class LLMMetricBatch(BaseModel):
+    """Request model for bulk metric ingest."""
+    metrics: List[LLMMetricCreate] = Field(..., max_length=1000, description="Metrics to store (max 1000)")
+
+
+@router.post("/metrics/batch", status_code=201)
+async def create_metrics_batch(
+    batch: LLMMetricBatch,
+    db: Session = Depends(get_db)
+):
+    """
+    Store a batch of LLM performance metrics in one multi-row INSERT.
+
+    Called by the services' background metric batchers. No authentication
+    required for internal service-to-service calls.
+
+    Returns:
+        201: {"inserted": n}
+        500: Database error (nothing from the batch is stored)
+    """
+    if not batch.metrics:
+        return {"inserted": 0, "status": "created"}
+
+    rows = [
+        {
+            "timestamp": datetime.fromtimestamp(m.timestamp),
+            "model": m.model,
+            "backend": m.backend,
+            "latency_seconds": m.latency_seconds,
+            "tokens_generated": m.tokens,
+            "tokens_per_second": m.tokens_per_second,
+            "request_id": m.request_id,
+            "session_id": m.session_id,
+            "user_id": m.user_id,
+            "zone": m.zone,
+            "intent": m.intent,
+            "source": m.source,
+            "stage": m.stage,
+        }
+        for m in batch.metrics
+    ]
+
+    try:
+        # executemany of a bare insert() is sent as multi-row INSERT ... VALUES
+        # batches, without the per-row RETURNING/refresh of create_metric
+        db.execute(insert(LLMPerformanceMetric), rows)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error("failed_to_persist_metric_batch", error=str(e), count=len(rows))
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to persist metrics: {str(e)}"
+        )
+
+    logger.debug("llm_metric_batch_persisted", count=len(rows))
+    return {"inserted": len(rows), "status": "created"}
+
+
 @router.get("/{backend_id}", response_model=LLMBackendResponse)
 async def get_backend(
     backend_id: int,
@@ -4,7 +4,8 @@ Settings management API routes.
 Provides endpoints for managing application settings including OIDC configuration.
 Settings are stored as encrypted secrets in the database.
 """
-from typing import Optional
+import json
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
@@ -825,3 +826,102 @@ async def get_ollama_url_internal(
     except Exception as e:
         logger.error("failed_to_get_ollama_url_internal", error=str(e))
         return {"ollama_url": os.getenv("OLLAMA_URL", "http://localhost:11434")}
+
+
+# ============================================================================
+# Semantic Cache Category Table
+# ============================================================================
+
+class SemanticCacheCategory(BaseModel):
+    """One row of the orchestrator's semantic cache category table."""
+    category: str
+    keywords: List[str] = []
+    co_keywords: List[List[str]] = []
+    key: str = ""
+    slots: Dict[str, Dict[str, Any]] = {}
+
+
+class SemanticCacheCategoriesSettings(BaseModel):
+    """Ordered semantic cache category table (first match wins)."""
+    categories: List[SemanticCacheCategory]
+
+
+@router.get("/semantic-cache-categories/internal")
+async def get_semantic_cache_categories_internal(
+    db: Session = Depends(get_db)
+):
+    """
+    Internal endpoint for the orchestrator to fetch the semantic cache category table.
+
+    No authentication required. Returns {"categories": null} when no override
+    is stored, in which case the orchestrator uses its built-in table.
+    """
+    try:
+        setting = db.query(SystemSetting).filter(
+            SystemSetting.key == "semantic_cache_categories"
+        ).first()
+
+        categories = json.loads(setting.value) if setting and setting.value else None
+        return {"categories": categories}
+
+    except Exception as e:
+        logger.error("failed_to_get_semantic_cache_categories", error=str(e))
+        return {"categories": None}
+
+
+@router.post("/semantic-cache-categories")
+async def save_semantic_cache_categories(
+    settings: SemanticCacheCategoriesSettings,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Save the semantic cache category table.
+
+    Categories are evaluated in order; the orchestrator loads the table at startup.
+    An empty list removes the override and restores the built-in table.
+    """
+    if not current_user.has_permission('write'):
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+
+    try:
+        setting = db.query(SystemSetting).filter(
+            SystemSetting.key == "semantic_cache_categories"
+        ).first()
+
+        if not settings.categories:
+            if setting:
+                db.delete(setting)
+                db.commit()
+            logger.info("semantic_cache_categories_reset", user=current_user.username)
+            return {"status": "success", "message": "Restored built-in semantic cache categories"}
+
+        value = json.dumps([c.model_dump() for c in settings.categories])
+        if setting:
+            setting.value = value
+        else:
+            setting = SystemSetting(
+                key="semantic_cache_categories",
+                value=value,
+                description="Ordered category table used by the orchestrator semantic cache to classify queries and build cache keys.",
+                category="performance"
+            )
+            db.add(setting)
+
+        db.commit()
+
+        logger.info(
+            "semantic_cache_categories_saved",
+            user=current_user.username,
+            category_count=len(settings.categories)
+        )
+
+        return {
+            "status": "success",
+            "message": f"Saved {len(settings.categories)} semantic cache categories",
+        }
+
+    except Exception as e:
+        db.rollback()
+        logger.error("failed_to_save_semantic_cache_categories", error=str(e), user=current_user.username)
+        raise HTTPException(status_code=500, detail=f"Failed to save semantic cache categories: {str(e)}")
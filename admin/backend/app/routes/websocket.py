@@ -24,6 +24,9 @@ router = APIRouter(tags=["websocket"])
 JWT_SECRET = os.getenv("JWT_SECRET", "dev-secret-change-in-production")
 JWT_ALGORITHM = "HS256"
 
+# Seconds a client may take to accept a broadcast before it is dropped
+WS_SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", "2.0"))
+
 # Connected clients
 admin_jarvis_clients: Set[WebSocket] = set()
 
@@ -49,16 +52,21 @@ class WebSocketManager:
         logger.info("websocket_disconnected", total_clients=len(self._clients))
 
     async def broadcast(self, message: dict):
-        """Broadcast a message to all connected clients."""
+        """
+        Broadcast a message to all connected clients.
+
+        Sends run concurrently; a client that does not accept the message
+        within WS_SEND_TIMEOUT seconds is dropped so it cannot stall others.
+        """
         if not self._clients:
             return
 
-        disconnected = set()
-        for client in self._clients:
-            try:
-                await client.send_json(message)
-            except Exception:
-                disconnected.add(client)
+        clients = list(self._clients)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(client.send_json(message), WS_SEND_TIMEOUT) for client in clients),
+            return_exceptions=True
+        )
+        disconnected = {client for client, result in zip(clients, results) if isinstance(result, Exception)}
 
         # Clean up disconnected clients
         if disconnected:
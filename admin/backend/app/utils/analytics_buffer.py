@@ -0,0 +1,284 @@
+"""
+Buffered Analytics Ingestion
+
+/api/internal/analytics/log is called for every pipeline event under voice
+load. Instead of an INSERT per event, events are appended to an in-memory
+buffer and written to conversation_analytics with COPY
+(copy_records_to_table) from a background task, once ANALYTICS_BATCH_SIZE
+events are buffered or ANALYTICS_FLUSH_INTERVAL seconds have passed.
+
+Each batch also updates the per-minute/per-hour latency rollups
+(app.utils.latency_rollups) in the same transaction, so dashboards never
+have to scan raw events. A batch Postgres rejects for its data (e.g. a
+NUL character jsonb cannot store) is split until the bad events are
+isolated; those are logged and dropped so they cannot block the rest.
+
+The Admin Jarvis WebSocket broadcast runs on its own bounded queue and task,
+so neither a slow database nor a slow WebSocket client holds up the other or
+the ingest request.
+"""
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+import asyncpg
+import structlog
+
+from app.utils.db_pools import ADMIN_DB, get_pool
+from app.utils.latency_rollups import accumulate, event_is_error, event_latency, prune_rollups, upsert_rollups
+
+logger = structlog.get_logger(__name__)
+
+ANALYTICS_TABLE = "conversation_analytics"
+ANALYTICS_COLUMNS = ["session_id", "event_type", "metadata", "timestamp"]
+
+# Seconds between rollup retention sweeps
+ROLLUP_PRUNE_INTERVAL = 3600
+
+# Errors caused by the events themselves: retrying the same batch cannot succeed
+REJECTED_EVENT_ERRORS = (asyncpg.DataError, asyncpg.IntegrityConstraintViolationError)
+
+# (COPY record, latency_ms, is_error)
+BufferedEvent = Tuple[Tuple[str, str, Optional[str], datetime], Optional[float], bool]
+
+
+class AnalyticsBuffer:
+    """In-memory analytics event buffer flushed to Postgres with COPY."""
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_buffer: Optional[int] = None,
+        max_broadcast_queue: Optional[int] = None,
+        get_db_pool: Callable[[], Awaitable[Any]] = lambda: get_pool(ADMIN_DB),
+        broadcast: Optional[Callable[[dict], Awaitable[None]]] = None
+    ):
+        """
+        Initialize the buffer. Unset limits are read from the environment.
+
+        Args:
+            batch_size: Events per COPY (ANALYTICS_BATCH_SIZE, default 200)
+            flush_interval: Max seconds an event waits (ANALYTICS_FLUSH_INTERVAL, default 0.5)
+            max_buffer: Buffered events before the oldest are dropped (ANALYTICS_MAX_BUFFER, default 20000)
+            max_broadcast_queue: Pending WebSocket broadcasts before new ones are dropped (default 1000)
+            get_db_pool: Coroutine returning the asyncpg pool to write to
+            broadcast: Coroutine sending an event to Admin Jarvis clients
+        """
+        self.batch_size = batch_size or int(os.getenv("ANALYTICS_BATCH_SIZE", "200"))
+        self.flush_interval = flush_interval if flush_interval is not None else float(os.getenv("ANALYTICS_FLUSH_INTERVAL", "0.5"))
+        self.max_buffer = max_buffer or int(os.getenv("ANALYTICS_MAX_BUFFER", "20000"))
+        self.max_broadcast_queue = max_broadcast_queue or 1000
+        self._get_db_pool = get_db_pool
+        self._broadcast = broadcast
+
+        self._records: Deque[BufferedEvent] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._broadcasts: Optional[asyncio.Queue] = None
+        self._broadcast_task: Optional[asyncio.Task] = None
+
+        self.written = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.broadcasts_dropped = 0
+        self.flushes = 0
+        self._last_prune = 0.0
+        self.last_error: Optional[str] = None
+
+    def _ensure_started(self):
+        if self._wakeup is None:
+            self.start()
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        if self._broadcast is not None and (self._broadcast_task is None or self._broadcast_task.done()):
+            self._broadcast_task = asyncio.create_task(self._broadcast_loop())
+
+    def start(self):
+        """
+        Start the background flush and broadcast tasks on the running loop.
+
+        The event, lock and queue are bound to the loop that first uses them,
+        so they are recreated on every start: a second app lifespan (tests,
+        in-process restart) runs on a new event loop.
+        """
+        for task in (self._flush_task, self._broadcast_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._broadcast_task = None
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._broadcasts = asyncio.Queue(maxsize=self.max_broadcast_queue)
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        if self._broadcast is not None:
+            self._broadcast_task = asyncio.create_task(self._broadcast_loop())
+
+    def add(self, session_id: str, event_type: str, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Buffer an event for the next COPY and queue its broadcast.
+
+        Never blocks: past ``max_buffer`` the oldest buffered events are
+        dropped, and broadcasts are dropped while their queue is full.
+        """
+        self._ensure_started()
+        if len(self._records) >= self.max_buffer:
+            self._records.popleft()
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning("analytics_buffer_full", dropped=self.dropped, max_buffer=self.max_buffer)
+        self._records.append((
+            (
+                session_id,
+                event_type,
+                json.dumps(metadata) if metadata else None,
+                datetime.now(timezone.utc),
+            ),
+            event_latency(metadata),
+            event_is_error(metadata),
+        ))
+        if len(self._records) >= self.batch_size:
+            self._wakeup.set()
+
+        if self._broadcast is not None:
+            try:
+                self._broadcasts.put_nowait({
+                    "event_type": event_type,
+                    "session_id": session_id,
+                    "data": metadata or {},
+                    "timestamp": time.time()
+                })
+            except asyncio.QueueFull:
+                self.broadcasts_dropped += 1
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+            if time.monotonic() - self._last_prune >= ROLLUP_PRUNE_INTERVAL:
+                await self._prune()
+
+    async def flush(self):
+        """Write all buffered events, one COPY and rollup upsert per ``batch_size`` events."""
+        if self._flush_lock is None:
+            return
+        async with self._flush_lock:
+            while self._records:
+                # Stack of parts still to write; a rejected part is replaced by its halves
+                parts = [[self._records.popleft() for _ in range(min(self.batch_size, len(self._records)))]]
+                while parts:
+                    part = parts.pop()
+                    try:
+                        await self._write(part)
+                    except REJECTED_EVENT_ERRORS as e:
+                        self.last_error = str(e)
+                        if len(part) > 1:
+                            middle = len(part) // 2
+                            parts.extend([part[middle:], part[:middle]])
+                            continue
+                        record = part[0][0]
+                        self.rejected += 1
+                        logger.warning(
+                            "analytics_event_rejected", session_id=record[0], event_type=record[1],
+                            metadata=(record[2] or "")[:500], error=str(e)
+                        )
+                        continue
+                    except Exception as e:
+                        # Keep the unwritten events for the next attempt (oldest
+                        # are dropped by add() if the database stays down)
+                        unwritten = part + [event for rest in reversed(parts) for event in rest]
+                        self._records.extendleft(reversed(unwritten))
+                        self.last_error = str(e)
+                        logger.warning("analytics_flush_failed", events=len(unwritten), error=str(e))
+                        return
+                    self.written += len(part)
+                    self.flushes += 1
+                    logger.debug("analytics_events_flushed", events=len(part))
+
+    async def _write(self, batch):
+        pool = await self._get_db_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.copy_records_to_table(
+                    ANALYTICS_TABLE, records=[record for record, _, _ in batch], columns=ANALYTICS_COLUMNS
+                )
+                await upsert_rollups(conn, accumulate(
+                    (record[1], record[3], latency, is_error) for record, latency, is_error in batch
+                ))
+
+    async def _prune(self):
+        self._last_prune = time.monotonic()
+        try:
+            pool = await self._get_db_pool()
+            async with pool.acquire() as conn:
+                await prune_rollups(conn)
+        except Exception as e:
+            logger.warning("analytics_rollup_prune_failed", error=str(e))
+
+    async def _broadcast_loop(self):
+        while True:
+            event = await self._broadcasts.get()
+            try:
+                await self._broadcast(event)
+            except Exception as e:
+                logger.warning("analytics_broadcast_failed", error=str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "buffered": len(self._records),
+            "written": self.written,
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+            "flushes": self.flushes,
+            "pending_broadcasts": self._broadcasts.qsize() if self._broadcasts is not None else 0,
+            "broadcasts_dropped": self.broadcasts_dropped,
+            "last_error": self.last_error,
+        }
+
+    @staticmethod
+    async def _cancel(task: Optional[asyncio.Task]):
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def close(self):
+        """Stop background tasks and flush what is buffered."""
+        if self._flush_lock is not None:
+            # Holding the lock means the flush task is not mid-COPY
+            async with self._flush_lock:
+                await self._cancel(self._flush_task)
+        await self._cancel(self._broadcast_task)
+        self._flush_task = None
+        self._broadcast_task = None
+        await self.flush()
+        # Loop-bound; the next start() creates them on its own loop
+        self._wakeup = None
+        self._flush_lock = None
+        self._broadcasts = None
+        if self._records:
+            logger.warning("analytics_events_lost_on_shutdown", events=len(self._records))
+
+
+_analytics_buffer: Optional[AnalyticsBuffer] = None
+
+
+def get_analytics_buffer() -> AnalyticsBuffer:
+    """Get or create the analytics buffer singleton (broadcasting to Admin Jarvis)."""
+    global _analytics_buffer
+    if _analytics_buffer is None:
+        from app.routes.websocket import broadcast_to_admin_jarvis
+
+        _analytics_buffer = AnalyticsBuffer(broadcast=broadcast_to_admin_jarvis)
+    return _analytics_buffer
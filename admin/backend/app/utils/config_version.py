@@ -0,0 +1,179 @@
+"""
+Config Snapshot Versioning
+
+Services hold the admin configuration (routing, tools, component models,
+gateway and voice config) as one in-memory snapshot fetched from
+/api/config-snapshot/public, and feature flags in an in-process flag store.
+This module keeps them coherent: whenever a commit touches a table a config
+section is built from, the config version in Redis is incremented and the
+changed section names are published so services can refetch just those
+sections.
+
+Tracking hooks into the SQLAlchemy session, so every route that writes
+configuration through the ORM is covered without calling anything itself.
+The Redis INCR/PUBLISH runs on a background thread: commits happen inside
+async request handlers, and an unreachable Redis must not stall the event
+loop for the socket timeout on every write.
+"""
+import json
+import os
+import queue
+import threading
+from itertools import chain
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+CONFIG_VERSION_KEY = "athena:config:version"
+CONFIG_CHANNEL = "athena:config:changed"
+
+# Config section -> tables it is built from. "features" is not part of the
+# config snapshot (flags are served by /api/features/snapshot) but its changes
+# are published the same way.
+SECTION_TABLES: Dict[str, Tuple[str, ...]] = {
+    "features": ("features",),
+    "intent_routing": ("intent_routing",),
+    "provider_routing": ("provider_routing",),
+    "llm_backends": ("llm_backends",),
+    "tool_calling_settings": ("tool_calling_settings",),
+    "enabled_tools": ("tool_registry",),
+    "fallback_triggers": ("tool_calling_triggers",),
+    "component_models": ("component_model_assignments",),
+    "gateway_config": ("gateway_config", "system_settings"),
+    "voice_stt": ("stt_models", "voice_service_config"),
+    "voice_tts": ("tts_voices", "voice_service_config"),
+    "voice_all": ("stt_models", "tts_voices", "voice_service_config"),
+}
+
+TABLE_SECTIONS: Dict[str, Set[str]] = {}
+for _section, _tables in SECTION_TABLES.items():
+    for _table in _tables:
+        TABLE_SECTIONS.setdefault(_table, set()).add(_section)
+
+_PENDING_KEY = "config_snapshot_sections"
+
+try:
+    import redis
+    redis_available = True
+except ImportError:
+    redis_available = False
+    logger.warning("redis not available - config snapshot push invalidation disabled")
+
+_redis_client = None
+
+# Section sets committed but not yet published, drained by _bump_worker
+_pending_bumps: "queue.Queue[Set[str]]" = queue.Queue()
+_bump_thread: Optional[threading.Thread] = None
+_bump_thread_lock = threading.Lock()
+
+
+def _get_redis_client():
+    """Get the (lazily created) sync redis client, or None."""
+    global _redis_client
+    if not redis_available or os.getenv("DEV_MODE", "false").lower() == "true":
+        return None
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            os.getenv("REDIS_URL", "redis://redis:6379"),
+            decode_responses=True,
+            socket_timeout=1.0,
+            socket_connect_timeout=1.0,
+        )
+    return _redis_client
+
+
+def get_config_version() -> int:
+    """Current config version (0 if Redis is unavailable)."""
+    client = _get_redis_client()
+    if client is None:
+        return 0
+    try:
+        return int(client.get(CONFIG_VERSION_KEY) or 0)
+    except Exception as e:
+        logger.warning("config_version_read_failed", error=str(e))
+        return 0
+
+
+def bump_config_version(sections: Iterable[str]) -> Optional[int]:
+    """
+    Increment the config version and notify services of the changed sections.
+
+    Args:
+        sections: Snapshot section names that changed
+
+    Returns:
+        The new version, or None if Redis is unavailable (services then pick
+        the change up on their periodic resync)
+    """
+    sections = sorted(set(sections))
+    client = _get_redis_client()
+    if client is None or not sections:
+        return None
+    try:
+        version = client.incr(CONFIG_VERSION_KEY)
+        client.publish(CONFIG_CHANNEL, json.dumps({"version": version, "sections": sections}))
+        logger.info("config_version_bumped", version=version, sections=sections)
+        return version
+    except Exception as e:
+        logger.warning("config_version_bump_failed", sections=sections, error=str(e))
+        return None
+
+
+def _bump_worker():
+    while True:
+        sections = set(_pending_bumps.get())
+        # Commits that queued up meanwhile share one version bump
+        while True:
+            try:
+                sections |= _pending_bumps.get_nowait()
+            except queue.Empty:
+                break
+        bump_config_version(sections)
+
+
+def schedule_config_version_bump(sections: Iterable[str]) -> None:
+    """Bump the config version for ``sections`` on the background thread."""
+    global _bump_thread
+    _pending_bumps.put(set(sections))
+    with _bump_thread_lock:
+        if _bump_thread is None or not _bump_thread.is_alive():
+            _bump_thread = threading.Thread(target=_bump_worker, name="config-version-bump", daemon=True)
+            _bump_thread.start()
+
+
+def _changed_sections(session: Session) -> Set[str]:
+    sections: Set[str] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table in TABLE_SECTIONS:
+            sections |= TABLE_SECTIONS[table]
+    return sections
+
+
+def _after_flush(session: Session, flush_context):
+    sections = _changed_sections(session)
+    if sections:
+        session.info.setdefault(_PENDING_KEY, set()).update(sections)
+
+
+def _after_commit(session: Session):
+    sections = session.info.pop(_PENDING_KEY, None)
+    if sections:
+        schedule_config_version_bump(sections)
+
+
+def _after_rollback(session: Session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_session_hooks(session_factory) -> None:
+    """Track config table writes on sessions from ``session_factory``."""
+    if event.contains(session_factory, "after_commit", _after_commit):
+        return
+    event.listen(session_factory, "after_flush", _after_flush)
+    event.listen(session_factory, "after_commit", _after_commit)
+    event.listen(session_factory, "after_rollback", _after_rollback)
@@ -0,0 +1,109 @@
+"""
+Shared asyncpg Connection Pools
+
+Long-lived pools for the two databases the internal service API reads
+directly (see app.routes.internal):
+
+- athena: RAG services registry, base_knowledge, validation tables
+- athena_admin: conversation settings, clarification, analytics
+
+Pools are created on first use (or warmed by init_db_pools() at startup)
+and closed by close_db_pools() at shutdown, so internal requests borrow a
+connection instead of paying a Postgres handshake each.
+"""
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Dict
+
+import asyncpg
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+ATHENA_DB = "athena"
+ADMIN_DB = "athena_admin"
+
+_pools: Dict[str, asyncpg.Pool] = {}
+_pool_locks: Dict[str, asyncio.Lock] = {}
+
+
+class DatabaseNotConfigured(RuntimeError):
+    """ATHENA_DB_PASSWORD is not set."""
+
+
+def _connect_kwargs(name: str) -> Dict[str, object]:
+    password = os.getenv('ATHENA_DB_PASSWORD')
+    if not password:
+        raise DatabaseNotConfigured("ATHENA_DB_PASSWORD not configured")
+    if name == ATHENA_DB:
+        return dict(
+            host=os.getenv('ATHENA_DB_HOST', 'localhost'),
+            port=int(os.getenv('ATHENA_DB_PORT', '5432')),
+            user=os.getenv('ATHENA_DB_USER', 'psadmin'),
+            password=password,
+            database=os.getenv('ATHENA_DB_NAME', 'athena')
+        )
+    return dict(
+        host=os.getenv('ADMIN_DB_HOST', os.getenv('ATHENA_DB_HOST', 'localhost')),
+        port=int(os.getenv('ADMIN_DB_PORT', os.getenv('ATHENA_DB_PORT', '5432'))),
+        user=os.getenv('ADMIN_DB_USER', os.getenv('ATHENA_DB_USER', 'psadmin')),
+        password=password,
+        database=os.getenv('ADMIN_DB_NAME', 'athena_admin')
+    )
+
+
+async def get_pool(name: str) -> asyncpg.Pool:
+    """Get (creating on first use) the pool for ATHENA_DB or ADMIN_DB."""
+    pool = _pools.get(name)
+    if pool is not None:
+        return pool
+    lock = _pool_locks.setdefault(name, asyncio.Lock())
+    async with lock:
+        if name not in _pools:
+            _pools[name] = await asyncpg.create_pool(
+                min_size=int(os.getenv('INTERNAL_DB_POOL_MIN', '1')),
+                max_size=int(os.getenv('INTERNAL_DB_POOL_MAX', '10')),
+                max_inactive_connection_lifetime=float(os.getenv('INTERNAL_DB_POOL_IDLE_SECONDS', '300')),
+                **_connect_kwargs(name)
+            )
+            logger.info("asyncpg_pool_created", database=name)
+    return _pools[name]
+
+
+@asynccontextmanager
+async def db_connection(name: str):
+    """Borrow a connection from the ``name`` pool for the block."""
+    pool = await get_pool(name)
+    async with pool.acquire() as conn:
+        yield conn
+
+
+async def init_db_pools():
+    """Create both pools at startup; failures are logged and retried on first use."""
+    for name in (ADMIN_DB, ATHENA_DB):
+        try:
+            await get_pool(name)
+        except Exception as e:
+            logger.warning("asyncpg_pool_init_failed", database=name, error=str(e))
+
+
+async def close_db_pools():
+    """Close all pools (shutdown)."""
+    pools = list(_pools.items())
+    _pools.clear()
+    # Locks are bound to this lifespan's event loop; the next one makes its own
+    _pool_locks.clear()
+    for name, pool in pools:
+        try:
+            await pool.close()
+        except Exception as e:
+            logger.warning("asyncpg_pool_close_failed", database=name, error=str(e))
+
+
+def get_pool_stats() -> Dict[str, Dict[str, int]]:
+    """Size and idle connections per pool."""
+    return {
+        name: {"size": pool.get_size(), "idle": pool.get_idle_size(), "max_size": pool.get_max_size()}
+        for name, pool in _pools.items()
+    }
@@ -0,0 +1,334 @@
+"""
+Conversation Analytics Rollups
+
+Keeps per-minute and per-hour aggregates of conversation_analytics in
+conversation_analytics_rollups so dashboard queries cost O(buckets) rather
+than O(events):
+
+- AnalyticsBuffer calls accumulate() on each flushed batch and writes the
+  deltas with upsert_rollups() in the same transaction as the COPY
+- prune_rollups() deletes minute buckets past ROLLUP_MINUTE_RETENTION_HOURS
+  and hour buckets past ROLLUP_HOUR_RETENTION_DAYS
+- load_window() merges the buckets covering a time window, and quantiles()
+  reads percentiles off the merged histogram
+- merge_sketches() combines the live latency sketches served by each
+  orchestrator/gateway replica at /metrics/quantiles (shared.metrics.LatencySketch
+  uses the same bins)
+
+Latencies go into log-scale buckets: bucket i holds values in
+(GAMMA^(i-1), GAMMA^i], so reporting 2*GAMMA^i/(GAMMA+1) for any value in it
+is within RELATIVE_ACCURACY of the true value. Histograms from different
+buckets (or admin replicas) merge by adding counts.
+"""
+import json
+import math
+import os
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models import ConversationAnalyticsRollup
+
+ROLLUP_TABLE = "conversation_analytics_rollups"
+
+RELATIVE_ACCURACY = 0.01
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(GAMMA)
+
+RESOLUTIONS = ("minute", "hour")
+
+# Metadata keys carrying an event's latency, in order of preference
+LATENCY_KEYS = ("total_latency_ms", "latency_ms", "duration_ms")
+
+MINUTE_RETENTION = timedelta(hours=int(os.getenv("ROLLUP_MINUTE_RETENTION_HOURS", "48")))
+HOUR_RETENTION = timedelta(days=int(os.getenv("ROLLUP_HOUR_RETENTION_DAYS", "90")))
+
+RollupKey = Tuple[str, datetime, str]
+
+
+# =============================================================================
+# Event classification and histogram buckets
+# =============================================================================
+
+def event_latency(metadata: Optional[Dict[str, Any]]) -> Optional[float]:
+    """An event's latency in ms, or None if it carries none."""
+    if not metadata:
+        return None
+    for key in LATENCY_KEYS:
+        value = metadata.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+            return float(value)
+    return None
+
+
+def event_is_error(metadata: Optional[Dict[str, Any]]) -> bool:
+    return bool(metadata) and bool(metadata.get("error") or metadata.get("status") == "error")
+
+
+def bucket_index(latency_ms: float) -> int:
+    return math.ceil(math.log(latency_ms) / _LOG_GAMMA)
+
+
+def bucket_value(index: int) -> float:
+    """Representative latency for a histogram bucket."""
+    return 2 * GAMMA ** index / (GAMMA + 1)
+
+
+def bucket_start(timestamp: datetime, resolution: str) -> datetime:
+    timestamp = timestamp.astimezone(timezone.utc)
+    if resolution == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(second=0, microsecond=0)
+
+
+def quantiles(histogram: Dict[Any, int], qs: Sequence[float], zero_count: int = 0) -> List[Optional[float]]:
+    """
+    Quantiles (0..1) from a bucket histogram.
+
+    Args:
+        histogram: {bucket index: count}
+        qs: Quantiles to compute
+        zero_count: Observations of 0ms (which have no log-scale bucket)
+
+    Returns:
+        One latency per requested quantile (None if the histogram is empty)
+    """
+    buckets = sorted((int(i), n) for i, n in histogram.items() if n)
+    total = zero_count + sum(n for _, n in buckets)
+    if not total:
+        return [None for _ in qs]
+    results = []
+    for q in qs:
+        rank = q * (total - 1)
+        if rank < zero_count:
+            results.append(0.0)
+            continue
+        seen = zero_count
+        for index, n in buckets:
+            seen += n
+            if seen > rank:
+                results.append(round(bucket_value(index), 1))
+                break
+    return results
+
+
+# =============================================================================
+# Ingest side (asyncpg)
+# =============================================================================
+
+def _empty_delta() -> Dict[str, Any]:
+    return {
+        "count": 0,
+        "error_count": 0,
+        "latency_count": 0,
+        "latency_sum": 0.0,
+        "latency_min": None,
+        "latency_max": None,
+        "histogram": Counter(),
+    }
+
+
+def accumulate(
+    events: Iterable[Tuple[str, datetime, Optional[float], bool]]
+) -> Dict[RollupKey, Dict[str, Any]]:
+    """
+    Aggregate events into rollup deltas.
+
+    Args:
+        events: (event_type, timestamp, latency_ms or None, is_error)
+
+    Returns:
+        {(resolution, bucket_start, event_type): delta}
+    """
+    deltas: Dict[RollupKey, Dict[str, Any]] = {}
+    for event_type, timestamp, latency, is_error in events:
+        index = bucket_index(latency) if latency is not None else None
+        for resolution in RESOLUTIONS:
+            key = (resolution, bucket_start(timestamp, resolution), event_type)
+            delta = deltas.get(key)
+            if delta is None:
+                delta = deltas[key] = _empty_delta()
+            delta["count"] += 1
+            if is_error:
+                delta["error_count"] += 1
+            if latency is not None:
+                delta["latency_count"] += 1
+                delta["latency_sum"] += latency
+                delta["latency_min"] = latency if delta["latency_min"] is None else min(delta["latency_min"], latency)
+                delta["latency_max"] = latency if delta["latency_max"] is None else max(delta["latency_max"], latency)
+                delta["histogram"][index] += 1
+    return deltas
+
+
+UPSERT_SQL = f"""
+    INSERT INTO {ROLLUP_TABLE} AS r
+        (resolution, bucket_start, event_type, count, error_count,
+         latency_count, latency_sum, latency_min, latency_max, histogram, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10::jsonb, NOW())
+    ON CONFLICT (resolution, bucket_start, event_type) DO UPDATE SET
+        count = r.count + EXCLUDED.count,
+        error_count = r.error_count + EXCLUDED.error_count,
+        latency_count = r.latency_count + EXCLUDED.latency_count,
+        latency_sum = r.latency_sum + EXCLUDED.latency_sum,
+        latency_min = LEAST(r.latency_min, EXCLUDED.latency_min),
+        latency_max = GREATEST(r.latency_max, EXCLUDED.latency_max),
+        histogram = (
+            SELECT COALESCE(jsonb_object_agg(k, n), '{{}}'::jsonb)
+            FROM (
+                SELECT k, SUM(n) AS n
+                FROM (
+                    SELECT key AS k, value::bigint AS n FROM jsonb_each_text(r.histogram)
+                    UNION ALL
+                    SELECT key, value::bigint FROM jsonb_each_text(EXCLUDED.histogram)
+                ) parts
+                GROUP BY k
+            ) merged
+        ),
+        updated_at = NOW()
+"""
+
+
+async def upsert_rollups(conn, deltas: Dict[RollupKey, Dict[str, Any]]):
+    """Add deltas to the rollup table (in key order, so concurrent writers lock rows consistently)."""
+    if not deltas:
+        return
+    await conn.executemany(UPSERT_SQL, [
+        (
+            resolution, start, event_type,
+            d["count"], d["error_count"], d["latency_count"], d["latency_sum"],
+            d["latency_min"], d["latency_max"],
+            json.dumps({str(i): n for i, n in d["histogram"].items()}),
+        )
+        for (resolution, start, event_type), d in sorted(deltas.items())
+    ])
+
+
+async def prune_rollups(conn, now: Optional[datetime] = None):
+    """Delete rollup buckets past their retention."""
+    now = now or datetime.now(timezone.utc)
+    await conn.execute(
+        f"DELETE FROM {ROLLUP_TABLE} WHERE (resolution = 'minute' AND bucket_start < $1) "
+        f"OR (resolution = 'hour' AND bucket_start < $2)",
+        now - MINUTE_RETENTION, now - HOUR_RETENTION
+    )
+
+
+# =============================================================================
+# Query side (SQLAlchemy)
+# =============================================================================
+
+def _ceil_hour(timestamp: datetime) -> datetime:
+    floor = bucket_start(timestamp, "hour")
+    return floor if floor == timestamp else floor + timedelta(hours=1)
+
+
+def load_window(
+    db: Session,
+    event_types: Sequence[str],
+    since: datetime,
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Merge the rollup buckets covering [since, now] for ``event_types``.
+
+    Whole hours use hour buckets; the partial hour at the start of the window
+    uses minute buckets while they are retained (beyond that the window is
+    widened to the start of that hour).
+
+    Returns:
+        Merged totals: count, error_count, latency_count, latency_sum,
+        latency_min, latency_max and histogram
+    """
+    now = now or datetime.now(timezone.utc)
+    since = since.astimezone(timezone.utc) if since.tzinfo else since.replace(tzinfo=timezone.utc)
+    query = db.query(ConversationAnalyticsRollup).filter(
+        ConversationAnalyticsRollup.event_type.in_(list(event_types))
+    )
+
+    if since >= now - MINUTE_RETENTION:
+        first_hour = _ceil_hour(since)
+        rows = query.filter(
+            ((ConversationAnalyticsRollup.resolution == "minute")
+             & (ConversationAnalyticsRollup.bucket_start >= bucket_start(since, "minute"))
+             & (ConversationAnalyticsRollup.bucket_start < first_hour))
+            | ((ConversationAnalyticsRollup.resolution == "hour")
+               & (ConversationAnalyticsRollup.bucket_start >= first_hour))
+        ).all()
+    else:
+        rows = query.filter(
+            ConversationAnalyticsRollup.resolution == "hour",
+            ConversationAnalyticsRollup.bucket_start >= bucket_start(since, "hour")
+        ).all()
+
+    merged = _empty_delta()
+    for row in rows:
+        merged["count"] += row.count
+        merged["error_count"] += row.error_count
+        merged["latency_count"] += row.latency_count
+        merged["latency_sum"] += row.latency_sum or 0.0
+        for field, pick in (("latency_min", min), ("latency_max", max)):
+            value = getattr(row, field)
+            if value is not None:
+                merged[field] = value if merged[field] is None else pick(merged[field], value)
+        histogram = row.histogram
+        if isinstance(histogram, str):
+            histogram = json.loads(histogram)
+        for index, n in (histogram or {}).items():
+            merged["histogram"][int(index)] += n
+    return merged
+
+
+# =============================================================================
+# Replica sketch merging
+# =============================================================================
+
+def merge_sketches(snapshots: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge /metrics/quantiles snapshots from several replicas.
+
+    Sketches are combined per (stage, model) by adding bin counts; sketches
+    built with a different relative accuracy are skipped since their bins
+    do not line up.
+
+    Returns:
+        [{stage, model, count, replicas, avg_ms, p50_ms, p95_ms, p99_ms, max_ms}]
+        sorted by stage and model
+    """
+    merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for snapshot in snapshots:
+        for entry in snapshot.get("sketches", []):
+            sketch = entry.get("sketch")
+            if not sketch or not math.isclose(sketch.get("relative_accuracy", 0), RELATIVE_ACCURACY):
+                continue
+            key = (entry["stage"], entry.get("model") or "-")
+            total = merged.get(key)
+            if total is None:
+                total = merged[key] = _empty_delta()
+                total["zero_count"] = 0
+                total["replicas"] = 0
+            total["replicas"] += 1
+            total["count"] += sketch.get("count", 0)
+            total["zero_count"] += sketch.get("zero_count", 0)
+            total["latency_sum"] += sketch.get("sum", 0.0)
+            if sketch.get("max") is not None:
+                total["latency_max"] = sketch["max"] if total["latency_max"] is None else max(total["latency_max"], sketch["max"])
+            for index, n in sketch.get("bins", {}).items():
+                total["histogram"][int(index)] += n
+
+    results = []
+    for (stage, model), total in sorted(merged.items()):
+        p50, p95, p99 = quantiles(total["histogram"], [0.5, 0.95, 0.99], total["zero_count"])
+        results.append({
+            "stage": stage,
+            "model": model,
+            "count": total["count"],
+            "replicas": total["replicas"],
+            "avg_ms": round(total["latency_sum"] / total["count"], 1) if total["count"] else None,
+            "p50_ms": p50,
+            "p95_ms": p95,
+            "p99_ms": p99,
+            "max_ms": round(total["latency_max"], 1) if total["latency_max"] is not None else None,
+        })
+    return results
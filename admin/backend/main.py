@@ -24,6 +24,8 @@ import structlog
 
 from app.database import get_db, check_db_connection, init_db, DEV_MODE, seed_dev_data, seed_oss_defaults, seed_oss_features, seed_oss_conversation_settings, OSS_DEFAULT_MODEL, OSS_OLLAMA_URL, OSS_AUTO_PULL_MODELS, OSS_SEED_DEFAULTS
 from app.services.calendar_sync import start_background_sync, stop_background_sync
+from app.utils.db_pools import init_db_pools, close_db_pools
+from app.utils.analytics_buffer import get_analytics_buffer
 from app.auth.oidc import (
     oauth,
     get_authentik_userinfo,
@@ -44,7 +46,7 @@ from app.routes import (
     voice_config, voice_interfaces, mcp_security, websocket, pipeline_events, tool_proposals,
     site_scraper, performance_presets, voice_automations, alerts, follow_me, model_config,
     model_downloads, ha_pipelines, cloud_providers, cloud_llm_usage, rag_service_bypass,
-    dashboard, integrations, escalation, debug_logs, modules
+    dashboard, integrations, escalation, debug_logs, modules, config_snapshot
 )
 
 logger = structlog.get_logger()
@@ -192,6 +194,7 @@ app.include_router(integrations.router)
 app.include_router(escalation.router)
 app.include_router(debug_logs.router)
 app.include_router(modules.router)
+app.include_router(config_snapshot.router)
 
 
 # Startup event: Initialize database and check connections
@@ -276,6 +279,11 @@ async def startup_event():
     # Start background calendar sync task
     start_background_sync()
 
+    # Internal API asyncpg pools and analytics ingest buffer
+    if not DEV_MODE:
+        await init_db_pools()
+    get_analytics_buffer().start()
+
 
 async def ensure_default_model():
     """
@@ -340,6 +348,8 @@ async def shutdown_event():
     """Clean up background tasks on shutdown."""
     logger.info("athena_admin_shutdown")
     await stop_background_sync()
+    await get_analytics_buffer().close()
+    await close_db_pools()
 
 
 # Authentication routes
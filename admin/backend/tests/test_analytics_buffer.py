@@ -0,0 +1,178 @@
+"""
+Unit tests for buffered analytics ingestion.
+"""
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+import asyncpg
+import pytest
+
+# Set test environment
+os.environ["DEV_MODE"] = "true"
+
+from app.utils.analytics_buffer import ANALYTICS_COLUMNS, ANALYTICS_TABLE, AnalyticsBuffer
+
+
+class FakePool:
+    """asyncpg pool stand-in recording COPY and rollup upsert calls."""
+
+    def __init__(self):
+        self.copies = []
+        self.upserts = []
+        self.down = False
+        self.copy_attempts = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        if self.down:
+            raise OSError("connection refused")
+        yield self
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copy_attempts += 1
+        if any(record[2] and "\\u0000" in record[2] for record in records):
+            raise asyncpg.exceptions.UntranslatableCharacterError("unsupported Unicode escape sequence")
+        self.copies.append((table, list(records), columns))
+
+    async def executemany(self, query, args):
+        self.upserts.append(list(args))
+
+    async def execute(self, query, *args):
+        pass
+
+
+def _buffer(pool: FakePool, **kwargs) -> AnalyticsBuffer:
+    async def get_pool():
+        return pool
+    return AnalyticsBuffer(get_db_pool=get_pool, **kwargs)
+
+
+class TestAnalyticsBuffer:
+    """Tests for AnalyticsBuffer."""
+
+    @pytest.mark.asyncio
+    async def test_events_written_in_copy_batches(self):
+        """Events are written with one COPY per batch."""
+        pool = FakePool()
+        buffer = _buffer(pool, batch_size=50, flush_interval=0.05)
+        for i in range(120):
+            buffer.add("session-1", "query_intent", {"i": i})
+        await asyncio.sleep(0.2)
+        await buffer.close()
+
+        assert [len(records) for _, records, _ in pool.copies] == [50, 50, 20]
+        table, records, columns = pool.copies[0]
+        assert table == ANALYTICS_TABLE
+        assert columns == ANALYTICS_COLUMNS
+        assert records[0][:3] == ("session-1", "query_intent", '{"i": 0}')
+        assert records[0][3].tzinfo is not None
+        assert buffer.stats()["written"] == 120
+
+    @pytest.mark.asyncio
+    async def test_rollups_upserted_with_each_batch(self):
+        """Each COPY batch also upserts its minute and hour rollups."""
+        pool = FakePool()
+        buffer = _buffer(pool, batch_size=100, flush_interval=60)
+        buffer.add("session-1", "query_complete", {"total_latency_ms": 120})
+        buffer.add("session-1", "query_complete", {"total_latency_ms": 480, "error": "timeout"})
+        buffer.add("session-1", "session_created")
+        await buffer.close()
+
+        assert len(pool.upserts) == 1
+        rows = {(row[0], row[2]): row for row in pool.upserts[0]}
+        assert set(rows) == {
+            ("minute", "query_complete"), ("hour", "query_complete"),
+            ("minute", "session_created"), ("hour", "session_created"),
+        }
+        # count, error_count, latency_count, latency_sum, min, max
+        assert rows[("hour", "query_complete")][3:9] == (2, 1, 2, 600.0, 120.0, 480.0)
+        assert rows[("hour", "session_created")][3:9] == (1, 0, 0, 0.0, None, None)
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_events(self):
+        """Events survive a database outage and are written once it recovers."""
+        pool = FakePool()
+        pool.down = True
+        buffer = _buffer(pool, batch_size=10, flush_interval=60)
+        for _ in range(3):
+            buffer.add("session-1", "session_created")
+        await buffer.flush()
+        assert buffer.stats()["buffered"] == 3
+        assert "connection refused" in buffer.stats()["last_error"]
+
+        pool.down = False
+        await buffer.close()
+        assert sum(len(records) for _, records, _ in pool.copies) == 3
+
+    @pytest.mark.asyncio
+    async def test_rejected_event_does_not_block_batch(self):
+        """An event Postgres rejects is isolated and dropped; the rest of its batch is written."""
+        pool = FakePool()
+        buffer = _buffer(pool, batch_size=100, flush_interval=60)
+        for i in range(8):
+            buffer.add("session-1", "query_intent", {"i": i, "text": "bad\x00" if i == 5 else "ok"})
+        await buffer.flush()
+
+        written = [record for _, records, _ in pool.copies for record in records]
+        assert len(written) == 7
+        assert not any('"i": 5' in record[2] for record in written)
+        stats = buffer.stats()
+        assert stats["buffered"] == 0
+        assert stats["rejected"] == 1
+        assert stats["written"] == 7
+        # Bisected down to the bad event rather than retried one COPY per event
+        assert pool.copy_attempts < 8
+        await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_oldest_events_dropped_when_full(self):
+        """Past max_buffer the oldest events are dropped and counted."""
+        pool = FakePool()
+        pool.down = True
+        buffer = _buffer(pool, batch_size=100, flush_interval=60, max_buffer=5)
+        for i in range(8):
+            buffer.add("session-1", f"event_{i}")
+        assert buffer.stats()["dropped"] == 3
+
+        pool.down = False
+        await buffer.close()
+        assert [r[1] for r in pool.copies[0][1]] == [f"event_{i}" for i in range(3, 8)]
+
+    @pytest.mark.asyncio
+    async def test_slow_broadcast_does_not_delay_ingestion(self):
+        """A stalled WebSocket broadcast neither blocks add() nor the COPY."""
+        pool = FakePool()
+        stalled = asyncio.Event()
+
+        async def broadcast(event):
+            await stalled.wait()
+
+        buffer = _buffer(pool, batch_size=10, flush_interval=0.05, max_broadcast_queue=5, broadcast=broadcast)
+        for i in range(20):
+            buffer.add("session-1", "query_intent", {"i": i})
+        await asyncio.sleep(0.2)
+
+        assert sum(len(records) for _, records, _ in pool.copies) == 20
+        assert buffer.stats()["broadcasts_dropped"] > 0
+        await buffer.close()
+
+    def test_restart_on_new_event_loop(self):
+        """A second lifespan on a new event loop gets fresh loop-bound primitives."""
+        pool = FakePool()
+        buffer = _buffer(pool, batch_size=1, flush_interval=60, broadcast=lambda event: asyncio.sleep(0))
+
+        async def lifespan(event_type):
+            buffer.start()
+            buffer.add("session-1", event_type)
+            await asyncio.sleep(0.05)
+            await buffer.close()
+
+        asyncio.run(lifespan("first"))
+        asyncio.run(lifespan("second"))
+
+        assert [records[0][1] for _, records, _ in pool.copies] == ["first", "second"]
@@ -0,0 +1,67 @@
+"""
+Unit tests for config snapshot version bumps.
+"""
+import json
+import os
+import threading
+import time
+
+# Set test environment
+os.environ["DEV_MODE"] = "true"
+
+from app.utils import config_version
+from app.utils.config_version import CONFIG_CHANNEL, CONFIG_VERSION_KEY
+
+
+class SlowRedis:
+    """Sync redis stand-in whose calls block until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.version = 0
+        self.published = []
+
+    def incr(self, key):
+        assert key == CONFIG_VERSION_KEY
+        self.release.wait(5)
+        self.version += 1
+        return self.version
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+def _published_sections(redis):
+    return {section for _, message in redis.published for section in json.loads(message)["sections"]}
+
+
+class FakeSession:
+    def __init__(self, sections):
+        self.info = {config_version._PENDING_KEY: set(sections)}
+
+
+class TestConfigVersionBump:
+    """Tests for the after_commit version bump."""
+
+    def test_commit_does_not_wait_for_redis(self, monkeypatch):
+        redis = SlowRedis()
+        monkeypatch.setattr(config_version, "_get_redis_client", lambda: redis)
+
+        start = time.monotonic()
+        config_version._after_commit(FakeSession({"features"}))
+        config_version._after_commit(FakeSession({"llm_backends"}))
+        config_version._after_commit(FakeSession({"intent_routing"}))
+        assert time.monotonic() - start < 0.5
+        assert redis.published == []
+
+        redis.release.set()
+        expected = {"features", "llm_backends", "intent_routing"}
+        for _ in range(100):
+            if _published_sections(redis) == expected:
+                break
+            time.sleep(0.01)
+
+        assert _published_sections(redis) == expected
+        assert all(channel == CONFIG_CHANNEL for channel, _ in redis.published)
+        # Commits queued behind a blocked bump are coalesced into one
+        assert redis.version <= 2
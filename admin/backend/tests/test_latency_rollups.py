@@ -0,0 +1,181 @@
+"""
+Unit tests for conversation analytics latency rollups.
+"""
+import os
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Set test environment
+os.environ["DEV_MODE"] = "true"
+
+from app.models import ConversationAnalyticsRollup
+from app.utils.latency_rollups import (
+    RELATIVE_ACCURACY,
+    accumulate,
+    bucket_index,
+    bucket_value,
+    event_is_error,
+    event_latency,
+    load_window,
+    merge_sketches,
+    quantiles,
+)
+
+
+def _to_row(key, delta) -> ConversationAnalyticsRollup:
+    resolution, start, event_type = key
+    return ConversationAnalyticsRollup(
+        resolution=resolution,
+        bucket_start=start,
+        event_type=event_type,
+        count=delta["count"],
+        error_count=delta["error_count"],
+        latency_count=delta["latency_count"],
+        latency_sum=delta["latency_sum"],
+        latency_min=delta["latency_min"],
+        latency_max=delta["latency_max"],
+        histogram={str(i): n for i, n in delta["histogram"].items()},
+    )
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    ConversationAnalyticsRollup.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+class TestEventClassification:
+    """Tests for latency and error extraction from event metadata."""
+
+    def test_latency_keys(self):
+        """total_latency_ms wins, non-numeric and non-positive values are ignored."""
+        assert event_latency({"total_latency_ms": 250, "latency_ms": 10}) == 250.0
+        assert event_latency({"latency_ms": "fast", "duration_ms": 40}) == 40.0
+        assert event_latency({"latency_ms": 0}) is None
+        assert event_latency(None) is None
+
+    def test_errors(self):
+        """Truthy error or status == error marks an event as failed."""
+        assert event_is_error({"error": "timeout"})
+        assert event_is_error({"status": "error"})
+        assert not event_is_error({"error": None, "status": "ok"})
+
+
+class TestHistogram:
+    """Tests for log-scale latency buckets."""
+
+    def test_bucket_value_within_relative_accuracy(self):
+        """A bucket's representative value is within RELATIVE_ACCURACY of its members."""
+        for latency in (0.5, 3.7, 99.9, 100.0, 1234.5, 60000.0):
+            value = bucket_value(bucket_index(latency))
+            assert abs(value - latency) / latency <= RELATIVE_ACCURACY + 1e-9
+
+    def test_quantiles_match_exact(self):
+        """Histogram quantiles stay within ~1% of exact quantiles."""
+        rng = random.Random(7)
+        latencies = sorted(rng.lognormvariate(6, 0.8) for _ in range(5000))
+        deltas = accumulate(
+            ("query_complete", datetime(2026, 1, 1, tzinfo=timezone.utc), latency, False)
+            for latency in latencies
+        )
+        histogram = deltas[("hour", datetime(2026, 1, 1, tzinfo=timezone.utc), "query_complete")]["histogram"]
+        for q, estimate in zip((0.5, 0.95, 0.99), quantiles(histogram, [0.5, 0.95, 0.99])):
+            exact = latencies[int(q * (len(latencies) - 1))]
+            assert abs(estimate - exact) / exact < 0.02
+
+    def test_empty_histogram(self):
+        assert quantiles({}, [0.5, 0.99]) == [None, None]
+
+
+class TestRollups:
+    """Tests for accumulating and reading rollup buckets."""
+
+    def test_accumulate_minute_and_hour(self):
+        """Events land in both their minute and hour buckets."""
+        t0 = datetime(2026, 1, 1, 10, 15, 30, tzinfo=timezone.utc)
+        deltas = accumulate([
+            ("query_complete", t0, 100.0, False),
+            ("query_complete", t0 + timedelta(minutes=1), 300.0, True),
+            ("query_complete", t0 + timedelta(minutes=1), None, False),
+        ])
+        minute = deltas[("minute", t0.replace(second=0), "query_complete")]
+        assert minute["count"] == 1
+        hour = deltas[("hour", t0.replace(minute=0, second=0), "query_complete")]
+        assert (hour["count"], hour["error_count"], hour["latency_count"]) == (3, 1, 2)
+        assert (hour["latency_sum"], hour["latency_min"], hour["latency_max"]) == (400.0, 100.0, 300.0)
+
+    def test_load_window_uses_minutes_then_hours(self, db):
+        """The partial first hour comes from minute buckets, whole hours from hour buckets."""
+        now = datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc)
+        events = [
+            ("query_complete", datetime(2026, 1, 1, 9, 50, tzinfo=timezone.utc), 1000.0, False),  # before window
+            ("query_complete", datetime(2026, 1, 1, 10, 20, tzinfo=timezone.utc), 100.0, False),  # before window
+            ("query_complete", datetime(2026, 1, 1, 10, 40, tzinfo=timezone.utc), 200.0, True),
+            ("query_complete", datetime(2026, 1, 1, 11, 10, tzinfo=timezone.utc), 300.0, False),
+            ("query_complete", datetime(2026, 1, 1, 12, 20, tzinfo=timezone.utc), 400.0, False),
+            ("stt_complete", datetime(2026, 1, 1, 12, 20, tzinfo=timezone.utc), 50.0, False),
+        ]
+        db.add_all(_to_row(key, delta) for key, delta in accumulate(events).items())
+        db.commit()
+
+        window = load_window(db, ["query_complete"], now - timedelta(hours=2), now=now)
+
+        assert window["count"] == 3
+        assert window["error_count"] == 1
+        assert window["latency_sum"] == 900.0
+        assert (window["latency_min"], window["latency_max"]) == (200.0, 400.0)
+        assert sum(window["histogram"].values()) == 3
+
+
+class TestMergeSketches:
+    """Tests for merging replica /metrics/quantiles snapshots."""
+
+    @staticmethod
+    def _snapshot(latencies, zeros=0, relative_accuracy=RELATIVE_ACCURACY):
+        bins = {}
+        for latency in latencies:
+            bins[str(bucket_index(latency))] = bins.get(str(bucket_index(latency)), 0) + 1
+        return {"sketches": [{
+            "stage": "llm.classify",
+            "model": "qwen",
+            "sketch": {
+                "relative_accuracy": relative_accuracy,
+                "count": len(latencies) + zeros,
+                "sum": sum(latencies),
+                "min": 0.0 if zeros else min(latencies),
+                "max": max(latencies),
+                "zero_count": zeros,
+                "bins": bins,
+            },
+        }]}
+
+    def test_replicas_merged(self):
+        """Replica sketches merge into one set of percentiles."""
+        rng = random.Random(11)
+        replicas = [[rng.uniform(50, 1500) for _ in range(1000)] for _ in range(3)]
+        merged = merge_sketches([self._snapshot(latencies) for latencies in replicas])
+
+        assert len(merged) == 1
+        entry = merged[0]
+        assert (entry["stage"], entry["model"], entry["count"], entry["replicas"]) == ("llm.classify", "qwen", 3000, 3)
+        everything = sorted(latency for latencies in replicas for latency in latencies)
+        for key, q in (("p50_ms", 0.5), ("p99_ms", 0.99)):
+            exact = everything[int(q * (len(everything) - 1))]
+            assert abs(entry[key] - exact) / exact < 0.02
+
+    def test_zero_counts_and_mismatched_accuracy(self):
+        """0ms observations rank first; sketches with other bins are skipped."""
+        merged = merge_sketches([
+            self._snapshot([100.0], zeros=3),
+            self._snapshot([5000.0], relative_accuracy=0.05),
+        ])
+        assert merged[0]["count"] == 4
+        assert merged[0]["replicas"] == 1
+        assert merged[0]["p50_ms"] == 0.0
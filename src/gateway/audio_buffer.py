@@ -0,0 +1,117 @@
+"""
+Fixed-capacity PCM ring buffer for gateway audio capture.
+
+Audio frames arrive every 10-20 ms. Appending them to ``bytes`` copies the
+whole buffer per frame, so a long utterance costs O(n^2). PCMRingBuffer
+preallocates its storage once, and each write costs the same no matter
+how much audio is held.
+
+The storage is mirrored (each frame is written twice, ``capacity`` bytes
+apart), so the most recent N bytes are always one contiguous slice.
+Readers get zero-copy ``memoryview``/NumPy views, e.g. the wake-word model
+reads ``tail(3 s)`` and STT reads ``since(mark)`` without concatenating.
+
+Views alias the buffer. They are valid until the next write(); copy them
+(``bytes(view)``) if they must outlive it.
+
+    ring = PCMRingBuffer.for_duration(33.0)
+    ring.write(frame.data.cast("B"))
+    start = ring.mark()                 # utterance starts here
+    ...
+    samples = ring.samples(ring.since(start))
+"""
+
+from typing import Optional
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2  # 16-bit PCM
+
+# Longest utterance kept for STT (older audio is dropped)
+MAX_UTTERANCE_SECONDS = 30.0
+
+
+class PCMRingBuffer:
+    """
+    Preallocated ring of 16-bit mono PCM with contiguous tail views.
+
+    Positions returned by mark() are absolute byte offsets in the stream,
+    so a mark stays meaningful while the ring wraps. Use overflowed() to
+    check whether audio after a mark has already been overwritten.
+    """
+
+    def __init__(self, capacity: int):
+        capacity -= capacity % SAMPLE_WIDTH
+        if capacity <= 0:
+            raise ValueError("capacity must hold at least one sample")
+        self.capacity = capacity
+        self._data = bytearray(2 * capacity)
+        self._view = memoryview(self._data)
+        self._written = 0  # total bytes ever written
+
+    @classmethod
+    def for_duration(cls, seconds: float, sample_rate: int = SAMPLE_RATE) -> "PCMRingBuffer":
+        """Ring holding ``seconds`` of 16-bit mono audio."""
+        return cls(int(seconds * sample_rate) * SAMPLE_WIDTH)
+
+    def __len__(self) -> int:
+        return min(self._written, self.capacity)
+
+    @property
+    def position(self) -> int:
+        """Absolute stream offset of the next write."""
+        return self._written
+
+    def write(self, data) -> None:
+        """Append PCM (any bytes-like object, including memoryview)."""
+        data = memoryview(data).cast("B")
+        n = len(data)
+        if n == 0:
+            return
+        if n > self.capacity:
+            # Only the newest ``capacity`` bytes survive
+            self._written += n - self.capacity
+            data = data[n - self.capacity:]
+            n = self.capacity
+
+        capacity = self.capacity
+        start = self._written % capacity
+        first = min(n, capacity - start)
+        # Primary copy, then the mirror one capacity later
+        self._view[start:start + first] = data[:first]
+        self._view[start + capacity:start + capacity + first] = data[:first]
+        if first < n:
+            rest = n - first
+            self._view[0:rest] = data[first:]
+            self._view[capacity:capacity + rest] = data[first:]
+        self._written += n
+
+    def mark(self) -> int:
+        """Current stream offset, for since()."""
+        return self._written
+
+    def overflowed(self, mark: int) -> bool:
+        """Whether audio written after ``mark`` has been partly overwritten."""
+        return self._written - mark > self.capacity
+
+    def tail(self, nbytes: Optional[int] = None) -> memoryview:
+        """The newest ``nbytes`` (default: everything held), zero-copy."""
+        held = len(self)
+        n = held if nbytes is None else max(0, min(int(nbytes), held))
+        n -= n % SAMPLE_WIDTH
+        end = self._written % self.capacity + self.capacity
+        return self._view[end - n:end]
+
+    def since(self, mark: int) -> memoryview:
+        """Everything written after ``mark`` that is still held, zero-copy."""
+        return self.tail(self._written - mark)
+
+    @staticmethod
+    def samples(view: memoryview) -> np.ndarray:
+        """int16 NumPy view over a tail()/since() result (no copy)."""
+        return np.frombuffer(view, dtype=np.int16)
+
+    def clear(self) -> None:
+        """Drop held audio (storage is kept)."""
+        self._written = 0
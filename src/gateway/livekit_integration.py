@@ -3,13 +3,14 @@ LiveKit Integration with Athena Pipeline.
 
 Connects LiveKit audio processing to the orchestrator:
 - Query handling (audio → STT → orchestrator → TTS → audio)
+- Streaming STT partials (speculative preclassification)
 - Event emission for Admin Jarvis
 - Session management
 """
 
 import os
 import asyncio
-from typing import Optional, Any, Dict
+from typing import Optional, Any, AsyncIterator, Dict
 import structlog
 
 from gateway.livekit_service import (
@@ -18,6 +19,8 @@ from gateway.livekit_service import (
     get_livekit_service,
     initialize_livekit_service
 )
+from gateway.streaming_stt import StreamingTranscriber, preclassify
+from gateway.tts_pipeline import iter_sentences, stream_query_sentences
 
 logger = structlog.get_logger()
 
@@ -26,6 +29,9 @@ ORCHESTRATOR_URL = os.getenv("ORCHESTRATOR_SERVICE_URL", "http://localhost:8001"
 STT_SERVICE_URL = os.getenv("STT_SERVICE_URL", "http://localhost:10301")
 TTS_SERVICE_URL = os.getenv("TTS_SERVICE_URL", "http://localhost:10201")
 
+# Speak sentences from /query/stream/v2 as they arrive instead of the full /query answer
+STREAMING_TTS_ENABLED = os.getenv("STREAMING_TTS_ENABLED", "true").lower() == "true"
+
 
 class LiveKitIntegration:
     """
@@ -75,11 +81,14 @@ class LiveKitIntegration:
 
         # Set up query handler
         self.livekit_service.set_query_handler(self._handle_query)
+        if STREAMING_TTS_ENABLED:
+            self.livekit_service.set_query_stream_handler(self._handle_query_stream)
 
         # Set up session handlers for event emission
         self.livekit_service.set_session_handlers(
             on_start=self._on_session_start,
-            on_end=self._on_session_end
+            on_end=self._on_session_end,
+            on_partial=self._on_partial_transcript
         )
 
         logger.info("livekit_integration_initialized")
@@ -162,6 +171,75 @@ class LiveKitIntegration:
 
             return "I encountered an error processing your request. Please try again."
 
+    async def _handle_query_stream(
+        self,
+        session_id: str,
+        transcript: str,
+        interface: str = "livekit",
+        room: str = "unknown",
+        interruption_context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Handle a transcribed query, yielding response sentences as the
+        orchestrator produces them (/query/stream/v2).
+
+        Falls back to the full /query answer if the stream fails before its
+        first sentence.
+        """
+        logger.info("livekit_query_stream_received",
+                   session_id=session_id,
+                   query=transcript[:50],
+                   has_interruption_context=interruption_context is not None)
+
+        await self._emit_event("query_received", session_id, {
+            "query": transcript,
+            "interface": interface,
+            "room": room,
+            "interruption_context": interruption_context
+        })
+
+        request_data = {
+            "query": transcript,
+            "mode": "owner",
+            "room": room,
+            "session_id": session_id,
+            "interface_type": "voice"
+        }
+        if interruption_context:
+            request_data["interruption_context"] = interruption_context
+
+        result: Dict[str, Any] = {}
+        sentences = []
+        try:
+            async for sentence in stream_query_sentences(self._http_client, "/query/stream/v2", request_data, result):
+                sentences.append(sentence)
+                yield sentence
+        except Exception as e:
+            logger.warning("livekit_query_stream_failed",
+                          session_id=session_id,
+                          sentences=len(sentences),
+                          error=str(e))
+            if sentences:
+                return
+            # Nothing spoken yet: answer from the non-streaming endpoint
+            answer = await self._handle_query(session_id, transcript, interface, room, interruption_context)
+            async for sentence in iter_sentences(answer or ""):
+                yield sentence
+            return
+
+        answer = result.get("full_response") or " ".join(sentences)
+        logger.info("livekit_query_response",
+                   session_id=session_id,
+                   response=answer[:50],
+                   sentences=len(sentences),
+                   streaming=True)
+
+        await self._emit_event("response_generated", session_id, {
+            "response": answer,
+            "intent": result.get("intent"),
+            "tools_used": result.get("tools_used", [])
+        })
+
     async def _on_session_start(self, session: LiveKitSession):
         """Handle LiveKit session start."""
         await self._emit_event("session_start", session.session_id, {
@@ -179,6 +257,25 @@ class LiveKitIntegration:
             "duration_ms": duration_ms
         })
 
+    async def _on_partial_transcript(self, session: LiveKitSession, text: str, stable: bool):
+        """Publish streaming STT partials; classify stable ones ahead of the final transcript."""
+        try:
+            from shared.events import emit_stt_progress
+            await emit_stt_progress(session.session_id, text, stable, interface="livekit")
+        except ImportError:
+            pass  # Events module not available
+        except Exception as e:
+            logger.warning("event_emit_failed", error=str(e))
+
+        if stable:
+            await preclassify(
+                self.orchestrator_url,
+                text,
+                session_id=session.session_id,
+                room=session.room,
+                client=self._http_client
+            )
+
     async def _emit_event(self, event_type: str, session_id: str, data: dict):
         """Emit event for Admin Jarvis monitoring."""
         try:
@@ -220,6 +317,12 @@ class STTClient:
     def __init__(self, stt_url: str):
         self.stt_url = stt_url
 
+    async def open_stream(self, on_partial=None) -> StreamingTranscriber:
+        """Open a streaming STT session (raises StreamingSTTError if unsupported)."""
+        transcriber = StreamingTranscriber(self.stt_url, on_partial=on_partial)
+        await transcriber.start()
+        return transcriber
+
     async def transcribe(self, audio_data: bytes) -> str:
         """Transcribe audio bytes to text."""
         import subprocess
@@ -318,7 +421,6 @@ class TTSClient:
 
     async def synthesize(self, text: str) -> bytes:
         """Synthesize text to audio bytes."""
-        import subprocess
         import tempfile
         import json
 
@@ -327,21 +429,30 @@ class TTSClient:
             with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
                 tmp_path = tmp.name
 
-            result = subprocess.run(
-                ["curl", "-s", "-m", "30", "-X", "POST",
-                 "-H", "Content-Type: application/json",
-                 "-d", json.dumps({"text": text}),
-                 "-o", tmp_path,
-                 f"{self.tts_url}/tts/synthesize"],
-                capture_output=True,
-                text=True,
-                timeout=35
+            # Async subprocess: the event loop keeps playing the previous
+            # sentence while this one renders
+            process = await asyncio.create_subprocess_exec(
+                "curl", "-s", "-m", "30", "-X", "POST",
+                "-H", "Content-Type: application/json",
+                "-d", json.dumps({"text": text}),
+                "-o", tmp_path,
+                f"{self.tts_url}/tts/synthesize",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
+            try:
+                _, stderr = await asyncio.wait_for(process.communicate(), timeout=35)
+            except BaseException:
+                # Timed out or cancelled (barge-in)
+                process.kill()
+                import os
+                os.unlink(tmp_path)
+                raise
 
-            if result.returncode != 0:
+            if process.returncode != 0:
                 logger.error("tts_curl_failed",
-                           returncode=result.returncode,
-                           stderr=result.stderr[:200] if result.stderr else "")
+                           returncode=process.returncode,
+                           stderr=stderr.decode(errors="replace")[:200] if stderr else "")
                 return b""
 
             # Read the audio file
@@ -21,7 +21,7 @@ import time
 import asyncio
 import hashlib
 import random
-from typing import Optional, Dict, Any, Callable, List
+from typing import Optional, Dict, Any, AsyncIterator, Callable, List
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import timedelta
@@ -32,6 +32,12 @@ import structlog
 import httpx
 import numpy as np
 
+from gateway.audio_buffer import MAX_UTTERANCE_SECONDS, SAMPLE_WIDTH, PCMRingBuffer
+from gateway.streaming_stt import STREAMING_STT_ENABLED, STT_ENDPOINT_SILENCE_MS, StreamingSTTError
+from gateway.tts_pipeline import iter_sentences, observe_time_to_first_audio, synthesize_ahead
+from gateway.vad import VAD_ENDPOINT_SILENCE_MS, VoiceActivityDetector
+from gateway.wake_word_worker import SharedModelBackend, WakeWordInferenceWorker
+
 # LiveKit imports
 try:
     from livekit import api, rtc
@@ -93,6 +99,10 @@ async def fetch_livekit_credentials() -> Dict[str, str]:
 SAMPLE_RATE = 16000  # 16kHz for speech
 CHANNELS = 1  # Mono
 CHUNK_DURATION_MS = 100  # 100ms audio chunks
+WAKE_WORD_CHUNK_BYTES = 1280 * 2  # 80ms: OpenWakeWord's streaming frame size
+# Audio kept ahead of the VAD's speech run when an utterance starts without a
+# wake word: soft onsets scored as noise, or speech during room calibration
+SPEECH_PREROLL_MS = 200
 
 # AI-initiated follow-up settings (Phase 2)
 FOLLOW_UP_SILENCE_THRESHOLD_MS = 3000  # 3 seconds of silence before follow-up
@@ -130,9 +140,20 @@ class LiveKitSession:
     participant_id: str
     state: SessionState = SessionState.IDLE
 
-    # Audio buffers
-    audio_buffer: bytes = b""
-    wake_word_buffer: bytes = b""
+    # Captured audio: one preallocated ring read by wake word (tail), VAD
+    # (per frame) and STT (since query_start)
+    audio: PCMRingBuffer = field(
+        default_factory=lambda: PCMRingBuffer.for_duration(MAX_UTTERANCE_SECONDS + 1)
+    )
+    query_start: int = 0  # ring position where the current utterance begins
+    wake_start: int = 0  # ring position of audio not yet scored for the wake word
+
+    # Voice activity (noise floor shared by sessions in the same room)
+    vad: VoiceActivityDetector = field(default_factory=VoiceActivityDetector)
+
+    # Streaming STT (fed while the user speaks)
+    transcriber: Optional[Any] = None
+    partial_transcript: str = ""
 
     # Timing
     created_at: float = field(default_factory=time.time)
@@ -158,6 +179,17 @@ class LiveKitSession:
     on_transcription: Optional[Callable] = None
     on_response: Optional[Callable] = None
 
+    @property
+    def audio_buffer(self) -> memoryview:
+        """Current utterance audio (zero-copy view, valid until the next frame)."""
+        return self.audio.since(self.query_start)
+
+    def start_utterance_at_speech(self):
+        """Begin the utterance where the VAD's current speech run started (plus pre-roll)."""
+        lead_ms = self.vad.speech_ms + SPEECH_PREROLL_MS
+        lead = int(lead_ms * SAMPLE_RATE / 1000) * SAMPLE_WIDTH
+        self.query_start = max(self.audio.position - len(self.audio), self.audio.position - lead)
+
 
 class LiveKitService:
     """
@@ -178,7 +210,8 @@ class LiveKitService:
         api_secret: str = LIVEKIT_API_SECRET,
         wake_word_detector: Optional[Any] = None,
         stt_client: Optional[Any] = None,
-        tts_client: Optional[Any] = None
+        tts_client: Optional[Any] = None,
+        wake_word_worker: Optional[WakeWordInferenceWorker] = None
     ):
         self.livekit_url = livekit_url
         self.api_key = api_key
@@ -188,6 +221,11 @@ class LiveKitService:
         # External clients
         self.wake_word_detector = wake_word_detector
         self.stt_client = stt_client
+
+        # Wake word inference runs off the event loop, batched across rooms
+        if wake_word_worker is None and wake_word_detector is not None:
+            wake_word_worker = WakeWordInferenceWorker(SharedModelBackend(wake_word_detector))
+        self.wake_word_worker = wake_word_worker
         self.tts_client = tts_client
 
         # Active sessions
@@ -198,11 +236,14 @@ class LiveKitService:
 
         # Callbacks for events
         self._on_query_ready: Optional[Callable] = None
+        self._on_query_stream: Optional[Callable] = None  # yields response sentences
         self._on_session_start: Optional[Callable] = None
         self._on_session_end: Optional[Callable] = None
+        self._on_partial_transcript: Optional[Callable] = None
 
         # Settings
-        self.silence_timeout_ms = 2000  # End listening after 2s silence
+        self.silence_timeout_ms = VAD_ENDPOINT_SILENCE_MS  # End listening after 2s silence
+        self.stt_endpoint_silence_ms = STT_ENDPOINT_SILENCE_MS  # ...or sooner once the partial is stable
         self.max_query_duration_ms = 30000  # Max 30s query
         self.wake_word_buffer_ms = 3000  # Keep 3s of audio for wake word detection
 
@@ -466,7 +507,11 @@ class LiveKitService:
         session = LiveKitSession(
             session_id=session_id,
             room_name=room_name,
-            participant_id=participant_id
+            participant_id=participant_id,
+            audio=PCMRingBuffer.for_duration(
+                max(self.max_query_duration_ms, self.wake_word_buffer_ms) / 1000 + 1
+            ),
+            vad=VoiceActivityDetector.for_room(room_name)
         )
         self._sessions[session_id] = session
 
@@ -478,11 +523,15 @@ class LiveKitService:
         # Configure audio stream for 16kHz mono (optimal for Whisper STT)
         audio_stream = rtc.AudioStream(track, sample_rate=16000, num_channels=1)
 
-        silence_start = None
-
         async for frame_event in audio_stream:
-            # Extract raw PCM bytes from AudioFrameEvent -> AudioFrame -> data (memoryview)
-            audio_data = bytes(frame_event.frame.data.cast("B"))
+            # Raw PCM from AudioFrameEvent -> AudioFrame -> data (memoryview, not copied)
+            audio_data = frame_event.frame.data.cast("B")
+
+            # One VAD pass per frame, in every state, so the noise floor keeps tracking
+            # the room (frozen while our TTS plays, so the echo cannot raise it)
+            voice = session.vad.process(
+                audio_data, adapt_noise_floor=session.state != SessionState.RESPONDING
+            )
 
             if session.state == SessionState.IDLE:
                 # Periodically refresh feature flags
@@ -495,35 +544,35 @@ class LiveKitService:
                     continue
 
                 # If no wake word detector, start listening immediately when speech detected
-                if not self.wake_word_detector:
+                if not self.wake_word_worker:
+                    # Keep idle audio too: speech is only reported after the VAD onset
+                    session.audio.write(audio_data)
+
                     # Check if user started speaking (not silence)
-                    if not self._is_silence(audio_data):
+                    if voice.is_speech:
                         logger.info("speech_detected_starting_listen",
                                    session_id=session_id,
                                    mode="no_wake_word")
                         session.state = SessionState.LISTENING
                         session.wake_word_detected_at = time.time()
-                        session.audio_buffer = audio_data  # Include this frame
+                        session.start_utterance_at_speech()
+                        await self._start_transcriber(session)
 
                         # Notify listeners
                         if self._on_session_start:
                             await self._on_session_start(session)
                 else:
-                    # Accumulate audio for wake word detection
-                    session.wake_word_buffer += audio_data
-
-                    # Keep only last N seconds
-                    max_buffer_size = int(SAMPLE_RATE * CHANNELS * 2 *
-                                         (self.wake_word_buffer_ms / 1000))
-                    if len(session.wake_word_buffer) > max_buffer_size:
-                        session.wake_word_buffer = session.wake_word_buffer[-max_buffer_size:]
+                    # Accumulate audio for wake word detection (ring keeps the last N seconds)
+                    session.audio.write(audio_data)
 
                     # Check for wake word
-                    if await self._detect_wake_word(session.wake_word_buffer):
+                    if await self._scan_for_wake_word(session):
                         logger.info("wake_word_detected", session_id=session_id)
                         session.state = SessionState.LISTENING
                         session.wake_word_detected_at = time.time()
-                        session.audio_buffer = b""
+                        session.query_start = session.wake_start = session.audio.mark()
+                        session.vad.reset()  # count silence from the wake word
+                        await self._start_transcriber(session)
 
                         # Notify listeners
                         if self._on_session_start:
@@ -531,26 +580,32 @@ class LiveKitService:
 
             elif session.state == SessionState.LISTENING:
                 # Capture query audio
-                session.audio_buffer += audio_data
+                session.audio.write(audio_data)
                 session.last_activity = time.time()
-
-                # Check for silence (voice activity detection)
-                if self._is_silence(audio_data):
-                    if silence_start is None:
-                        silence_start = time.time()
-                    elif (time.time() - silence_start) * 1000 > self.silence_timeout_ms:
+                if session.transcriber:
+                    session.transcriber.feed(audio_data)
+
+                # Check for silence (past the VAD hangover)
+                if not voice.is_speech:
+                    silence_ms = session.vad.silence_ms
+                    # Transcript stopped changing across the pause: finalize early
+                    early_endpoint = (
+                        session.transcriber is not None
+                        and session.transcriber.stable
+                        and silence_ms > self.stt_endpoint_silence_ms
+                    )
+                    if early_endpoint or silence_ms > self.silence_timeout_ms:
                         # End of query - send to STT
                         session.state = SessionState.PROCESSING
                         logger.info("query_complete",
                                    session_id=session_id,
-                                   duration_ms=int((time.time() - session.wake_word_detected_at) * 1000))
+                                   duration_ms=int((time.time() - session.wake_word_detected_at) * 1000),
+                                   early_endpoint=early_endpoint)
 
                         # Process the captured audio
                         asyncio.create_task(
                             self._process_query(session)
                         )
-                else:
-                    silence_start = None
 
                 # Check for max duration
                 if session.wake_word_detected_at:
@@ -560,8 +615,11 @@ class LiveKitService:
                         asyncio.create_task(self._process_query(session))
 
             elif session.state == SessionState.RESPONDING:
+                # Keep the audio: a barge-in starts before the VAD reports it
+                session.audio.write(audio_data)
+
                 # Check for interruption (user speaking during response)
-                if not self._is_silence(audio_data):
+                if voice.is_speech:
                     # Detect immediate stop commands
                     is_stop_command = await self._detect_stop_command(audio_data)
 
@@ -584,26 +642,82 @@ class LiveKitService:
                     else:
                         # Go back to listening for the new query
                         session.state = SessionState.LISTENING
-                        session.audio_buffer = audio_data  # Include this frame
+                        session.start_utterance_at_speech()
                         session.wake_word_detected_at = time.time()
+                        await self._start_transcriber(session)
+
+    async def _start_transcriber(self, session: LiveKitSession):
+        """Open a streaming STT session for the utterance (batch STT if unavailable)."""
+        if session.transcriber:
+            await session.transcriber.abort()
+            session.transcriber = None
+        session.partial_transcript = ""
+
+        open_stream = getattr(self.stt_client, "open_stream", None)
+        if not STREAMING_STT_ENABLED or open_stream is None:
+            return
+
+        async def on_partial(text: str, stable: bool):
+            session.partial_transcript = text
+            if self._on_partial_transcript:
+                await self._on_partial_transcript(session, text, stable)
 
-    async def _detect_wake_word(self, audio_buffer: bytes) -> bool:
+        try:
+            session.transcriber = await open_stream(on_partial)
+        except StreamingSTTError as e:
+            logger.warning("streaming_stt_unavailable",
+                          session_id=session.session_id,
+                          error=str(e))
+            return
+        if session.audio_buffer:
+            session.transcriber.feed(session.audio_buffer)
+
+    async def _transcribe(self, session: LiveKitSession) -> str:
+        """Final transcript: finalize the streaming session, else upload the buffered audio."""
+        transcriber, session.transcriber = session.transcriber, None
+        if transcriber:
+            try:
+                return await transcriber.finalize()
+            except StreamingSTTError as e:
+                logger.warning("streaming_stt_failed",
+                              session_id=session.session_id,
+                              error=str(e))
+
+        if self.stt_client:
+            return await self.stt_client.transcribe(session.audio_buffer)
+        # Fallback for testing
+        return "[Audio captured but STT not configured]"
+
+    async def _scan_for_wake_word(self, session: LiveKitSession) -> bool:
+        """Score audio written since the last scan, one 80ms chunk at a time."""
+        ring = session.audio
+        session.wake_start = max(session.wake_start, ring.position - len(ring))
+        while ring.position - session.wake_start >= WAKE_WORD_CHUNK_BYTES:
+            chunk = ring.since(session.wake_start)[:WAKE_WORD_CHUNK_BYTES]
+            session.wake_start += WAKE_WORD_CHUNK_BYTES
+            if await self._detect_wake_word(session.session_id, chunk):
+                # Fresh model state for the next wake word
+                self.wake_word_worker.remove_stream(session.session_id)
+                return True
+        return False
+
+    async def _detect_wake_word(self, stream_id: str, audio_chunk: memoryview) -> bool:
         """
-        Detect wake word in audio buffer.
+        Detect wake word in an audio chunk.
 
-        Uses OpenWakeWord or similar for detection.
+        Uses OpenWakeWord or similar for detection, via the shared inference
+        worker so the model never runs on the event loop.
         """
-        if not self.wake_word_detector:
+        if not self.wake_word_worker:
             # No detector configured - use simple trigger for testing
             return False
 
         try:
-            # Convert bytes to numpy array for processing
-            import numpy as np
-            audio_array = np.frombuffer(audio_buffer, dtype=np.int16)
+            # Copy: the worker thread must not read the ring the event loop writes to
+            audio_array = np.frombuffer(audio_chunk, dtype=np.int16).copy()
 
             # Run wake word detection
-            predictions = self.wake_word_detector.predict(audio_array)
+            predictions = await self.wake_word_worker.predict(stream_id, audio_array)
 
             # Check for "jarvis" or "athena" wake words
             for wake_word, confidence in predictions.items():
@@ -619,41 +733,42 @@ class LiveKitService:
             logger.warning("wake_word_detection_error", error=str(e))
             return False
 
-    def _is_silence(self, audio_data: bytes, threshold: int = 2000) -> bool:
-        """
-        Check if audio frame is silence (below threshold).
-
-        Simple energy-based VAD.
-        """
-        try:
-            import numpy as np
-            samples = np.frombuffer(audio_data, dtype=np.int16)
-            energy = np.sqrt(np.mean(samples.astype(np.float32) ** 2))
-            return energy < threshold
-        except:
-            return True
-
     async def _process_query(self, session: LiveKitSession):
         """
         Process captured audio query through STT and orchestrator.
         """
         try:
             # Transcribe audio
-            if self.stt_client:
-                transcript = await self.stt_client.transcribe(session.audio_buffer)
-            else:
-                # Fallback for testing
-                transcript = "[Audio captured but STT not configured]"
+            stt_start = time.time()
+            streaming = session.transcriber is not None
+            transcript = await self._transcribe(session)
 
             # Store query for interruption context
             session.last_query = transcript
 
             logger.info("query_transcribed",
                        session_id=session.session_id,
-                       transcript=transcript[:50])
+                       transcript=transcript[:50],
+                       stt_duration_ms=int((time.time() - stt_start) * 1000),
+                       streaming=streaming)
+
+            # Stream the response: sentence N plays while N+1 is synthesized
+            if self._on_query_stream:
+                query_started_at = time.time()
+                sentences = self._on_query_stream(
+                    session_id=session.session_id,
+                    transcript=transcript,
+                    interface="livekit",
+                    room=session.room,
+                    interruption_context=self._get_interruption_context_dict(session)
+                )
+                session.interruption_context = None
+                session.state = SessionState.RESPONDING
+                await self._play_tts_sentences(session, sentences, query_started_at, mode="streaming")
 
             # Notify that query is ready
-            if self._on_query_ready:
+            elif self._on_query_ready:
+                query_started_at = time.time()
                 response = await self._on_query_ready(
                     session_id=session.session_id,
                     transcript=transcript,
@@ -668,11 +783,11 @@ class LiveKitService:
                 # Play TTS response
                 if response:
                     session.state = SessionState.RESPONDING
-                    await self._play_tts_response(session, response)
+                    await self._play_tts_sentences(session, iter_sentences(response), query_started_at, mode="full")
 
             # Return to idle state
             session.state = SessionState.IDLE
-            session.audio_buffer = b""
+            session.query_start = session.wake_start = session.audio.mark()
 
         except Exception as e:
             logger.error("query_processing_error",
@@ -736,27 +851,51 @@ class LiveKitService:
         # Return to listening for their response
         session.state = SessionState.LISTENING
         session.wake_word_detected_at = time.time()
+        session.vad.reset()
         return True
 
     async def _play_tts_response(self, session: LiveKitSession, text: str):
         """
         Synthesize and play TTS response to the room with interruption support.
         """
-        if not self.tts_client:
-            logger.warning("tts_not_configured")
-            return
+        await self._play_tts_sentences(session, iter_sentences(text))
 
-        try:
-            room = self._rooms.get(session.room_name)
-            if not room:
-                return
+    async def _play_tts_sentences(
+        self,
+        session: LiveKitSession,
+        sentences: AsyncIterator[str],
+        started_at: Optional[float] = None,
+        mode: Optional[str] = None
+    ):
+        """
+        Play response sentences as they arrive, synthesizing the next sentence
+        while the current one plays.
 
-            # Generate TTS audio
-            audio_data = await self.tts_client.synthesize(text)
+        Barge-in is checked before every audio chunk; stopping also cancels
+        the pending synthesis and the orchestrator stream. If ``mode`` is given,
+        time from ``started_at`` to the first audio frame is recorded as
+        time-to-first-audio.
+        """
+        room = self._rooms.get(session.room_name)
+        if not self.tts_client or not room:
+            if not self.tts_client:
+                logger.warning("tts_not_configured")
+            # Nothing will consume the sentences: release the orchestrator stream
+            aclose = getattr(sentences, "aclose", None)
+            if aclose:
+                await aclose()
+            return
+
+        started_at = started_at or time.time()
+        spoken: List[str] = []
+        first_audio_at: Optional[float] = None
+        track = None
+        audio = synthesize_ahead(sentences, self.tts_client.synthesize)
 
+        try:
             # Store current response for interruption context
             session.interruption_context = InterruptionContext(
-                interrupted_response=text,
+                interrupted_response="",
                 previous_query=session.last_query or ""
             )
             session.tts_playback_active = True
@@ -775,41 +914,65 @@ class LiveKitService:
             # Stream audio frames with position tracking
             chunk_size = int(SAMPLE_RATE * CHANNELS * 2 * (CHUNK_DURATION_MS / 1000))
             chunk_duration_ms = CHUNK_DURATION_MS
-            total_chunks = len(audio_data) // chunk_size
-
-            for i in range(0, len(audio_data), chunk_size):
-                # Check for interruption BEFORE each chunk
-                if session.state == SessionState.INTERRUPTED or not session.tts_playback_active:
+            interrupted = False
+
+            async for sentence, audio_data in audio:
+                spoken.append(sentence)
+                if session.interruption_context:
+                    session.interruption_context.interrupted_response = " ".join(spoken)
+
+                for i in range(0, len(audio_data), chunk_size):
+                    # Check for interruption BEFORE each chunk
+                    if session.state == SessionState.INTERRUPTED or not session.tts_playback_active:
+                        interrupted = True
+                        break
+
+                    chunk = audio_data[i:i + chunk_size]
+                    frame = rtc.AudioFrame(
+                        data=chunk,
+                        sample_rate=SAMPLE_RATE,
+                        num_channels=CHANNELS,
+                        samples_per_channel=len(chunk) // (CHANNELS * 2)
+                    )
+                    await source.capture_frame(frame)
+                    if first_audio_at is None:
+                        first_audio_at = time.time()
+                        if mode:
+                            observe_time_to_first_audio("livekit", mode, first_audio_at - started_at)
+                    session.tts_audio_position_ms += chunk_duration_ms
+
+                if interrupted or session.state == SessionState.INTERRUPTED or not session.tts_playback_active:
                     if session.interruption_context:
                         session.interruption_context.audio_position_ms = session.tts_audio_position_ms
                     logger.info("tts_interrupted",
                                session_id=session.session_id,
                                position_ms=session.tts_audio_position_ms,
-                               total_chunks=total_chunks)
+                               sentences_played=len(spoken))
                     break
 
-                chunk = audio_data[i:i + chunk_size]
-                frame = rtc.AudioFrame(
-                    data=chunk,
-                    sample_rate=SAMPLE_RATE,
-                    num_channels=CHANNELS,
-                    samples_per_channel=len(chunk) // (CHANNELS * 2)
-                )
-                await source.capture_frame(frame)
-                session.tts_audio_position_ms += chunk_duration_ms
-
-            # Unpublish track
-            await room.local_participant.unpublish_track(track)
-            if hasattr(room, '_tts_track'):
-                delattr(room, '_tts_track')
-
-            session.tts_playback_active = False
             session.last_response_time = time.time()  # Track when response completed for follow-ups
+            logger.info("tts_playback_complete",
+                       session_id=session.session_id,
+                       sentences=len(spoken),
+                       mode=mode,
+                       time_to_first_audio_ms=int((first_audio_at - started_at) * 1000) if first_audio_at else None)
 
         except Exception as e:
             logger.error("tts_playback_error", error=str(e))
+
+        finally:
+            # Stops the synthesis prefetch and the orchestrator stream
+            await audio.aclose()
             session.tts_playback_active = False
 
+            # Unpublish track
+            if track is not None and hasattr(room, '_tts_track'):
+                try:
+                    await room.local_participant.unpublish_track(track)
+                except Exception as e:
+                    logger.debug("tts_unpublish_error", error=str(e))
+                delattr(room, '_tts_track')
+
     async def _stop_tts_playback(self, session: LiveKitSession):
         """Stop current TTS playback for interruption handling."""
         # Mark playback as inactive - the playback loop will stop on next chunk
@@ -902,6 +1065,11 @@ class LiveKitService:
 
         for sid in sessions_to_remove:
             session = self._sessions.pop(sid, None)
+            if session and session.transcriber:
+                await session.transcriber.abort()
+                session.transcriber = None
+            if session and self.wake_word_worker:
+                self.wake_word_worker.remove_stream(session.session_id)
             if session and self._on_session_end:
                 await self._on_session_end(session)
 
@@ -916,14 +1084,28 @@ class LiveKitService:
         """Set callback for when query is ready for processing."""
         self._on_query_ready = handler
 
+    def set_query_stream_handler(self, handler: Optional[Callable]):
+        """
+        Set callback returning an async iterator of response sentences.
+
+        Takes precedence over the query handler so TTS starts on the first sentence.
+        """
+        self._on_query_stream = handler
+
     def set_session_handlers(
         self,
         on_start: Optional[Callable] = None,
-        on_end: Optional[Callable] = None
+        on_end: Optional[Callable] = None,
+        on_partial: Optional[Callable] = None
     ):
-        """Set callbacks for session lifecycle events."""
+        """
+        Set callbacks for session lifecycle events.
+
+        on_partial(session, text, stable) receives streaming STT partials.
+        """
         self._on_session_start = on_start
         self._on_session_end = on_end
+        self._on_partial_transcript = on_partial
 
     async def get_active_sessions(self) -> List[Dict[str, Any]]:
         """Get list of active LiveKit sessions."""
@@ -945,6 +1127,8 @@ class LiveKitService:
 
         self._sessions.clear()
         self._rooms.clear()
+        if self.wake_word_worker:
+            await self.wake_word_worker.stop()
         logger.info("livekit_service_shutdown")
 
 
@@ -963,14 +1147,16 @@ def get_livekit_service() -> LiveKitService:
 async def initialize_livekit_service(
     wake_word_detector: Optional[Any] = None,
     stt_client: Optional[Any] = None,
-    tts_client: Optional[Any] = None
+    tts_client: Optional[Any] = None,
+    wake_word_worker: Optional[WakeWordInferenceWorker] = None
 ) -> LiveKitService:
     """Initialize LiveKit service with required clients."""
     global _livekit_service
     _livekit_service = LiveKitService(
         wake_word_detector=wake_word_detector,
         stt_client=stt_client,
-        tts_client=tts_client
+        tts_client=tts_client,
+        wake_word_worker=wake_word_worker
     )
     # Load credentials from admin API
     await _livekit_service.load_credentials()
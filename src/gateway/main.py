@@ -14,7 +14,7 @@ import subprocess
 import signal
 from datetime import datetime, timezone
 from typing import AsyncIterator, Dict, Any, List, Optional, Union
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 
 import httpx
 from fastapi import FastAPI, HTTPException, Request, Depends
@@ -30,6 +30,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from shared.logging_config import configure_logging
 from shared.ollama_client import OllamaClient
 from shared.admin_config import get_admin_client
+from shared.feature_flags import get_flag_store
+from shared.metric_batcher import MetricBatcher
+from shared.metrics import record_latency, setup_quantiles_endpoint
 from shared.tracing import RequestTracingMiddleware, get_tracing_headers
 from shared.errors import (
     register_exception_handlers,
@@ -74,6 +77,18 @@ request_duration = Histogram(
     ['endpoint']
 )
 
+
+@contextmanager
+def _time_request(endpoint: str):
+    """Time a block into request_duration and the gateway.<endpoint> latency sketch."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        request_duration.labels(endpoint=endpoint).observe(elapsed)
+        record_latency(f"gateway.{endpoint}", elapsed * 1000)
+
 # Voice pipeline timing metrics (for Prometheus/Grafana monitoring)
 stt_duration = Histogram(
     'athena_stt_duration_seconds',
@@ -99,6 +114,8 @@ voice_pipeline_duration = Histogram(
     ['interface'],
     buckets=[1.0, 2.0, 3.0, 4.0, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0]
 )
+# Time-to-first-audio and wake word worker metrics live in shared.metrics
+# (VOICE_TIME_TO_FIRST_AUDIO, WAKE_WORD_*) so gateway modules can record them
 
 # Counter for voice pipeline steps
 voice_step_counter = Counter(
@@ -113,6 +130,7 @@ ollama_client: Optional[OllamaClient] = None
 device_session_mgr: Optional[DeviceSessionManager] = None
 admin_client = None  # Admin API client for configuration
 metric_client: Optional[httpx.AsyncClient] = None  # Shared client for metric logging
+metric_batcher: Optional[MetricBatcher] = None  # Background batched metric shipping
 ha_client: Optional[httpx.AsyncClient] = None  # Shared client for Home Assistant API
 
 # Gateway configuration (loaded from database)
@@ -129,11 +147,6 @@ OLLAMA_URL = os.getenv("LLM_SERVICE_URL") or os.getenv("OLLAMA_URL", "http://loc
 API_KEY = os.getenv("GATEWAY_API_KEY", "dummy-key")  # Optional for Phase 1
 ADMIN_API_URL = os.getenv("ADMIN_API_URL", "http://localhost:8080")
 
-# Feature flag cache - per-flag caching with TTL
-# Structure: {flag_name: (timestamp, value)}
-_feature_flag_cache: Dict[str, tuple] = {}
-_feature_flag_cache_ttl = 60.0  # seconds
-
 # General cache TTL (used by LLM backends cache)
 _cache_ttl = 60  # 60 seconds
 
@@ -224,7 +237,7 @@ async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
     global orchestrator_client, ollama_client, device_session_mgr, admin_client, gateway_config
     global orchestrator_circuit_breaker, global_rate_limiter
-    global metric_client, ha_client
+    global metric_client, metric_batcher, ha_client
 
     # Kill any existing process on gateway port before starting
     gateway_port = int(os.getenv("GATEWAY_PORT", "8000"))
@@ -235,6 +248,7 @@ async def lifespan(app: FastAPI):
 
     # Initialize shared HTTP clients for reuse (performance optimization)
     metric_client = httpx.AsyncClient(timeout=5.0)  # For metric logging
+    metric_batcher = MetricBatcher(f"{ADMIN_API_URL}/api/llm-backends/metrics/batch", client=metric_client)
     ha_client = httpx.AsyncClient(timeout=3.0, verify=False)  # For HA API calls
     logger.info("Shared HTTP clients initialized (metric_client, ha_client)")
 
@@ -373,6 +387,8 @@ async def lifespan(app: FastAPI):
         await ollama_client.close()
     if admin_client:
         await admin_client.close()
+    if metric_batcher:
+        await metric_batcher.close()
     if metric_client:
         await metric_client.aclose()
     if ha_client:
@@ -586,8 +602,7 @@ async def is_feature_enabled(feature_name: str) -> bool:
         True if feature is enabled, False otherwise
 
     Note:
-        Uses AdminConfigClient's built-in caching (60-second TTL).
-        Reuses the shared HTTP client instead of creating new connections.
+        Reads the in-process feature flag store.
         If Admin API is unavailable, returns False (safe default).
 
     Performance:
@@ -607,11 +622,10 @@ async def is_feature_enabled(feature_name: str) -> bool:
 
 async def get_feature_flag(flag_name: str, default: bool = False) -> bool:
     """
-    Get feature flag value with local caching.
+    Get feature flag value from the in-process flag store.
 
-    This function provides an additional layer of caching on top of
-    AdminConfigClient's caching, with support for instant cache invalidation
-    via the /admin/invalidate-feature-cache endpoint.
+    Flag changes are pushed by the admin backend via the
+    /admin/invalidate-feature-cache endpoint.
 
     Args:
         flag_name: Name of feature flag to check
@@ -620,35 +634,13 @@ async def get_feature_flag(flag_name: str, default: bool = False) -> bool:
     Returns:
         True if feature is enabled, False otherwise
     """
-    global _feature_flag_cache
-
-    # Check local cache first
-    if flag_name in _feature_flag_cache:
-        cached_time, cached_value = _feature_flag_cache[flag_name]
-        if time.time() - cached_time < _feature_flag_cache_ttl:
-            return cached_value
-
-    # Fetch from admin API
-    try:
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(
-                f"{ADMIN_API_URL}/api/features/public",
-                params={"name": flag_name}
-            )
-            if response.status_code == 200:
-                flags = response.json()
-                for flag in flags:
-                    if flag.get("name") == flag_name:
-                        value = flag.get("enabled", default)
-                        _feature_flag_cache[flag_name] = (time.time(), value)
-                        return value
-    except Exception as e:
-        logger.warning(f"Feature flag fetch failed for {flag_name}: {e}")
-
-    return default
+    store = get_flag_store()
+    if not store.loaded:
+        await store.ensure_loaded()
+    return store.is_enabled(flag_name, default)
 
 
-async def _log_metric_to_db(
+def _log_metric_to_db(
     timestamp: float,
     model: str,
     backend: str,
@@ -663,7 +655,7 @@ async def _log_metric_to_db(
     source: Optional[str] = None
 ):
     """
-    Log LLM performance metric to admin database (fire-and-forget).
+    Queue LLM performance metric for the admin database (non-blocking).
 
     Args:
         timestamp: Unix timestamp of request start
@@ -680,54 +672,31 @@ async def _log_metric_to_db(
         source: Optional source service (gateway, orchestrator, etc.)
 
     Note:
-        Failures are logged but don't raise exceptions to avoid
-        impacting the main LLM request flow.
+        Failures are counted by the batcher (see /debug/metric-shipping)
+        and never raise into the main LLM request flow.
 
     Performance:
-        Uses shared metric_client instead of creating new httpx.AsyncClient
-        for every metric write. Saves ~10-50ms per call (TCP/TLS overhead).
+        metric_batcher ships queued metrics to the admin bulk endpoint from
+        a background task, so the request path only does a queue put.
     """
-    try:
-        metric_payload = {
-            "timestamp": timestamp,
-            "model": model,
-            "backend": backend,
-            "latency_seconds": latency_seconds,
-            "tokens": tokens,
-            "tokens_per_second": tokens_per_second,
-            "request_id": request_id,
-            "session_id": session_id,
-            "user_id": user_id,
-            "zone": zone,
-            "intent": intent,
-            "source": source
-        }
-
-        url = f"{ADMIN_API_URL}/api/llm-backends/metrics"
-
-        # Use shared metric_client for connection reuse (performance optimization)
-        if metric_client:
-            response = await metric_client.post(url, json=metric_payload)
-        else:
-            # Fallback if client not initialized (shouldn't happen normally)
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.post(url, json=metric_payload)
-
-        if response.status_code == 201:
-            logger.info(
-                "metric_logged_to_db",
-                model=model,
-                backend=backend,
-                tokens_per_sec=round(tokens_per_second, 2)
-            )
-        else:
-            logger.warning(
-                "failed_to_log_metric",
-                status_code=response.status_code,
-                error=response.text[:200]
-            )
-    except Exception as e:
-        logger.error(f"Metric logging error: {e}", exc_info=False)
+    record_latency(f"llm.{source or 'gateway'}", latency_seconds * 1000, model)
+    if not metric_batcher:
+        return
+
+    metric_batcher.submit({
+        "timestamp": timestamp,
+        "model": model,
+        "backend": backend,
+        "latency_seconds": latency_seconds,
+        "tokens": tokens,
+        "tokens_per_second": tokens_per_second,
+        "request_id": request_id,
+        "session_id": session_id,
+        "user_id": user_id,
+        "zone": zone,
+        "intent": intent,
+        "source": source
+    })
 
 
 async def classify_intent_llm(query: str) -> bool:
@@ -1011,7 +980,7 @@ async def route_to_orchestrator(
                 user_message = msg.content
 
         # Call orchestrator with session support
-        with request_duration.labels(endpoint="orchestrator").time():
+        with _time_request("orchestrator"):
             payload = {
                 "query": user_message,
                 "mode": "owner",  # Default to owner mode
@@ -1099,7 +1068,7 @@ async def route_to_ollama(
         ]
 
         # Call Ollama
-        with request_duration.labels(endpoint="ollama").time():
+        with _time_request("ollama"):
             response_text = ""
             eval_count = 0
             async for chunk in ollama_client.chat(
@@ -1118,9 +1087,8 @@ async def route_to_ollama(
         tokens = eval_count or len(response_text.split())  # Fallback to word count
         tokens_per_second = tokens / latency_seconds if latency_seconds > 0 and tokens > 0 else 0
 
-        # Log metrics to database (fire-and-forget)
-        import asyncio
-        asyncio.create_task(_log_metric_to_db(
+        # Log metrics to database (batched in the background)
+        _log_metric_to_db(
             timestamp=start_time,
             model=ollama_model,
             backend="ollama",
@@ -1133,7 +1101,7 @@ async def route_to_ollama(
             zone=device_id,
             intent=None,
             source="gateway"
-        ))
+        )
 
         # Format as OpenAI response
         return ChatCompletionResponse(
@@ -1773,6 +1741,9 @@ async def metrics():
     return Response(content=generate_latest(), media_type="text/plain")
 
 
+setup_quantiles_endpoint(app, "gateway")
+
+
 @app.get("/config")
 async def get_config():
     """
@@ -1874,72 +1845,63 @@ async def refresh_config():
 
 
 @app.post("/admin/invalidate-feature-cache")
-async def invalidate_feature_cache(
-    request: Request,
-    flags: Optional[List[str]] = None
-):
+async def invalidate_feature_cache(request: Request):
     """
-    Invalidate feature flag cache. Called by Admin backend on flag changes.
+    Apply feature flag changes. Called by Admin backend on flag changes.
 
     This endpoint enables instant propagation of feature flag changes from
-    the Admin UI to the Gateway without waiting for cache TTL expiration.
+    the Admin UI to the Gateway: the pushed flag states are applied to the
+    in-process flag store (which is refetched when the body carries none).
 
     Args:
-        request: FastAPI request object
-        flags: Optional list of specific flag names to invalidate.
-               If None, invalidates all cached flags.
+        request: FastAPI request object; JSON body
+                 {"flags": [...], "changes": {name: {enabled, config}}, "etag": str}
 
     Returns:
-        dict with status and invalidated flags/count
+        dict with status and changed flags
     """
-    global _feature_flag_cache
-
     client_host = request.client.host if request.client else "unknown"
 
-    if flags:
-        # Invalidate specific flags
-        invalidated = []
-        for flag_name in flags:
-            if flag_name in _feature_flag_cache:
-                del _feature_flag_cache[flag_name]
-                invalidated.append(flag_name)
-        logger.info("feature_cache_invalidated", flags=invalidated, source=client_host)
-        return {"status": "ok", "invalidated": invalidated}
-    else:
-        # Invalidate all
-        count = len(_feature_flag_cache)
-        _feature_flag_cache.clear()
-        logger.info("feature_cache_cleared", count=count, source=client_host)
-        return {"status": "ok", "invalidated_count": count}
+    try:
+        payload = await request.json()
+    except ValueError:
+        payload = {}
+
+    await get_flag_store().handle_push(payload)
+
+    flags = payload.get("flags") if isinstance(payload, dict) else payload
+    logger.info("feature_cache_invalidated", flags=flags, source=client_host)
+    return {"status": "ok", "invalidated": flags or []}
 
 
 @app.get("/debug/feature-flags")
 async def debug_feature_flags():
     """
-    Debug endpoint to view current feature flag cache state.
+    Debug endpoint to view the in-process flag store.
 
     Returns:
-        dict with current cache state and TTL info
+        dict with store state and current flag values
     """
-    now = time.time()
-    flags_state = {}
-
-    for flag_name, (cached_time, value) in _feature_flag_cache.items():
-        age_seconds = now - cached_time
-        flags_state[flag_name] = {
-            "value": value,
-            "cached_at": cached_time,
-            "age_seconds": round(age_seconds, 2),
-            "expires_in_seconds": round(max(0, _feature_flag_cache_ttl - age_seconds), 2)
-        }
-
+    store = get_flag_store()
     return {
-        "cache_ttl_seconds": _feature_flag_cache_ttl,
-        "cached_flags": flags_state,
-        "total_cached": len(_feature_flag_cache)
+        **store.stats(),
+        "flags": {name: flag["enabled"] for name, flag in store.flags().items()},
     }
 
 
+@app.get("/debug/metric-shipping")
+async def debug_metric_shipping():
+    """
+    Debug endpoint to view batched LLM metric shipping.
+
+    Returns:
+        dict with queue depth and sent/dropped/failed counters
+    """
+    if not metric_batcher:
+        return {"enabled": False}
+    return {"enabled": True, **metric_batcher.stats()}
+
+
 @app.get("/v1/models")
 async def list_models():
     """List available models (OpenAI-compatible) - returns actual available LLM backends."""
@@ -2326,7 +2288,7 @@ async def ha_conversation(request: HAConversationRequest):
         )
 
         # Route to orchestrator with room (mapped from device) and session info
-        with request_duration.labels(endpoint="ha_conversation").time():
+        with _time_request("ha_conversation"):
             chat_response, orchestrator_session_id = await route_to_orchestrator(
                 request=chat_request,
                 device_id=room,  # Use mapped room name for audio routing
@@ -0,0 +1,267 @@
+"""
+Incremental (streaming) STT for the voice gateways.
+
+The batch path buffers the whole utterance and uploads one WAV after
+end-of-speech, so the full STT time is added after the user stops talking.
+In streaming mode audio is sent to the STT service in ~STT_CHUNK_MS chunks
+while the user speaks. The service decodes as it goes, so finalizing at
+end-of-speech only has to decode the last chunk.
+
+STT service protocol (HTTP, 16kHz mono int16 PCM):
+
+    POST   {stt_url}/stt/stream                   {"sample_rate", "language"} -> {"stream_id"}
+    POST   {stt_url}/stt/stream/{id}/audio        raw PCM body                -> {"partial"}
+    POST   {stt_url}/stt/stream/{id}/finalize                                 -> {"text"}
+    DELETE {stt_url}/stt/stream/{id}
+
+A partial that comes back unchanged STT_STABLE_PARTIALS times in a row is
+"stable": the user has most likely finished the phrase. Stable partials
+are used to end the utterance early (LiveKit) and to start speculative
+intent classification in the orchestrator (preclassify).
+
+Any streaming failure raises StreamingSTTError from finalize(); callers
+fall back to the batch upload of their buffered audio.
+"""
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+# Send audio to the STT service while the user is speaking
+STREAMING_STT_ENABLED = os.getenv("STREAMING_STT_ENABLED", "false").lower() == "true"
+
+# Audio per request to the STT service
+STT_CHUNK_MS = int(os.getenv("STT_CHUNK_MS", "320"))
+
+# Identical partials in a row before a partial counts as stable
+STT_STABLE_PARTIALS = int(os.getenv("STT_STABLE_PARTIALS", "2"))
+
+# Silence that ends an utterance once its partial is stable (vs. the full silence timeout)
+STT_ENDPOINT_SILENCE_MS = int(os.getenv("STT_ENDPOINT_SILENCE_MS", "500"))
+
+# Speculatively classify stable partials in the orchestrator
+STT_PRECLASSIFY_ENABLED = os.getenv("STT_PRECLASSIFY_ENABLED", "true").lower() == "true"
+PRECLASSIFY_MIN_WORDS = 2
+
+PartialCallback = Callable[[str, bool], Awaitable[None]]
+
+
+class StreamingSTTError(Exception):
+    """The streaming STT session failed; use the batch upload instead."""
+
+
+class StreamingTranscriber:
+    """
+    One streaming STT session (one utterance).
+
+    Usage:
+        transcriber = StreamingTranscriber(stt_url, on_partial=handle_partial)
+        await transcriber.start()
+        transcriber.feed(pcm)            # per audio frame, never blocks
+        text = await transcriber.finalize()   # at end-of-speech
+
+    Args:
+        stt_url: STT service base URL
+        on_partial: Called with (text, stable) for each new partial and once
+            more with stable=True when a partial stabilizes. Runs as a
+            background task so it never delays audio upload.
+        client: HTTP client to use (one is created and closed if omitted)
+        sample_rate: PCM sample rate
+        chunk_ms: Audio per upload request (STT_CHUNK_MS)
+        stable_partials: Repeats before a partial is stable (STT_STABLE_PARTIALS)
+    """
+
+    def __init__(
+        self,
+        stt_url: str,
+        on_partial: Optional[PartialCallback] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        sample_rate: int = 16000,
+        chunk_ms: Optional[int] = None,
+        stable_partials: Optional[int] = None,
+        language: str = "en"
+    ):
+        self.stt_url = stt_url.rstrip("/")
+        self.on_partial = on_partial
+        self.sample_rate = sample_rate
+        self.language = language
+        self.chunk_bytes = sample_rate * 2 * (chunk_ms or STT_CHUNK_MS) // 1000
+        self.stable_partials = max(1, stable_partials or STT_STABLE_PARTIALS)
+
+        self._client = client
+        self._owns_client = client is None
+        self._stream_id: Optional[str] = None
+        self._pending = bytearray()
+        self._audio_ready = asyncio.Event()
+        self._closing = False
+        self._sender: Optional[asyncio.Task] = None
+        self._callbacks: Set[asyncio.Task] = set()
+        self._error: Optional[Exception] = None
+
+        self.partial = ""
+        self.audio_bytes_sent = 0
+        self._repeats = 0
+        self._last_stable: Optional[str] = None
+
+    @property
+    def stable(self) -> bool:
+        """Whether the current partial has stopped changing."""
+        return bool(self.partial) and self._repeats >= self.stable_partials
+
+    async def start(self):
+        """Open the STT stream (raises StreamingSTTError on failure)."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=10.0)
+        try:
+            response = await self._client.post(
+                f"{self.stt_url}/stt/stream",
+                json={"sample_rate": self.sample_rate, "language": self.language}
+            )
+            response.raise_for_status()
+            self._stream_id = response.json()["stream_id"]
+        except Exception as e:
+            await self._close_client()
+            raise StreamingSTTError(f"stream open failed: {e}") from e
+        self._sender = asyncio.create_task(self._send_loop())
+
+    def feed(self, audio: bytes):
+        """Queue PCM for upload."""
+        if self._closing or self._error:
+            return
+        self._pending.extend(audio)
+        if len(self._pending) >= self.chunk_bytes:
+            self._audio_ready.set()
+
+    async def finalize(self) -> str:
+        """Flush remaining audio and return the final transcript."""
+        self._closing = True
+        self._audio_ready.set()
+        try:
+            if self._sender:
+                await self._sender
+            if self._error:
+                raise StreamingSTTError(str(self._error)) from self._error
+            response = await self._client.post(f"{self.stt_url}/stt/stream/{self._stream_id}/finalize")
+            response.raise_for_status()
+            return (response.json().get("text") or "").strip()
+        except StreamingSTTError:
+            raise
+        except Exception as e:
+            raise StreamingSTTError(f"finalize failed: {e}") from e
+        finally:
+            await self._close_client()
+
+    async def abort(self):
+        """Drop the stream (barge-in, session end)."""
+        self._closing = True
+        if self._sender:
+            self._sender.cancel()
+            try:
+                await self._sender
+            except (asyncio.CancelledError, Exception):
+                pass
+        for task in self._callbacks:
+            task.cancel()
+        if self._stream_id and self._client is not None:
+            try:
+                await self._client.delete(f"{self.stt_url}/stt/stream/{self._stream_id}")
+            except Exception:
+                pass
+        await self._close_client()
+
+    async def _send_loop(self):
+        while True:
+            await self._audio_ready.wait()
+            self._audio_ready.clear()
+            if self._pending:
+                audio = bytes(self._pending)
+                self._pending.clear()
+                try:
+                    response = await self._client.post(
+                        f"{self.stt_url}/stt/stream/{self._stream_id}/audio",
+                        content=audio,
+                        headers={"content-type": "application/octet-stream"}
+                    )
+                    response.raise_for_status()
+                except Exception as e:
+                    self._error = e
+                    logger.warning("streaming_stt_upload_failed",
+                                  stream_id=self._stream_id,
+                                  error=str(e))
+                    return
+                self.audio_bytes_sent += len(audio)
+                self._update_partial((response.json().get("partial") or "").strip())
+            if self._closing and not self._pending:
+                return
+            # Audio that arrived during the upload; once closing, the tail
+            # goes up whatever its size
+            if self._closing or len(self._pending) >= self.chunk_bytes:
+                self._audio_ready.set()
+
+    def _update_partial(self, text: str):
+        if text != self.partial:
+            self.partial = text
+            self._repeats = 1
+            self._notify(text, False)
+        else:
+            self._repeats += 1
+        if self.stable and text != self._last_stable:
+            self._last_stable = text
+            self._notify(text, True)
+
+    def _notify(self, text: str, stable: bool):
+        if not self.on_partial or not text:
+            return
+        task = asyncio.create_task(self.on_partial(text, stable))
+        self._callbacks.add(task)
+        task.add_done_callback(self._callbacks.discard)
+
+    async def _close_client(self):
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+async def preclassify(
+    orchestrator_url: str,
+    text: str,
+    session_id: Optional[str] = None,
+    room: str = "unknown",
+    client: Optional[httpx.AsyncClient] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Ask the orchestrator to classify a stable partial ahead of the final transcript.
+
+    Warms the orchestrator's intent cache; returns its reply, or None if
+    skipped or failed. Never raises.
+    """
+    if not STT_PRECLASSIFY_ENABLED or len(text.split()) < PRECLASSIFY_MIN_WORDS:
+        return None
+    request_data = {
+        "query": text,
+        "mode": "owner",
+        "room": room,
+        "session_id": session_id,
+        "interface_type": "voice",
+    }
+    try:
+        if client is not None:
+            response = await client.post(f"{orchestrator_url}/query/preclassify", json=request_data)
+        else:
+            async with httpx.AsyncClient(timeout=10.0) as http:
+                response = await http.post(f"{orchestrator_url}/query/preclassify", json=request_data)
+        response.raise_for_status()
+        result = response.json()
+        logger.debug("stt_partial_preclassified",
+                    session_id=session_id,
+                    partial=text[:50],
+                    intent=result.get("intent"))
+        return result
+    except Exception as e:
+        logger.debug("stt_preclassify_failed", error=str(e))
+        return None
@@ -0,0 +1,181 @@
+"""
+Sentence-pipelined TTS for the voice gateways.
+
+Instead of waiting for the whole orchestrator answer and then for the
+whole TTS render, the voice paths consume the orchestrator's
+``/query/stream/v2`` sentence events and synthesize sentence N+1 while
+sentence N is playing. Time-to-first-audio becomes roughly
+time-to-first-sentence plus one sentence of TTS.
+
+Used by gateway.wyoming_bridge and gateway.livekit_service:
+
+    sentences = stream_query_sentences(client, f"{ORCHESTRATOR_URL}/query/stream/v2", request_data, result)
+    audio = synthesize_ahead(sentences, tts_client.synthesize)
+    try:
+        async for sentence, pcm in audio:
+            ...  # play pcm, checking for barge-in between chunks
+            if interrupted:
+                break
+    finally:
+        await audio.aclose()  # stops TTS prefetch and the orchestrator stream
+
+Closing the generator cancels the in-flight synthesis and drops the
+orchestrator connection, so barge-in works at sentence granularity.
+"""
+
+import asyncio
+import io
+import json
+import os
+import wave
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import structlog
+
+from shared.metrics import VOICE_TIME_TO_FIRST_AUDIO
+
+logger = structlog.get_logger()
+
+# Sentences synthesized ahead of the one playing
+TTS_PREFETCH_SENTENCES = int(os.getenv("TTS_PREFETCH_SENTENCES", "1"))
+
+# Same boundary rule as the orchestrator's /query/stream/v2
+MIN_SENTENCE_CHARS = 20
+
+
+class QueryStreamError(Exception):
+    """The orchestrator stream reported an error stage."""
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text at . ! ? once a sentence is longer than MIN_SENTENCE_CHARS."""
+    sentences = []
+    buffer = ""
+    for char in text:
+        buffer += char
+        if char in '.!?' and len(buffer) > MIN_SENTENCE_CHARS:
+            sentences.append(buffer.strip())
+            buffer = ""
+    if buffer.strip():
+        sentences.append(buffer.strip())
+    return sentences
+
+
+async def iter_sentences(text: str) -> AsyncIterator[str]:
+    """Async iterator over split_sentences(text), for full (non-streamed) answers."""
+    for sentence in split_sentences(text):
+        yield sentence
+
+
+async def stream_query_sentences(
+    client: httpx.AsyncClient,
+    url: str,
+    request_data: Dict[str, Any],
+    result: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[str]:
+    """
+    Yield sentences from an orchestrator ``/query/stream/v2`` SSE response.
+
+    Args:
+        client: HTTP client to stream with
+        url: Full URL of the v2 stream endpoint
+        request_data: QueryRequest payload
+        result: Filled with the ``classified`` and ``complete`` event fields
+            (intent, full_response, processing_time, ...)
+
+    Raises:
+        QueryStreamError: The stream reported ``stage: error``
+        httpx.HTTPError: The request failed
+    """
+    async with client.stream("POST", url, json=request_data) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            try:
+                event = json.loads(line[len("data: "):])
+            except json.JSONDecodeError:
+                continue
+            stage = event.get("stage")
+            if stage == "streaming":
+                sentence = (event.get("sentence") or "").strip()
+                if sentence:
+                    yield sentence
+            elif stage in ("classified", "complete"):
+                if result is not None:
+                    result.update(event)
+            elif stage == "error":
+                raise QueryStreamError(event.get("message", "stream error"))
+
+
+def wav_to_pcm(audio: bytes) -> bytes:
+    """Strip the WAV header if present so per-sentence clips concatenate cleanly."""
+    if audio[:4] != b"RIFF":
+        return audio
+    try:
+        with wave.open(io.BytesIO(audio), "rb") as wav:
+            return wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return audio[44:]
+
+
+_DONE = object()
+
+
+async def synthesize_ahead(
+    sentences: AsyncIterator[str],
+    synthesize: Callable[[str], Awaitable[bytes]],
+    prefetch: Optional[int] = None
+) -> AsyncIterator[Tuple[str, bytes]]:
+    """
+    Yield (sentence, pcm) pairs, synthesizing the next sentence(s) while the
+    caller plays the current one.
+
+    Args:
+        sentences: Sentence source (orchestrator stream or iter_sentences)
+        synthesize: TTS call returning WAV or raw PCM bytes for one sentence
+        prefetch: Sentences to keep ready ahead of playback
+            (TTS_PREFETCH_SENTENCES, default 1)
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch or TTS_PREFETCH_SENTENCES))
+
+    async def produce():
+        try:
+            async for sentence in sentences:
+                audio = await synthesize(sentence)
+                await queue.put((sentence, wav_to_pcm(audio or b"")))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_DONE)
+        finally:
+            aclose = getattr(sentences, "aclose", None)
+            if aclose is not None:
+                try:
+                    await aclose()
+                except Exception:
+                    pass
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
+def observe_time_to_first_audio(interface: str, mode: str, seconds: float):
+    """Record the time-to-first-audio histogram."""
+    VOICE_TIME_TO_FIRST_AUDIO.labels(interface=interface, mode=mode).observe(seconds)
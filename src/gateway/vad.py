@@ -0,0 +1,339 @@
+"""
+Voice activity detection shared by the voice gateways.
+
+Replaces the fixed RMS thresholds (Wyoming barge-in, LiveKit endpointing,
+AudioStreamProcessor) with one detector:
+
+- Per-frame features are computed once: energy (dBFS) and spectral
+  flatness (0 = tonal/harmonic, ~0.56 = white noise) over the speech band.
+- The frame classifier is pluggable. The default uses energy above the
+  noise floor plus a spectral check, so steady broadband noise (fans, HVAC)
+  is not speech. Optionally VAD_ENGINE=webrtc (webrtcvad) or
+  VAD_ENGINE=silero (silero-vad) is used, gated by the noise floor.
+- The noise floor adapts to the room: it is measured for VAD_CALIBRATION_MS,
+  then drops quickly and rises slowly on noise frames, and is remembered per
+  room (the VAD_MAX_ROOMS most recently used), so the next session in a
+  noisy kitchen starts calibrated. Callers freeze it while their own TTS is
+  playing so the echo does not raise the floor and mask a barge-in.
+- Onset and hangover smoothing: speech starts after VAD_ONSET_MS of
+  speech frames and lasts VAD_HANGOVER_MS past the last one, so clicks
+  don't trigger and short pauses don't end the turn.
+
+    vad = VoiceActivityDetector.for_room("kitchen")
+    frame = vad.process(pcm)          # per audio frame
+    if vad.endpoint(silence_timeout_ms):
+        ...                           # user finished speaking
+
+Endpointing can be tuned and compared on audio fixtures with
+tests/benchmarks/bench_vad_endpointing.py.
+"""
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger()
+
+# Optional model engines
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
+try:
+    import torch
+    from silero_vad import load_silero_vad
+    SILERO_AVAILABLE = True
+except ImportError:
+    SILERO_AVAILABLE = False
+
+SAMPLE_RATE = 16000
+
+VAD_ENGINE = os.getenv("VAD_ENGINE", "energy")  # energy | webrtc | silero
+VAD_MARGIN_DB = float(os.getenv("VAD_MARGIN_DB", "10"))  # speech must exceed the noise floor by this
+VAD_HANGOVER_MS = int(os.getenv("VAD_HANGOVER_MS", "300"))
+VAD_ONSET_MS = int(os.getenv("VAD_ONSET_MS", "40"))
+
+# Trailing silence that ends a turn (LiveKit and AudioStreamProcessor)
+VAD_ENDPOINT_SILENCE_MS = int(os.getenv("VAD_ENDPOINT_SILENCE_MS", "2000"))
+
+DEFAULT_NOISE_FLOOR_DB = -55.0
+MIN_NOISE_FLOOR_DB = -75.0
+MIN_SPEECH_DB = -50.0  # never speech below this, however quiet the room
+
+# Spectral flatness above this is treated as noise (white noise is ~0.56)
+MAX_SPEECH_FLATNESS = 0.4
+SPEECH_BAND_HZ = (100.0, 4000.0)
+
+# Noise floor time constants: quick to fall, slow to rise, and very slow
+# while the frame could be speech (recovers from a step up in tonal noise)
+FLOOR_FALL_MS = 40.0
+FLOOR_RISE_MS = 600.0
+FLOOR_RISE_IN_SPEECH_MS = 10000.0
+
+# A room with no learned floor is measured for this long before speech is reported
+VAD_CALIBRATION_MS = int(os.getenv("VAD_CALIBRATION_MS", "200"))
+
+# Learned noise floor per room (dBFS), least recently used first
+VAD_MAX_ROOMS = int(os.getenv("VAD_MAX_ROOMS", "256"))
+_room_noise_floors: "OrderedDict[str, float]" = OrderedDict()
+
+# Silero model, loaded once per process (see SileroClassifier)
+_silero_model = None
+_silero_lock = threading.Lock()
+
+
+@dataclass
+class FrameFeatures:
+    """Per-frame measurements shared by classifiers."""
+    energy_db: float
+    flatness: float
+    duration_ms: float
+
+
+@dataclass
+class VADFrame:
+    """Result of VoiceActivityDetector.process for one frame."""
+    is_speech: bool  # smoothed (onset + hangover)
+    raw_speech: bool  # classifier decision for this frame alone
+    energy_db: float
+    noise_floor_db: float
+
+
+def frame_features(samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> FrameFeatures:
+    """Energy (dBFS) and speech-band spectral flatness of an int16 frame."""
+    n = len(samples)
+    if n == 0:
+        return FrameFeatures(energy_db=-100.0, flatness=1.0, duration_ms=0.0)
+    x = samples.astype(np.float32)
+    power = float(np.dot(x, x)) / n
+    energy_db = 10.0 * np.log10(power / (32768.0 ** 2) + 1e-12)
+
+    spectrum = np.abs(np.fft.rfft(x * np.hanning(n))) ** 2
+    freqs = np.fft.rfftfreq(n, 1.0 / sample_rate)
+    band = spectrum[(freqs >= SPEECH_BAND_HZ[0]) & (freqs <= SPEECH_BAND_HZ[1])] + 1e-10
+    flatness = float(np.exp(np.mean(np.log(band))) / np.mean(band)) if len(band) else 1.0
+
+    return FrameFeatures(energy_db=float(energy_db), flatness=flatness, duration_ms=n * 1000.0 / sample_rate)
+
+
+class EnergySpectralClassifier:
+    """Default: loud enough above the noise floor and not noise-like."""
+
+    name = "energy"
+
+    def __init__(self, margin_db: float = VAD_MARGIN_DB, max_flatness: float = MAX_SPEECH_FLATNESS):
+        self.margin_db = margin_db
+        self.max_flatness = max_flatness
+
+    def is_speech(self, samples: np.ndarray, features: FrameFeatures, noise_floor_db: float) -> bool:
+        return (
+            features.energy_db > max(noise_floor_db + self.margin_db, MIN_SPEECH_DB)
+            and features.flatness < self.max_flatness
+        )
+
+
+class WebRTCClassifier:
+    """webrtcvad on 10 ms sub-frames (majority vote), gated by the noise floor."""
+
+    name = "webrtc"
+
+    def __init__(self, aggressiveness: int = 2, gate_db: float = 3.0):
+        self._vad = webrtcvad.Vad(aggressiveness)
+        self.gate_db = gate_db
+
+    def is_speech(self, samples: np.ndarray, features: FrameFeatures, noise_floor_db: float) -> bool:
+        if features.energy_db < max(noise_floor_db + self.gate_db, MIN_SPEECH_DB):
+            return False
+        step = SAMPLE_RATE // 100
+        votes = [
+            self._vad.is_speech(samples[i:i + step].tobytes(), SAMPLE_RATE)
+            for i in range(0, len(samples) - step + 1, step)
+        ]
+        return bool(votes) and sum(votes) * 2 >= len(votes)
+
+
+def _load_silero():
+    global _silero_model
+    with _silero_lock:
+        if _silero_model is None:
+            _silero_model = load_silero_vad()
+        return _silero_model
+
+
+class SileroClassifier:
+    """Silero VAD on 512-sample windows (stateful, one per stream), gated by the noise floor."""
+
+    name = "silero"
+    WINDOW = 512
+
+    def __init__(self, threshold: float = 0.5, gate_db: float = 3.0):
+        # The model is loaded once; each stream gets an in-memory copy for its own RNN state
+        self._model = copy.deepcopy(_load_silero())
+        self.threshold = threshold
+        self.gate_db = gate_db
+        self._carry = np.zeros(0, dtype=np.float32)
+        self._last = False
+
+    def is_speech(self, samples: np.ndarray, features: FrameFeatures, noise_floor_db: float) -> bool:
+        audio = np.concatenate([self._carry, samples.astype(np.float32) / 32768.0])
+        usable = len(audio) - len(audio) % self.WINDOW
+        self._carry = audio[usable:]
+        for i in range(0, usable, self.WINDOW):
+            prob = self._model(torch.from_numpy(audio[i:i + self.WINDOW]), SAMPLE_RATE).item()
+            self._last = prob >= self.threshold
+        if features.energy_db < max(noise_floor_db + self.gate_db, MIN_SPEECH_DB):
+            return False
+        return self._last
+
+
+def create_classifier(engine: Optional[str] = None) -> Any:
+    """Frame classifier for ``engine`` (VAD_ENGINE), falling back to energy+spectral."""
+    engine = (engine or VAD_ENGINE).lower()
+    if engine == "webrtc":
+        if WEBRTCVAD_AVAILABLE:
+            return WebRTCClassifier()
+        logger.warning("vad_engine_unavailable", engine=engine, message="pip install webrtcvad")
+    elif engine == "silero":
+        if SILERO_AVAILABLE:
+            return SileroClassifier()
+        logger.warning("vad_engine_unavailable", engine=engine, message="pip install silero-vad")
+    elif engine != "energy":
+        logger.warning("vad_engine_unknown", engine=engine)
+    return EnergySpectralClassifier()
+
+
+class VoiceActivityDetector:
+    """
+    Streaming VAD for one audio stream with an adaptive noise floor.
+
+    Args:
+        classifier: Frame classifier (create_classifier() if omitted)
+        room: Room whose learned noise floor is used and updated
+        noise_floor_db: Starting noise floor (room's learned floor or
+            DEFAULT_NOISE_FLOOR_DB if omitted)
+        hangover_ms: Speech continues this long after the last speech frame
+        onset_ms: Consecutive speech needed before speech starts
+    """
+
+    def __init__(
+        self,
+        classifier: Optional[Any] = None,
+        room: Optional[str] = None,
+        noise_floor_db: Optional[float] = None,
+        hangover_ms: Optional[int] = None,
+        onset_ms: Optional[int] = None,
+        sample_rate: int = SAMPLE_RATE
+    ):
+        self.classifier = classifier or create_classifier()
+        self.room = room
+        self._calibration_ms = 0.0
+        if noise_floor_db is None:
+            if room in _room_noise_floors:
+                noise_floor_db = _room_noise_floors[room]
+            else:
+                noise_floor_db = DEFAULT_NOISE_FLOOR_DB
+                self._calibration_ms = VAD_CALIBRATION_MS
+        self.noise_floor_db = noise_floor_db
+        self.hangover_ms = VAD_HANGOVER_MS if hangover_ms is None else hangover_ms
+        self.onset_ms = VAD_ONSET_MS if onset_ms is None else onset_ms
+        self.sample_rate = sample_rate
+
+        self.in_speech = False
+        self.heard_speech = False  # any speech since reset()
+        self.silence_ms = 0.0  # since the last raw speech frame
+        self.speech_ms = 0.0  # of the current speech run, from its first speech frame
+        self._onset_ms = 0.0
+
+    @classmethod
+    def for_room(cls, room: Optional[str], engine: Optional[str] = None, **kwargs) -> "VoiceActivityDetector":
+        """Detector seeded with (and updating) the room's learned noise floor."""
+        return cls(classifier=create_classifier(engine), room=room, **kwargs)
+
+    def process(self, audio, adapt_noise_floor: bool = True) -> VADFrame:
+        """
+        Classify one frame of 16-bit PCM (bytes, memoryview or int16 array).
+
+        Pass ``adapt_noise_floor=False`` while the device is playing our own
+        audio: the frame is still classified (barge-in) but does not move the
+        noise floor.
+        """
+        samples = audio if isinstance(audio, np.ndarray) else np.frombuffer(audio, dtype=np.int16)
+        features = frame_features(samples, self.sample_rate)
+        duration = features.duration_ms
+        calibrating = self._calibration_ms > 0
+        if calibrating:
+            self._calibration_ms -= duration
+            raw = False
+        else:
+            raw = self.classifier.is_speech(samples, features, self.noise_floor_db)
+
+        if raw:
+            self.silence_ms = 0.0
+            self._onset_ms += duration
+            if self._onset_ms >= self.onset_ms:
+                if not self.in_speech:
+                    # The onset frames are part of the run
+                    self.speech_ms = self._onset_ms - duration
+                self.in_speech = True
+                self.heard_speech = True
+        else:
+            self.silence_ms += duration
+            self._onset_ms = 0.0
+            if self.in_speech and self.silence_ms > self.hangover_ms:
+                self.in_speech = False
+        if self.in_speech:
+            self.speech_ms += duration
+
+        if adapt_noise_floor:
+            self._track_noise_floor(features, raw, calibrating)
+        return VADFrame(
+            is_speech=self.in_speech,
+            raw_speech=raw,
+            energy_db=features.energy_db,
+            noise_floor_db=self.noise_floor_db
+        )
+
+    def endpoint(self, silence_timeout_ms: float) -> bool:
+        """Speech was heard and has been followed by ``silence_timeout_ms`` of silence."""
+        return self.heard_speech and not self.in_speech and self.silence_ms >= silence_timeout_ms
+
+    def reset(self):
+        """Start a new utterance (the learned noise floor is kept)."""
+        self.in_speech = False
+        self.heard_speech = False
+        self.silence_ms = 0.0
+        self.speech_ms = 0.0
+        self._onset_ms = 0.0
+
+    def _track_noise_floor(self, features: FrameFeatures, raw_speech: bool, calibrating: bool):
+        energy_db = features.energy_db
+        if calibrating or energy_db < self.noise_floor_db:
+            tau = FLOOR_FALL_MS
+        elif not raw_speech and (
+            energy_db < self.noise_floor_db + VAD_MARGIN_DB / 2 or features.flatness >= MAX_SPEECH_FLATNESS
+        ):
+            # Near the floor, or noise-like: evidence of the room's noise
+            tau = FLOOR_RISE_MS
+        else:
+            # Possibly speech (including quiet gaps between syllables)
+            tau = FLOOR_RISE_IN_SPEECH_MS
+        rate = 1.0 - np.exp(-features.duration_ms / tau)
+        self.noise_floor_db = max(MIN_NOISE_FLOOR_DB, self.noise_floor_db + rate * (energy_db - self.noise_floor_db))
+        if self.room is not None:
+            _room_noise_floors[self.room] = self.noise_floor_db
+            _room_noise_floors.move_to_end(self.room)
+            if len(_room_noise_floors) > VAD_MAX_ROOMS:
+                _room_noise_floors.popitem(last=False)
+
+
+def room_noise_floors() -> Dict[str, float]:
+    """Learned noise floor per room (dBFS), for diagnostics."""
+    return dict(_room_noise_floors)
@@ -2,7 +2,8 @@
 Wake Word Detection for LiveKit Audio Streams.
 
 Uses OpenWakeWord for detecting "Jarvis" and "Athena" wake words
-in real-time audio streams.
+in real-time audio streams. Inference runs on the shared worker thread
+(gateway.wake_word_worker), batched across streams.
 """
 
 import asyncio
@@ -13,6 +14,9 @@ import io
 import numpy as np
 import structlog
 
+from gateway.vad import VAD_ENDPOINT_SILENCE_MS, VoiceActivityDetector
+from gateway.wake_word_worker import OpenWakeWordBackend, WakeWordInferenceWorker
+
 logger = structlog.get_logger()
 
 # Try to import openwakeword
@@ -45,9 +49,9 @@ class WakeWordDetector:
 
     def __init__(self, config: Optional[WakeWordConfig] = None):
         self.config = config or WakeWordConfig()
-        self._model: Optional[Any] = None
+        self._worker: Optional[WakeWordInferenceWorker] = None
         self._initialized = False
-        self._last_detection: Dict[str, float] = {}
+        self._last_detection: Dict[Any, float] = {}
         self._lock = asyncio.Lock()
 
     @property
@@ -84,13 +88,21 @@ class WakeWordDetector:
                         logger.info("wake_word_custom_model_found", wake_word=wake_word)
 
                 # Load model
-                if model_paths:
-                    self._model = OWWModel(wakeword_models=model_paths)
-                else:
+                if not model_paths:
                     # Use default hey_jarvis model if available
-                    self._model = OWWModel(wakeword_models=["hey_jarvis_v0.1"])
+                    model_paths = ["hey_jarvis_v0.1"]
                     logger.info("wake_word_using_default_model", model="hey_jarvis_v0.1")
 
+                # Load the first stream's model now, so bad model paths fail here
+                # rather than on the first detect()
+                preloaded = [OWWModel(wakeword_models=model_paths)]
+
+                def model_factory():
+                    return preloaded.pop() if preloaded else OWWModel(wakeword_models=model_paths)
+
+                # One streaming model per stream, run off the event loop
+                self._worker = WakeWordInferenceWorker(OpenWakeWordBackend(model_factory))
+
                 self._initialized = True
                 logger.info("wake_word_initialized",
                            wake_words=self.config.wake_words,
@@ -101,25 +113,26 @@ class WakeWordDetector:
                 logger.error("wake_word_init_failed", error=str(e))
                 return False
 
-    async def detect(self, audio_data: bytes) -> Optional[str]:
+    async def detect(self, audio_data: bytes, stream_id: str = "default") -> Optional[str]:
         """
         Detect wake word in audio data.
 
         Args:
             audio_data: Raw PCM audio bytes (16-bit, mono, 16kHz)
+            stream_id: Audio stream (room/session); each has its own model state
 
         Returns:
             Detected wake word name or None
         """
-        if not self._initialized or not self._model:
+        if not self._initialized or not self._worker:
             return await self._fallback_detect(audio_data)
 
         try:
-            # Convert bytes to numpy array
-            audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+            # OpenWakeWord takes 16-bit PCM samples
+            audio_array = np.frombuffer(audio_data, dtype=np.int16).copy()
 
-            # Process through model
-            prediction = self._model.predict(audio_array)
+            # Process through model (worker thread, batched with other streams)
+            prediction = await self._worker.predict(stream_id, audio_array)
 
             # Check each wake word
             import time
@@ -131,11 +144,12 @@ class WakeWordDetector:
 
                 if score >= self.config.threshold:
                     # Check cooldown
-                    last_time = self._last_detection.get(wake_word, 0)
+                    last_time = self._last_detection.get((stream_id, wake_word), 0)
                     if current_time - last_time >= self.config.cooldown_seconds:
-                        self._last_detection[wake_word] = current_time
+                        self._last_detection[(stream_id, wake_word)] = current_time
                         logger.info("wake_word_detected",
                                    wake_word=wake_word,
+                                   stream=stream_id,
                                    score=score)
                         return wake_word
 
@@ -167,9 +181,20 @@ class WakeWordDetector:
         # In production, this should trigger a warning
         return None
 
-    def reset(self):
+    def reset(self, stream_id: Optional[str] = None):
         """Reset detection state (e.g., after handling a wake word)."""
-        self._last_detection.clear()
+        if stream_id is None:
+            self._last_detection.clear()
+            return
+        for key in [k for k in self._last_detection if k[0] == stream_id]:
+            del self._last_detection[key]
+        if self._worker:
+            self._worker.remove_stream(stream_id)
+
+    async def close(self):
+        """Stop the inference worker."""
+        if self._worker:
+            await self._worker.stop()
 
 
 class AudioStreamProcessor:
@@ -185,9 +210,11 @@ class AudioStreamProcessor:
         detector: WakeWordDetector,
         on_wake_word: Optional[Callable[[str], None]] = None,
         on_speech_start: Optional[Callable[[], None]] = None,
-        on_speech_end: Optional[Callable[[bytes], None]] = None
+        on_speech_end: Optional[Callable[[bytes], None]] = None,
+        stream_id: str = "default"
     ):
         self.detector = detector
+        self.stream_id = stream_id
         self.on_wake_word = on_wake_word
         self.on_speech_start = on_speech_start
         self.on_speech_end = on_speech_end
@@ -199,12 +226,11 @@ class AudioStreamProcessor:
         # State
         self._listening_for_query = False
         self._speech_buffer = io.BytesIO()
-        self._silence_frames = 0
         self._speech_frames = 0
 
-        # VAD config
-        self._vad_threshold = 500  # RMS threshold
-        self._silence_timeout_frames = 30  # ~2 seconds at 16kHz/1280 chunk
+        # VAD (noise floor learned per stream)
+        self.vad = VoiceActivityDetector.for_room(stream_id)
+        self._silence_timeout_ms = VAD_ENDPOINT_SILENCE_MS  # ~2 seconds
         self._min_speech_frames = 5  # Minimum frames to consider speech
 
     async def process_chunk(self, audio_chunk: bytes) -> Optional[str]:
@@ -222,18 +248,19 @@ class AudioStreamProcessor:
         while len(self._chunk_buffer) >= chunk_size:
             chunk = bytes(self._chunk_buffer[:chunk_size])
             del self._chunk_buffer[:chunk_size]
+            voice = self.vad.process(chunk)
 
             if self._listening_for_query:
                 # We're collecting speech after wake word
-                await self._process_speech_chunk(chunk)
+                await self._process_speech_chunk(chunk, voice.is_speech)
             else:
                 # Looking for wake word
-                wake_word = await self.detector.detect(chunk)
+                wake_word = await self.detector.detect(chunk, self.stream_id)
                 if wake_word:
                     self._listening_for_query = True
                     self._speech_buffer = io.BytesIO()
-                    self._silence_frames = 0
                     self._speech_frames = 0
+                    self.vad.reset()
 
                     if self.on_wake_word:
                         self.on_wake_word(wake_word)
@@ -242,28 +269,19 @@ class AudioStreamProcessor:
 
         return None
 
-    async def _process_speech_chunk(self, chunk: bytes):
+    async def _process_speech_chunk(self, chunk: bytes, is_speech: bool):
         """Process a chunk while collecting speech."""
-        # Calculate RMS energy
-        audio_array = np.frombuffer(chunk, dtype=np.int16)
-        rms = np.sqrt(np.mean(audio_array.astype(np.float32) ** 2))
-
-        is_speech = rms > self._vad_threshold
-
         if is_speech:
-            self._silence_frames = 0
             self._speech_frames += 1
 
             if self._speech_frames == 1 and self.on_speech_start:
                 self.on_speech_start()
-        else:
-            self._silence_frames += 1
 
         # Always write to buffer when listening
         self._speech_buffer.write(chunk)
 
         # Check for end of speech
-        if self._silence_frames >= self._silence_timeout_frames:
+        if not is_speech and self.vad.silence_ms >= self._silence_timeout_ms:
             if self._speech_frames >= self._min_speech_frames:
                 # Speech ended, emit the audio
                 speech_data = self._speech_buffer.getvalue()
@@ -273,7 +291,6 @@ class AudioStreamProcessor:
             # Reset state
             self._listening_for_query = False
             self._speech_buffer = io.BytesIO()
-            self._silence_frames = 0
             self._speech_frames = 0
 
     def reset(self):
@@ -282,9 +299,9 @@ class AudioStreamProcessor:
         self._chunk_buffer = bytearray()
         self._listening_for_query = False
         self._speech_buffer = io.BytesIO()
-        self._silence_frames = 0
         self._speech_frames = 0
-        self.detector.reset()
+        self.vad.reset()
+        self.detector.reset(self.stream_id)
 
 
 # Singleton instance
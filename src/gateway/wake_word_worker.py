@@ -0,0 +1,266 @@
+"""
+Off-loop, batched wake word inference.
+
+OpenWakeWord's predict() is synchronous. Calling it from the event loop
+for every 80 ms chunk of every room stalls all other gateway requests.
+WakeWordInferenceWorker moves inference to a dedicated worker thread
+(ONNX Runtime releases the GIL) and micro-batches: chunks submitted by
+all streams within WAKE_WORD_BATCH_WINDOW_MS are scored in one backend
+call, and each caller awaits its own scores.
+
+    worker = WakeWordInferenceWorker(OpenWakeWordBackend(model_paths))
+    scores = await worker.predict(room_id, chunk)   # {"hey_jarvis": 0.93}
+    ...
+    worker.remove_stream(room_id)                   # drops per-stream model state
+
+Backends implement predict_batch([(stream_id, samples), ...]) -> [scores, ...].
+OpenWakeWord models are stateful streaming models, so OpenWakeWordBackend
+keeps one model per stream and runs them back to back within the batch.
+A backend with a truly batched model can score the whole list in one call.
+
+Metrics (shared.metrics): per-stream queue depth and submit-to-score
+latency, batch inference time and batch size.
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+from shared.metrics import (
+    WAKE_WORD_BATCH_SIZE, WAKE_WORD_INFERENCE_DURATION, WAKE_WORD_LATENCY, WAKE_WORD_QUEUE_DEPTH
+)
+
+logger = structlog.get_logger()
+
+# Extra wait after the first pending chunk, to pick up other streams' chunks
+WAKE_WORD_BATCH_WINDOW_MS = float(os.getenv("WAKE_WORD_BATCH_WINDOW_MS", "10"))
+
+# Chunks a stream may have waiting before its oldest are skipped
+WAKE_WORD_MAX_QUEUE = int(os.getenv("WAKE_WORD_MAX_QUEUE", "8"))
+
+Scores = Dict[str, float]
+
+
+class OpenWakeWordBackend:
+    """
+    Per-stream OpenWakeWord models, created lazily in the worker thread.
+
+    Args:
+        model_factory: Returns a new model with predict(samples) -> {name: score}
+            (e.g. ``lambda: openwakeword.model.Model(wakeword_models=paths)``)
+    """
+
+    def __init__(self, model_factory: Callable[[], Any]):
+        self.model_factory = model_factory
+        self._models: Dict[str, Any] = {}
+
+    def predict_batch(self, items: Sequence[Tuple[str, np.ndarray]]) -> List[Scores]:
+        results = []
+        for stream_id, samples in items:
+            model = self._models.get(stream_id)
+            if model is None:
+                model = self._models[stream_id] = self.model_factory()
+            results.append(_max_scores(model.predict(samples)))
+        return results
+
+    def remove_stream(self, stream_id: str):
+        self._models.pop(stream_id, None)
+
+
+class SharedModelBackend:
+    """One model for every stream (for stateless models or legacy callers)."""
+
+    def __init__(self, model: Any):
+        self.model = model
+
+    def predict_batch(self, items: Sequence[Tuple[str, np.ndarray]]) -> List[Scores]:
+        return [_max_scores(self.model.predict(samples)) for _, samples in items]
+
+    def remove_stream(self, stream_id: str):
+        pass
+
+
+def _max_scores(prediction: Dict[str, Any]) -> Scores:
+    """Normalize a prediction to {name: score}, taking the max of score lists."""
+    scores = {}
+    for name, value in prediction.items():
+        if isinstance(value, (list, np.ndarray)):
+            scores[name] = float(max(value)) if len(value) > 0 else 0.0
+        else:
+            scores[name] = float(value)
+    return scores
+
+
+class WakeWordInferenceWorker:
+    """
+    Scores audio chunks from many streams on a worker thread, batched per tick.
+
+    Args:
+        backend: predict_batch/remove_stream implementation
+        batch_window_ms: Wait after the first chunk before dispatching
+        max_queue: Per-stream backlog before the oldest chunks are skipped
+            (their callers get empty scores)
+        executor: Executor to run inference on (one dedicated thread if omitted)
+    """
+
+    def __init__(
+        self,
+        backend: Any,
+        batch_window_ms: Optional[float] = None,
+        max_queue: Optional[int] = None,
+        executor: Optional[ThreadPoolExecutor] = None
+    ):
+        self.backend = backend
+        self.batch_window = (WAKE_WORD_BATCH_WINDOW_MS if batch_window_ms is None else batch_window_ms) / 1000
+        self.max_queue = max(1, max_queue or WAKE_WORD_MAX_QUEUE)
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="wake-word")
+        self._owns_executor = executor is None
+
+        self._queues: Dict[str, Deque[Tuple[np.ndarray, asyncio.Future, float]]] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._removed: List[str] = []
+
+        # Stats
+        self.batches = 0
+        self.chunks = 0
+        self.dropped = 0
+        self.max_batch_size = 0
+
+    def queue_depth(self, stream_id: str) -> int:
+        """Chunks waiting for inference for a stream."""
+        return len(self._queues.get(stream_id, ()))
+
+    async def predict(self, stream_id: str, samples: np.ndarray) -> Scores:
+        """Score one chunk for a stream (the worker keeps per-stream order)."""
+        self._ensure_running()
+        queue = self._queues.setdefault(stream_id, deque())
+        if len(queue) >= self.max_queue:
+            _, skipped, _ = queue.popleft()
+            if not skipped.done():
+                skipped.set_result({})
+            self.dropped += 1
+            logger.warning("wake_word_chunk_dropped", stream=stream_id, queue_depth=len(queue))
+
+        future = asyncio.get_running_loop().create_future()
+        queue.append((samples, future, time.perf_counter()))
+        _observe_queue_depth(stream_id, len(queue))
+        self._wakeup.set()
+        return await future
+
+    def remove_stream(self, stream_id: str):
+        """Forget a stream (session ended or wake word handled)."""
+        queue = self._queues.pop(stream_id, None)
+        for _, future, _ in queue or ():
+            if not future.done():
+                future.set_result({})
+        # Backend state is touched only from the worker thread
+        self._removed.append(stream_id)
+        _remove_stream_metrics(stream_id)
+        if self._wakeup:
+            self._wakeup.set()
+
+    async def stop(self):
+        """Stop the dispatch loop and release the worker thread."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for stream_id in list(self._queues):
+            self.remove_stream(stream_id)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "streams": len(self._queues),
+            "batches": self.batches,
+            "chunks": self.chunks,
+            "dropped": self.dropped,
+            "max_batch_size": self.max_batch_size,
+            "avg_batch_size": round(self.chunks / self.batches, 2) if self.batches else 0.0,
+        }
+
+    def _ensure_running(self):
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            if self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+            self._wakeup.clear()
+
+            removed, self._removed = self._removed, []
+            # One chunk per stream per batch keeps each stream's order
+            batch = []
+            for stream_id, queue in self._queues.items():
+                if queue:
+                    samples, future, submitted = queue.popleft()
+                    batch.append((stream_id, samples, future, submitted))
+                    _observe_queue_depth(stream_id, len(queue))
+            if not batch and not removed:
+                continue
+
+            started = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self._infer, removed, [(s, samples) for s, samples, _, _ in batch]
+                )
+            except Exception as e:
+                logger.error("wake_word_inference_error", error=str(e), batch_size=len(batch))
+                results = [{}] * len(batch)
+            finished = time.perf_counter()
+
+            if batch:
+                self.batches += 1
+                self.chunks += len(batch)
+                self.max_batch_size = max(self.max_batch_size, len(batch))
+                _observe_batch(finished - started, len(batch))
+            for (stream_id, _, future, submitted), scores in zip(batch, results):
+                _observe_latency(stream_id, finished - submitted)
+                if not future.done():
+                    future.set_result(scores)
+
+            if any(self._queues.values()):
+                self._wakeup.set()
+
+    def _infer(self, removed: List[str], items: List[Tuple[str, np.ndarray]]) -> List[Scores]:
+        for stream_id in removed:
+            self.backend.remove_stream(stream_id)
+        if not items:
+            return []
+        return self.backend.predict_batch(items)
+
+
+def _observe_queue_depth(stream_id: str, depth: int):
+    WAKE_WORD_QUEUE_DEPTH.labels(stream=stream_id).set(depth)
+
+
+def _observe_latency(stream_id: str, seconds: float):
+    WAKE_WORD_LATENCY.labels(stream=stream_id).observe(seconds)
+
+
+def _observe_batch(seconds: float, size: int):
+    WAKE_WORD_INFERENCE_DURATION.observe(seconds)
+    WAKE_WORD_BATCH_SIZE.observe(size)
+
+
+def _remove_stream_metrics(stream_id: str):
+    for metric in (WAKE_WORD_QUEUE_DEPTH, WAKE_WORD_LATENCY):
+        try:
+            metric.remove(stream_id)
+        except KeyError:
+            pass
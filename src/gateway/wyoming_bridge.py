@@ -17,6 +17,13 @@ Features:
     - Session state tracking for continued conversation
     - TTS cancellation on user speech
     - Interruption context passed to orchestrator
+    - Sentence-pipelined TTS (gateway.tts_pipeline): the answer is read from
+      /query/stream/v2 and spoken sentence by sentence, synthesizing the next
+      sentence while the current one plays
+    - Streaming STT (gateway.streaming_stt): audio is sent to STT while the
+      user speaks, so AudioStop only waits for the last chunk to decode
+    - Barge-in uses the shared VAD (gateway.vad), whose noise floor adapts to
+      the room instead of a fixed RMS threshold
 """
 
 import asyncio
@@ -30,7 +37,16 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 import httpx
 import structlog
-import numpy as np
+
+from gateway.audio_buffer import MAX_UTTERANCE_SECONDS, PCMRingBuffer
+from gateway.streaming_stt import (
+    STREAMING_STT_ENABLED, StreamingSTTError, StreamingTranscriber, preclassify
+)
+from gateway.tts_pipeline import (
+    TTS_PREFETCH_SENTENCES, iter_sentences, observe_time_to_first_audio,
+    stream_query_sentences, synthesize_ahead
+)
+from gateway.vad import VoiceActivityDetector
 
 logger = structlog.get_logger()
 
@@ -52,6 +68,27 @@ class WyomingInterruptionContext:
     audio_position_ms: int = 0
     interruption_point: float = 0.0
 
+
+# Wyoming event context fields that identify the satellite
+SATELLITE_ID_FIELDS = ("satellite_id", "device_id")
+
+
+def vad_room_key(interface_name: str, peername: Any = None, context: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Key for a connection's learned VAD noise floor.
+
+    Uses the satellite id from the event context when present, else the
+    peer's host (each satellite connects from its own address), and the
+    interface name only when neither is known.
+    """
+    for id_field in SATELLITE_ID_FIELDS:
+        if context and context.get(id_field):
+            return f"{interface_name}:{context[id_field]}"
+    if peername:
+        host = peername[0] if isinstance(peername, (tuple, list)) else peername
+        return f"{interface_name}@{host}"
+    return interface_name
+
 # Check if wyoming is available
 try:
     from wyoming.server import AsyncServer
@@ -69,7 +106,7 @@ except ImportError:
 
 # Try to import event system
 try:
-    from shared.events import EventType, EventEmitterFactory, emit_session_start, emit_session_end
+    from shared.events import EventType, EventEmitterFactory, emit_session_start, emit_session_end, emit_stt_progress
     EVENTS_AVAILABLE = True
 except ImportError:
     EVENTS_AVAILABLE = False
@@ -91,6 +128,9 @@ DEFAULT_TTS_URL = os.getenv("TTS_URL", "http://localhost:10201")
 ORCHESTRATOR_URL = os.getenv("ORCHESTRATOR_URL", "http://localhost:8001")
 ADMIN_API_URL = os.getenv("ADMIN_API_URL", "http://localhost:8080")
 
+# Read answers from /query/stream/v2 and start TTS on the first sentence
+STREAMING_TTS_ENABLED = os.getenv("STREAMING_TTS_ENABLED", "true").lower() == "true"
+
 # AI-initiated follow-up settings (Phase 2)
 FOLLOW_UP_DELAY_SECONDS = 3.0  # Wait 3 seconds after TTS before follow-up
 FOLLOW_UP_PHRASES: List[str] = [
@@ -129,12 +169,15 @@ if WYOMING_AVAILABLE:
 
         # Audio analysis constants
         SAMPLE_RATE = 16000
-        SILENCE_THRESHOLD = 0.02  # RMS threshold for silence detection
 
         def __init__(self, *args, interface_name: str = 'home_assistant', **kwargs):
             super().__init__(*args, **kwargs)
             self.interface_name = interface_name
-            self.audio_buffer = bytearray()
+            self.audio_buffer = PCMRingBuffer.for_duration(MAX_UTTERANCE_SECONDS)
+            # Barge-in VAD (noise floor learned per satellite)
+            writer = getattr(self, "writer", None)
+            self._peername = writer.get_extra_info("peername") if writer is not None else None
+            self._vad = VoiceActivityDetector.for_room(vad_room_key(interface_name, self._peername))
             self.session_id: Optional[str] = None
             self._voice_manager = None
 
@@ -149,6 +192,13 @@ if WYOMING_AVAILABLE:
             # TTS playback control
             self._tts_cancel_event: Optional[asyncio.Event] = None
 
+            # Sentence audio rendered while the answer was still streaming
+            self._prefetched_audio: Dict[str, asyncio.Task] = {}
+            self._query_started_at: Optional[float] = None
+
+            # Streaming STT session for the current utterance
+            self._transcriber: Optional[StreamingTranscriber] = None
+
             # Pipeline timing (for total duration metric)
             self.pipeline_start_time: Optional[float] = None
 
@@ -235,7 +285,7 @@ if WYOMING_AVAILABLE:
                            follow_up_count=self.follow_up_count)
 
                 # Synthesize and play the follow-up
-                await self._synthesize(phrase)
+                await self._speak(phrase)
 
             except asyncio.CancelledError:
                 # Task was cancelled (new audio came in)
@@ -243,22 +293,6 @@ if WYOMING_AVAILABLE:
             except Exception as e:
                 logger.error("wyoming_follow_up_error", error=str(e))
 
-        def _calculate_audio_energy(self, audio_data: bytes) -> float:
-            """Calculate RMS energy of audio data for speech detection."""
-            try:
-                samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-                if len(samples) == 0:
-                    return 0.0
-                rms = np.sqrt(np.mean(samples ** 2))
-                return float(rms / 32768.0)  # Normalize to 0-1 range
-            except Exception:
-                return 0.0
-
-        def _is_speech(self, audio_data: bytes) -> bool:
-            """Detect if audio contains speech (not silence)."""
-            energy = self._calculate_audio_energy(audio_data)
-            return energy > self.SILENCE_THRESHOLD
-
         async def handle_event(self, event: Event):
             """Handle incoming Wyoming events with state tracking."""
             try:
@@ -275,17 +309,24 @@ if WYOMING_AVAILABLE:
                     return await self._audio_stop()
 
                 elif Transcribe.is_type(event.type):
+                    self._use_satellite_vad(Transcribe.from_event(event).context)
                     return await self._transcribe()
 
                 elif Synthesize.is_type(event.type):
                     synth = Synthesize.from_event(event)
-                    return await self._synthesize(synth.text)
+                    return await self._speak(synth.text)
 
             except Exception as e:
                 logger.error("wyoming_event_error", error=str(e), event_type=event.type)
                 self.state = WyomingSessionState.IDLE
                 raise
 
+        def _use_satellite_vad(self, context: Optional[Dict[str, Any]]):
+            """Switch to the noise floor of the satellite named in the event context."""
+            room = vad_room_key(self.interface_name, self._peername, context)
+            if room != self._vad.room:
+                self._vad = VoiceActivityDetector.for_room(room)
+
         async def _describe(self) -> Event:
             """Return service capabilities."""
             manager = await self._get_voice_manager()
@@ -350,10 +391,14 @@ if WYOMING_AVAILABLE:
                 if self._tts_cancel_event:
                     self._tts_cancel_event.set()
 
+            self._clear_prefetched_audio()
             self.audio_buffer.clear()
             self.session_id = str(uuid.uuid4())
             self.state = WyomingSessionState.LISTENING
 
+            if STREAMING_STT_ENABLED:
+                await self._start_transcriber()
+
             # Start pipeline timing
             self.pipeline_start_time = time.time()
 
@@ -373,9 +418,15 @@ if WYOMING_AVAILABLE:
             chunk = AudioChunk.from_event(event)
             audio_data = chunk.audio
 
+            # Every chunk goes through the VAD; the noise floor is frozen during
+            # TTS playback so our own echo does not raise it and mask a barge-in
+            voice = self._vad.process(
+                audio_data, adapt_noise_floor=self.state != WyomingSessionState.SPEAKING
+            )
+
             # If we're in speaking state, check for barge-in
             if self.state == WyomingSessionState.SPEAKING:
-                if self._is_speech(audio_data):
+                if voice.is_speech:
                     logger.info("wyoming_barge_in_speech_detected",
                                session_id=self.session_id)
 
@@ -394,21 +445,16 @@ if WYOMING_AVAILABLE:
                     # Start capturing the new utterance
                     self.state = WyomingSessionState.LISTENING
 
-            self.audio_buffer.extend(audio_data)
+            self.audio_buffer.write(audio_data)
+            if self._transcriber:
+                self._transcriber.feed(audio_data)
 
         async def _audio_stop(self):
             """Handle audio session stop - triggers transcription."""
             return await self._transcribe()
 
-        async def _transcribe(self) -> Event:
-            """Transcribe accumulated audio using configured STT engine."""
-            if not self.audio_buffer:
-                logger.debug("wyoming_transcribe_empty")
-                return Transcript(text='').event()
-
-            session_id = self.session_id or str(uuid.uuid4())
-
-            # Get STT URL from config or use default
+        async def _get_stt_settings(self):
+            """(stt_url, stt_engine) from voice config or defaults."""
             stt_url = DEFAULT_STT_URL
             stt_engine = "whisper"  # Default engine name for metrics
             manager = await self._get_voice_manager()
@@ -419,20 +465,97 @@ if WYOMING_AVAILABLE:
                     stt_url = config.get('wyoming_url').replace('tcp://', 'http://').replace(':10300', ':10301')
                 if config and config.get('engine'):
                     stt_engine = config.get('engine')
+            return stt_url, stt_engine
+
+        async def _start_transcriber(self):
+            """Open a streaming STT session for the new utterance (batch STT if unavailable)."""
+            if self._transcriber:
+                await self._transcriber.abort()
+                self._transcriber = None
+
+            stt_url, _ = await self._get_stt_settings()
+            transcriber = StreamingTranscriber(stt_url, on_partial=self._on_partial_transcript)
+            try:
+                await transcriber.start()
+            except StreamingSTTError as e:
+                logger.warning("wyoming_streaming_stt_unavailable",
+                              session_id=self.session_id,
+                              error=str(e))
+                return
+            self._transcriber = transcriber
+
+        async def _on_partial_transcript(self, text: str, stable: bool):
+            """Publish partials; classify stable ones ahead of the final transcript."""
+            session_id = self.session_id
+            logger.debug("wyoming_partial_transcript",
+                        session_id=session_id,
+                        text=text[:100],
+                        stable=stable)
+            if EVENTS_AVAILABLE:
+                await emit_stt_progress(session_id, text, stable, self.interface_name)
+            if stable:
+                await preclassify(ORCHESTRATOR_URL, text, session_id=session_id, room=self.interface_name)
+
+        async def _transcribe(self) -> Event:
+            """Transcribe accumulated audio using configured STT engine."""
+            transcriber, self._transcriber = self._transcriber, None
+            if not self.audio_buffer:
+                logger.debug("wyoming_transcribe_empty")
+                if transcriber:
+                    await transcriber.abort()
+                return Transcript(text='').event()
+
+            session_id = self.session_id or str(uuid.uuid4())
+
+            stt_url, stt_engine = await self._get_stt_settings()
 
             logger.info("wyoming_transcribe_start",
                        session_id=session_id,
                        audio_bytes=len(self.audio_buffer),
-                       stt_url=stt_url)
+                       stt_url=stt_url,
+                       streaming=transcriber is not None)
 
             stt_start_time = time.time()
 
+            if transcriber:
+                # Audio is already decoded up to the last chunk
+                try:
+                    text = await transcriber.finalize()
+                except StreamingSTTError as e:
+                    logger.warning("wyoming_streaming_stt_failed",
+                                  session_id=session_id,
+                                  error=str(e))
+                else:
+                    stt_elapsed = time.time() - stt_start_time
+                    if METRICS_AVAILABLE:
+                        stt_duration.labels(
+                            engine=stt_engine,
+                            interface=self.interface_name
+                        ).observe(stt_elapsed)
+                        voice_step_counter.labels(
+                            step="stt",
+                            status="success",
+                            interface=self.interface_name
+                        ).inc()
+
+                    logger.info("wyoming_transcribe_complete",
+                               session_id=session_id,
+                               text=text[:100],
+                               stt_duration_ms=int(stt_elapsed * 1000),
+                               streaming=True)
+
+                    if text:
+                        await self._process_query(text, session_id)
+
+                    return Transcript(text=text).event()
+
             try:
                 async with httpx.AsyncClient(timeout=30.0) as client:
                     # Send audio to STT service
                     response = await client.post(
                         f"{stt_url}/v1/audio/transcriptions",
-                        files={'file': ('audio.wav', bytes(self.audio_buffer), 'audio/wav')},
+                        # Multipart needs bytes: the one copy per utterance
+                        files={'file': ('audio.wav', self.audio_buffer.tail().tobytes(), 'audio/wav')},
                         data={'model': 'whisper-1', 'language': 'en'},
                     )
 
@@ -524,6 +647,10 @@ if WYOMING_AVAILABLE:
                     # Clear after use
                     self.interruption_context = None
 
+                self._query_started_at = llm_start_time
+                if STREAMING_TTS_ENABLED and await self._process_query_stream(request_data, session_id, llm_start_time):
+                    return
+
                 async with httpx.AsyncClient(timeout=60.0) as client:
                     response = await client.post(
                         f"{ORCHESTRATOR_URL}/query",
@@ -581,17 +708,64 @@ if WYOMING_AVAILABLE:
                 if self.state == WyomingSessionState.PROCESSING:
                     self.state = WyomingSessionState.IDLE
 
-        async def _synthesize(self, text: str):
-            """Synthesize speech using configured TTS engine with cancellation support."""
-            session_id = self.session_id or str(uuid.uuid4())
-
-            # Store current response for interruption context
-            self.current_response = text
-            self.tts_position_ms = 0
-            self.tts_cancelled = False
-            self._tts_cancel_event = asyncio.Event()
-
-            # Get TTS URL from config or use default
+        async def _process_query_stream(self, request_data: Dict[str, Any], session_id: str, llm_start_time: float) -> bool:
+            """
+            Read the answer from /query/stream/v2, starting TTS for the first
+            sentences as soon as they arrive. Returns False if the stream
+            failed before producing a sentence (caller falls back to /query).
+            """
+            tts_url, voice_id, tts_engine = await self._get_tts_settings()
+            result: Dict[str, Any] = {}
+            sentences: List[str] = []
+            try:
+                async with httpx.AsyncClient(timeout=60.0) as client:
+                    async for sentence in stream_query_sentences(
+                        client, f"{ORCHESTRATOR_URL}/query/stream/v2", request_data, result
+                    ):
+                        if len(sentences) <= TTS_PREFETCH_SENTENCES and sentence not in self._prefetched_audio:
+                            self._prefetched_audio[sentence] = asyncio.create_task(
+                                self._tts_request(sentence, tts_url, voice_id, tts_engine)
+                            )
+                        sentences.append(sentence)
+            except Exception as e:
+                logger.warning("wyoming_query_stream_failed",
+                              session_id=session_id,
+                              sentences=len(sentences),
+                              error=str(e))
+                if not sentences:
+                    self._clear_prefetched_audio()
+                    return False
+
+            llm_elapsed = time.time() - llm_start_time
+            self.current_response = result.get('full_response') or " ".join(sentences)
+
+            if METRICS_AVAILABLE:
+                llm_duration.labels(
+                    model='orchestrator',
+                    interface=self.interface_name
+                ).observe(llm_elapsed)
+                voice_step_counter.labels(
+                    step="llm",
+                    status="success",
+                    interface=self.interface_name
+                ).inc()
+
+            logger.info("wyoming_query_complete",
+                       session_id=session_id,
+                       response_preview=self.current_response[:100],
+                       llm_duration_ms=int(llm_elapsed * 1000),
+                       sentences=len(sentences),
+                       streaming=True)
+            return True
+
+        def _clear_prefetched_audio(self):
+            """Drop sentence audio that will not be played (barge-in, new query)."""
+            for task in self._prefetched_audio.values():
+                task.cancel()
+            self._prefetched_audio = {}
+
+        async def _get_tts_settings(self):
+            """(tts_url, voice_id, tts_engine) from voice config or defaults."""
             tts_url = DEFAULT_TTS_URL
             voice_id = "en_US-lessac-medium"
             tts_engine = "piper"  # Default engine name for metrics
@@ -606,16 +780,11 @@ if WYOMING_AVAILABLE:
                         voice_id = config.get('voice_id')
                     if config.get('engine'):
                         tts_engine = config.get('engine')
+            return tts_url, voice_id, tts_engine
 
-            logger.info("wyoming_synthesize_start",
-                       session_id=session_id,
-                       text_length=len(text),
-                       tts_url=tts_url)
-
-            # Enter speaking state
-            self.state = WyomingSessionState.SPEAKING
+        async def _tts_request(self, text: str, tts_url: str, voice_id: str, tts_engine: str) -> bytes:
+            """Synthesize one sentence via /tts/synthesize (empty bytes on failure)."""
             tts_start_time = time.time()
-
             try:
                 async with httpx.AsyncClient(timeout=30.0) as client:
                     # Use /tts/synthesize endpoint with correct parameters
@@ -626,59 +795,108 @@ if WYOMING_AVAILABLE:
                             'voice': voice_id,
                         },
                     )
+            except Exception as e:
+                logger.error("wyoming_synthesize_error", error=str(e))
+                return b""
+
+            tts_elapsed = time.time() - tts_start_time
+            if response.status_code != 200:
+                logger.error("wyoming_tts_error",
+                            status=response.status_code,
+                            response=response.text[:200],
+                            tts_duration_ms=int(tts_elapsed * 1000))
+                return b""
+
+            # Record TTS metrics (per sentence)
+            if METRICS_AVAILABLE:
+                tts_duration.labels(
+                    engine=tts_engine,
+                    voice=voice_id,
+                    interface=self.interface_name
+                ).observe(tts_elapsed)
+            return response.content
+
+        async def _speak(self, text: str):
+            """Write a complete Wyoming audio response (start, chunks, stop) for ``text``."""
+            await self.write_event(AudioStart(rate=16000, width=2, channels=1).event())
+            async for event in self._synthesize(text):
+                await self.write_event(event)
+            await self.write_event(AudioStop().event())
+            return True
 
-                    tts_elapsed = time.time() - tts_start_time
+        async def _synthesize(self, text: str):
+            """Synthesize speech using configured TTS engine with cancellation support."""
+            session_id = self.session_id or str(uuid.uuid4())
 
-                    if response.status_code == 200:
-                        audio_data = response.content
+            # Store current response for interruption context
+            self.current_response = text
+            self.tts_position_ms = 0
+            self.tts_cancelled = False
+            self._tts_cancel_event = asyncio.Event()
 
-                        # Record TTS metrics
-                        if METRICS_AVAILABLE:
-                            tts_duration.labels(
-                                engine=tts_engine,
-                                voice=voice_id,
-                                interface=self.interface_name
-                            ).observe(tts_elapsed)
-                            voice_step_counter.labels(
-                                step="tts",
-                                status="success",
-                                interface=self.interface_name
-                            ).inc()
+            tts_url, voice_id, tts_engine = await self._get_tts_settings()
 
-                        logger.info("wyoming_synthesize_complete",
-                                   session_id=session_id,
-                                   audio_bytes=len(audio_data),
-                                   tts_duration_ms=int(tts_elapsed * 1000))
+            logger.info("wyoming_synthesize_start",
+                       session_id=session_id,
+                       text_length=len(text),
+                       tts_url=tts_url)
 
-                        # Return audio chunks with cancellation check
-                        chunk_size = 16000 * 2  # 1 second of 16kHz 16-bit audio
-                        chunk_duration_ms = 1000  # 1 second per chunk
+            # Enter speaking state
+            self.state = WyomingSessionState.SPEAKING
+            tts_start_time = time.time()
+            started_at = self._query_started_at or tts_start_time
+            mode = "streaming" if self._prefetched_audio else "full"
+            self._query_started_at = None
 
-                        for i in range(0, len(audio_data), chunk_size):
-                            # Check for cancellation before each chunk
-                            if self.tts_cancelled or self._tts_cancel_event.is_set():
-                                logger.info("wyoming_tts_cancelled",
-                                           session_id=session_id,
-                                           position_ms=self.tts_position_ms)
-                                break
+            async def synthesize_sentence(sentence: str) -> bytes:
+                prefetched = self._prefetched_audio.pop(sentence, None)
+                if prefetched is not None:
+                    return await prefetched
+                return await self._tts_request(sentence, tts_url, voice_id, tts_engine)
 
-                            chunk = audio_data[i:i + chunk_size]
-                            yield AudioChunk(audio=chunk, rate=16000, width=2, channels=1).event()
-                            self.tts_position_ms += chunk_duration_ms
+            # Synthesize sentence N+1 while sentence N is being sent
+            audio = synthesize_ahead(iter_sentences(text), synthesize_sentence)
+            first_audio_at: Optional[float] = None
+            audio_bytes = 0
 
-                    else:
-                        # Record TTS failure
-                        if METRICS_AVAILABLE:
-                            voice_step_counter.labels(
-                                step="tts",
-                                status="error",
-                                interface=self.interface_name
-                            ).inc()
+            try:
+                # Return audio chunks with cancellation check
+                chunk_size = 16000 * 2  # 1 second of 16kHz 16-bit audio
+
+                async for sentence, audio_data in audio:
+                    for i in range(0, len(audio_data), chunk_size):
+                        # Check for cancellation before each chunk
+                        if self.tts_cancelled or self._tts_cancel_event.is_set():
+                            break
+
+                        chunk = audio_data[i:i + chunk_size]
+                        if first_audio_at is None:
+                            first_audio_at = time.time()
+                            observe_time_to_first_audio(self.interface_name, mode, first_audio_at - started_at)
+                        yield AudioChunk(audio=chunk, rate=16000, width=2, channels=1).event()
+                        audio_bytes += len(chunk)
+                        self.tts_position_ms += len(chunk) * 1000 // (16000 * 2)
+
+                    if self.tts_cancelled or self._tts_cancel_event.is_set():
+                        logger.info("wyoming_tts_cancelled",
+                                   session_id=session_id,
+                                   position_ms=self.tts_position_ms)
+                        break
 
-                        logger.error("wyoming_tts_error",
-                                    status=response.status_code,
-                                    response=response.text[:200],
-                                    tts_duration_ms=int(tts_elapsed * 1000))
+                tts_elapsed = time.time() - tts_start_time
+                if METRICS_AVAILABLE:
+                    voice_step_counter.labels(
+                        step="tts",
+                        status="success" if audio_bytes else "error",
+                        interface=self.interface_name
+                    ).inc()
+
+                logger.info("wyoming_synthesize_complete",
+                           session_id=session_id,
+                           audio_bytes=audio_bytes,
+                           mode=mode,
+                           time_to_first_audio_ms=int((first_audio_at - started_at) * 1000) if first_audio_at else None,
+                           tts_duration_ms=int(tts_elapsed * 1000))
 
             except Exception as e:
                 # Record TTS failure
@@ -692,6 +910,10 @@ if WYOMING_AVAILABLE:
                 logger.error("wyoming_synthesize_error", error=str(e))
 
             finally:
+                # Stops pending sentence synthesis (barge-in)
+                await audio.aclose()
+                self._clear_prefetched_audio()
+
                 # Reset state
                 if self.state == WyomingSessionState.SPEAKING:
                     self.state = WyomingSessionState.IDLE
@@ -4,10 +4,10 @@ Context Storage
 Stores and retrieves conversation context from Redis for session continuity.
 """
 
-import json
 import time
 from typing import Optional
 
+from shared.cache import encode_value, decode_value, get_encoded
 from shared.logging_config import configure_logging
 from orchestrator.state import ConversationContext
 
@@ -33,9 +33,9 @@ async def get_conversation_context(
 
     try:
         context_key = f"athena:context:{session_id}"
-        context_json = await cache_client.client.get(context_key)
-        if context_json:
-            data = json.loads(context_json)
+        context_data = await get_encoded(cache_client.client, context_key)
+        if context_data:
+            data = decode_value(context_data)
             return ConversationContext(**data)
     except Exception as e:
         logger.warning(f"Failed to retrieve conversation context: {e}")
@@ -82,7 +82,7 @@ async def store_conversation_context(
             timestamp=time.time()
         )
         context_key = f"athena:context:{session_id}"
-        await cache_client.client.setex(context_key, ttl, context.model_dump_json())
+        await cache_client.client.setex(context_key, ttl, encode_value(context.model_dump(mode="json")))
         logger.info(f"Stored conversation context for session {session_id[:8]}...: intent={intent}")
         return True
     except Exception as e:
@@ -1,14 +1,27 @@
 """
 Home Assistant Entity Manager
 Dynamically fetches and caches HA entities for intelligent device control
+
+With an HAStateMirror attached, entities come from the mirror's
+event-driven in-memory state (no I/O) and the indexes below are updated
+per state change; the 5-minute /api/states poll is only the fallback while
+the mirror is not live.
+
+Room names resolve through a RoomIndex (room_index.py) built from the
+entities, the mirror's area registry and ROOM_SYNONYMS; it is rebuilt only
+when entities are added/removed/renamed or the registry changes.
 """
 import asyncio
 import httpx
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
+from shared.ha_state_mirror import HAStateMirror
+
+from .room_index import RoomIndex
+
 class HAEntityManager:
-    def __init__(self, ha_url: str, ha_token: str):
+    def __init__(self, ha_url: str, ha_token: str, state_mirror: Optional[HAStateMirror] = None):
         self.ha_url = ha_url
         self.ha_token = ha_token
         self.headers = {
@@ -31,6 +44,39 @@ class HAEntityManager:
         self._entities_by_area = {}
         self._entities_by_type = {}
         self._light_groups = {}
+
+        # Room resolution (see _room_index)
+        self.room_index = RoomIndex(self.ROOM_SYNONYMS)
+        self._room_index_stale = True
+        self._room_index_registry_version = None
+
+        # Event-driven state (preferred over the REST cache while live)
+        self.state_mirror = state_mirror
+        self._using_mirror = False
+        if state_mirror is not None:
+            state_mirror.add_listener(self._on_state_change)
+
+    def _on_state_change(self, entity_id: str, old_state: Optional[Dict], new_state: Optional[Dict]):
+        """Keep the indexes current as the mirror applies state changes."""
+        if not self._using_mirror:
+            return
+        if old_state is None or new_state is None or \
+           old_state.get('attributes', {}).get('friendly_name') != new_state.get('attributes', {}).get('friendly_name'):
+            self._room_index_stale = True
+        if new_state is None:
+            self._unindex_entity(entity_id)
+        else:
+            self._index_entity(entity_id, new_state)
+
+    def _use_mirror(self) -> bool:
+        """Switch reads to the mirror once it is live (indexes built once, then per change)."""
+        if self.state_mirror is None or not self.state_mirror.is_live:
+            return False
+        if not self._using_mirror:
+            self._entities_cache = self.state_mirror.states
+            self._using_mirror = True
+            self._build_indexes()
+        return True
     
     async def refresh_entities(self):
         """Fetch all entities from Home Assistant"""
@@ -51,41 +97,77 @@ class HAEntityManager:
         self._entities_by_area = {}
         self._entities_by_type = {}
         self._light_groups = {}
+        self._room_index_stale = True
         
         for entity_id, entity in self._entities_cache.items():
-            # Index by domain (light, switch, etc)
-            domain = entity_id.split('.')[0]
-            if domain not in self._entities_by_type:
-                self._entities_by_type[domain] = {}
-            self._entities_by_type[domain][entity_id] = entity
-            
-            # Index light groups AND individual lights
-            if domain == 'light':
-                attrs = entity.get('attributes', {})
-                if 'entity_id' in attrs and isinstance(attrs['entity_id'], list):
-                    # This is a group - store its members
-                    self._light_groups[entity_id] = {
-                        'friendly_name': attrs.get('friendly_name', entity_id),
-                        'members': attrs['entity_id'],
-                        'state': entity.get('state'),
-                        'is_group': True
-                    }
-                else:
-                    # Individual light - store without members
-                    self._light_groups[entity_id] = {
-                        'friendly_name': attrs.get('friendly_name', entity_id),
-                        'members': [],  # No members - it's an individual light
-                        'state': entity.get('state'),
-                        'is_group': False
-                    }
+            self._index_entity(entity_id, entity)
+
+    def _index_entity(self, entity_id: str, entity: Dict):
+        """Add or update one entity in the lookup indexes"""
+        # Index by domain (light, switch, etc)
+        domain = entity_id.split('.')[0]
+        if domain not in self._entities_by_type:
+            self._entities_by_type[domain] = {}
+        self._entities_by_type[domain][entity_id] = entity
+
+        # Index light groups AND individual lights
+        if domain == 'light':
+            attrs = entity.get('attributes', {})
+            if 'entity_id' in attrs and isinstance(attrs['entity_id'], list):
+                # This is a group - store its members
+                self._light_groups[entity_id] = {
+                    'friendly_name': attrs.get('friendly_name', entity_id),
+                    'members': attrs['entity_id'],
+                    'state': entity.get('state'),
+                    'is_group': True
+                }
+            else:
+                # Individual light - store without members
+                self._light_groups[entity_id] = {
+                    'friendly_name': attrs.get('friendly_name', entity_id),
+                    'members': [],  # No members - it's an individual light
+                    'state': entity.get('state'),
+                    'is_group': False
+                }
+
+    def _unindex_entity(self, entity_id: str):
+        """Remove one entity from the lookup indexes"""
+        domain = entity_id.split('.')[0]
+        self._entities_by_type.get(domain, {}).pop(entity_id, None)
+        self._light_groups.pop(entity_id, None)
     
     async def get_entities(self, force_refresh=False) -> Dict:
         """Get cached entities or refresh if needed"""
+        if self._use_mirror():
+            # Shallow copy: callers may await mid-iteration while events add/remove entities
+            return dict(self._entities_cache)
+        if self._using_mirror:
+            # Mirror went stale (HA disconnected): poll REST until it is back
+            self._using_mirror = False
+            self._entities_cache = None
         if force_refresh or self._entities_cache is None or \
            (datetime.now() - self._cache_time) > self._cache_duration:
             await self.refresh_entities()
         
         return self._entities_cache
+
+    async def get_entities_by_domain(self, *domains: str) -> Dict[str, Dict]:
+        """Get entities of the given domains (e.g. 'lock', 'fan') from the domain index"""
+        await self.get_entities()
+        entities = {}
+        for domain in domains:
+            entities.update(self._entities_by_type.get(domain, {}))
+        return entities
+
+    async def get_state(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """Get one entity's state (from the mirror when live, else REST)"""
+        if self._use_mirror():
+            return self.state_mirror.get_state(entity_id)
+        response = await self.client.get(f"/api/states/{entity_id}")
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
     
     # Room name synonyms for flexible matching
     ROOM_SYNONYMS = {
@@ -111,73 +193,65 @@ class HAEntityManager:
         'porch': ['front_porch', 'back_porch', 'outdoor', 'outside', 'exterior', 'front', 'back_yard'],
     }
 
+    def _room_index(self) -> RoomIndex:
+        """The room index, rebuilt first if entities or the area registry changed"""
+        self._use_mirror()
+        registry_version = self.state_mirror.registry_version if self.state_mirror is not None else None
+        if self._room_index_stale or registry_version != self._room_index_registry_version:
+            if self.state_mirror is not None:
+                self.room_index.rebuild(
+                    self._entities_cache or {},
+                    self.state_mirror.areas(),
+                    self.state_mirror.entity_areas()
+                )
+            else:
+                self.room_index.rebuild(self._entities_cache or {})
+            self._room_index_stale = False
+            self._room_index_registry_version = registry_version
+        return self.room_index
+
     def _expand_room_names(self, room_name: str) -> List[str]:
         """Expand a room name into all possible search terms including synonyms"""
-        room_lower = room_name.lower().strip()
-
-        # Split on common conjunctions and punctuation
-        # Handle "hall and hallway", "hall, hallway", "hall/hallway", etc.
-        import re
-        parts = re.split(r'\s+and\s+|\s*,\s*|\s*/\s*|\s+or\s+', room_lower)
-
-        # Collect all search terms
-        search_terms = set()
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
+        return sorted(self.room_index.expand(room_name))
 
-            # Add the part itself (both with spaces and underscores)
-            search_terms.add(part.replace(' ', '_'))
-            search_terms.add(part.replace('_', ' '))
+    async def get_room_entities(
+        self, room_name: str, *domains: str, expand_synonyms: bool = True
+    ) -> Dict[str, Dict]:
+        """
+        Get entities in a room (supports compound names and synonyms), optionally limited to domains.
 
-            # Add synonyms
-            for key, synonyms in self.ROOM_SYNONYMS.items():
-                if part == key or part.replace(' ', '_') == key.replace(' ', '_'):
-                    for syn in synonyms:
-                        search_terms.add(syn.replace(' ', '_'))
-                        search_terms.add(syn.replace('_', ' '))
-                # Also check if any synonym matches
-                for syn in synonyms:
-                    if part == syn or part.replace(' ', '_') == syn.replace(' ', '_'):
-                        search_terms.add(key.replace(' ', '_'))
-                        search_terms.add(key.replace('_', ' '))
+        expand_synonyms=False matches only the literal room text (locks, fans, covers).
+        """
+        await self.get_entities()
+        entity_ids = self._room_index().entities(room_name, *domains, expand_synonyms=expand_synonyms)
+        return {
+            entity_id: self._entities_cache[entity_id]
+            for entity_id in sorted(entity_ids)
+            if entity_id in self._entities_cache
+        }
 
-        return list(search_terms)
+    def room_of(self, entity_id: str, friendly_name: Optional[str] = None) -> Optional[str]:
+        """Room label for an entity (e.g. 'Master Bathroom'), None if it has no recognizable room"""
+        return self._room_index().room_of(entity_id, friendly_name)
 
     async def find_lights_by_room(self, room_name: str) -> List[Dict]:
         """Find light entities for a specific room (supports compound names like 'hall and hallway')"""
         await self.get_entities()
+        room_lights = self._room_index().entities(room_name, 'light')
 
-        # Expand room name into all possible search terms
-        search_terms = self._expand_room_names(room_name)
-
-        # Look for light groups matching any search term
+        # Keep index order (groups as HA lists them) for stable results
         matches = []
-        seen_entity_ids = set()  # Avoid duplicates
-
         for entity_id, group_info in self._light_groups.items():
-            if entity_id in seen_entity_ids:
+            if entity_id not in room_lights:
                 continue
-
-            friendly_name = group_info['friendly_name'].lower()
-            # Normalize entity name the same way
-            entity_name_normalized = entity_id.replace('light.', '').lower()
-            friendly_normalized = friendly_name.replace(' ', '_')
-
-            # Check if any search term matches
-            for search_term in search_terms:
-                if search_term in entity_name_normalized or search_term in friendly_normalized:
-                    is_group = group_info.get('is_group', len(group_info.get('members', [])) > 0)
-                    matches.append({
-                        'entity_id': entity_id,
-                        'friendly_name': group_info['friendly_name'],
-                        'members': group_info['members'],
-                        'state': group_info['state'],
-                        'type': 'group' if is_group else 'individual'
-                    })
-                    seen_entity_ids.add(entity_id)
-                    break  # Found a match, no need to check other terms
+            is_group = group_info.get('is_group', len(group_info.get('members', [])) > 0)
+            matches.append({
+                'entity_id': entity_id,
+                'friendly_name': group_info['friendly_name'],
+                'members': group_info['members'],
+                'state': group_info['state'],
+                'type': 'group' if is_group else 'individual'
+            })
 
         return matches
 
@@ -219,10 +293,15 @@ class HAEntityManager:
             'friendly_name': attrs.get('friendly_name', entity_id)
         }
 
-    async def get_climate_state(self, entity_id: str = "climate.thermostat") -> Optional[Dict]:
-        """Get current state of climate/thermostat entity"""
+    async def get_climate_state(self, entity_id: str = "climate.thermostat", room: Optional[str] = None) -> Optional[Dict]:
+        """Get current state of climate/thermostat entity (the room's thermostat if one is found)"""
         await self.get_entities()
 
+        if room:
+            room_climate = sorted(self._room_index().entities(room, 'climate'))
+            if room_climate:
+                entity_id = room_climate[0]
+
         entity = self._entities_cache.get(entity_id)
         if not entity:
             # Try to find any climate entity
@@ -308,11 +308,9 @@ async def optimize_status_query(
     # Get relevant domains
     domains = get_domains_for_query_type(query_type)
 
-    # Get all entities (uses cache if available)
-    all_entities = await entity_manager.get_entities()
-
-    # Filter by domain
-    filtered_entities = filter_entities_by_domains(all_entities, domains)
+    # Read the relevant domains from the entity manager's domain index
+    # (in-memory when the HA state mirror is live)
+    filtered_entities = await entity_manager.get_entities_by_domain(*domains)
 
     # Get max entities from config
     max_entities = 50
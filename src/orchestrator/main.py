@@ -40,14 +40,16 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from shared.logging_config import configure_logging
 from shared.ha_client import HomeAssistantClient
+from shared.ha_state_mirror import HAStateMirror
 from shared.llm_router import get_llm_router, LLMRouter
-from shared.cache import CacheClient
+from shared.cache import CacheClient, encode_value, decode_value, get_encoded
 from shared.admin_config import get_admin_client
+from shared.feature_flags import get_flag_store
 from shared.base_knowledge_utils import get_knowledge_context_for_user, get_home_address_for_user
 from shared.tracing import RequestTracingMiddleware, get_tracing_headers
 from shared.errors import register_exception_handlers, RateLimitError, ServiceUnavailableError
 from shared.service_registry import get_service_url as registry_get_service_url
-from shared.metrics import record_tool_execution, get_metrics_text, record_timing_metrics
+from shared.metrics import record_tool_execution, get_metrics_text, record_timing_metrics, setup_quantiles_endpoint
 
 # Parallel search imports
 from orchestrator.search_providers.parallel_search import ParallelSearchEngine
@@ -93,7 +95,17 @@ from orchestrator.circuit_breaker import get_circuit_breaker_registry
 from orchestrator.rate_limiter import get_rate_limiter_registry
 
 # Semantic query caching for latency optimization
-from orchestrator.semantic_cache import get_cached_response, cache_response, extract_semantic_intent
+from orchestrator.semantic_cache import (
+    get_cached_response,
+    cache_response,
+    extract_semantic_intent,
+    match_uncacheable_rule,
+    load_semantic_intent_categories,
+    invalidate_cache as invalidate_semantic_cache_entries,
+    is_semantic_pattern,
+    CACHE_TTL_CONFIG,
+    SEMANTIC_KEY_NAMESPACE,
+)
 
 # Sentence buffering for LLM streaming pipeline
 from orchestrator.sentence_buffer import SentenceBuffer, stream_with_sentence_buffering
@@ -176,14 +188,9 @@ if not EVENTS_AVAILABLE:
 # Feature Flag Helper
 # =============================================================================
 
-# Feature flag cache for orchestrator
-_orch_feature_flag_cache: dict = {}
-_orch_feature_flag_cache_ttl = 60.0  # seconds
-
-
 async def get_feature_flag(flag_name: str, default: bool = False) -> bool:
     """
-    Get feature flag value with caching.
+    Get feature flag value from the in-process flag store.
 
     Args:
         flag_name: Name of the feature flag
@@ -192,33 +199,10 @@ async def get_feature_flag(flag_name: str, default: bool = False) -> bool:
     Returns:
         Boolean flag value
     """
-    import time
-
-    # Check cache first
-    if flag_name in _orch_feature_flag_cache:
-        cached_time, cached_value = _orch_feature_flag_cache[flag_name]
-        if time.time() - cached_time < _orch_feature_flag_cache_ttl:
-            return cached_value
-
-    # Fetch from admin API
-    try:
-        import httpx
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(
-                f"{ADMIN_API_URL}/api/features/public",
-                params={"name": flag_name}
-            )
-            if response.status_code == 200:
-                flags = response.json()
-                for flag in flags:
-                    if flag.get("name") == flag_name:
-                        value = flag.get("enabled", default)
-                        _orch_feature_flag_cache[flag_name] = (time.time(), value)
-                        return value
-    except Exception as e:
-        logger.warning("feature_flag_fetch_failed", flag=flag_name, error=str(e))
-
-    return default
+    store = get_flag_store()
+    if not store.loaded:
+        await store.ensure_loaded()
+    return store.is_enabled(flag_name, default)
 
 
 async def get_feature_config(flag_name: str) -> Dict[str, Any]:
@@ -231,38 +215,10 @@ async def get_feature_config(flag_name: str) -> Dict[str, Any]:
     Returns:
         Dict with enabled status and config, or empty dict if not found
     """
-    import time
-
-    cache_key = f"{flag_name}_config"
-
-    # Check cache first
-    if cache_key in _orch_feature_flag_cache:
-        cached_time, cached_value = _orch_feature_flag_cache[cache_key]
-        if time.time() - cached_time < _orch_feature_flag_cache_ttl:
-            return cached_value
-
-    # Fetch from admin API
-    try:
-        import httpx
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(
-                f"{ADMIN_API_URL}/api/features/public",
-                params={"name": flag_name}
-            )
-            if response.status_code == 200:
-                flags = response.json()
-                for flag in flags:
-                    if flag.get("name") == flag_name:
-                        result = {
-                            "enabled": flag.get("enabled", False),
-                            "config": flag.get("config", {}),
-                        }
-                        _orch_feature_flag_cache[cache_key] = (time.time(), result)
-                        return result
-    except Exception as e:
-        logger.warning("feature_config_fetch_failed", flag=flag_name, error=str(e))
-
-    return {"enabled": False, "config": {}}
+    store = get_flag_store()
+    if not store.loaded:
+        await store.ensure_loaded()
+    return store.get(flag_name) or {"enabled": False, "config": {}}
 
 
 async def get_automation_system_mode() -> str:
@@ -272,36 +228,8 @@ async def get_automation_system_mode() -> str:
     Returns:
         "pattern_matching" or "dynamic_agent"
     """
-    import time
-
-    flag_name = "automation_system_mode"
-
-    # Check cache first
-    if flag_name in _orch_feature_flag_cache:
-        cached_time, cached_value = _orch_feature_flag_cache[flag_name]
-        if time.time() - cached_time < _orch_feature_flag_cache_ttl:
-            return cached_value
-
-    # Fetch from admin API
-    try:
-        import httpx
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(
-                f"{ADMIN_API_URL}/api/features/public",
-                params={"name": flag_name}
-            )
-            if response.status_code == 200:
-                flags = response.json()
-                for flag in flags:
-                    if flag.get("name") == flag_name:
-                        config = flag.get("config", {})
-                        mode = config.get("mode", "pattern_matching")
-                        _orch_feature_flag_cache[flag_name] = (time.time(), mode)
-                        return mode
-    except Exception as e:
-        logger.warning("automation_mode_fetch_failed", error=str(e))
-
-    return "pattern_matching"  # Default to pattern matching
+    config = (await get_feature_config("automation_system_mode"))["config"]
+    return config.get("mode", "pattern_matching")  # Default to pattern matching
 
 
 async def get_weather_provider_mode() -> str:
@@ -311,36 +239,8 @@ async def get_weather_provider_mode() -> str:
     Returns:
         "standard" (free tier) or "onecall" (OneCall 3.0)
     """
-    import time
-
-    flag_name = "weather_provider"
-
-    # Check cache first
-    if flag_name in _orch_feature_flag_cache:
-        cached_time, cached_value = _orch_feature_flag_cache[flag_name]
-        if time.time() - cached_time < _orch_feature_flag_cache_ttl:
-            return cached_value
-
-    # Fetch from admin API
-    try:
-        import httpx
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(
-                f"{ADMIN_API_URL}/api/features/public",
-                params={"name": flag_name}
-            )
-            if response.status_code == 200:
-                flags = response.json()
-                for flag in flags:
-                    if flag.get("name") == flag_name:
-                        config = flag.get("config", {})
-                        mode = config.get("mode", "standard")
-                        _orch_feature_flag_cache[flag_name] = (time.time(), mode)
-                        return mode
-    except Exception as e:
-        logger.warning("weather_provider_mode_fetch_failed", error=str(e))
-
-    return "standard"  # Default to standard weather service
+    config = (await get_feature_config("weather_provider"))["config"]
+    return config.get("mode", "standard")  # Default to standard weather service
 
 
 # =============================================================================
@@ -852,6 +752,7 @@ session_manager: Optional[SessionManager] = None
 rag_client: Optional[Any] = None  # Unified RAG client with circuit breakers
 mode_client: Optional[httpx.AsyncClient] = None  # Phase 2: Guest mode integration
 entity_manager: Optional[HAEntityManager] = None
+ha_state_mirror: Optional[HAStateMirror] = None
 smart_controller: Optional[SmartHomeController] = None
 sequence_executor: Optional[SequenceExecutor] = None
 automation_agent: Optional[AutomationAgent] = None
@@ -914,12 +815,12 @@ async def get_conversation_context(session_id: str) -> Optional[ConversationCont
         try:
             context_key = f"athena:context:{session_id}"
             # Use asyncio.wait_for to prevent hanging on dead Redis connections
-            context_json = await asyncio.wait_for(
-                cache_client.client.get(context_key),
+            context_data = await asyncio.wait_for(
+                get_encoded(cache_client.client, context_key),
                 timeout=2.0  # 2 second timeout
             )
-            if context_json:
-                data = json.loads(context_json)
+            if context_data:
+                data = decode_value(context_data)
                 logger.debug(f"Retrieved context from Redis for session {session_id[:8]}...")
                 return ConversationContext(**data)
         except asyncio.TimeoutError:
@@ -968,7 +869,7 @@ async def store_conversation_context(
         try:
             context_key = f"athena:context:{session_id}"
             await asyncio.wait_for(
-                cache_client.client.setex(context_key, ttl, context.model_dump_json()),
+                cache_client.client.setex(context_key, ttl, encode_value(context.model_dump(mode="json"))),
                 timeout=2.0  # 2 second timeout
             )
             logger.info(f"Stored context in Redis for session {session_id[:8]}...: intent={intent}")
@@ -1542,6 +1443,9 @@ class OrchestratorState(BaseModel):
     # Barge-in / Interruption context (when user interrupts previous response)
     interruption_context: Optional[Dict[str, Any]] = Field(None, description="Context when user interrupted (previous_query, interrupted_response, audio_position_ms)")
 
+    # Speculative classification of a partial transcript (/query/preclassify)
+    speculative: bool = Field(False, description="Classify only: skip intent discovery and intent metrics")
+
     # Conversation context
     conversation_history: List[Dict[str, str]] = Field(default_factory=list, description="Previous conversation messages")
     history_summary: str = Field("", description="Summarized conversation context (for summarized mode)")
@@ -1701,7 +1605,7 @@ async def ensure_gateway_running() -> bool:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
-    global ha_client, llm_router, cache_client, session_manager, rag_client, parallel_search_engine, result_fusion, mode_client, entity_manager, smart_controller, sequence_executor, automation_agent, music_handler, tv_handler, intent_classifier, follow_me_service
+    global ha_state_mirror, ha_client, llm_router, cache_client, session_manager, rag_client, parallel_search_engine, result_fusion, mode_client, entity_manager, smart_controller, sequence_executor, automation_agent, music_handler, tv_handler, intent_classifier, follow_me_service
 
     # Kill any existing process on orchestrator port before starting
     orchestrator_port = int(os.getenv("ORCHESTRATOR_PORT", "8001"))
@@ -1739,8 +1643,16 @@ async def lifespan(app: FastAPI):
         ha_token = os.getenv("HA_TOKEN", "")
         logger.info("ha_config_from_env_fallback", url=ha_url)
 
+    # Event-driven HA state mirror (WebSocket state_changed subscription);
+    # state reads fall back to REST until it has synced
+    if ha_token and os.getenv("HA_STATE_MIRROR_ENABLED", "true").lower() == "true":
+        ha_state_mirror = HAStateMirror(ha_url, ha_token)
+        await ha_state_mirror.start()
+        if not await ha_state_mirror.wait_ready(timeout=float(os.getenv("HA_STATE_MIRROR_STARTUP_WAIT", "5"))):
+            logger.warning("ha_state_mirror_not_ready", msg="Using REST state reads until the mirror syncs")
+
     # Initialize clients
-    ha_client = HomeAssistantClient(url=ha_url, token=ha_token) if ha_token else None
+    ha_client = HomeAssistantClient(url=ha_url, token=ha_token, state_mirror=ha_state_mirror) if ha_token else None
     if not ha_client:
         logger.warning("ha_client_not_initialized", reason="No token available")
 
@@ -1750,12 +1662,15 @@ async def lifespan(app: FastAPI):
 
     # Initialize entity manager for dynamic HA entity discovery
     if ha_token:
-        entity_manager = HAEntityManager(ha_url=ha_url, ha_token=ha_token)
-        try:
-            await entity_manager.refresh_entities()
-            logger.info("Entity manager initialized with HA entities cached")
-        except Exception as e:
-            logger.warning("ha_entity_refresh_failed", error=str(e), msg="HA unavailable, will retry later")
+        entity_manager = HAEntityManager(ha_url=ha_url, ha_token=ha_token, state_mirror=ha_state_mirror)
+        if ha_state_mirror is None or not ha_state_mirror.is_live:
+            try:
+                await entity_manager.refresh_entities()
+                logger.info("Entity manager initialized with HA entities cached")
+            except Exception as e:
+                logger.warning("ha_entity_refresh_failed", error=str(e), msg="HA unavailable, will retry later")
+        else:
+            logger.info("Entity manager initialized from HA state mirror", entities=len(ha_state_mirror.states))
 
         # Initialize smart home controller with LLM intent extraction
         smart_controller = SmartHomeController(entity_manager, llm_router)
@@ -1825,6 +1740,12 @@ async def lifespan(app: FastAPI):
 
     cache_client = CacheClient()
 
+    # Load semantic cache category table override (built-in table if none stored)
+    try:
+        await load_semantic_intent_categories(admin_client)
+    except Exception as e:
+        logger.warning("semantic_intent_table_load_failed", error=str(e))
+
     # Initialize session manager
     session_manager = await get_session_manager()
     logger.info("Session manager initialized")
@@ -1885,6 +1806,8 @@ async def lifespan(app: FastAPI):
         await admin_client.close()
     if ha_client:
         await ha_client.close()
+    if ha_state_mirror:
+        await ha_state_mirror.close()
     if llm_router:
         await llm_router.close()
     if cache_client:
@@ -3216,9 +3139,7 @@ async def classify_node(state: OrchestratorState) -> OrchestratorState:
 
     # OPTIMIZATION: Check cache first (but skip for problem-reporting queries)
     # Problem queries need fresh classification each time since device state changes
-    from semantic_cache import UNCACHEABLE_PATTERNS
-    query_lower = state.query.lower()
-    skip_cache = any(re.search(p, query_lower) for p in UNCACHEABLE_PATTERNS)
+    skip_cache = match_uncacheable_rule(state.query) is not None
 
     if skip_cache:
         logger.info(f"Intent cache SKIP for problem-reporting query: '{state.query[:50]}...'")
@@ -3922,60 +3843,65 @@ Respond in JSON format:
 
         # INTENT DISCOVERY: Check for novel intents when confidence is low
         # This helps track user needs that don't match existing services
-        discovery_start = time.time()
-        try:
-            if state.confidence < INTENT_DISCOVERY_CONFIG["confidence_threshold"]:
-                logger.info(f"Low confidence ({state.confidence}) - triggering intent discovery")
-                discovery_result = await discover_intent(
-                    query=state.query,
-                    current_intent=state.intent.value if state.intent else "unknown",
-                    current_confidence=state.confidence,
-                    llm_router=llm_router,
-                    admin_api_url=ADMIN_API_URL
-                )
+        # Skipped for speculative classification of a partial transcript
+        if not state.speculative:
+            discovery_start = time.time()
+            try:
+                if state.confidence < INTENT_DISCOVERY_CONFIG["confidence_threshold"]:
+                    logger.info(f"Low confidence ({state.confidence}) - triggering intent discovery")
+                    discovery_result = await discover_intent(
+                        query=state.query,
+                        current_intent=state.intent.value if state.intent else "unknown",
+                        current_confidence=state.confidence,
+                        llm_router=llm_router,
+                        admin_api_url=ADMIN_API_URL
+                    )
 
-                if discovery_result.is_novel:
-                    state.is_novel_intent = True
-                    state.emerging_intent_id = discovery_result.emerging_intent_id
-                    state.novel_intent_name = discovery_result.canonical_name
+                    if discovery_result.is_novel:
+                        state.is_novel_intent = True
+                        state.emerging_intent_id = discovery_result.emerging_intent_id
+                        state.novel_intent_name = discovery_result.canonical_name
 
-                    # Apply confidence boost if clustered with existing intent
-                    if discovery_result.confidence_boost > 0:
-                        state.confidence = min(1.0, state.confidence + discovery_result.confidence_boost)
-                        logger.info(f"Novel intent clustered: {discovery_result.canonical_name}, "
-                                  f"confidence boosted to {state.confidence}")
-                    else:
-                        logger.info(f"New novel intent created: {discovery_result.canonical_name}")
-
-            # Record intent metric for analytics (fire-and-forget to avoid blocking)
-            asyncio.create_task(record_intent_metric(
-                intent=state.intent.value if state.intent else "unknown",
-                confidence=state.confidence,
-                raw_query=state.query,
-                session_id=state.session_id or "",
-                mode=state.mode,
-                room=state.room,
-                request_id=state.request_id,
-                processing_time_ms=int((time.time() - discovery_start) * 1000),
-                is_novel=state.is_novel_intent,
-                emerging_intent_id=state.emerging_intent_id,
-                complexity=state.complexity or "simple",
-                admin_api_url=ADMIN_API_URL
-            ))
-        except Exception as e:
-            logger.warning(f"Intent discovery/metrics failed (non-blocking): {e}")
+                        # Apply confidence boost if clustered with existing intent
+                        if discovery_result.confidence_boost > 0:
+                            state.confidence = min(1.0, state.confidence + discovery_result.confidence_boost)
+                            logger.info(f"Novel intent clustered: {discovery_result.canonical_name}, "
+                                      f"confidence boosted to {state.confidence}")
+                        else:
+                            logger.info(f"New novel intent created: {discovery_result.canonical_name}")
+
+                # Record intent metric for analytics (fire-and-forget to avoid blocking)
+                asyncio.create_task(record_intent_metric(
+                    intent=state.intent.value if state.intent else "unknown",
+                    confidence=state.confidence,
+                    raw_query=state.query,
+                    session_id=state.session_id or "",
+                    mode=state.mode,
+                    room=state.room,
+                    request_id=state.request_id,
+                    processing_time_ms=int((time.time() - discovery_start) * 1000),
+                    is_novel=state.is_novel_intent,
+                    emerging_intent_id=state.emerging_intent_id,
+                    complexity=state.complexity or "simple",
+                    admin_api_url=ADMIN_API_URL
+                ))
+            except Exception as e:
+                logger.warning(f"Intent discovery/metrics failed (non-blocking): {e}")
 
-        # OPTIMIZATION: Cache the result (5 minute TTL)
-        try:
-            await cache_client.set(cache_key, {
-                "intent": state.intent.value,
-                "confidence": state.confidence,
-                "complexity": state.complexity,  # NEW: Cache complexity
-                "entities": state.entities
-            }, ttl=300)
-            logger.info(f"Intent classification cached for '{state.query}'")
-        except Exception as e:
-            logger.warning(f"Intent cache write failed: {e}")
+        # OPTIMIZATION: Cache the result (5 minute TTL). A speculative result
+        # that skipped intent discovery is not cached, so the final query runs it
+        skipped_discovery = state.speculative and state.confidence < INTENT_DISCOVERY_CONFIG["confidence_threshold"]
+        if not skipped_discovery:
+            try:
+                await cache_client.set(cache_key, {
+                    "intent": state.intent.value,
+                    "confidence": state.confidence,
+                    "complexity": state.complexity,  # NEW: Cache complexity
+                    "entities": state.entities
+                }, ttl=300)
+                logger.info(f"Intent classification cached for '{state.query}'")
+            except Exception as e:
+                logger.warning(f"Intent cache write failed: {e}")
 
     except Exception as e:
         logger.error(f"Classification error: {e}", exc_info=True)
@@ -9082,6 +9008,74 @@ class QueryResponse(BaseModel):
     sms_content: Optional[str] = Field(None, description="Content to send via SMS if offered")
     sms_content_type: Optional[str] = Field(None, description="Type of detected SMS content")
 
+async def load_conversation_history(session, conv_settings: Dict[str, Any], query: str) -> tuple[List[Dict[str, str]], str]:
+    """
+    Load the conversation context the LLM sees for this turn.
+
+    Follows the conversation settings' history_mode: "none" loads nothing,
+    "summarized" returns a (possibly precomputed) summary, "full" the last
+    max_llm_history_messages messages.
+
+    Returns:
+        tuple of (conversation_history, history_summary)
+    """
+    # Only load history if conversation context is enabled
+    conversation_history = []
+    history_summary = ""
+
+    if conv_settings.get("enabled", True) and conv_settings.get("use_context", True):
+        history_mode = conv_settings.get("history_mode", "full")
+
+        if history_mode == "none":
+            # No history - fastest mode
+            logger.info("History mode: none - skipping conversation history")
+
+        elif history_mode == "summarized":
+            # Summarized history - balanced mode
+            precompute_enabled = await get_feature_flag("ha_precomputed_summaries", default=False)
+
+            if precompute_enabled:
+                # Try to use precomputed summary from session
+                precomputed = await get_session_summary(session.session_id)
+                if precomputed:
+                    history_summary = precomputed
+                    logger.info("History mode: summarized - using precomputed summary")
+                else:
+                    # No precomputed summary, compute fresh and store it
+                    max_history = conv_settings.get("max_llm_history_messages", 10)
+                    raw_history = session.get_llm_history(max_history)
+
+                    if raw_history:
+                        history_summary = await summarize_conversation_history(
+                            raw_history,
+                            query,
+                            request_id=hashlib.md5(f"{query}{time.time()}".encode()).hexdigest()[:8]
+                        )
+                        # Store for future use
+                        await update_session_summary(session.session_id, history_summary)
+                        logger.info(f"History mode: summarized - computed and cached ({len(raw_history)} messages)")
+            else:
+                # Original behavior - compute fresh summary
+                max_history = conv_settings.get("max_llm_history_messages", 10)
+                raw_history = session.get_llm_history(max_history)
+
+                if raw_history:
+                    history_summary = await summarize_conversation_history(
+                        raw_history,
+                        query,
+                        request_id=hashlib.md5(f"{query}{time.time()}".encode()).hexdigest()[:8]
+                    )
+                    logger.info(f"History mode: summarized - compressed {len(raw_history)} messages")
+
+        else:  # "full" mode (default)
+            # Full history - current behavior
+            max_history = conv_settings.get("max_llm_history_messages", 10)
+            conversation_history = session.get_llm_history(max_history)
+            logger.info(f"History mode: full - loaded {len(conversation_history)} previous messages")
+
+    return conversation_history, history_summary
+
+
 @app.post("/query", response_model=QueryResponse)
 async def process_query(request: QueryRequest) -> QueryResponse:
     """
@@ -9126,10 +9120,19 @@ async def process_query(request: QueryRequest) -> QueryResponse:
                 user_id=user_id,
                 zone=request.room
             )
+            # Read only the messages history loading below can use
+            config = await get_config()
+            conv_settings = await config.get_conversation_settings()
+            use_history = (
+                conv_settings.get("enabled", True)
+                and conv_settings.get("use_context", True)
+                and conv_settings.get("history_mode", "full") != "none"
+            )
             session = await session_manager.get_or_create_session(
                 session_id=request.session_id,
                 user_id=user_id,
-                zone=request.room
+                zone=request.room,
+                history_limit=max(conv_settings.get("max_llm_history_messages", 10), 0) if use_history else 0
             )
 
         logger.info(f"Processing query in session {session.session_id}")
@@ -9192,62 +9195,9 @@ async def process_query(request: QueryRequest) -> QueryResponse:
 
         # Get conversation history for LLM context
         async with timing_tracker.track_async("pre_graph", "history_loading"):
-            config = await get_config()
-            conv_settings = await config.get_conversation_settings()
-
-            # Only load history if conversation context is enabled
-            conversation_history = []
-            history_summary = ""
-
-            if conv_settings.get("enabled", True) and conv_settings.get("use_context", True):
-                history_mode = conv_settings.get("history_mode", "full")
-
-                if history_mode == "none":
-                    # No history - fastest mode
-                    logger.info("History mode: none - skipping conversation history")
-
-                elif history_mode == "summarized":
-                    # Summarized history - balanced mode
-                    precompute_enabled = await get_feature_flag("ha_precomputed_summaries", default=False)
-
-                    if precompute_enabled:
-                        # Try to use precomputed summary from session
-                        precomputed = await get_session_summary(session.session_id)
-                        if precomputed:
-                            history_summary = precomputed
-                            logger.info("History mode: summarized - using precomputed summary")
-                        else:
-                            # No precomputed summary, compute fresh and store it
-                            max_history = conv_settings.get("max_llm_history_messages", 10)
-                            raw_history = session.get_llm_history(max_history)
-
-                            if raw_history:
-                                history_summary = await summarize_conversation_history(
-                                    raw_history,
-                                    request.query,
-                                    request_id=hashlib.md5(f"{request.query}{time.time()}".encode()).hexdigest()[:8]
-                                )
-                                # Store for future use
-                                await update_session_summary(session.session_id, history_summary)
-                                logger.info(f"History mode: summarized - computed and cached ({len(raw_history)} messages)")
-                    else:
-                        # Original behavior - compute fresh summary
-                        max_history = conv_settings.get("max_llm_history_messages", 10)
-                        raw_history = session.get_llm_history(max_history)
-
-                        if raw_history:
-                            history_summary = await summarize_conversation_history(
-                                raw_history,
-                                request.query,
-                                request_id=hashlib.md5(f"{request.query}{time.time()}".encode()).hexdigest()[:8]
-                            )
-                            logger.info(f"History mode: summarized - compressed {len(raw_history)} messages")
-
-                else:  # "full" mode (default)
-                    # Full history - current behavior
-                    max_history = conv_settings.get("max_llm_history_messages", 10)
-                    conversation_history = session.get_llm_history(max_history)
-                    logger.info(f"History mode: full - loaded {len(conversation_history)} previous messages")
+            conversation_history, history_summary = await load_conversation_history(
+                session, conv_settings, request.query
+            )
 
         # Retrieve relevant memories from Qdrant for context augmentation
         memory_context = ""
@@ -9647,7 +9597,7 @@ async def process_query(request: QueryRequest) -> QueryResponse:
             metadata={"model_tier": model_tier.value if model_tier and hasattr(model_tier, "value") else str(model_tier)}
         )
 
-        logger.info(f"Session {session.session_id} updated with {len(session.messages)} total messages")
+        logger.info(f"Session {session.session_id} updated with {session.message_count} total messages")
 
         # Track session update timing
         if timing_tracker:
@@ -9731,7 +9681,7 @@ async def process_query(request: QueryRequest) -> QueryResponse:
             "data_source": final_state.get("data_source"),
             "validation_passed": final_state.get("validation_passed"),
             "node_timings": final_state.get("node_timings"),
-            "conversation_turns": len(session.messages) // 2,
+            "conversation_turns": session.message_count // 2,
             "tokens": final_state.get("llm_tokens", 0),
             "tokens_per_second": final_state.get("llm_tokens_per_second", 0.0),
             "tool_exec_time": tool_exec_time,
@@ -10048,11 +9998,19 @@ async def process_query_stream_v2(request: QueryRequest):
             if orchestrator_graph is None:
                 orchestrator_graph = create_orchestrator_graph()
 
-            # Session management
+            # Session management (reading only the history the LLM can use, as /query does)
+            config = await get_config()
+            conv_settings = await config.get_conversation_settings()
+            use_history = (
+                conv_settings.get("enabled", True)
+                and conv_settings.get("use_context", True)
+                and conv_settings.get("history_mode", "full") != "none"
+            )
             session = await session_manager.get_or_create_session(
                 session_id=request.session_id,
                 user_id=request.mode,
-                zone=request.room
+                zone=request.room,
+                history_limit=max(conv_settings.get("max_llm_history_messages", 10), 0) if use_history else 0
             )
 
             # Get mode
@@ -10063,19 +10021,25 @@ async def process_query_stream_v2(request: QueryRequest):
             # We need intent classification and RAG data, but will stream the LLM response
             timing_tracker = TimingTracker()
 
+            async with timing_tracker.track_async("pre_graph", "history_loading"):
+                conversation_history, history_summary = await load_conversation_history(
+                    session, conv_settings, request.query
+                )
+
             initial_state = OrchestratorState(
                 query=request.query,
                 mode=current_mode,
                 room=request.room,
                 temperature=request.temperature,
                 session_id=session.session_id,
-                conversation_history=[],
-                history_summary="",
+                conversation_history=conversation_history,
+                history_summary=history_summary,
                 permissions=mode_info.get("permissions", {}),
                 interface_type=request.interface_type,
                 context=dict(request.context) if request.context else {},
                 memory_context="",
-                timing_tracker=timing_tracker
+                timing_tracker=timing_tracker,
+                interruption_context=request.interruption_context  # Barge-in: acknowledge the interrupted answer
             )
 
             # Run through classification and RAG nodes only (stop before synthesis)
@@ -10113,14 +10077,32 @@ async def process_query_stream_v2(request: QueryRequest):
                 sentences.append(buffer.strip())
                 yield f"data: {json.dumps({'stage': 'streaming', 'sentence_num': len(sentences), 'sentence': buffer.strip(), 'is_final': True})}\n\n"
 
+            # Update and save the session before "complete": clients may hang up on it
+            model_tier = final_state.get("model_tier")
+            model_tier_str = model_tier.value if model_tier and hasattr(model_tier, "value") else str(model_tier)
+            session.add_message(
+                role="user",
+                content=request.query,
+                metadata={"intent": intent_str, "confidence": final_state.get("confidence"), "room": request.room, "streaming": True}
+            )
+            session.add_message(role="assistant", content=answer, metadata={"model_tier": model_tier_str})
+            await session_manager.add_message(
+                session_id=session.session_id,
+                role="user",
+                content=request.query,
+                metadata={"intent": intent_str, "confidence": final_state.get("confidence")}
+            )
+            await session_manager.add_message(
+                session_id=session.session_id,
+                role="assistant",
+                content=answer,
+                metadata={"model_tier": model_tier_str}
+            )
+
             # Stage 4: Complete
             processing_time = time.time() - start_time
             yield f"data: {json.dumps({'stage': 'complete', 'total_sentences': len(sentences), 'full_response': answer, 'intent': intent_str, 'processing_time': processing_time})}\n\n"
 
-            # Update session
-            session.add_message(role="user", content=request.query, metadata={"streaming": True})
-            session.add_message(role="assistant", content=answer)
-
             logger.info(
                 "stream_v2_complete",
                 total_sentences=len(sentences),
@@ -10955,7 +10937,7 @@ async def health_check(detailed: bool = False):
 
 
 @app.post("/admin/invalidate-feature-cache")
-async def invalidate_feature_cache(request: Request, flags: Optional[List[str]] = None):
+async def invalidate_feature_cache(request: Request):
     """
     Invalidate feature flag and configuration caches.
 
@@ -10963,10 +10945,12 @@ async def invalidate_feature_cache(request: Request, flags: Optional[List[str]]
     Clears:
     - Config loader's memory and Redis caches
     - Any TV handler or other module-specific caches
+    Applies the pushed flag states to the in-process flag store (or
+    refetches it when the body carries no states).
 
     Args:
-        request: FastAPI request object
-        flags: Optional list of specific flag names (not used currently - clears all)
+        request: FastAPI request object; JSON body
+                 {"flags": [...], "changes": {name: {enabled, config}}, "etag": str}
 
     Returns:
         dict with status
@@ -10975,9 +10959,16 @@ async def invalidate_feature_cache(request: Request, flags: Optional[List[str]]
 
     client_host = request.client.host if request.client else "unknown"
 
+    try:
+        payload = await request.json()
+    except ValueError:
+        payload = {}
+    flags = payload.get("flags") if isinstance(payload, dict) else payload
+
     try:
         # Clear config loader cache (memory + Redis)
         await clear_cache()
+        await get_flag_store().handle_push(payload)
 
         logger.info(
             "feature_cache_invalidated",
@@ -11036,6 +11027,53 @@ async def warmup_session(session_id: str) -> dict:
         }
 
 
+@app.post("/query/preclassify")
+async def preclassify_partial_transcript(request: QueryRequest) -> dict:
+    """
+    Speculatively classify a partial voice transcript.
+
+    Called by Gateway when streaming STT reports a stable partial, while the
+    user may still be finishing the sentence. Runs classify_node on a
+    throwaway, speculative state so the intent cache is warm when the final
+    transcript arrives at /query. Nothing is executed and no session is
+    modified; intent discovery and intent metrics are skipped (the final
+    query records them), but classification itself may still call the LLM.
+
+    Args:
+        request: Query with the partial transcript (only query, mode, room,
+            session_id and interface_type are used)
+
+    Returns:
+        Status dict with the speculative intent
+    """
+    start = time.time()
+    try:
+        state = OrchestratorState(
+            query=request.query,
+            mode=request.mode,
+            room=request.room,
+            session_id=request.session_id,
+            interface_type=request.interface_type,
+            speculative=True,
+        )
+        state = await asyncio.wait_for(classify_node(state), timeout=5.0)
+        logger.info(
+            f"Preclassified partial '{request.query[:50]}' as {state.intent} "
+            f"in {(time.time() - start) * 1000:.0f}ms"
+        )
+        return {
+            "status": "classified",
+            "intent": state.intent.value if state.intent else None,
+            "confidence": state.confidence,
+        }
+    except Exception as e:
+        logger.warning(f"Preclassification failed for '{request.query[:50]}': {e}")
+        return {
+            "status": "error",
+            "message": str(e)
+        }
+
+
 @app.get("/health/live")
 async def liveness_probe():
     """
@@ -11118,6 +11156,9 @@ async def metrics_endpoint():
     return PlainTextResponse(get_metrics_text(), media_type="text/plain")
 
 
+setup_quantiles_endpoint(app, "orchestrator")
+
+
 @app.get("/resilience")
 async def resilience_status():
     """
@@ -11142,6 +11183,19 @@ async def resilience_status():
         return {"status": "error", "error": str(e)}
 
 
+@app.get("/ha-mirror")
+async def ha_mirror_status():
+    """
+    Home Assistant state mirror status.
+
+    Shows whether state reads are served from the WebSocket-fed mirror
+    (live) or falling back to REST, plus event and resync counters.
+    """
+    if not ha_state_mirror:
+        return {"status": "disabled"}
+    return {"status": "ok", **ha_state_mirror.stats()}
+
+
 @app.post("/admin/reset-circuit-breaker/{service_name}")
 async def reset_circuit_breaker(service_name: str):
     """
@@ -11212,6 +11266,42 @@ async def invalidate_model_cache():
         return {"status": "error", "message": str(e)}
 
 
+@app.post("/admin/invalidate-semantic-cache")
+async def invalidate_semantic_cache(category: Optional[str] = None, pattern: Optional[str] = None):
+    """
+    Invalidate semantic cache entries without waiting for TTLs.
+
+    Use when upstream data (weather, sports, ...) was bad and cached answers
+    must be dropped. With no arguments, clears the whole semantic cache.
+
+    Args:
+        category: Semantic cache category (e.g., "weather", "sports")
+        pattern: Glob pattern over semantic cache keys; must start with
+            "athena_semantic:" (e.g., "athena_semantic:sports_nfl_*")
+
+    Returns:
+        dict with status and number of keys removed
+    """
+    if category and category not in CACHE_TTL_CONFIG:
+        raise HTTPException(status_code=400, detail=f"Unknown semantic cache category: {category}")
+    if pattern and not is_semantic_pattern(pattern):
+        raise HTTPException(status_code=400, detail=f"Pattern must start with '{SEMANTIC_KEY_NAMESPACE}:'")
+
+    keys_removed = await invalidate_semantic_cache_entries(category=category, pattern=pattern)
+    logger.info(
+        "semantic_cache_invalidated_via_api",
+        category=category,
+        pattern=pattern,
+        keys_removed=keys_removed
+    )
+    return {
+        "status": "success",
+        "category": category,
+        "pattern": pattern,
+        "keys_removed": keys_removed
+    }
+
+
 @app.get("/metrics")
 async def metrics():
     """Prometheus metrics endpoint."""
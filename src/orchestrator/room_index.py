@@ -0,0 +1,268 @@
+"""
+Room Index
+Precomputed room-to-entity resolution for device control
+
+Built from the entity states, the HA area/device/entity registries (via
+HAStateMirror) and the room synonym table, then served from exact-match
+dicts:
+
+    alias (room name, synonym, area name/id) -> {domain: {entity_ids}}
+    entity_id -> room label (motion sensor occupancy reports)
+
+Name matching keeps the original substring semantics (a term matches an
+entity when it appears in the entity id or friendly name), but each term is
+evaluated once per rebuild instead of once per entity per call. Entities
+assigned to a matching HA area are used for a domain when no entity name
+matches, so rooms named only in the area registry still resolve.
+
+Synonym expansion suits lights ("lounge" for the living room) but not
+security-sensitive domains: "front" must not reach a back porch lock.
+Lookups with ``expand_synonyms=False`` keep the literal rule the lock, fan
+and cover handlers always used (the room text in the entity id or friendly
+name, no synonyms, no area fallback).
+
+HAEntityManager rebuilds the index when the entity set, a friendly name or
+the area registry changes; plain state changes (on/off) do not touch it.
+
+The known vocabulary (synonyms, area names/ids) is precomputed on rebuild and
+kept until the next one. Room text that only shows up in queries is memoized
+in small LRUs (ROOM_INDEX_CACHE_SIZE entries) so a long-running orchestrator
+does not keep every phrase a user ever said.
+"""
+import os
+import re
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from shared.ha_state_mirror import normalize_room
+
+# Room labels for entities (motion sensor occupancy reports).
+# IMPORTANT: Order matters! More specific patterns must come first;
+# patterns are checked in order, first match wins.
+ROOM_LABEL_PATTERNS: List[Tuple[str, str]] = [
+    # Specific bathroom patterns (before 'master' or 'bath')
+    ('master_bath', 'Master Bathroom'),
+    ('master bath', 'Master Bathroom'),
+    ('masterbath', 'Master Bathroom'),
+    ('main_bath', 'Main Bathroom'),
+    ('main bath', 'Main Bathroom'),
+    ('mainbath', 'Main Bathroom'),
+    ('powder', 'Powder Room'),
+    ('basement_bath', 'Basement Bathroom'),
+    ('basement bath', 'Basement Bathroom'),
+    # Master bedroom (after master bath patterns)
+    ('master_bed', 'Master Bedroom'),
+    ('master bed', 'Master Bedroom'),
+    ('masterbed', 'Master Bedroom'),
+    ('master_closet', 'Master Closet'),
+    ('master closet', 'Master Closet'),
+    ('underbed', 'Master Bedroom'),
+    # Other bedrooms
+    ('alpha', 'Alpha'),
+    ('beta', 'Beta'),
+    # Living areas
+    ('living', 'Living Room'),
+    ('dining', 'Dining Room'),
+    ('kitchen', 'Kitchen'),
+    ('office', 'Office'),
+    # Hallways (be specific)
+    ('basement_hall', 'Basement Hallway'),
+    ('basement hall', 'Basement Hallway'),
+    ('hallway_front', 'Front Hallway'),
+    ('front_hall', 'Front Hallway'),
+    ('hall', 'Hallway'),
+    # Basement
+    ('basement_stair', 'Basement Stairs'),
+    ('basement stair', 'Basement Stairs'),
+    ('basement', 'Basement'),
+    # Generic patterns (after specific ones)
+    ('master', 'Master Bedroom'),  # Fallback if no bath/bed specified
+    ('shower', 'Master Bathroom'),
+    ('front_door', 'Front Door'),
+    ('front door', 'Front Door'),
+    ('back_door', 'Back Door'),
+    ('entrance', 'Entrance'),
+]
+
+# Handle "hall and hallway", "hall, hallway", "hall/hallway", etc.
+_ROOM_SEPARATORS = re.compile(r'\s+and\s+|\s*,\s*|\s*/\s*|\s+or\s+')
+
+DomainEntities = Dict[str, FrozenSet[str]]
+
+ROOM_INDEX_CACHE_SIZE = int(os.getenv("ROOM_INDEX_CACHE_SIZE", "256"))
+
+
+def room_label(entity_id: str, friendly_name: Optional[str] = None) -> Optional[str]:
+    """Match ROOM_LABEL_PATTERNS against the entity id and friendly name (None if no room)"""
+    search_text = entity_id.lower().split('.', 1)[-1]
+    if friendly_name:
+        search_text = f"{search_text} {friendly_name.lower()}"
+    for pattern, label in ROOM_LABEL_PATTERNS:
+        if pattern in search_text:
+            return label
+    return None
+
+
+class RoomIndex:
+    """Exact-map room resolution, rebuilt only when names or areas change"""
+
+    def __init__(self, synonyms: Dict[str, List[str]], cache_size: int = ROOM_INDEX_CACHE_SIZE):
+        # normalized alias -> every search term it expands to (itself included)
+        self._synonyms: Dict[str, Set[str]] = {}
+        for key, values in synonyms.items():
+            key = normalize_room(key)
+            for value in values:
+                value = normalize_room(value)
+                self._synonyms.setdefault(key, {key}).add(value)
+                self._synonyms.setdefault(value, {value}).add(key)
+
+        self._names: List[Tuple[str, str, str, str]] = []  # (entity_id, domain, name, friendly)
+        self._friendly: Dict[str, str] = {}
+        self._area_labels: Dict[str, str] = {}  # entity_id -> area name
+        self._areas: Dict[str, DomainEntities] = {}  # normalized area name/id -> entities
+        self._vocab: Dict[str, DomainEntities] = {}  # known search term -> name matches
+        self._terms: "OrderedDict[str, DomainEntities]" = OrderedDict()  # other search terms (LRU)
+        self._rooms: "OrderedDict[Tuple[str, bool], DomainEntities]" = OrderedDict()  # (room, expanded) (LRU)
+        self.cache_size = cache_size
+        self._labels: Dict[str, Optional[str]] = {}
+        self.builds = 0
+
+    def rebuild(
+        self,
+        states: Dict[str, Dict],
+        area_names: Optional[Dict[str, str]] = None,
+        entity_area: Optional[Dict[str, str]] = None
+    ):
+        """Rebuild from entity states and the area registry (area id -> name, entity id -> area id)"""
+        area_names = area_names or {}
+        entity_area = entity_area or {}
+
+        self._names = []
+        self._friendly = {}
+        self._area_labels = {}
+        by_area: Dict[str, Dict[str, Set[str]]] = {}
+        for entity_id, state in states.items():
+            domain = entity_id.split('.', 1)[0]
+            friendly_name = (state.get('attributes') or {}).get('friendly_name') or ''
+            self._friendly[entity_id] = friendly_name
+            self._names.append((
+                entity_id, domain,
+                normalize_room(entity_id.split('.', 1)[-1]),
+                normalize_room(friendly_name)
+            ))
+            area_id = entity_area.get(entity_id)
+            if area_id:
+                by_area.setdefault(area_id, {}).setdefault(domain, set()).add(entity_id)
+                self._area_labels[entity_id] = area_names.get(area_id, area_id)
+
+        self._areas = {}
+        for area_id, name in area_names.items():
+            members = {domain: frozenset(ids) for domain, ids in by_area.get(area_id, {}).items()}
+            for alias in {normalize_room(name), normalize_room(area_id)}:
+                self._areas[alias] = self._union(self._areas.get(alias, {}), members)
+
+        self._vocab = {}
+        self._terms = OrderedDict()
+        self._rooms = OrderedDict()
+        self._labels = {}
+        # Precompute the known vocabulary so common rooms never scan
+        for term in set(self._synonyms) | set(self._areas):
+            self._vocab[term] = self._scan(term)
+        self.builds += 1
+
+    # =========================================================================
+    # Resolution
+    # =========================================================================
+
+    def expand(self, room_name: str) -> Set[str]:
+        """Normalized search terms for a room name, including synonyms"""
+        terms: Set[str] = set()
+        for part in _ROOM_SEPARATORS.split(room_name.lower().strip()):
+            part = normalize_room(part)
+            if part:
+                terms |= self._synonyms.get(part, {part})
+        return terms
+
+    def resolve(self, room_name: str, expand_synonyms: bool = True) -> DomainEntities:
+        """Domain -> entity ids for a room name (cached until the next rebuild)"""
+        key = (room_name.lower().strip(), expand_synonyms)
+        resolved = self._lru_get(self._rooms, key)
+        if resolved is None and not expand_synonyms:
+            term = normalize_room(key[0])
+            resolved = self._term_matches(term) if term else {}
+            self._lru_put(self._rooms, key, resolved)
+        elif resolved is None:
+            terms = self.expand(key[0])
+            by_name: DomainEntities = {}
+            by_area: DomainEntities = {}
+            for term in terms:
+                by_name = self._union(by_name, self._term_matches(term))
+                by_area = self._union(by_area, self._areas.get(term, {}))
+            # Name matches win per domain; area membership fills in the rest
+            resolved = {**by_area, **by_name}
+            self._lru_put(self._rooms, key, resolved)
+        return resolved
+
+    def entities(self, room_name: str, *domains: str, expand_synonyms: bool = True) -> Set[str]:
+        """Entity ids in the room, limited to ``domains`` if given"""
+        resolved = self.resolve(room_name, expand_synonyms)
+        if not domains:
+            domains = tuple(resolved)
+        return {entity_id for domain in domains for entity_id in resolved.get(domain, ())}
+
+    def room_of(self, entity_id: str, friendly_name: Optional[str] = None) -> Optional[str]:
+        """Room label for an entity: ROOM_LABEL_PATTERNS first, then its HA area name"""
+        if entity_id in self._labels:
+            return self._labels[entity_id]
+        known = entity_id in self._friendly
+        label = room_label(entity_id, self._friendly.get(entity_id) if known else friendly_name)
+        if label is None:
+            label = self._area_labels.get(entity_id)
+        if known:
+            self._labels[entity_id] = label
+        return label
+
+    def _term_matches(self, term: str) -> DomainEntities:
+        matches = self._vocab.get(term)
+        if matches is None:
+            matches = self._lru_get(self._terms, term)
+        if matches is None:
+            matches = self._scan(term)
+            self._lru_put(self._terms, term, matches)
+        return matches
+
+    def _scan(self, term: str) -> DomainEntities:
+        found: Dict[str, Set[str]] = {}
+        for entity_id, domain, name, friendly in self._names:
+            if term in name or term in friendly:
+                found.setdefault(domain, set()).add(entity_id)
+        return {domain: frozenset(ids) for domain, ids in found.items()}
+
+    @staticmethod
+    def _lru_get(cache: OrderedDict, key):
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _lru_put(self, cache: OrderedDict, key, value):
+        cache[key] = value
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _union(a: DomainEntities, b: DomainEntities) -> DomainEntities:
+        if not a:
+            return b
+        if not b:
+            return a
+        return {domain: a.get(domain, frozenset()) | b.get(domain, frozenset()) for domain in set(a) | set(b)}
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entities": len(self._names),
+            "aliases": len(self._synonyms) + len(self._areas),
+            "cached_terms": len(self._vocab) + len(self._terms),
+            "cached_rooms": len(self._rooms),
+            "builds": self.builds,
+        }
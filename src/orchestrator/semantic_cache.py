@@ -8,11 +8,19 @@ rather than exact query text.
 Expected savings: 1-3 seconds for cached queries (eliminates RAG API calls)
 """
 
+import functools
 import hashlib
 import re
-from typing import Optional, Tuple, Dict, Any
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Tuple, Dict, Any, List, FrozenSet, Iterable, Set
 from datetime import datetime, timezone
 
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse as _sre_parse
+
 from shared.cache import get_cache_client
 import structlog
 
@@ -331,6 +339,140 @@ UNCACHEABLE_PATTERNS = [
     r"\bfinish\s+(the|that|your)\b",  # Finish the story/that/your thought
 ]
 
+@dataclass(frozen=True)
+class UncacheableRule:
+    """A single UNCACHEABLE_PATTERNS entry that matched a query."""
+    index: int
+    pattern: str
+
+
+_WORD_CHAR = re.compile(r"\w")
+_WORD_TOKEN = re.compile(r"\w+")
+_LEADING_ANCHORS = (_sre_parse.AT_BEGINNING, _sre_parse.AT_BOUNDARY)
+
+
+def _literal_prefixes(items: Iterable) -> Optional[FrozenSet[str]]:
+    """
+    Collect the word-character literal prefixes a parsed pattern must start with.
+
+    Returns None when no non-empty literal prefix can be proven (optional
+    groups, character classes, leading wildcards, ...).
+    """
+    prefix = []
+    for op, arg in items:
+        if op is _sre_parse.LITERAL and _WORD_CHAR.match(chr(arg)):
+            prefix.append(chr(arg))
+            continue
+        if not prefix and op is _sre_parse.SUBPATTERN:
+            return _literal_prefixes(arg[-1])
+        if not prefix and op is _sre_parse.BRANCH:
+            branches = set()
+            for branch in arg[1]:
+                branch_prefixes = _literal_prefixes(branch)
+                if not branch_prefixes:
+                    return None
+                branches |= branch_prefixes
+            return frozenset(branches)
+        if prefix and op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+            # The repeated item is not part of the guaranteed prefix
+            break
+        break
+    return frozenset(["".join(prefix)]) if prefix else None
+
+
+def _anchored_prefixes(pattern: str) -> Optional[FrozenSet[str]]:
+    """
+    Return the literal word prefixes for a pattern anchored by ``\\b`` or ``^``.
+
+    For such patterns every match starts at the beginning of a ``\\w+`` token,
+    so the pattern can only fire if some query token starts with one of the
+    returned prefixes. Unanchored or non-literal patterns return None.
+    """
+    try:
+        parsed = list(_sre_parse.parse(pattern))
+    except Exception:
+        return None
+    if not parsed or parsed[0][0] is not _sre_parse.AT or parsed[0][1] not in _LEADING_ANCHORS:
+        return None
+    return _literal_prefixes(parsed[1:])
+
+
+class UncacheableRuleSet:
+    """
+    Compiled matcher for UNCACHEABLE_PATTERNS.
+
+    Patterns are compiled once and split into two tiers:
+
+    - Indexed rules: anchored patterns with a literal leading word. They are
+      keyed by that word so only rules whose prefix starts a query token are
+      ever executed.
+    - Fallback rules: everything else, always executed.
+
+    Candidates are evaluated in list order, so ``match`` reports exactly the
+    rule the previous linear ``re.search`` loop would have stopped on, while
+    typical queries only run a handful of regexes regardless of list length.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = list(patterns)
+        self._compiled = [re.compile(p) for p in self.patterns]
+        self._prefix_index: Dict[str, List[int]] = {}
+        self._fallback: List[int] = []
+
+        for index, pattern in enumerate(self.patterns):
+            prefixes = _anchored_prefixes(pattern)
+            if not prefixes:
+                self._fallback.append(index)
+                continue
+            for prefix in prefixes:
+                self._prefix_index.setdefault(prefix, []).append(index)
+
+        self._max_prefix_len = max((len(p) for p in self._prefix_index), default=0)
+        # Voice vocabulary is small, so per-token lookups are memoized
+        self._token_rules = functools.lru_cache(maxsize=8192)(self._lookup_token)
+
+    @property
+    def indexed_count(self) -> int:
+        """Number of rules reachable through the literal prefix index."""
+        return len(self.patterns) - len(self._fallback)
+
+    @property
+    def fallback_count(self) -> int:
+        """Number of rules evaluated for every query."""
+        return len(self._fallback)
+
+    def _lookup_token(self, token: str) -> FrozenSet[int]:
+        """Indexed rules whose literal prefix starts ``token``."""
+        rules = set()
+        for end in range(1, min(len(token), self._max_prefix_len) + 1):
+            hits = self._prefix_index.get(token[:end])
+            if hits:
+                rules.update(hits)
+        return frozenset(rules)
+
+    def _candidates(self, text: str) -> List[int]:
+        candidates = set(self._fallback)
+        for token in set(_WORD_TOKEN.findall(text)):
+            candidates |= self._token_rules(token)
+        return sorted(candidates)
+
+    def match(self, text: str) -> Optional[UncacheableRule]:
+        """Return the first rule (in list order) matching ``text``, if any."""
+        compiled = self._compiled
+        for index in self._candidates(text):
+            if compiled[index].search(text):
+                return UncacheableRule(index=index, pattern=self.patterns[index])
+        return None
+
+
+_uncacheable_rules = UncacheableRuleSet(UNCACHEABLE_PATTERNS)
+
+
+def match_uncacheable_rule(query: str) -> Optional[UncacheableRule]:
+    """Return the UNCACHEABLE_PATTERNS rule that fires for ``query``, if any."""
+    return _uncacheable_rules.match(query.lower())
+
+
 # Location normalization for Baltimore area
 LOCATION_NORMALIZATIONS = {
     "baltimore": "baltimore_md",
@@ -352,6 +494,11 @@ LOCATION_INDICATORS = [
     r'\bat\s+([a-zA-Z\s]+?)[?!.;]*(?:\s*,|\s*$|\s+(?:for|today|tonight|tomorrow))',
 ]
 
+# Precompiled indicators paired with the literal word each one requires
+_LOCATION_INDICATOR_RES = [
+    (re.match(r"\\b(\w+)", pattern).group(1), re.compile(pattern)) for pattern in LOCATION_INDICATORS
+]
+
 
 def normalize_location(text: str) -> str:
     """
@@ -370,8 +517,8 @@ def normalize_location(text: str) -> str:
 
     # Check if user explicitly specified a different location
     # Extract the location name and use it as the cache key
-    for pattern in LOCATION_INDICATORS:
-        match = re.search(pattern, text_lower)
+    for word, regex in _LOCATION_INDICATOR_RES:
+        match = word in text_lower and regex.search(text_lower)
         if match:
             location = match.group(1).strip()
             # Clean up the location name for use as cache key
@@ -390,147 +537,372 @@ def normalize_location(text: str) -> str:
     return "baltimore_md"  # Default location when nothing is specified
 
 
+# Declarative semantic intent table, evaluated top to bottom (first match wins).
+#
+# Each entry:
+#   category:    Cache category (must exist in CACHE_TTL_CONFIG to be cacheable)
+#   keywords:    Substrings that select the category
+#   co_keywords: Optional alternative trigger - every group must contribute a hit
+#   key:         Normalized key template. Slots and built-in extractors
+#                ({location}, {dish}, {ticker}, {destination}) fill the fields.
+#                An empty key means the category is never cached.
+#   slots:       Named keyword slots. The first option (in table order) found in
+#                the query wins; options are "value" or {"value", "keywords"}.
+#
+# The table is JSON-serializable so it can be overridden from the admin
+# database (system setting "semantic_cache_categories").
+_CUISINES = [
+    "greek", "italian", "mexican", "chinese", "japanese", "thai", "indian",
+    "american", "sushi", "pizza", "burger", "korean", "vietnamese", "french",
+    "mediterranean", "seafood", "steakhouse", "bbq", "barbecue", "jamaican",
+    "irish", "spanish", "cuban", "brazilian", "peruvian", "ethiopian", "moroccan",
+    "turkish", "lebanese", "german", "british", "southern", "cajun", "soul food",
+    "vegan", "vegetarian", "ramen", "pho", "dim sum", "tapas",
+]
+
+SEMANTIC_INTENT_CATEGORIES: List[Dict[str, Any]] = [
+    # Recipes - check FIRST to catch "make dinner with chicken" BEFORE dining matches "dinner"
+    {
+        "category": "recipes",
+        "keywords": [
+            "recipe", "how to make", "how to cook", "ingredients for",
+            "what can i make with", "make dinner with", "make lunch with",
+            "cook something with", "prepare dinner", "prepare lunch",
+            "i want to make", "want to cook", "need to cook", "should i cook",
+            "something to make with", "ideas for cooking",
+        ],
+        "key": "recipe_{dish}",
+    },
+    # Weather - "what's the weather" == "how's the weather" == "weather"
+    {
+        "category": "weather",
+        "keywords": ["weather", "temperature", "forecast", "rain", "sunny", "cold", "hot"],
+        "key": "weather_{location}",
+    },
+    # Dining - also matches cuisine names with eating context ("good Greek place")
+    {
+        "category": "dining",
+        "keywords": [
+            "restaurant", "where to eat", "food near", "dinner", "lunch", "breakfast", "dining",
+            "place to eat", "eat tonight", "eat today", "good place", "recommend a", "recommendation",
+            "somewhere to eat", "grab a bite", "get food", "hungry", "cuisine",
+        ],
+        "co_keywords": [
+            _CUISINES,
+            ["place", "spot", "eat", "food", "tonight", "today", "near"],
+        ],
+        "key": "dining_{location}_{cuisine}",
+        "slots": {
+            "cuisine": {"default": "general", "options": _CUISINES},
+        },
+    },
+    # Sports - granular keys to avoid returning wrong cached data
+    {
+        "category": "sports",
+        "keywords": [
+            "game", "score", "ravens", "orioles", "nfl", "mlb", "nba", "nhl", "match",
+            "playoff", "standings", "bracket", "season", "championship", "super bowl",
+        ],
+        "key": "sports_{league}_{query_type}_{team}",
+        "slots": {
+            "league": {"default": "general", "options": ["nfl", "nba", "mlb", "nhl", "ncaa", "mls"]},
+            "query_type": {
+                "default": "scores",
+                "options": [
+                    {"value": "playoff", "keywords": ["playoff", "bracket", "picture", "wild card", "seed"]},
+                    {"value": "standings", "keywords": ["standing", "rank", "division", "conference", "record"]},
+                    {"value": "schedule", "keywords": ["schedule", "upcoming", "next game", "when do"]},
+                    {"value": "recent", "keywords": ["latest", "recent", "last game", "yesterday"]},
+                ],
+            },
+            "team": {
+                "default": "all",
+                "options": [
+                    "ravens", "orioles", "commanders", "nationals", "wizards", "capitals",
+                    "eagles", "cowboys", "giants", "steelers", "chiefs", "bills", "49ers",
+                ],
+            },
+        },
+    },
+    {"category": "news", "keywords": ["news", "headline", "what's happening"], "key": "news_current"},
+    {
+        "category": "stocks",
+        "keywords": ["stock", "market", "price of", "how is", "nasdaq", "dow"],
+        "key": "stocks_{ticker}",
+    },
+    # NEVER CACHE
+    {"category": "time", "keywords": ["time", "date", "day is it"], "key": ""},
+    {
+        "category": "smart_home",
+        "keywords": ["turn", "set temperature", "lights", "thermostat", "lock", "unlock"],
+        "key": "",
+    },
+    {
+        "category": "events",
+        "keywords": ["events", "happening", "concerts", "shows", "tickets"],
+        "key": "events_{location}",
+    },
+    {
+        "category": "airports",
+        "keywords": ["flight", "airport", "departures", "arrivals", "bwi"],
+        "key": "airports_bwi",
+    },
+    {
+        "category": "streaming",
+        "keywords": ["watch", "netflix", "hulu", "streaming", "movie", "show"],
+        "key": "streaming_general",
+    },
+    # Directions - origin is added via location_override in get_cache_key
+    {
+        "category": "directions",
+        "keywords": [
+            "directions", "how do i get to", "how to get to", "navigate to",
+            "route to", "drive to", "driving to", "way to", "fastest route",
+            "how far", "how long to get", "trip to", "going to",
+        ],
+        "key": "directions_to_{destination}",
+    },
+]
+
+
+class KeywordIndex:
+    """
+    Aho-Corasick automaton over a fixed keyword set.
+
+    ``find`` reports every keyword occurring anywhere in the text (including
+    overlapping and nested occurrences) in a single pass over its characters,
+    matching the substring semantics of ``keyword in text``.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[FrozenSet[str]] = [frozenset()]
+
+        for keyword in set(keywords):
+            if not keyword:
+                continue
+            state = 0
+            for ch in keyword:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(frozenset())
+                    self._goto[state][ch] = next_state
+                state = next_state
+            self._out[state] = self._out[state] | {keyword}
+
+        # Breadth-first construction of failure links
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._out[child] = self._out[child] | self._out[self._fail[child]]
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of keywords contained in ``text``."""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: Set[str] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                hits |= out[state]
+        return hits
+
+
+def _extract_dish(query_lower: str, query: str) -> str:
+    dish_match = re.search(r'(?:recipe for|how to (?:make|cook)|make (?:dinner|lunch) with|with) (.+?)(?:\?|$)', query_lower)
+    return dish_match.group(1).strip().replace(" ", "_")[:30] if dish_match else "general"
+
+
+def _extract_ticker(query_lower: str, query: str) -> str:
+    # Tickers are uppercase in the original text
+    ticker = re.search(r'\b([A-Z]{2,5})\b', query)
+    return ticker.group(1).lower() if ticker else "market"
+
+
+def _extract_destination(query_lower: str, query: str) -> str:
+    dest_match = re.search(r'(?:to|get to|reach|navigate to)\s+(.+?)(?:\?|$|from)', query_lower)
+    return dest_match.group(1).strip().replace(" ", "_")[:30] if dest_match else "unknown"
+
+
+# Built-in key fields computed from the query text rather than keyword slots
+_KEY_EXTRACTORS = {
+    "location": lambda query_lower, query: normalize_location(query_lower),
+    "dish": _extract_dish,
+    "ticker": _extract_ticker,
+    "destination": _extract_destination,
+}
+
+_KEY_FIELD = re.compile(r"\{(\w+)\}")
+
+
+@dataclass(frozen=True)
+class _IntentRule:
+    """Compiled form of one SEMANTIC_INTENT_CATEGORIES entry."""
+    category: str
+    keywords: FrozenSet[str]
+    co_keywords: Tuple[FrozenSet[str], ...]
+    key: str
+    slots: Tuple[Tuple[str, Tuple[Tuple[str, FrozenSet[str]], ...], str], ...]
+    extractors: Tuple[str, ...]
+
+    def matches(self, hits: Set[str]) -> bool:
+        if not self.keywords.isdisjoint(hits):
+            return True
+        return bool(self.co_keywords) and all(not group.isdisjoint(hits) for group in self.co_keywords)
+
+
+class SemanticIntentTable:
+    """
+    Table-driven semantic intent extractor.
+
+    All keywords from every category, co-keyword group and slot are compiled
+    into one KeywordIndex at construction. Classification scans the query
+    once, then resolves the category and key slots with set lookups.
+    """
+
+    def __init__(self, categories: List[Dict[str, Any]]):
+        self.categories = categories
+        self._rules: List[_IntentRule] = []
+        all_keywords: Set[str] = set()
+
+        for entry in categories:
+            slots = []
+            for name, slot in (entry.get("slots") or {}).items():
+                options = []
+                for option in slot.get("options", []):
+                    if isinstance(option, str):
+                        value, keywords = option, [option]
+                    else:
+                        value, keywords = option["value"], option.get("keywords") or [option["value"]]
+                    options.append((value, frozenset(keywords)))
+                    all_keywords.update(keywords)
+                slots.append((name, tuple(options), slot.get("default", "general")))
+
+            key = entry.get("key", "")
+            slot_names = {name for name, _, _ in slots}
+            extractors = []
+            for field in _KEY_FIELD.findall(key):
+                if field in slot_names:
+                    continue
+                if field not in _KEY_EXTRACTORS:
+                    raise ValueError(f"Unknown semantic key field '{field}' in category '{entry['category']}'")
+                extractors.append(field)
+
+            rule = _IntentRule(
+                category=entry["category"],
+                keywords=frozenset(entry.get("keywords", [])),
+                co_keywords=tuple(frozenset(group) for group in entry.get("co_keywords", [])),
+                key=key,
+                slots=tuple(slots),
+                extractors=tuple(extractors),
+            )
+            all_keywords.update(rule.keywords)
+            for group in rule.co_keywords:
+                all_keywords.update(group)
+            self._rules.append(rule)
+
+        self._index = KeywordIndex(all_keywords)
+        self.keyword_count = len(all_keywords)
+
+    def key_prefix(self, category: str) -> Optional[str]:
+        """
+        Literal prefix of the normalized keys generated for ``category``.
+
+        Returns None for categories without a key template (never cached or
+        hashed general queries), which can only be invalidated via tags.
+        """
+        for rule in self._rules:
+            if rule.category == category:
+                return rule.key.split("{", 1)[0] or None
+        return None
+
+    def extract(self, query: str) -> Tuple[str, str]:
+        """Return (category, normalized_query) for ``query``."""
+        query_lower = query.lower().strip()
+        hits = self._index.find(query_lower)
+
+        for rule in self._rules:
+            if not rule.matches(hits):
+                continue
+            if not rule.key:
+                return (rule.category, "")
+            fields = {}
+            for name, options, default in rule.slots:
+                fields[name] = next((value for value, keywords in options if not keywords.isdisjoint(hits)), default)
+            for name in rule.extractors:
+                fields[name] = _KEY_EXTRACTORS[name](query_lower, query)
+            return (rule.category, rule.key.format(**fields))
+
+        # Default - general queries
+        return ("general", hashlib.md5(query_lower.encode()).hexdigest()[:16])
+
+
+_intent_table = SemanticIntentTable(SEMANTIC_INTENT_CATEGORIES)
+
+
+@functools.lru_cache(maxsize=1024)
 def extract_semantic_intent(query: str) -> Tuple[str, str]:
     """
     Extract semantic intent category and normalized query from raw query.
 
+    Memoized because the read and write paths classify the same query.
+
     Returns:
         (category, normalized_query) - category for TTL lookup, normalized query for cache key
     """
-    query_lower = query.lower().strip()
+    return _intent_table.extract(query)
 
-    # Recipes - check FIRST to catch "make dinner with chicken" BEFORE dining matches "dinner"
-    recipe_patterns = [
-        "recipe", "how to make", "how to cook", "ingredients for",
-        "what can i make with", "make dinner with", "make lunch with",
-        "cook something with", "prepare dinner", "prepare lunch",
-        "i want to make", "want to cook", "need to cook", "should i cook",
-        "something to make with", "ideas for cooking"
-    ]
-    if any(p in query_lower for p in recipe_patterns):
-        # Try to extract dish or main ingredient
-        dish_match = re.search(r'(?:recipe for|how to (?:make|cook)|make (?:dinner|lunch) with|with) (.+?)(?:\?|$)', query_lower)
-        dish = dish_match.group(1).strip().replace(" ", "_")[:30] if dish_match else "general"
-        return ("recipes", f"recipe_{dish}")
-
-    # Weather queries
-    if any(w in query_lower for w in ["weather", "temperature", "forecast", "rain", "sunny", "cold", "hot"]):
-        location = normalize_location(query_lower)
-        # Normalize variations: "what's the weather" == "how's the weather" == "weather"
-        return ("weather", f"weather_{location}")
-
-    # Dining queries - expanded patterns for natural language
-    dining_patterns = [
-        "restaurant", "where to eat", "food near", "dinner", "lunch", "breakfast", "dining",
-        "place to eat", "eat tonight", "eat today", "good place", "recommend a", "recommendation",
-        "somewhere to eat", "grab a bite", "get food", "hungry", "cuisine"
-    ]
-    # Also match cuisine names directly (e.g., "good Greek place")
-    cuisine_triggers = ["greek", "italian", "mexican", "chinese", "japanese", "thai", "indian",
-                        "american", "sushi", "pizza", "burger", "korean", "vietnamese", "french",
-                        "mediterranean", "seafood", "steakhouse", "bbq", "barbecue", "jamaican",
-                        "irish", "spanish", "cuban", "brazilian", "peruvian", "ethiopian", "moroccan",
-                        "turkish", "lebanese", "german", "british", "southern", "cajun", "soul food",
-                        "vegan", "vegetarian", "ramen", "pho", "dim sum", "tapas"]
-
-    is_dining = any(w in query_lower for w in dining_patterns)
-    # Check if a cuisine type is mentioned with eating-related context
-    if not is_dining:
-        for cuisine_word in cuisine_triggers:
-            if cuisine_word in query_lower and any(eat_word in query_lower for eat_word in ["place", "spot", "eat", "food", "tonight", "today", "near"]):
-                is_dining = True
-                break
-
-    if is_dining:
-        location = normalize_location(query_lower)
-        # Extract cuisine type if present
-        cuisine = "general"
-        for c in cuisine_triggers:
-            if c in query_lower:
-                cuisine = c
-                break
-        return ("dining", f"dining_{location}_{cuisine}")
-
-    # Sports queries - more granular cache keys to avoid returning wrong cached data
-    sports_keywords = ["game", "score", "ravens", "orioles", "nfl", "mlb", "nba", "nhl", "match",
-                       "playoff", "standings", "bracket", "season", "championship", "super bowl"]
-    if any(w in query_lower for w in sports_keywords):
-        # Determine league
-        league = "general"
-        for l in ["nfl", "nba", "mlb", "nhl", "ncaa", "mls"]:
-            if l in query_lower:
-                league = l
-                break
-
-        # Determine query type (more specific cache keys)
-        query_type = "scores"  # default
-        if any(w in query_lower for w in ["playoff", "bracket", "picture", "wild card", "seed"]):
-            query_type = "playoff"
-        elif any(w in query_lower for w in ["standing", "rank", "division", "conference", "record"]):
-            query_type = "standings"
-        elif any(w in query_lower for w in ["schedule", "upcoming", "next game", "when do"]):
-            query_type = "schedule"
-        elif any(w in query_lower for w in ["latest", "recent", "last game", "yesterday"]):
-            query_type = "recent"
-
-        # Determine team (most specific)
-        team = "all"
-        for t in ["ravens", "orioles", "commanders", "nationals", "wizards", "capitals",
-                  "eagles", "cowboys", "giants", "steelers", "chiefs", "bills", "49ers"]:
-            if t in query_lower:
-                team = t
-                break
-
-        return ("sports", f"sports_{league}_{query_type}_{team}")
-
-    # News queries
-    if any(w in query_lower for w in ["news", "headline", "what's happening"]):
-        return ("news", "news_current")
-
-    # Stocks queries
-    if any(w in query_lower for w in ["stock", "market", "price of", "how is", "nasdaq", "dow"]):
-        # Extract ticker if present
-        ticker = re.search(r'\b([A-Z]{2,5})\b', query)
-        ticker_key = ticker.group(1).lower() if ticker else "market"
-        return ("stocks", f"stocks_{ticker_key}")
-
-    # Time queries - NEVER CACHE
-    if any(w in query_lower for w in ["time", "date", "day is it"]):
-        return ("time", "")
-
-    # Smart home - NEVER CACHE
-    if any(w in query_lower for w in ["turn", "set temperature", "lights", "thermostat", "lock", "unlock"]):
-        return ("smart_home", "")
-
-    # Events
-    if any(w in query_lower for w in ["events", "happening", "concerts", "shows", "tickets"]):
-        location = normalize_location(query_lower)
-        return ("events", f"events_{location}")
-
-    # Flights/Airports
-    if any(w in query_lower for w in ["flight", "airport", "departures", "arrivals", "bwi"]):
-        return ("airports", "airports_bwi")
-
-    # Streaming
-    if any(w in query_lower for w in ["watch", "netflix", "hulu", "streaming", "movie", "show"]):
-        return ("streaming", "streaming_general")
-
-    # Directions queries - MUST include origin location in cache key
-    # These are location-sensitive and should have different cache entries per origin
-    directions_patterns = [
-        "directions", "how do i get to", "how to get to", "navigate to",
-        "route to", "drive to", "driving to", "way to", "fastest route",
-        "how far", "how long to get", "trip to", "going to"
-    ]
-    if any(w in query_lower for w in directions_patterns):
-        # Extract destination if possible
-        dest_match = re.search(r'(?:to|get to|reach|navigate to)\s+(.+?)(?:\?|$|from)', query_lower)
-        dest = dest_match.group(1).strip().replace(" ", "_")[:30] if dest_match else "unknown"
-        # Note: Origin will be added via location_override parameter in get_cached_response
-        return ("directions", f"directions_to_{dest}")
-
-    # Default - general queries
-    return ("general", hashlib.md5(query_lower.encode()).hexdigest()[:16])
+
+def set_semantic_intent_categories(categories: Optional[List[Dict[str, Any]]]) -> bool:
+    """
+    Replace the semantic intent table (e.g., with categories from the admin DB).
+
+    Passing None or an empty list restores SEMANTIC_INTENT_CATEGORIES.
+    Invalid tables are rejected and the current table is kept.
+
+    Returns:
+        True if the table was installed
+    """
+    global _intent_table
+    try:
+        table = SemanticIntentTable(categories or SEMANTIC_INTENT_CATEGORIES)
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        logger.warning("semantic_intent_table_invalid", error=str(e))
+        return False
+    _intent_table = table
+    extract_semantic_intent.cache_clear()
+    logger.info(
+        "semantic_intent_table_loaded",
+        categories=len(table.categories),
+        keywords=table.keyword_count,
+        source="admin" if categories else "default",
+    )
+    return True
+
+
+async def load_semantic_intent_categories(admin_client) -> bool:
+    """
+    Load the semantic intent table from the admin database, if configured.
+
+    Returns:
+        True if an admin-provided table was installed
+    """
+    categories = await admin_client.get_semantic_cache_categories()
+    if not categories:
+        return False
+    return set_semantic_intent_categories(categories)
 
 
 def is_cacheable(category: str, query: str) -> bool:
@@ -541,18 +913,25 @@ def is_cacheable(category: str, query: str) -> bool:
         return False
 
     # Check for uncacheable patterns
-    query_lower = query.lower()
-    for pattern in UNCACHEABLE_PATTERNS:
-        if re.search(pattern, query_lower):
-            logger.info("cache_skip_pattern", pattern=pattern, query_preview=query[:50])
-            return False
+    rule = match_uncacheable_rule(query)
+    if rule:
+        logger.info("cache_skip_pattern", pattern=rule.pattern, rule_index=rule.index, query_preview=query[:50])
+        return False
 
     return True
 
 
+SEMANTIC_KEY_NAMESPACE = "athena_semantic"
+
+
+def get_category_tag(category: str) -> str:
+    """Redis set tracking every cached key of a category (for invalidation)."""
+    return f"{SEMANTIC_KEY_NAMESPACE}:tag:{category}"
+
+
 def get_cache_key(normalized_query: str, room: str = None, mode: str = None, location_override: dict = None) -> str:
     """Generate cache key with optional room/mode/location context."""
-    key_parts = ["athena_semantic", normalized_query]
+    key_parts = [SEMANTIC_KEY_NAMESPACE, normalized_query]
 
     # Include location_override in cache key for location-sensitive queries (directions, dining, etc.)
     # This ensures different origins get different cache entries
@@ -656,7 +1035,7 @@ async def cache_response(
             }
         }
 
-        await cache.set(cache_key, cached_response, ttl=ttl)
+        await cache.set(cache_key, cached_response, ttl=ttl, tags=[get_category_tag(category)])
 
         logger.info(
             "semantic_cache_stored",
@@ -672,33 +1051,56 @@ async def cache_response(
         return False
 
 
+def is_semantic_pattern(pattern: str) -> bool:
+    """Whether a key glob only matches semantic cache keys."""
+    return pattern.startswith(f"{SEMANTIC_KEY_NAMESPACE}:")
+
+
 async def invalidate_cache(category: str = None, pattern: str = None) -> int:
     """
     Invalidate cached responses by category or pattern.
 
+    Category invalidation removes the keys recorded in the category's tag set
+    (maintained by cache_response). If the tag set is empty - e.g. keys
+    written before tagging was introduced - it falls back to a batched SCAN
+    over the category's key prefix. Both paths delete in batches and yield to
+    the event loop, so large categories don't stall request handling.
+
     Args:
         category: Invalidate all caches for this category (e.g., "weather")
-        pattern: Invalidate caches matching this pattern
+        pattern: Invalidate caches matching this glob pattern
+                 (e.g., "athena_semantic:weather_*"); must stay inside the
+                 semantic cache namespace
 
     Returns:
         Number of keys invalidated
+
+    Raises:
+        ValueError: If ``pattern`` is outside the semantic cache namespace
     """
+    if pattern and not is_semantic_pattern(pattern):
+        raise ValueError(f"Pattern must start with '{SEMANTIC_KEY_NAMESPACE}:'")
+
     cache = get_cache_client()
 
     try:
         if category:
-            pattern = f"athena_semantic:{category}_*"
-        elif not pattern:
-            pattern = "athena_semantic:*"
+            removed = await cache.invalidate_tags(get_category_tag(category))
+            if removed == 0:
+                prefix = _intent_table.key_prefix(category)
+                if prefix:
+                    removed = await cache.delete_pattern(f"{SEMANTIC_KEY_NAMESPACE}:{prefix}*")
+        else:
+            pattern = pattern or f"{SEMANTIC_KEY_NAMESPACE}:*"
+            removed = await cache.delete_pattern(pattern)
 
-        # Note: This requires SCAN which may not be available in all Redis configs
-        # For now, just log the intent
-        logger.info("semantic_cache_invalidate_requested", pattern=pattern)
-
-        # Would need: keys = await cache.client.keys(pattern)
-        # For each key: await cache.delete(key)
-
-        return 0  # Placeholder - full implementation needs Redis SCAN
+        logger.info(
+            "semantic_cache_invalidated",
+            category=category,
+            pattern=pattern,
+            keys_removed=removed
+        )
+        return removed
 
     except Exception as e:
         logger.warning("semantic_cache_invalidate_error", error=str(e))
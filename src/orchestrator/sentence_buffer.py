@@ -9,7 +9,8 @@ Expected savings: 1-1.5 seconds per query
 """
 
 import re
-from typing import AsyncIterator, Optional
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, FrozenSet, Optional
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -25,11 +26,65 @@ MIN_SENTENCE_LENGTH = 20
 # Maximum buffer size before forcing a yield (prevents runaway buffering)
 MAX_BUFFER_SIZE = 500
 
+# Characters that may follow a terminator and still belong to the sentence
+CLOSING_CHARS = '"\'”’)]」』'
+
+# How far back to look for the word before a period
+MAX_ABBREVIATION_LENGTH = 10
+
+# How far back to look for the name before an initial ("John F. Kennedy")
+MAX_NAME_LENGTH = 20
+
+
+@dataclass(frozen=True)
+class SentenceRules:
+    """Per-language sentence boundary rules.
+
+    Attributes:
+        terminators: Characters that can end a sentence
+        requires_space: Whether a terminator must be followed by whitespace
+            (False for CJK, which doesn't separate sentences with spaces)
+        abbreviations: Lowercase words (without the final period) that never
+            end a sentence, e.g. titles before a name ("dr" in "Dr. Smith")
+    """
+    terminators: str = ".!?"
+    requires_space: bool = True
+    abbreviations: FrozenSet[str] = field(default_factory=frozenset)
+
+
+LANGUAGE_RULES: Dict[str, SentenceRules] = {
+    "en": SentenceRules(abbreviations=frozenset({
+        "mr", "mrs", "ms", "dr", "prof", "st", "mt", "ft", "vs", "e.g", "i.e",
+        "approx", "dept", "est", "fig", "gen", "gov", "sen", "rep", "lt", "col", "sgt",
+    })),
+    "es": SentenceRules(abbreviations=frozenset({
+        "sr", "sra", "srta", "dr", "dra", "ud", "uds", "p.ej", "aprox",
+    })),
+    "de": SentenceRules(abbreviations=frozenset({
+        "dr", "hr", "fr", "prof", "z.b", "bzw", "ca", "nr", "u.a", "d.h", "vgl", "sog",
+    })),
+    "fr": SentenceRules(abbreviations=frozenset({"m", "mme", "mlle", "dr", "p.ex", "cf", "env"})),
+    "zh": SentenceRules(terminators="。！？!?", requires_space=False),
+    "ja": SentenceRules(terminators="。！？!?", requires_space=False),
+}
+
+
+def get_sentence_rules(language: str = "en") -> SentenceRules:
+    """Rules for a language code ("en", "en-US", ...); falls back to English."""
+    return LANGUAGE_RULES.get(language.split("-")[0].lower(), LANGUAGE_RULES["en"])
+
 
 class SentenceBuffer:
     """
     Buffers streaming tokens and yields complete sentences.
 
+    Boundary detection is incremental: each token only scans the characters
+    it added (plus a bounded look-back for abbreviations), so the per-token
+    cost doesn't grow with the length of the sentence being buffered. A
+    period at the end of the buffer is held until the next non-space
+    character arrives, so "Dr. Smith", "3.14" and "U.S. policy" are not
+    split.
+
     Usage:
         buffer = SentenceBuffer()
         async for sentence in buffer.process(token_stream):
@@ -40,36 +95,119 @@ class SentenceBuffer:
     def __init__(
         self,
         min_length: int = MIN_SENTENCE_LENGTH,
-        max_buffer: int = MAX_BUFFER_SIZE
+        max_buffer: int = MAX_BUFFER_SIZE,
+        language: str = "en"
     ):
         self.buffer = ""
         self.min_length = min_length
         self.max_buffer = max_buffer
+        self.rules = get_sentence_rules(language)
         self.sentences_yielded = 0
         self.total_tokens = 0
+        # Offset in self.buffer where the next scan resumes
+        self._scan_pos = 0
 
     def _find_sentence_boundary(self) -> Optional[int]:
-        """Find the position of a sentence boundary in the buffer."""
-        # Look for sentence endings
-        for i, char in enumerate(self.buffer):
-            if char in '.!?':
-                # Check if this is a real sentence ending
-                # (not abbreviation like "Dr." or decimal like "3.14")
-                pos = i + 1
-
-                # Skip if too short
-                if pos < self.min_length:
-                    continue
+        """Find the end of the first complete sentence in the buffer.
 
-                # Check for quote after punctuation
-                if pos < len(self.buffer) and self.buffer[pos] in '"\'"':
-                    pos += 1
+        Resumes from the last scanned offset. Returns None when there is no
+        boundary yet, leaving ``_scan_pos`` on any terminator that still
+        needs more input to decide.
+        """
+        buf = self.buffer
+        length = len(buf)
+        terminators = self.rules.terminators
+        i = self._scan_pos
+        while i < length:
+            char = buf[i]
+            if char not in terminators:
+                i += 1
+                continue
+
+            end = i + 1
+            while end < length and buf[end] in CLOSING_CHARS:
+                end += 1
+
+            if self.rules.requires_space:
+                if end == length:
+                    if char == ".":
+                        # Could be "3." + "14" or "Dr." + " Smith" - wait and see
+                        self._scan_pos = i
+                        return None
+                elif not buf[end].isspace():
+                    # "3.14", "U.S.", "e.g.": not followed by whitespace
+                    i += 1
+                    continue
+                elif char == ".":
+                    decision = self._period_ends_sentence(buf, i, end)
+                    if decision is None:
+                        self._scan_pos = i
+                        return None
+                    if not decision:
+                        i += 1
+                        continue
+
+            # Skip if too short
+            if end < self.min_length:
+                i += 1
+                continue
+
+            self._scan_pos = 0
+            return end
+
+        self._scan_pos = length
+        return None
 
-                # Check for space or end of buffer (indicates sentence end)
-                if pos >= len(self.buffer) or self.buffer[pos].isspace():
-                    return pos
+    def _period_ends_sentence(self, buf: str, i: int, end: int) -> Optional[bool]:
+        """Decide whether the period at ``buf[i]`` (followed by whitespace) ends a sentence.
 
-        return None
+        Returns None if the next word hasn't arrived yet.
+        """
+        start = i
+        floor = max(0, i - MAX_ABBREVIATION_LENGTH)
+        while start > floor and not buf[start - 1].isspace():
+            start -= 1
+        word = buf[start:i].lstrip("\"'([“‘").lower()
+        if word in self.rules.abbreviations:
+            return False
+
+        j = end
+        length = len(buf)
+        while j < length and buf[j].isspace():
+            j += 1
+        if j == length:
+            return None
+        if buf[j].islower():
+            # "approx. five", "etc. and" - the sentence continues
+            return False
+
+        if len(word) == 1 and buf[i - 1].isupper():
+            # An initial ("J. R. R. Tolkien", "John F. Kennedy") is followed by
+            # another initial or follows a name; "so did I. Then" ends here
+            if j + 1 == length:
+                return None
+            if buf[j + 1] == "." or self._follows_capitalized_word(buf, start):
+                return False
+        return True
+
+    @staticmethod
+    def _follows_capitalized_word(buf: str, start: int) -> bool:
+        """Whether the word before ``buf[start]`` is capitalized (True at the start of the buffer)."""
+        k = start - 1
+        while k >= 0 and buf[k].isspace():
+            k -= 1
+        if k < 0:
+            return True
+        floor = max(0, k - MAX_NAME_LENGTH)
+        while k > floor and not buf[k - 1].isspace():
+            k -= 1
+        return buf[k:start].lstrip("\"'([“‘")[:1].isupper()
+
+    def _take(self, end: int) -> str:
+        sentence = self.buffer[:end].strip()
+        self.buffer = self.buffer[end:].lstrip()
+        self._scan_pos = 0
+        return sentence
 
     async def process(
         self,
@@ -91,12 +229,10 @@ class SentenceBuffer:
             if token:
                 self.buffer += token
 
-                # Check for sentence boundary
+                # Yield every sentence the new token completed
                 boundary = self._find_sentence_boundary()
-
-                if boundary:
-                    sentence = self.buffer[:boundary].strip()
-                    self.buffer = self.buffer[boundary:].lstrip()
+                while boundary:
+                    sentence = self._take(boundary)
 
                     if sentence:
                         self.sentences_yielded += 1
@@ -107,9 +243,10 @@ class SentenceBuffer:
                             remaining_buffer=len(self.buffer)
                         )
                         yield sentence
+                    boundary = self._find_sentence_boundary()
 
                 # Force yield if buffer gets too large
-                elif len(self.buffer) > self.max_buffer:
+                if len(self.buffer) > self.max_buffer:
                     # Find a natural break point (comma, semicolon, dash)
                     break_pos = None
                     for delim in [', ', '; ', ' - ', ' — ']:
@@ -118,13 +255,8 @@ class SentenceBuffer:
                             break_pos = pos + len(delim)
                             break
 
-                    if break_pos:
-                        sentence = self.buffer[:break_pos].strip()
-                        self.buffer = self.buffer[break_pos:].lstrip()
-                    else:
-                        # No good break point, force yield at max
-                        sentence = self.buffer[:self.max_buffer].strip()
-                        self.buffer = self.buffer[self.max_buffer:].lstrip()
+                    # No good break point, force yield at max
+                    sentence = self._take(break_pos or self.max_buffer)
 
                     if sentence:
                         self.sentences_yielded += 1
@@ -148,6 +280,7 @@ class SentenceBuffer:
                     )
                     yield self.buffer.strip()
                     self.buffer = ""
+                    self._scan_pos = 0
 
                 logger.info(
                     "sentence_buffer_complete",
@@ -161,6 +294,7 @@ class SentenceBuffer:
         self.buffer = ""
         self.sentences_yielded = 0
         self.total_tokens = 0
+        self._scan_pos = 0
 
 
 async def stream_with_sentence_buffering(
@@ -168,7 +302,8 @@ async def stream_with_sentence_buffering(
     model: str,
     prompt: str,
     temperature: float = 0.7,
-    max_tokens: int = 2048
+    max_tokens: int = 2048,
+    language: str = "en"
 ) -> AsyncIterator[dict]:
     """
     Stream LLM output with sentence buffering.
@@ -179,7 +314,7 @@ async def stream_with_sentence_buffering(
             - 'sentence_num': Sentence number (1-indexed)
             - 'is_final': True if this is the last sentence
     """
-    buffer = SentenceBuffer()
+    buffer = SentenceBuffer(language=language)
 
     token_stream = llm_router.generate_stream(
         model=model,
@@ -6,14 +6,16 @@ Integrates with config_loader for dynamic configuration.
 """
 
 import os
+import time
 import uuid
-import json
 import asyncio
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import structlog
 
 from orchestrator.config_loader import get_config
+from shared.cache import encode_value, decode_value
+from redis.client import NEVER_DECODE
 
 logger = structlog.get_logger()
 
@@ -24,13 +26,36 @@ REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_ENABLED = os.getenv("REDIS_ENABLED", "false").lower() == "true"
 
-# Session key prefix
+# Session key prefix. Each session is a metadata hash ({prefix}{id}:meta,
+# one codec-encoded value per field) plus an append-only list of
+# codec-encoded messages ({prefix}{id}:messages). Sessions written before
+# this layout live in a single blob at {prefix}{id} and are migrated on read.
 SESSION_KEY_PREFIX = "athena:session:"
 
+# How long conversation settings are reused before asking config_loader again
+SETTINGS_CACHE_SECONDS = 30
+
 # In-memory fallback storage
 _memory_sessions: Dict[str, Dict[str, Any]] = {}
 
 
+def _meta_key(session_id: str) -> str:
+    return f"{SESSION_KEY_PREFIX}{session_id}:meta"
+
+
+def _messages_key(session_id: str) -> str:
+    return f"{SESSION_KEY_PREFIX}{session_id}:messages"
+
+
+def _new_message(role: str, content: str, metadata: Optional[Dict] = None) -> Dict[str, Any]:
+    return {
+        "role": role,
+        "content": content,
+        "timestamp": datetime.utcnow().isoformat(),
+        "metadata": metadata or {}
+    }
+
+
 class ConversationSession:
     """Represents a conversation session with history and metadata."""
 
@@ -57,6 +82,9 @@ class ConversationSession:
         self.last_activity = datetime.utcnow()
         self.messages: List[Dict[str, Any]] = []
         self.metadata: Dict[str, Any] = {}
+        # Messages in storage; larger than len(messages) when the session was
+        # loaded with a history limit
+        self.message_count = 0
 
     def add_message(self, role: str, content: str, metadata: Optional[Dict] = None):
         """
@@ -67,13 +95,8 @@ class ConversationSession:
             content: Message content
             metadata: Optional message metadata (intent, confidence, etc.)
         """
-        message = {
-            "role": role,
-            "content": content,
-            "timestamp": datetime.utcnow().isoformat(),
-            "metadata": metadata or {}
-        }
-        self.messages.append(message)
+        self.messages.append(_new_message(role, content, metadata))
+        self.message_count += 1
         self.last_activity = datetime.utcnow()
 
     def get_recent_messages(self, max_messages: int) -> List[Dict[str, Any]]:
@@ -145,6 +168,7 @@ class ConversationSession:
         if len(self.messages) > max_messages:
             # Keep most recent messages
             self.messages = self.messages[-max_messages:]
+            self.message_count = len(self.messages)
             logger.info("session_history_trimmed",
                        session_id=self.session_id,
                        kept=len(self.messages))
@@ -186,8 +210,15 @@ class ConversationSession:
         session.last_activity = datetime.fromisoformat(data["last_activity"])
         session.messages = data.get("messages", [])
         session.metadata = data.get("metadata", {})
+        session.message_count = data.get("message_count", len(session.messages))
         return session
 
+    def meta_fields(self) -> Dict[str, Any]:
+        """Session fields stored in the metadata hash (everything but messages)."""
+        data = self.to_dict()
+        del data["messages"]
+        return data
+
 
 class SessionManager:
     """Manages conversation sessions with Redis storage."""
@@ -197,6 +228,8 @@ class SessionManager:
         self.redis_client = None
         self._initialized = False
         self._cleanup_task = None
+        self._settings: Optional[Dict[str, Any]] = None
+        self._settings_loaded_at = 0.0
 
     async def initialize(self):
         """Initialize Redis connection and start cleanup task."""
@@ -245,6 +278,15 @@ class SessionManager:
 
         self._initialized = False
 
+    async def _get_settings(self) -> Dict[str, Any]:
+        """Conversation settings, reused for SETTINGS_CACHE_SECONDS."""
+        now = time.monotonic()
+        if self._settings is None or now - self._settings_loaded_at > SETTINGS_CACHE_SECONDS:
+            config = await get_config()
+            self._settings = await config.get_conversation_settings()
+            self._settings_loaded_at = now
+        return self._settings
+
     async def create_session(
         self,
         session_id: Optional[str] = None,
@@ -291,12 +333,18 @@ class SessionManager:
 
         return session
 
-    async def get_session(self, session_id: str) -> Optional[ConversationSession]:
+    async def get_session(
+        self,
+        session_id: str,
+        history_limit: Optional[int] = None
+    ) -> Optional[ConversationSession]:
         """
         Get existing session by ID.
 
         Args:
             session_id: Session identifier
+            history_limit: Load only the most recent N messages (0 loads
+                metadata only); None loads the full history
 
         Returns:
             ConversationSession if found, None otherwise
@@ -304,10 +352,10 @@ class SessionManager:
         # Try Redis first
         if self.redis_client:
             try:
-                data = await self.redis_client.get(f"{SESSION_KEY_PREFIX}{session_id}")
-                if data:
-                    session_dict = json.loads(data)
-                    session = ConversationSession.from_dict(session_dict)
+                session = await self._load_redis_session(session_id, history_limit)
+                if session is None:
+                    session = await self._migrate_legacy_session(session_id, history_limit)
+                if session:
                     logger.debug("session_retrieved",
                                session_id=session_id,
                                source="redis")
@@ -321,6 +369,8 @@ class SessionManager:
         if session_id in _memory_sessions:
             session_dict = _memory_sessions[session_id]
             session = ConversationSession.from_dict(session_dict)
+            if history_limit is not None:
+                session.messages = session.messages[-history_limit:] if history_limit else []
             logger.debug("session_retrieved",
                        session_id=session_id,
                        source="memory")
@@ -332,7 +382,8 @@ class SessionManager:
         self,
         session_id: Optional[str] = None,
         user_id: Optional[str] = None,
-        zone: Optional[str] = None
+        zone: Optional[str] = None,
+        history_limit: Optional[int] = None
     ) -> ConversationSession:
         """
         Get existing session or create new one.
@@ -341,16 +392,16 @@ class SessionManager:
             session_id: Optional existing session ID
             user_id: Optional user identifier
             zone: Optional zone identifier
+            history_limit: Load only the most recent N messages (see get_session)
 
         Returns:
             ConversationSession instance
         """
         if session_id:
-            session = await self.get_session(session_id)
+            session = await self.get_session(session_id, history_limit=history_limit)
             if session:
                 # Check if session is expired
-                config = await get_config()
-                settings = await config.get_conversation_settings()
+                settings = await self._get_settings()
                 timeout = settings.get("timeout_seconds", 1800)
 
                 if not session.is_expired(timeout):
@@ -374,32 +425,46 @@ class SessionManager:
         """
         Add message to session.
 
+        Appends to the session's message list and trims it with LTRIM in
+        one round-trip; the existing history is never read or rewritten.
+
         Args:
             session_id: Session identifier
             role: Message role ('user' or 'assistant')
             content: Message content
             metadata: Optional message metadata
         """
-        session = await self.get_session(session_id)
-        if not session:
+        message = _new_message(role, content, metadata)
+        settings = await self._get_settings()
+        max_messages = settings.get("max_messages", 20)
+        ttl = settings.get("session_ttl_seconds", 3600)
+
+        if self.redis_client:
+            try:
+                message_count = await self._append_redis_message(session_id, message, max_messages, ttl)
+                if message_count is not None:
+                    logger.debug("message_added",
+                                session_id=session_id,
+                                role=role,
+                                message_count=message_count)
+                    return
+            except Exception as e:
+                logger.warning("redis_append_failed",
+                             session_id=session_id,
+                             error=str(e))
+
+        session_dict = _memory_sessions.get(session_id)
+        if not session_dict:
             logger.warning("session_not_found", session_id=session_id)
             return
 
-        session.add_message(role, content, metadata)
-
-        # Trim history if needed
-        config = await get_config()
-        settings = await config.get_conversation_settings()
-        max_messages = settings.get("max_messages", 20)
-        session.trim_history(max_messages)
-
-        # Save updated session
-        await self._save_session(session)
+        session_dict["messages"] = (session_dict.get("messages", []) + [message])[-max_messages:]
+        session_dict["last_activity"] = datetime.utcnow().isoformat()
 
         logger.debug("message_added",
                     session_id=session_id,
                     role=role,
-                    message_count=len(session.messages))
+                    message_count=len(session_dict["messages"]))
 
     async def get_llm_context(
         self,
@@ -409,6 +474,8 @@ class SessionManager:
         """
         Get conversation history for LLM context.
 
+        Only the last ``max_history`` messages are read from storage.
+
         Args:
             session_id: Session identifier
             max_history: Optional override for max history messages
@@ -416,16 +483,15 @@ class SessionManager:
         Returns:
             List of message dicts for LLM
         """
-        session = await self.get_session(session_id)
-        if not session:
-            return []
-
         # Get max history from config if not specified
         if max_history is None:
-            config = await get_config()
-            settings = await config.get_conversation_settings()
+            settings = await self._get_settings()
             max_history = settings.get("max_llm_history_messages", 10)
 
+        session = await self.get_session(session_id, history_limit=max(max_history, 0))
+        if not session:
+            return []
+
         return session.get_llm_history(max_history)
 
     async def delete_session(self, session_id: str):
@@ -438,7 +504,11 @@ class SessionManager:
         # Delete from Redis
         if self.redis_client:
             try:
-                await self.redis_client.delete(f"{SESSION_KEY_PREFIX}{session_id}")
+                await self.redis_client.delete(
+                    _meta_key(session_id),
+                    _messages_key(session_id),
+                    f"{SESSION_KEY_PREFIX}{session_id}"
+                )
             except Exception as e:
                 logger.warning("redis_delete_failed",
                              session_id=session_id,
@@ -450,23 +520,42 @@ class SessionManager:
 
         logger.info("session_deleted", session_id=session_id)
 
+    async def save_metadata(self, session: ConversationSession):
+        """Persist session metadata only (e.g. a precomputed summary), not history."""
+        if self.redis_client:
+            try:
+                ttl = (await self._get_settings()).get("session_ttl_seconds", 3600)
+                pipe = self.redis_client.pipeline(transaction=True)
+                pipe.hset(_meta_key(session.session_id), mapping={
+                    "metadata": encode_value(session.metadata),
+                    "last_activity": encode_value(session.last_activity.isoformat()),
+                })
+                pipe.expire(_meta_key(session.session_id), ttl)
+                await pipe.execute()
+                return
+            except Exception as e:
+                logger.warning("redis_save_failed",
+                             session_id=session.session_id,
+                             error=str(e))
+
+        session_dict = _memory_sessions.get(session.session_id)
+        if session_dict is not None:
+            session_dict["metadata"] = session.metadata
+        else:
+            await self._save_session(session)
+
     async def _save_session(self, session: ConversationSession):
-        """Save session to storage."""
+        """Write a whole session (metadata and history) to storage."""
         session_dict = session.to_dict()
 
         # Get TTL from config
-        config = await get_config()
-        settings = await config.get_conversation_settings()
+        settings = await self._get_settings()
         ttl = settings.get("session_ttl_seconds", 3600)
 
         # Save to Redis
         if self.redis_client:
             try:
-                await self.redis_client.setex(
-                    f"{SESSION_KEY_PREFIX}{session.session_id}",
-                    ttl,
-                    json.dumps(session_dict)
-                )
+                await self._write_redis_session(session, ttl)
                 logger.debug("session_saved",
                            session_id=session.session_id,
                            source="redis")
@@ -482,13 +571,98 @@ class SessionManager:
                    session_id=session.session_id,
                    source="memory")
 
+    # -------------------------------------------------------------------------
+    # Redis layout
+    # -------------------------------------------------------------------------
+
+    async def _write_redis_session(self, session: ConversationSession, ttl: int):
+        meta_key = _meta_key(session.session_id)
+        messages_key = _messages_key(session.session_id)
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.delete(meta_key, messages_key)
+        pipe.hset(meta_key, mapping={
+            field: encode_value(value) for field, value in session.meta_fields().items()
+        })
+        if session.messages:
+            pipe.rpush(messages_key, *(encode_value(m) for m in session.messages))
+            pipe.expire(messages_key, ttl)
+        pipe.expire(meta_key, ttl)
+        await pipe.execute()
+
+    async def _load_redis_session(
+        self,
+        session_id: str,
+        history_limit: Optional[int]
+    ) -> Optional[ConversationSession]:
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.execute_command("HGETALL", _meta_key(session_id), **{NEVER_DECODE: True})
+        if history_limit != 0:
+            start = -history_limit if history_limit else 0
+            pipe.execute_command("LRANGE", _messages_key(session_id), start, -1, **{NEVER_DECODE: True})
+        pipe.llen(_messages_key(session_id))
+        results = await pipe.execute()
+        raw_meta, message_count = results[0], results[-1]
+        if not raw_meta:
+            return None
+
+        data = {field.decode(): decode_value(value) for field, value in raw_meta.items()}
+        data["messages"] = [decode_value(m) for m in results[1]] if history_limit != 0 else []
+        data["message_count"] = message_count
+        return ConversationSession.from_dict(data)
+
+    async def _append_redis_message(
+        self,
+        session_id: str,
+        message: Dict[str, Any],
+        max_messages: int,
+        ttl: int
+    ) -> Optional[int]:
+        """Append one message; returns the new message count, or None if no session."""
+        meta_key = _meta_key(session_id)
+        messages_key = _messages_key(session_id)
+        if not await self.redis_client.exists(meta_key):
+            if not await self._migrate_legacy_session(session_id, history_limit=0):
+                return None
+
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.rpush(messages_key, encode_value(message))
+        pipe.ltrim(messages_key, -max_messages, -1)
+        pipe.hset(meta_key, "last_activity", encode_value(message["timestamp"]))
+        pipe.expire(messages_key, ttl)
+        pipe.expire(meta_key, ttl)
+        pipe.llen(messages_key)
+        results = await pipe.execute()
+        return results[-1]
+
+    async def _migrate_legacy_session(
+        self,
+        session_id: str,
+        history_limit: Optional[int]
+    ) -> Optional[ConversationSession]:
+        """Move a single-blob session to the hash + list layout."""
+        legacy_key = f"{SESSION_KEY_PREFIX}{session_id}"
+        data = await self.redis_client.execute_command("GET", legacy_key, **{NEVER_DECODE: True})
+        if not data:
+            return None
+
+        session = ConversationSession.from_dict(decode_value(data))
+        ttl = await self.redis_client.ttl(legacy_key)
+        if ttl is None or ttl < 1:
+            ttl = (await self._get_settings()).get("session_ttl_seconds", 3600)
+        await self._write_redis_session(session, ttl)
+        await self.redis_client.delete(legacy_key)
+        logger.info("session_migrated", session_id=session_id, messages=len(session.messages))
+
+        if history_limit is not None:
+            session.messages = session.messages[-history_limit:] if history_limit else []
+        return session
+
     async def _cleanup_loop(self):
         """Background task to cleanup expired sessions."""
         while True:
             try:
                 # Get cleanup interval from config
-                config = await get_config()
-                settings = await config.get_conversation_settings()
+                settings = await self._get_settings()
                 interval = settings.get("cleanup_interval_seconds", 60)
                 timeout = settings.get("timeout_seconds", 1800)
 
@@ -600,14 +774,14 @@ async def update_session_summary(
         True if update successful, False otherwise
     """
     manager = await get_session_manager()
-    session = await manager.get_session(session_id)
+    session = await manager.get_session(session_id, history_limit=0)
     if not session:
         logger.warning("session_not_found_for_summary_update", session_id=session_id)
         return False
 
-    message_count = len(session.messages)
+    message_count = session.message_count
     session.set_precomputed_summary(summary, message_count)
-    await manager._save_session(session)
+    await manager.save_metadata(session)
 
     logger.info("session_summary_updated",
                session_id=session_id,
@@ -629,7 +803,7 @@ async def get_session_summary(session_id: str) -> Optional[str]:
         Precomputed summary if available and fresh, None otherwise
     """
     manager = await get_session_manager()
-    session = await manager.get_session(session_id)
+    session = await manager.get_session(session_id, history_limit=0)
     if not session:
         return None
 
@@ -638,7 +812,7 @@ async def get_session_summary(session_id: str) -> Optional[str]:
         return None
 
     # Check if summary is still fresh (within 4 messages)
-    current_count = len(session.messages)
+    current_count = session.message_count
     summary_count = session.get_summary_message_count()
 
     if current_count - summary_count <= 4:
@@ -1984,22 +1984,22 @@ Return ONLY valid JSON."""
         
         # Execute action based on type
         # Use brief responses suitable for voice output
-        # Parallelize HA API calls for faster response
+        # Batch HA service calls (merged into multi-entity calls) for faster response
         if action == "turn_on":
-            await asyncio.gather(*[
-                ha_client.call_service("light", "turn_on", {"entity_id": light})
+            await ha_client.call_services([
+                ("light", "turn_on", {"entity_id": light})
                 for light in target_lights
-            ])
+            ], raise_on_error=True)
             light_names = ', '.join([l.split('.')[-1].replace('_', ' ') for l in target_lights[:3]])
             if len(target_lights) > 3:
                 light_names += f" and {len(target_lights) - 3} more"
             return vary_response(LIGHT_ON_RESPONSES, lights=light_names)
 
         elif action == "turn_off":
-            await asyncio.gather(*[
-                ha_client.call_service("light", "turn_off", {"entity_id": light})
+            await ha_client.call_services([
+                ("light", "turn_off", {"entity_id": light})
                 for light in target_lights
-            ])
+            ], raise_on_error=True)
             light_names = ', '.join([l.split('.')[-1].replace('_', ' ') for l in target_lights[:3]])
             if len(target_lights) > 3:
                 light_names += f" and {len(target_lights) - 3} more"
@@ -2043,8 +2043,8 @@ Return ONLY valid JSON."""
                 if is_single_color and detected_color:
                     # Override LLM colors - use the named color for all lights
                     hue, sat = self.color_name_to_hs(detected_color)
-                    await asyncio.gather(*[
-                        ha_client.call_service(
+                    await ha_client.call_services([
+                        (
                             "light",
                             "turn_on",
                             {
@@ -2054,7 +2054,7 @@ Return ONLY valid JSON."""
                             }
                         )
                         for light in target_lights
-                    ])
+                    ], raise_on_error=True)
                     light_names = ', '.join([l.split('.')[-1].replace('_', ' ') for l in target_lights[:3]])
                     if len(target_lights) > 3:
                         light_names += f" and {len(target_lights) - 3} more"
@@ -2062,8 +2062,12 @@ Return ONLY valid JSON."""
                 else:
                     # Use LLM-generated colors for varied/themed requests
                     # Build color assignments then execute in parallel
-                    async def set_light_color(light, hue, sat):
-                        await ha_client.call_service(
+                    # Lights that share a color are merged into one call
+                    calls = []
+                    for i, light in enumerate(target_lights):
+                        color_idx = i % len(hs_colors)  # Cycle if fewer colors than lights
+                        hue, sat = hs_colors[color_idx]
+                        calls.append((
                             "light",
                             "turn_on",
                             {
@@ -2071,14 +2075,8 @@ Return ONLY valid JSON."""
                                 "hs_color": [hue, sat],
                                 "brightness": 255
                             }
-                        )
-
-                    tasks = []
-                    for i, light in enumerate(target_lights):
-                        color_idx = i % len(hs_colors)  # Cycle if fewer colors than lights
-                        hue, sat = hs_colors[color_idx]
-                        tasks.append(set_light_color(light, hue, sat))
-                    await asyncio.gather(*tasks)
+                        ))
+                    await ha_client.call_services(calls, raise_on_error=True)
                     light_names = ', '.join([l.split('.')[-1].replace('_', ' ') for l in target_lights[:3]])
                     if len(target_lights) > 3:
                         light_names += f" and {len(target_lights) - 3} more"
@@ -2097,8 +2095,8 @@ Return ONLY valid JSON."""
                     colors = self.generate_random_colors(len(target_lights))
                     color_desc = "different colors"
 
-                await asyncio.gather(*[
-                    ha_client.call_service(
+                await ha_client.call_services([
+                    (
                         "light",
                         "turn_on",
                         {
@@ -2108,7 +2106,7 @@ Return ONLY valid JSON."""
                         }
                     )
                     for i, light in enumerate(target_lights)
-                ])
+                ], raise_on_error=True)
                 light_names = ', '.join([l.split('.')[-1].replace('_', ' ') for l in target_lights[:3]])
                 if len(target_lights) > 3:
                     light_names += f" and {len(target_lights) - 3} more"
@@ -2118,8 +2116,8 @@ Return ONLY valid JSON."""
                 color_value = parameters.get('color_value', 'white')
                 hue, sat = self.color_name_to_hs(color_value)
 
-                await asyncio.gather(*[
-                    ha_client.call_service(
+                await ha_client.call_services([
+                    (
                         "light",
                         "turn_on",
                         {
@@ -2129,7 +2127,7 @@ Return ONLY valid JSON."""
                         }
                     )
                     for light in target_lights
-                ])
+                ], raise_on_error=True)
                 light_names = ', '.join([l.split('.')[-1].replace('_', ' ') for l in target_lights[:3]])
                 if len(target_lights) > 3:
                     light_names += f" and {len(target_lights) - 3} more"
@@ -2141,8 +2139,8 @@ Return ONLY valid JSON."""
             brightness = max(0, min(255, brightness))
             percent = int((brightness / 255) * 100)
 
-            await asyncio.gather(*[
-                ha_client.call_service(
+            await ha_client.call_services([
+                (
                     "light",
                     "turn_on",
                     {
@@ -2151,7 +2149,7 @@ Return ONLY valid JSON."""
                     }
                 )
                 for light in target_lights
-            ])
+            ], raise_on_error=True)
             light_names = ', '.join([l.split('.')[-1].replace('_', ' ') for l in target_lights[:3]])
             if len(target_lights) > 3:
                 light_names += f" and {len(target_lights) - 3} more"
@@ -2161,8 +2159,8 @@ Return ONLY valid JSON."""
             # Increase brightness by ~20%
             brightness_step = parameters.get('brightness_step', 50)
 
-            await asyncio.gather(*[
-                ha_client.call_service(
+            await ha_client.call_services([
+                (
                     "light",
                     "turn_on",
                     {
@@ -2171,7 +2169,7 @@ Return ONLY valid JSON."""
                     }
                 )
                 for light in target_lights
-            ])
+            ], raise_on_error=True)
             light_names = ', '.join([l.split('.')[-1].replace('_', ' ') for l in target_lights[:3]])
             if len(target_lights) > 3:
                 light_names += f" and {len(target_lights) - 3} more"
@@ -2181,8 +2179,8 @@ Return ONLY valid JSON."""
             # Decrease brightness by ~20%
             brightness_step = parameters.get('brightness_step', 50)
 
-            await asyncio.gather(*[
-                ha_client.call_service(
+            await ha_client.call_services([
+                (
                     "light",
                     "turn_on",
                     {
@@ -2191,7 +2189,7 @@ Return ONLY valid JSON."""
                     }
                 )
                 for light in target_lights
-            ])
+            ], raise_on_error=True)
             light_names = ', '.join([l.split('.')[-1].replace('_', ' ') for l in target_lights[:3]])
             if len(target_lights) > 3:
                 light_names += f" and {len(target_lights) - 3} more"
@@ -2204,8 +2202,8 @@ Return ONLY valid JSON."""
         import logging
         logger = logging.getLogger(__name__)
 
-        # Get climate state from entity manager
-        climate_state = await self.entity_manager.get_climate_state()
+        # Get climate state from entity manager (the room's thermostat when one is named)
+        climate_state = await self.entity_manager.get_climate_state(room=(parameters or {}).get('room'))
 
         if not climate_state:
             return "I couldn't find a thermostat to check."
@@ -2555,7 +2553,7 @@ Return ONLY valid JSON."""
 
         try:
             # Get all entity states from HA via entity manager
-            all_entities = await self.entity_manager.get_entities()
+            all_entities = await self.entity_manager.get_entities_by_domain('binary_sensor')
 
             open_windows = []
             closed_windows = []
@@ -2617,7 +2615,7 @@ Return ONLY valid JSON."""
 
         try:
             # Get all entity states from HA via entity manager
-            all_entities = await self.entity_manager.get_entities()
+            all_entities = await self.entity_manager.get_entities_by_domain('binary_sensor')
 
             motion_sensors = []
             for entity_id, state in all_entities.items():
@@ -2684,7 +2682,7 @@ Return ONLY valid JSON."""
         logger = logging.getLogger(__name__)
 
         try:
-            all_entities = await self.entity_manager.get_entities()
+            all_entities = await self.entity_manager.get_entities_by_domain('binary_sensor')
 
             # Collect sensors by room and type for prioritization
             sensors_by_room = {}  # room -> {'presence': [], 'pir': [], 'motion': []}
@@ -2985,68 +2983,13 @@ Return ONLY valid JSON."""
             return "I had trouble checking the sensor status. Please try again."
 
     def _extract_room_from_entity(self, entity_id: str, friendly_name: str = None) -> str:
-        """Extract room name from motion sensor entity ID or friendly name."""
-        # IMPORTANT: Order matters! More specific patterns must come first
-        # Patterns are checked in order, first match wins
-        room_patterns = [
-            # Specific bathroom patterns (before 'master' or 'bath')
-            ('master_bath', 'Master Bathroom'),
-            ('master bath', 'Master Bathroom'),
-            ('masterbath', 'Master Bathroom'),
-            ('main_bath', 'Main Bathroom'),
-            ('main bath', 'Main Bathroom'),
-            ('mainbath', 'Main Bathroom'),
-            ('powder', 'Powder Room'),
-            ('basement_bath', 'Basement Bathroom'),
-            ('basement bath', 'Basement Bathroom'),
-            # Master bedroom (after master bath patterns)
-            ('master_bed', 'Master Bedroom'),
-            ('master bed', 'Master Bedroom'),
-            ('masterbed', 'Master Bedroom'),
-            ('master_closet', 'Master Closet'),
-            ('master closet', 'Master Closet'),
-            ('underbed', 'Master Bedroom'),
-            # Other bedrooms
-            ('alpha', 'Alpha'),
-            ('beta', 'Beta'),
-            # Living areas
-            ('living', 'Living Room'),
-            ('dining', 'Dining Room'),
-            ('kitchen', 'Kitchen'),
-            ('office', 'Office'),
-            # Hallways (be specific)
-            ('basement_hall', 'Basement Hallway'),
-            ('basement hall', 'Basement Hallway'),
-            ('hallway_front', 'Front Hallway'),
-            ('front_hall', 'Front Hallway'),
-            ('hall', 'Hallway'),
-            # Basement
-            ('basement_stair', 'Basement Stairs'),
-            ('basement stair', 'Basement Stairs'),
-            ('basement', 'Basement'),
-            # Generic patterns (after specific ones)
-            ('master', 'Master Bedroom'),  # Fallback if no bath/bed specified
-            ('shower', 'Master Bathroom'),
-            ('front_door', 'Front Door'),
-            ('front door', 'Front Door'),
-            ('back_door', 'Back Door'),
-            ('entrance', 'Entrance'),
-        ]
+        """Extract room name from motion sensor entity ID or friendly name.
 
-        # Combine entity_id and friendly_name for matching
-        entity_lower = entity_id.lower().replace('binary_sensor.', '')
-        search_text = entity_lower
-        if friendly_name:
-            search_text = f"{entity_lower} {friendly_name.lower()}"
-
-        # Check patterns in order (first match wins)
-        for pattern, room_name in room_patterns:
-            if pattern in search_text:
-                return room_name
-
-        # No known room pattern matched - return None to skip this sensor
-        # This filters out generic sensors like "Presence Sensor 1" with hex codes
-        return None
+        Served from the entity manager's room index (ROOM_LABEL_PATTERNS in
+        room_index.py, then the HA area), computed once per entity. Returns None
+        for generic sensors like "Presence Sensor 1" so callers skip them.
+        """
+        return self.entity_manager.room_of(entity_id, friendly_name)
 
     async def _format_motion_status(self, motion_data: List[Dict], is_last_motion_query: bool = False) -> str:
         """
@@ -3350,8 +3293,7 @@ Do NOT mention rooms that have no current or recent motion."""
         if action in ['turn_on', 'turn_off'] and ha_client:
             try:
                 # Get all media_player entities
-                all_entities = await self.entity_manager.get_entities()
-                media_players = {k: v for k, v in all_entities.items() if k.startswith('media_player.')}
+                media_players = await self.entity_manager.get_entities_by_domain('media_player')
 
                 # Find TV entities (shield, nvidia, TV, etc.)
                 tv_patterns = ['shield', 'tv', 'nvidia', 'television', 'roku', 'fire', 'chromecast']
@@ -3558,8 +3500,7 @@ Do NOT mention rooms that have no current or recent motion."""
 
         try:
             # Get all light entities via entity manager
-            all_entities = await self.entity_manager.get_entities()
-            lights = {k: v for k, v in all_entities.items() if k.startswith('light.')}
+            lights = await self.entity_manager.get_entities_by_domain('light')
 
             if not lights:
                 return "I couldn't find any lights in the home automation system."
@@ -3615,8 +3556,7 @@ Do NOT mention rooms that have no current or recent motion."""
 
         try:
             # Get all lock entities from HA
-            all_entities = await self.entity_manager.get_entities()
-            locks = {k: v for k, v in all_entities.items() if k.startswith('lock.')}
+            locks = await self.entity_manager.get_entities_by_domain('lock')
 
             if not locks:
                 return "I couldn't find any locks in the home automation system."
@@ -3629,21 +3569,21 @@ Do NOT mention rooms that have no current or recent motion."""
             if room and room.lower() in ['all_doors', 'all doors', 'all']:
                 logger.info(f"Lock intent: targeting all doors ({len(locks)} locks)")
                 target_locks = list(locks.items())
+            elif room:
+                # Match by room name or lock name (literal: no synonyms for locks)
+                target_locks = list((await self.entity_manager.get_room_entities(
+                    room, 'lock', expand_synonyms=False
+                )).items())
             else:
                 for entity_id, state_data in locks.items():
                     friendly_name = state_data.get('attributes', {}).get('friendly_name', entity_id).lower()
                     entity_lower = entity_id.lower()
 
-                    # Match by room name or lock name
-                    if room:
-                        room_lower = room.lower().replace('_', ' ')
-                        if room_lower in friendly_name or room_lower in entity_lower:
-                            target_locks.append((entity_id, state_data))
-                    elif 'front' in query_lower and ('front' in friendly_name or 'front' in entity_lower):
+                    if 'front' in query_lower and ('front' in friendly_name or 'front' in entity_lower):
                         target_locks.append((entity_id, state_data))
                     elif 'back' in query_lower and ('back' in friendly_name or 'back' in entity_lower):
                         target_locks.append((entity_id, state_data))
-                    elif not room:
+                    else:
                         # No specific lock mentioned, include all
                         target_locks.append((entity_id, state_data))
 
@@ -3699,8 +3639,7 @@ Do NOT mention rooms that have no current or recent motion."""
 
         try:
             # Get all fan entities from HA
-            all_entities = await self.entity_manager.get_entities()
-            fans = {k: v for k, v in all_entities.items() if k.startswith('fan.')}
+            fans = await self.entity_manager.get_entities_by_domain('fan')
 
             if not fans:
                 return "I couldn't find any fans in the home automation system."
@@ -3709,16 +3648,16 @@ Do NOT mention rooms that have no current or recent motion."""
             target_fans = []
             query_lower = (original_query or "").lower()
 
-            for entity_id, state_data in fans.items():
-                friendly_name = state_data.get('attributes', {}).get('friendly_name', entity_id).lower()
-                entity_lower = entity_id.lower()
-
+            if room:
                 # Match by room name
-                if room:
-                    room_lower = room.lower().replace('_', ' ')
-                    if room_lower in friendly_name or room_lower in entity_lower:
-                        target_fans.append((entity_id, state_data))
-                else:
+                target_fans = list((await self.entity_manager.get_room_entities(
+                    room, 'fan', expand_synonyms=False
+                )).items())
+            else:
+                for entity_id, state_data in fans.items():
+                    friendly_name = state_data.get('attributes', {}).get('friendly_name', entity_id).lower()
+                    entity_lower = entity_id.lower()
+
                     # Try to match from query
                     if 'ceiling' in query_lower:
                         if 'ceiling' in friendly_name or 'ceiling' in entity_lower:
@@ -3773,8 +3712,7 @@ Do NOT mention rooms that have no current or recent motion."""
 
         try:
             # Get all cover entities from HA
-            all_entities = await self.entity_manager.get_entities()
-            covers = {k: v for k, v in all_entities.items() if k.startswith('cover.')}
+            covers = await self.entity_manager.get_entities_by_domain('cover')
 
             if not covers:
                 return "I couldn't find any garage doors or covers in the home automation system."
@@ -3783,20 +3721,22 @@ Do NOT mention rooms that have no current or recent motion."""
             target_covers = []
             query_lower = (original_query or "").lower()
 
-            for entity_id, state_data in covers.items():
-                friendly_name = state_data.get('attributes', {}).get('friendly_name', entity_id).lower()
-                entity_lower = entity_id.lower()
+            if room:
+                # Match by room name
+                target_covers = list((await self.entity_manager.get_room_entities(
+                    room, 'cover', expand_synonyms=False
+                )).items())
+            else:
+                for entity_id, state_data in covers.items():
+                    friendly_name = state_data.get('attributes', {}).get('friendly_name', entity_id).lower()
+                    entity_lower = entity_id.lower()
 
-                # Match by room name or keyword
-                if room:
-                    room_lower = room.lower().replace('_', ' ')
-                    if room_lower in friendly_name or room_lower in entity_lower:
-                        target_covers.append((entity_id, state_data))
-                elif 'garage' in query_lower:
-                    if 'garage' in friendly_name or 'garage' in entity_lower:
+                    # Match by keyword
+                    if 'garage' in query_lower:
+                        if 'garage' in friendly_name or 'garage' in entity_lower:
+                            target_covers.append((entity_id, state_data))
+                    else:
                         target_covers.append((entity_id, state_data))
-                else:
-                    target_covers.append((entity_id, state_data))
 
             if not target_covers:
                 return f"I couldn't find a garage door or cover matching '{room or 'your request'}'."
@@ -3949,7 +3889,7 @@ Do NOT mention rooms that have no current or recent motion."""
         Execute a command across all rooms in the house.
         Handles Christmas themes, whole-house color changes, etc.
         Supports exclusions like "all lights except bedroom".
-        All HA API calls are parallelized for faster response.
+        All HA service calls are batched (merged per color/action) for faster response.
         """
         import logging
         logger = logging.getLogger(__name__)
@@ -3990,8 +3930,8 @@ Do NOT mention rooms that have no current or recent motion."""
         is_christmas = 'christmas' in query_lower or ('red' in query_lower and 'green' in query_lower)
         wants_white_accent = 'white' in query_lower and ('visibility' in query_lower or 'couple' in query_lower or 'some' in query_lower)
 
-        # Collect all tasks first, then execute in parallel
-        tasks = []
+        # Collect all service calls first, then execute as one batch
+        calls = []
         global_light_index = 0
 
         for group in all_light_groups:
@@ -4004,11 +3944,11 @@ Do NOT mention rooms that have no current or recent motion."""
 
             if action == "turn_on":
                 for light in members:
-                    tasks.append(ha_client.call_service("light", "turn_on", {"entity_id": light}))
+                    calls.append(("light", "turn_on", {"entity_id": light}))
 
             elif action == "turn_off":
                 for light in members:
-                    tasks.append(ha_client.call_service("light", "turn_off", {"entity_id": light}))
+                    calls.append(("light", "turn_off", {"entity_id": light}))
 
             elif action == "set_color":
                 if is_christmas:
@@ -4020,19 +3960,19 @@ Do NOT mention rooms that have no current or recent motion."""
                     for i, light in enumerate(members):
                         if wants_white_accent and len(members) > 2 and i == len(members) // 2:
                             # Put a white light in the middle of each room for visibility
-                            tasks.append(ha_client.call_service(
+                            calls.append((
                                 "light", "turn_on",
                                 {"entity_id": light, "hs_color": [white_hue, white_sat], "brightness": 255}
                             ))
                         elif global_light_index % 2 == 0:
                             # Red lights on even global indices
-                            tasks.append(ha_client.call_service(
+                            calls.append((
                                 "light", "turn_on",
                                 {"entity_id": light, "hs_color": [red_hue, red_sat], "brightness": 255}
                             ))
                         else:
                             # Green lights on odd global indices
-                            tasks.append(ha_client.call_service(
+                            calls.append((
                                 "light", "turn_on",
                                 {"entity_id": light, "hs_color": [green_hue, green_sat], "brightness": 255}
                             ))
@@ -4043,7 +3983,7 @@ Do NOT mention rooms that have no current or recent motion."""
                     for i, light in enumerate(members):
                         color_idx = global_light_index % len(hs_colors)
                         hue, sat = hs_colors[color_idx]
-                        tasks.append(ha_client.call_service(
+                        calls.append((
                             "light", "turn_on",
                             {"entity_id": light, "hs_color": [hue, sat], "brightness": 255}
                         ))
@@ -4051,14 +3991,14 @@ Do NOT mention rooms that have no current or recent motion."""
                 else:
                     # Default to white if no colors specified
                     for light in members:
-                        tasks.append(ha_client.call_service(
+                        calls.append((
                             "light", "turn_on",
                             {"entity_id": light, "brightness": 255}
                         ))
 
-        # Execute all HA API calls in parallel
-        if tasks:
-            await asyncio.gather(*tasks)
+        # Execute as one batch (same-color lights merge into a single call)
+        if calls:
+            await ha_client.call_services(calls, raise_on_error=True)
 
         # Return contextual response for voice output
         room_count = len(all_light_groups)
@@ -4081,7 +4021,7 @@ Do NOT mention rooms that have no current or recent motion."""
         """
         Execute a command across multiple specific rooms.
         Handles commands like "turn on kitchen and living room lights".
-        All HA API calls are parallelized for faster response.
+        All HA service calls are batched (merged per color/action) for faster response.
         """
         import structlog
         logger = structlog.get_logger(__name__)
@@ -4089,7 +4029,7 @@ Do NOT mention rooms that have no current or recent motion."""
         logger.info(f"Executing multi-room command: action={action}, rooms={rooms}")
 
         # Collect all lights to control from all rooms
-        all_tasks = []
+        all_calls = []
         all_light_names = []
         total_count = 0
 
@@ -4115,19 +4055,19 @@ Do NOT mention rooms that have no current or recent motion."""
                 # If no members, use the group entity itself
                 members = [light_group.get('entity_id')]
 
-            # Queue up tasks for this room
+            # Queue up calls for this room
             for light in members:
                 if action == "turn_on":
-                    all_tasks.append(ha_client.call_service("light", "turn_on", {"entity_id": light}))
+                    all_calls.append(("light", "turn_on", {"entity_id": light}))
                 elif action == "turn_off":
-                    all_tasks.append(ha_client.call_service("light", "turn_off", {"entity_id": light}))
+                    all_calls.append(("light", "turn_off", {"entity_id": light}))
 
             all_light_names.append(group_name)
             total_count += len(members)
 
-        # Execute all tasks in parallel
-        if all_tasks:
-            await asyncio.gather(*all_tasks, return_exceptions=True)
+        # Execute as one batch; failures are per entity and don't abort the rest
+        if all_calls:
+            await ha_client.call_services(all_calls)
 
         # Build response
         room_list = ' and '.join(all_light_names)
@@ -4146,7 +4086,7 @@ Do NOT mention rooms that have no current or recent motion."""
         Execute a command across all rooms in a room group.
         Handles commands like "turn on the first floor lights" where first floor
         includes living room, dining room, and kitchen.
-        All HA API calls are parallelized for faster response.
+        All HA service calls are batched (merged per color/action) for faster response.
         """
         import structlog
         logger = structlog.get_logger(__name__)
@@ -4189,8 +4129,8 @@ Do NOT mention rooms that have no current or recent motion."""
         # Get all room lights in parallel
         room_lights_results = await asyncio.gather(*[get_room_lights(m) for m in members])
 
-        # Step 2: Collect all HA tasks
-        tasks = []
+        # Step 2: Collect all HA service calls
+        calls = []
         light_index = 0  # Global index for color cycling
 
         for members_lights in room_lights_results:
@@ -4199,11 +4139,11 @@ Do NOT mention rooms that have no current or recent motion."""
 
             if action == "turn_on":
                 for light in members_lights:
-                    tasks.append(ha_client.call_service("light", "turn_on", {"entity_id": light}))
+                    calls.append(("light", "turn_on", {"entity_id": light}))
 
             elif action == "turn_off":
                 for light in members_lights:
-                    tasks.append(ha_client.call_service("light", "turn_off", {"entity_id": light}))
+                    calls.append(("light", "turn_off", {"entity_id": light}))
 
             elif action == "set_color":
                 if is_christmas:
@@ -4213,12 +4153,12 @@ Do NOT mention rooms that have no current or recent motion."""
 
                     for light in members_lights:
                         if light_index % 2 == 0:
-                            tasks.append(ha_client.call_service(
+                            calls.append((
                                 "light", "turn_on",
                                 {"entity_id": light, "hs_color": [red_hue, red_sat], "brightness": 255}
                             ))
                         else:
-                            tasks.append(ha_client.call_service(
+                            calls.append((
                                 "light", "turn_on",
                                 {"entity_id": light, "hs_color": [green_hue, green_sat], "brightness": 255}
                             ))
@@ -4229,7 +4169,7 @@ Do NOT mention rooms that have no current or recent motion."""
                     for light in members_lights:
                         color_idx = light_index % len(hs_colors)
                         hue, sat = hs_colors[color_idx]
-                        tasks.append(ha_client.call_service(
+                        calls.append((
                             "light", "turn_on",
                             {"entity_id": light, "hs_color": [hue, sat], "brightness": 255}
                         ))
@@ -4238,14 +4178,14 @@ Do NOT mention rooms that have no current or recent motion."""
                 else:
                     # Default to white if no colors specified
                     for light in members_lights:
-                        tasks.append(ha_client.call_service(
+                        calls.append((
                             "light", "turn_on",
                             {"entity_id": light, "brightness": 255}
                         ))
 
-        # Execute all HA API calls in parallel
-        if tasks:
-            await asyncio.gather(*tasks)
+        # Execute as one batch (same-color lights merge into a single call)
+        if calls:
+            await ha_client.call_services(calls, raise_on_error=True)
 
         # Return contextual response for voice output
         room_count = len(members)
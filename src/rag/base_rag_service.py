@@ -14,6 +14,8 @@ import asyncpg
 import redis.asyncio as redis
 import structlog
 
+from shared.cache import encode_value, decode_value
+
 logger = structlog.get_logger()
 
 
@@ -126,7 +128,7 @@ class BaseRAGService:
             cached = await self.redis_client.get(cache_key)
             if cached:
                 logger.debug(f"Cache hit for {self.service_name}")
-                return json.loads(cached)
+                return decode_value(cached)
         except Exception as e:
             logger.error(f"Cache retrieval error: {e}")
 
@@ -142,7 +144,7 @@ class BaseRAGService:
             await self.redis_client.setex(
                 cache_key,
                 ttl,
-                json.dumps(response)
+                encode_value(response)
             )
             logger.debug(f"Cached response for {self.service_name} (TTL: {ttl}s)")
         except Exception as e:
@@ -284,7 +284,7 @@ def deduplicate_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]
 
     return unique_articles
 
-@cached(ttl=900)  # OPTIMIZATION: Cache for 15 minutes (news doesn't need second-level freshness)
+@cached(ttl=3600, soft_ttl=900)  # OPTIMIZATION: Fresh 15 minutes (news doesn't need second-level freshness), stale-while-revalidate up to 1 hour
 async def search_news(
     query: str,
     language: str = "en",
@@ -903,7 +903,7 @@ async def get_team_info_api(team_id: str) -> Dict[str, Any]:
 
     raise ValueError(f"Unknown provider for team id: {team_id}")
 
-@cached(ttl=600, key_prefix="next_events_v5")  # Cache for 10 minutes; v5 with seasontype fix
+@cached(ttl=3600, soft_ttl=600, key_prefix="next_events_v5", distributed=True)  # Fresh 10 minutes, stale up to 1 hour; v5 with seasontype fix
 async def get_next_events_api(team_id: str) -> List[Dict[str, Any]]:
     """Get next events for a team (provider-aware).
 
@@ -1076,7 +1076,7 @@ async def get_next_events_api(team_id: str) -> List[Dict[str, Any]]:
 
     return []
 
-@cached(ttl=600, key_prefix="last_events_v3")  # Cache for 10 minutes; v3 with seasontype fix
+@cached(ttl=3600, soft_ttl=600, key_prefix="last_events_v3")  # Fresh 10 minutes, stale up to 1 hour; v3 with seasontype fix
 async def get_last_events_api(team_id: str) -> List[Dict[str, Any]]:
     """Get last events for a team (provider-aware).
 
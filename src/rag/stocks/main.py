@@ -112,7 +112,7 @@ app = FastAPI(
 # Setup Prometheus metrics
 setup_metrics_endpoint(app, SERVICE_NAME, SERVICE_PORT)
 
-@cached(ttl=60)  # Cache for 1 minute (market data changes frequently)
+@cached(ttl=300, soft_ttl=60, prewarm_top=20)  # Fresh 1 minute (market data changes frequently), stale-while-revalidate up to 5 minutes
 async def get_stock_quote(symbol: str) -> Dict[str, Any]:
     """
     Get real-time stock quote for a symbol.
@@ -182,7 +182,7 @@ async def geocode_location(location: str) -> Dict[str, Any]:
         "country": result.get("country", "")
     }
 
-@cached(ttl=300, key_prefix="weather")  # Cache for 5 minutes
+@cached(ttl=1800, soft_ttl=300, key_prefix="weather", distributed=True, prewarm_top=20)  # Fresh 5 min, served stale up to 30 min while refreshing
 async def get_current_weather(lat: float, lon: float) -> Dict[str, Any]:
     """
     Get current weather for coordinates.
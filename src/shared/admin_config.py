@@ -3,15 +3,104 @@ Admin Configuration Client
 
 Allows services to fetch configuration and secrets from the admin API.
 Uses service-to-service authentication with API key.
+
+Configuration read on request paths (routing, LLM backends, tools, component
+models, gateway and voice config) is held as one in-memory snapshot. It is
+loaded in a single request, refetched section by section when the admin
+backend publishes a config version bump on Redis, and resynced periodically
+in the background as a safety net. Feature flags live in the in-process flag
+store (shared.feature_flags).
 """
 import os
+import json
 import time
+import asyncio
 import httpx
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable, Callable
 import structlog
 
+from shared.feature_flags import get_flag_store
+
 logger = structlog.get_logger()
 
+# Maintained by the admin backend (app/utils/config_version.py): the version
+# is incremented and published on every commit that changes a snapshot section
+CONFIG_VERSION_KEY = "athena:config:version"
+CONFIG_CHANNEL = "athena:config:changed"
+
+# Full resync interval while push notifications are flowing; without them
+# the snapshot falls back to resyncing every _cache_ttl seconds
+SNAPSHOT_RESYNC_SECONDS = 300
+# Retry interval while no snapshot could be loaded yet
+SNAPSHOT_RETRY_SECONDS = 5
+
+# Snapshot section -> public endpoint it mirrors. The endpoints are only
+# called directly against admin backends without /api/config-snapshot.
+SNAPSHOT_SECTIONS: Dict[str, str] = {
+    "intent_routing": "/api/intent-routing/routing/public",
+    "provider_routing": "/api/intent-routing/providers/public",
+    "llm_backends": "/api/llm-backends/public",
+    "tool_calling_settings": "/api/tool-calling/settings/public",
+    "enabled_tools": "/api/tool-calling/tools/public?enabled_only=true",
+    "fallback_triggers": "/api/tool-calling/triggers/public?enabled_only=true",
+    "component_models": "/api/component-models/public",
+    "gateway_config": "/api/gateway-config/public",
+    "voice_stt": "/api/voice-config/internal/stt",
+    "voice_tts": "/api/voice-config/internal/tts",
+    "voice_all": "/api/voice-config/internal/all",
+}
+
+VOICE_SECTIONS = ("voice_stt", "voice_tts", "voice_all")
+
+
+def _parse_intent_routing(data: List[Dict[str, Any]]) -> Dict[str, Dict]:
+    """Transform routing rows to Dict[category, config_dict]."""
+    routing: Dict[str, Dict] = {}
+    for item in data:
+        routing[item["intent_category"]] = {
+            "use_rag": item.get("use_rag", False),
+            "rag_service_url": item.get("rag_service_url"),
+            "use_web_search": item.get("use_web_search", False),
+            "use_llm": item.get("use_llm", True),
+            "priority": item.get("priority", 100)
+        }
+    return routing
+
+
+def _parse_provider_routing(data: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Group provider rows by category, ordered by priority."""
+    providers: Dict[str, List] = {}
+    for item in data:
+        providers.setdefault(item["intent_category"], []).append(
+            (item["provider_name"], item.get("priority", 100))
+        )
+    return {
+        category: [p[0] for p in sorted(entries, key=lambda x: x[1])]
+        for category, entries in providers.items()
+    }
+
+
+def _parse_llm_backends(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Only enabled backends, sorted by priority."""
+    enabled_backends = [b for b in data if b.get("enabled", False)]
+    enabled_backends.sort(key=lambda x: x.get("priority", 999))
+    return enabled_backends
+
+
+def _parse_fallback_triggers(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sort by priority (higher priority = checked first)."""
+    return sorted(data, key=lambda x: x.get("priority", 0), reverse=True)
+
+
+# Section -> transform applied once when the section is loaded
+SNAPSHOT_PARSERS: Dict[str, Callable[[Any], Any]] = {
+    "intent_routing": _parse_intent_routing,
+    "provider_routing": _parse_provider_routing,
+    "llm_backends": _parse_llm_backends,
+    "fallback_triggers": _parse_fallback_triggers,
+    "component_models": lambda data: {m["component_name"]: m for m in data},
+}
+
 
 class AdminConfigClient:
     """Client for fetching configuration from admin API."""
@@ -19,7 +108,8 @@ class AdminConfigClient:
     def __init__(
         self,
         admin_url: Optional[str] = None,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        redis_url: Optional[str] = None
     ):
         """
         Initialize admin configuration client.
@@ -27,6 +117,8 @@ class AdminConfigClient:
         Args:
             admin_url: Admin API URL (defaults to ADMIN_API_URL env var)
             api_key: Service API key (defaults to SERVICE_API_KEY env var)
+            redis_url: Redis URL for config change notifications (defaults to
+                 REDIS_URL env var, then the shared cache's Redis URL)
         """
         self.admin_url = admin_url or os.getenv(
             "ADMIN_API_URL",
@@ -45,48 +137,30 @@ class AdminConfigClient:
         # Critical paths like music playback compound multiple API calls
         self.client = httpx.AsyncClient(timeout=3.0)
 
-        # Routing configuration cache (60-second TTL)
+        # Config snapshot: section -> parsed value (see SNAPSHOT_SECTIONS)
+        self._snapshot: Dict[str, Any] = {}
+        self._snapshot_version = 0
+        self._snapshot_loaded_at = 0.0
+        self._snapshot_attempted_at = 0.0  # last load attempt, successful or not
+        self._snapshot_attempted = False
+        self._snapshot_lock = asyncio.Lock()
+        # Values derived from snapshot sections, dropped when a section reloads
+        self._derived: Dict[str, Any] = {}
+        self._snapshot_tasks: List[asyncio.Task] = []
+        self._snapshot_refreshes: set = set()
+        self._snapshot_live = False
+        self.redis_url = redis_url or os.getenv("REDIS_URL")
+
+        # Remaining per-endpoint caches (60-second TTL)
         self._cache_ttl = 60
         self._patterns_cache: Optional[Dict[str, List[str]]] = None
         self._patterns_cache_time = 0.0
-        self._routing_cache: Optional[Dict[str, Dict]] = None
-        self._routing_cache_time = 0.0
-        self._providers_cache: Optional[Dict[str, List[str]]] = None
-        self._providers_cache_time = 0.0
-
-        # LLM backends and features cache
-        self._llm_backends_cache: Optional[List[Dict[str, Any]]] = None
-        self._llm_backends_cache_time = 0.0
-        self._features_cache: Optional[Dict[str, bool]] = None
-        self._features_cache_time = 0.0
-
-        # Tool calling configuration cache
-        self._tool_calling_settings_cache: Optional[Dict[str, Any]] = None
-        self._tool_calling_settings_cache_time = 0.0
-        self._enabled_tools_cache: Optional[List[Dict[str, Any]]] = None
-        self._enabled_tools_cache_time = 0.0
-        self._fallback_triggers_cache: Optional[List[Dict[str, Any]]] = None
-        self._fallback_triggers_cache_time = 0.0
 
         # Base knowledge cache
         self._base_knowledge_cache: Optional[List[Dict[str, Any]]] = None
         self._base_knowledge_cache_time = 0.0
 
-        # Component model assignment cache
-        self._component_model_cache: Dict[str, Dict[str, Any]] = {}
-        self._component_model_cache_time: Dict[str, float] = {}
-
-        # Gateway config cache
-        self._gateway_config_cache: Optional[Dict[str, Any]] = None
-        self._gateway_config_cache_time: float = 0.0
-
-        # Voice config cache
-        self._voice_config_stt_cache: Optional[Dict[str, Any]] = None
-        self._voice_config_stt_cache_time: float = 0.0
-        self._voice_config_tts_cache: Optional[Dict[str, Any]] = None
-        self._voice_config_tts_cache_time: float = 0.0
-        self._voice_config_all_cache: Optional[Dict[str, Any]] = None
-        self._voice_config_all_cache_time: float = 0.0
+        # Voice interface cache
         self._voice_interface_cache: Dict[str, Dict[str, Any]] = {}
         self._voice_interface_cache_time: Dict[str, float] = {}
 
@@ -103,6 +177,189 @@ class AdminConfigClient:
             "use_database_model_config": True,  # Enabled - models fetched from database
         }
 
+    # ==========================================================================
+    # Config Snapshot
+    # ==========================================================================
+
+    async def _snapshot_section(self, name: str) -> Any:
+        """
+        Return a snapshot section, or None if it is not available.
+
+        Only the very first call waits for the admin backend; after that the
+        snapshot is kept current by background tasks and reads are in-memory.
+        """
+        if not self._snapshot_attempted:
+            async with self._snapshot_lock:
+                if not self._snapshot_attempted:
+                    await self._load_snapshot()
+                    self._snapshot_attempted = True
+        self._start_snapshot_sync()
+        return self._snapshot.get(name)
+
+    def _derive(self, name: str, section: str, build: Callable[[Any], Any]) -> Any:
+        """Memoize a value computed from a loaded snapshot section."""
+        if name not in self._derived:
+            self._derived[name] = build(self._snapshot[section])
+        return self._derived[name]
+
+    async def refresh_snapshot(self, sections: Optional[Iterable[str]] = None) -> bool:
+        """
+        Refetch config snapshot sections from the admin backend.
+
+        Args:
+            sections: Section names to refetch, or None for all
+
+        Returns:
+            True if the admin backend answered
+        """
+        async with self._snapshot_lock:
+            return await self._load_snapshot(sections)
+
+    async def _load_snapshot(self, sections: Optional[Iterable[str]] = None) -> bool:
+        names = list(sections) if sections is not None else list(SNAPSHOT_SECTIONS)
+        self._snapshot_attempted_at = time.time()
+        try:
+            params = {"sections": ",".join(names)} if sections is not None else None
+            response = await self.client.get(f"{self.admin_url}/api/config-snapshot/public", params=params)
+            if response.status_code == 404:
+                version, data = 0, await self._fetch_sections_individually(names)
+            elif response.status_code == 200:
+                payload = response.json()
+                version, data = payload.get("version", 0), payload.get("sections", {})
+            else:
+                logger.warning("config_snapshot_fetch_failed", status_code=response.status_code)
+                return False
+        except Exception as e:
+            logger.warning("config_snapshot_fetch_error", error=str(e), admin_url=self.admin_url)
+            return False
+
+        for name, raw in data.items():
+            if name not in SNAPSHOT_SECTIONS:
+                continue
+            try:
+                parser = SNAPSHOT_PARSERS.get(name)
+                self._snapshot[name] = parser(raw) if parser else raw
+            except Exception as e:
+                logger.warning("config_snapshot_section_invalid", section=name, error=str(e))
+        self._derived.clear()
+        self._snapshot_version = max(self._snapshot_version, version)
+        self._snapshot_loaded_at = time.time()
+
+        logger.info(
+            "config_snapshot_loaded",
+            version=self._snapshot_version,
+            sections=sorted(data) if sections is not None else len(data)
+        )
+        return True
+
+    async def _fetch_sections_individually(self, names: List[str]) -> Dict[str, Any]:
+        """Assemble a snapshot from the per-section public endpoints."""
+        async def fetch(name: str):
+            response = await self.client.get(f"{self.admin_url}{SNAPSHOT_SECTIONS[name]}")
+            return response.json() if response.status_code == 200 else None
+
+        results = await asyncio.gather(*(fetch(n) for n in names), return_exceptions=True)
+        return {
+            name: result for name, result in zip(names, results)
+            if result is not None and not isinstance(result, Exception)
+        }
+
+    def _start_snapshot_sync(self):
+        """Start the change listener and resync loop if they are not running."""
+        if self._snapshot_tasks and not any(t.done() for t in self._snapshot_tasks):
+            return
+        for task in self._snapshot_tasks:
+            task.cancel()
+        self._snapshot_tasks = [
+            asyncio.create_task(self._listen_for_config_changes()),
+            asyncio.create_task(self._resync_snapshot_loop()),
+        ]
+
+    def _schedule_snapshot_refresh(self, sections: Optional[Iterable[str]] = None):
+        """Refetch sections in the background (no-op outside an event loop)."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = asyncio.create_task(self.refresh_snapshot(sections))
+        self._snapshot_refreshes.add(task)
+        task.add_done_callback(self._snapshot_refreshes.discard)
+
+    async def _resync_snapshot_loop(self):
+        """Full resync: retries every SNAPSHOT_RETRY_SECONDS until loaded, slow once pushes flow."""
+        while True:
+            if not self._snapshot:
+                interval = SNAPSHOT_RETRY_SECONDS
+            elif self._snapshot_live:
+                interval = SNAPSHOT_RESYNC_SECONDS
+            else:
+                interval = self._cache_ttl
+            # Measured from the last attempt, so a failing admin backend is not hammered
+            await asyncio.sleep(max(0.0, self._snapshot_attempted_at + interval - time.time()))
+            if time.time() - self._snapshot_attempted_at >= interval:
+                await self.refresh_snapshot()
+
+    async def _listen_for_config_changes(self):
+        """Apply config version bumps from the admin backend. Reconnects on failure."""
+        import redis.asyncio as redis
+
+        backoff = 1.0
+        while True:
+            client = None
+            try:
+                if not self.redis_url:
+                    from shared.cache import get_redis_url
+                    self.redis_url = await asyncio.to_thread(get_redis_url)
+                client = redis.from_url(self.redis_url, decode_responses=True)
+                pubsub = client.pubsub()
+                await pubsub.subscribe(CONFIG_CHANNEL)
+                self._snapshot_live = True
+                backoff = 1.0
+                # Catch up on bumps published while we were not subscribed
+                version = int(await client.get(CONFIG_VERSION_KEY) or 0)
+                if self._snapshot_loaded_at and version > self._snapshot_version:
+                    await self.refresh_snapshot()
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        await self._apply_config_change(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("config_change_listener_error", error=str(e))
+            finally:
+                self._snapshot_live = False
+                if client is not None:
+                    try:
+                        await client.aclose()
+                    except Exception:
+                        pass
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    async def _apply_config_change(self, data: Optional[str]):
+        try:
+            change = json.loads(data)
+            version = int(change.get("version", 0))
+        except (TypeError, ValueError, AttributeError):
+            return
+        if version <= self._snapshot_version:
+            return
+        changed = change.get("sections") or []
+        if "features" in changed:
+            # Feature flags live in the flag store, which refetches on its own
+            await get_flag_store().refresh()
+        sections = [s for s in changed if s in SNAPSHOT_SECTIONS]
+        refreshed = True
+        if version != self._snapshot_version + 1:
+            # Missed a bump: the delta is unknown
+            refreshed = await self.refresh_snapshot()
+        elif sections:
+            refreshed = await self.refresh_snapshot(sections)
+        # A failed refetch leaves the version behind, so the next bump (or
+        # the periodic resync) fetches the whole snapshot again
+        if refreshed:
+            self._snapshot_version = max(self._snapshot_version, version)
+
     async def get_secret(self, service_name: str) -> Optional[str]:
         """
         Fetch a secret value from the admin API.
@@ -226,221 +483,62 @@ class AdminConfigClient:
 
     async def get_intent_routing(self) -> Dict[str, Dict]:
         """
-        Fetch intent routing configuration with caching.
+        Get intent routing configuration from the config snapshot.
 
         Returns:
             Dict mapping intent_category -> {use_rag, rag_service_url, use_web_search, use_llm}
             Returns empty dict if API unavailable (allows hardcoded fallback)
         """
-        # Check cache
-        if self._routing_cache and (time.time() - self._routing_cache_time < self._cache_ttl):
-            return self._routing_cache
-
-        # Fetch from API (use public endpoint - no auth required)
-        try:
-            url = f"{self.admin_url}/api/intent-routing/routing/public"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                data = response.json()
-
-                # Transform API response to Dict[category, config_dict]
-                routing: Dict[str, Dict] = {}
-                for item in data:
-                    category = item["intent_category"]
-                    routing[category] = {
-                        "use_rag": item.get("use_rag", False),
-                        "rag_service_url": item.get("rag_service_url"),
-                        "use_web_search": item.get("use_web_search", False),
-                        "use_llm": item.get("use_llm", True),
-                        "priority": item.get("priority", 100)
-                    }
-
-                # Cache successful result
-                self._routing_cache = routing
-                self._routing_cache_time = time.time()
-
-                logger.info(
-                    "intent_routing_loaded_from_db",
-                    categories=len(routing)
-                )
-                return routing
-            else:
-                logger.warning(
-                    "intent_routing_fetch_failed",
-                    status_code=response.status_code
-                )
-
-        except Exception as e:
-            logger.warning(
-                "intent_routing_db_error",
-                error=str(e),
-                admin_url=self.admin_url
-            )
-
-        # Return empty dict to trigger hardcoded fallback
-        return {}
+        routing = await self._snapshot_section("intent_routing")
+        return routing if routing is not None else {}
 
     async def get_provider_routing(self) -> Dict[str, List[str]]:
         """
-        Fetch provider routing with caching (ordered by priority).
+        Get provider routing from the config snapshot (ordered by priority).
 
         Returns:
             Dict mapping intent_category -> ordered list of provider names
             Returns empty dict if API unavailable (allows hardcoded fallback)
         """
-        # Check cache
-        if self._providers_cache and (time.time() - self._providers_cache_time < self._cache_ttl):
-            return self._providers_cache
-
-        # Fetch from API (use public endpoint - no auth required)
-        try:
-            url = f"{self.admin_url}/api/intent-routing/providers/public"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                data = response.json()
-
-                # Group by category and sort by priority
-                providers: Dict[str, List[str]] = {}
-                for item in data:
-                    category = item["intent_category"]
-                    provider = item["provider_name"]
-                    priority = item.get("priority", 100)
-
-                    if category not in providers:
-                        providers[category] = []
-                    providers[category].append((provider, priority))
-
-                # Sort by priority and extract provider names
-                for category in providers:
-                    providers[category] = [
-                        p[0] for p in sorted(providers[category], key=lambda x: x[1])
-                    ]
-
-                # Cache successful result
-                self._providers_cache = providers
-                self._providers_cache_time = time.time()
-
-                logger.info(
-                    "provider_routing_loaded_from_db",
-                    categories=len(providers)
-                )
-                return providers
-            else:
-                logger.warning(
-                    "provider_routing_fetch_failed",
-                    status_code=response.status_code
-                )
-
-        except Exception as e:
-            logger.warning(
-                "provider_routing_db_error",
-                error=str(e),
-                admin_url=self.admin_url
-            )
-
-        # Return empty dict to trigger hardcoded fallback
-        return {}
+        providers = await self._snapshot_section("provider_routing")
+        return providers if providers is not None else {}
 
     async def get_llm_backends(self) -> List[Dict[str, Any]]:
         """
-        Fetch enabled LLM backends from Admin API with caching.
+        Get enabled LLM backends from the config snapshot.
 
         Returns:
             List of LLM backend configurations sorted by priority
             Returns empty list if API unavailable (allows env var fallback)
         """
-        # Check cache
-        if self._llm_backends_cache and (time.time() - self._llm_backends_cache_time < self._cache_ttl):
-            return self._llm_backends_cache
-
-        # Fetch from API
-        try:
-            url = f"{self.admin_url}/api/llm-backends/public"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                backends = response.json()
-
-                # Filter to only enabled backends and sort by priority
-                enabled_backends = [b for b in backends if b.get("enabled", False)]
-                enabled_backends.sort(key=lambda x: x.get("priority", 999))
-
-                # Cache successful result
-                self._llm_backends_cache = enabled_backends
-                self._llm_backends_cache_time = time.time()
-
-                logger.info(
-                    "llm_backends_loaded_from_db",
-                    count=len(enabled_backends),
-                    backends=[b.get("model_name") for b in enabled_backends]
-                )
-                return enabled_backends
-            else:
-                logger.warning(
-                    "llm_backends_fetch_failed",
-                    status_code=response.status_code
-                )
-
-        except Exception as e:
-            logger.warning(
-                "llm_backends_db_error",
-                error=str(e),
-                admin_url=self.admin_url
-            )
-
-        # Return empty list to trigger env var fallback
-        return []
+        backends = await self._snapshot_section("llm_backends")
+        return backends if backends is not None else []
 
     async def get_feature_flags(self) -> Dict[str, bool]:
         """
-        Fetch feature flags from Admin API with caching.
+        Get feature flags from the in-process flag store.
 
         Returns:
             Dict mapping feature_name -> enabled status
             Returns empty dict if API unavailable (allows hardcoded defaults)
         """
-        # Check cache
-        if self._features_cache and (time.time() - self._features_cache_time < self._cache_ttl):
-            return self._features_cache
+        store = get_flag_store()
+        await store.ensure_loaded()
+        return {name: flag["enabled"] for name, flag in store.flags().items()}
 
-        # Fetch from API
-        try:
-            url = f"{self.admin_url}/api/features/public?enabled_only=false"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                features = response.json()
-
-                # Transform to dict of name -> enabled
-                flags = {f["name"]: f.get("enabled", False) for f in features}
-
-                # Cache successful result
-                self._features_cache = flags
-                self._features_cache_time = time.time()
-
-                logger.info(
-                    "feature_flags_loaded_from_db",
-                    count=len(flags),
-                    enabled_count=sum(1 for v in flags.values() if v)
-                )
-                return flags
-            else:
-                logger.warning(
-                    "feature_flags_fetch_failed",
-                    status_code=response.status_code
-                )
+    async def get_feature(self, feature_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a feature flag with its configuration from the in-process flag store.
 
-        except Exception as e:
-            logger.warning(
-                "feature_flags_db_error",
-                error=str(e),
-                admin_url=self.admin_url
-            )
+        Args:
+            feature_name: Name of the feature
 
-        # Return empty dict to trigger hardcoded defaults
-        return {}
+        Returns:
+            {"enabled": bool, "config": dict}, or None if not found
+        """
+        store = get_flag_store()
+        await store.ensure_loaded()
+        return store.get(feature_name)
 
     async def is_feature_enabled(self, feature_name: str) -> Optional[bool]:
         """
@@ -452,8 +550,8 @@ class AdminConfigClient:
         Returns:
             True if enabled, False if disabled, None if not found in DB (use default)
         """
-        flags = await self.get_feature_flags()
-        return flags.get(feature_name)
+        feature = await self.get_feature(feature_name)
+        return feature["enabled"] if feature is not None else None
 
     async def get_external_api_key(self, service_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -618,47 +716,15 @@ class AdminConfigClient:
 
     async def get_tool_calling_settings(self) -> Dict[str, Any]:
         """
-        Fetch tool calling settings from Admin API with caching.
+        Get tool calling settings from the config snapshot.
 
         Returns:
             Dict with tool calling configuration (enabled, llm_model, max_parallel_tools, etc.)
             Returns default settings if API unavailable
         """
-        # Check cache
-        if self._tool_calling_settings_cache and (time.time() - self._tool_calling_settings_cache_time < self._cache_ttl):
-            return self._tool_calling_settings_cache
-
-        # Fetch from API
-        try:
-            url = f"{self.admin_url}/api/tool-calling/settings/public"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                settings = response.json()
-
-                # Cache successful result
-                self._tool_calling_settings_cache = settings
-                self._tool_calling_settings_cache_time = time.time()
-
-                logger.info(
-                    "tool_calling_settings_loaded_from_db",
-                    enabled=settings.get("enabled"),
-                    llm_model=settings.get("llm_model"),
-                    llm_backend=settings.get("llm_backend")
-                )
-                return settings
-            else:
-                logger.warning(
-                    "tool_calling_settings_fetch_failed",
-                    status_code=response.status_code
-                )
-
-        except Exception as e:
-            logger.warning(
-                "tool_calling_settings_db_error",
-                error=str(e),
-                admin_url=self.admin_url
-            )
+        settings = await self._snapshot_section("tool_calling_settings")
+        if settings is not None:
+            return settings
 
         # Return default settings if API unavailable
         return {
@@ -676,7 +742,7 @@ class AdminConfigClient:
 
     async def get_enabled_tools(self, guest_mode: bool = False) -> List[Dict[str, Any]]:
         """
-        Fetch enabled tools from Admin API with caching.
+        Get enabled tools from the config snapshot.
 
         Args:
             guest_mode: If True, only return guest-mode-allowed tools
@@ -685,98 +751,26 @@ class AdminConfigClient:
             List of tool configurations with function schemas
             Returns empty list if API unavailable
         """
-        # Check cache (only use if not in guest_mode or cache was for guest_mode)
-        if self._enabled_tools_cache and (time.time() - self._enabled_tools_cache_time < self._cache_ttl):
-            tools = self._enabled_tools_cache
-            if guest_mode:
-                return [t for t in tools if t.get("guest_mode_allowed", False)]
-            return tools
-
-        # Fetch from API
-        try:
-            url = f"{self.admin_url}/api/tool-calling/tools/public?enabled_only=true"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                tools = response.json()
-
-                # Cache successful result
-                self._enabled_tools_cache = tools
-                self._enabled_tools_cache_time = time.time()
-
-                logger.info(
-                    "enabled_tools_loaded_from_db",
-                    count=len(tools),
-                    guest_mode_count=sum(1 for t in tools if t.get("guest_mode_allowed", False))
-                )
-
-                if guest_mode:
-                    return [t for t in tools if t.get("guest_mode_allowed", False)]
-                return tools
-            else:
-                logger.warning(
-                    "enabled_tools_fetch_failed",
-                    status_code=response.status_code
-                )
-
-        except Exception as e:
-            logger.warning(
-                "enabled_tools_db_error",
-                error=str(e),
-                admin_url=self.admin_url
+        tools = await self._snapshot_section("enabled_tools")
+        if tools is None:
+            return []
+        if guest_mode:
+            return self._derive(
+                "guest_tools", "enabled_tools",
+                lambda tools: [t for t in tools if t.get("guest_mode_allowed", False)]
             )
-
-        # Return empty list if API unavailable
-        return []
+        return tools
 
     async def get_fallback_triggers(self) -> List[Dict[str, Any]]:
         """
-        Fetch enabled fallback triggers from Admin API with caching.
+        Get enabled fallback triggers from the config snapshot.
 
         Returns:
             List of trigger configurations sorted by priority
             Returns empty list if API unavailable
         """
-        # Check cache
-        if self._fallback_triggers_cache and (time.time() - self._fallback_triggers_cache_time < self._cache_ttl):
-            return self._fallback_triggers_cache
-
-        # Fetch from API
-        try:
-            url = f"{self.admin_url}/api/tool-calling/triggers/public?enabled_only=true"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                triggers = response.json()
-
-                # Sort by priority (higher priority = checked first)
-                triggers.sort(key=lambda x: x.get("priority", 0), reverse=True)
-
-                # Cache successful result
-                self._fallback_triggers_cache = triggers
-                self._fallback_triggers_cache_time = time.time()
-
-                logger.info(
-                    "fallback_triggers_loaded_from_db",
-                    count=len(triggers),
-                    types=[t.get("trigger_type") for t in triggers]
-                )
-                return triggers
-            else:
-                logger.warning(
-                    "fallback_triggers_fetch_failed",
-                    status_code=response.status_code
-                )
-
-        except Exception as e:
-            logger.warning(
-                "fallback_triggers_db_error",
-                error=str(e),
-                admin_url=self.admin_url
-            )
-
-        # Return empty list if API unavailable
-        return []
+        triggers = await self._snapshot_section("fallback_triggers")
+        return triggers if triggers is not None else []
 
     # ==========================================================================
     # Escalation Presets
@@ -938,7 +932,7 @@ class AdminConfigClient:
 
     async def get_component_model(self, component_name: str) -> Optional[Dict[str, Any]]:
         """
-        Fetch model assignment for a specific component with caching.
+        Get model assignment for a specific component from the config snapshot.
 
         Args:
             component_name: The component identifier (e.g., "intent_classifier")
@@ -951,67 +945,23 @@ class AdminConfigClient:
         if not self._local_feature_flag_enabled("use_database_model_config"):
             return None  # Callers fall back to hardcoded values
 
-        now = time.time()
-
-        # Check cache (60 second TTL)
-        if component_name in self._component_model_cache:
-            cache_time = self._component_model_cache_time.get(component_name, 0)
-            if now - cache_time < self._cache_ttl:
-                return self._component_model_cache[component_name]
-
-        # Fetch from API
-        try:
-            url = f"{self.admin_url}/api/component-models/component/{component_name}"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                config = response.json()
-
-                # Cache successful result
-                self._component_model_cache[component_name] = config
-                self._component_model_cache_time[component_name] = now
-
-                logger.debug(
-                    "component_model_loaded",
-                    component=component_name,
-                    model=config.get("model_name")
-                )
-                return config
-            else:
-                logger.warning(
-                    "component_model_fetch_failed",
-                    component=component_name,
-                    status_code=response.status_code
-                )
-                return None
-
-        except Exception as e:
-            logger.warning(
-                "component_model_fetch_error",
-                component=component_name,
-                error=str(e)
-            )
-            return None
+        models = await self._snapshot_section("component_models")
+        return models.get(component_name) if models else None
 
     def invalidate_component_model_cache(self, component_name: Optional[str] = None):
         """
-        Invalidate component model cache.
+        Refetch component model assignments in the background.
 
         Args:
-            component_name: Specific component to invalidate, or None for all
+            component_name: Kept for compatibility; all assignments are one
+                 snapshot section and are refetched together
         """
-        if component_name:
-            self._component_model_cache.pop(component_name, None)
-            self._component_model_cache_time.pop(component_name, None)
-            logger.info("component_model_cache_invalidated", component=component_name)
-        else:
-            self._component_model_cache.clear()
-            self._component_model_cache_time.clear()
-            logger.info("component_model_cache_cleared")
+        self._schedule_snapshot_refresh(["component_models"])
+        logger.info("component_model_cache_invalidated", component=component_name)
 
     async def get_all_component_models(self) -> List[Dict[str, Any]]:
         """
-        Fetch all component model assignments in a single API call.
+        Get all enabled component model assignments from the config snapshot.
 
         Returns:
             List of component model configurations.
@@ -1021,24 +971,8 @@ class AdminConfigClient:
         if not self._local_feature_flag_enabled("use_database_model_config"):
             return []
 
-        try:
-            url = f"{self.admin_url}/api/component-models/public"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                models = response.json()
-                logger.debug("all_component_models_loaded", count=len(models))
-                return models
-            else:
-                logger.warning(
-                    "all_component_models_fetch_failed",
-                    status_code=response.status_code
-                )
-                return []
-
-        except Exception as e:
-            logger.warning("all_component_models_fetch_error", error=str(e))
-            return []
+        models = await self._snapshot_section("component_models")
+        return list(models.values()) if models else []
 
     async def record_tool_metric(
         self,
@@ -1235,7 +1169,7 @@ class AdminConfigClient:
 
     async def get_gateway_config(self) -> Optional[Dict[str, Any]]:
         """
-        Fetch gateway configuration from Admin API with caching.
+        Get gateway configuration from the config snapshot.
 
         Returns:
             Dict with gateway configuration, or None if API unavailable.
@@ -1243,49 +1177,11 @@ class AdminConfigClient:
             intent settings, timeouts, session settings, cache TTL,
             rate limiting, and circuit breaker settings.
         """
-        now = time.time()
-
-        # Check cache (60 second TTL)
-        if self._gateway_config_cache and (now - self._gateway_config_cache_time < self._cache_ttl):
-            return self._gateway_config_cache
-
-        # Fetch from API
-        try:
-            url = f"{self.admin_url}/api/gateway-config/public"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                config = response.json()
-
-                # Cache successful result
-                self._gateway_config_cache = config
-                self._gateway_config_cache_time = now
-
-                logger.info(
-                    "gateway_config_loaded_from_db",
-                    orchestrator_url=config.get("orchestrator_url"),
-                    intent_model=config.get("intent_model")
-                )
-                return config
-            else:
-                logger.warning(
-                    "gateway_config_fetch_failed",
-                    status_code=response.status_code
-                )
-                return None
-
-        except Exception as e:
-            logger.warning(
-                "gateway_config_fetch_error",
-                error=str(e),
-                admin_url=self.admin_url
-            )
-            return None
+        return await self._snapshot_section("gateway_config")
 
     def invalidate_gateway_config_cache(self):
-        """Invalidate gateway config cache to force refresh on next call."""
-        self._gateway_config_cache = None
-        self._gateway_config_cache_time = 0.0
+        """Refetch gateway config in the background."""
+        self._schedule_snapshot_refresh(["gateway_config"])
         logger.info("gateway_config_cache_invalidated")
 
     # ==========================================================================
@@ -1363,7 +1259,7 @@ class AdminConfigClient:
 
     async def get_voice_config_stt(self) -> Optional[Dict[str, Any]]:
         """
-        Fetch STT configuration from Admin API with caching.
+        Fetch STT configuration from the config snapshot.
 
         Returns:
             Dict with STT model info and service connection details:
@@ -1380,45 +1276,11 @@ class AdminConfigClient:
                 "service_port": 10300
             }
         """
-        now = time.time()
-
-        # Check cache (60 second TTL)
-        if self._voice_config_stt_cache and (now - self._voice_config_stt_cache_time < self._cache_ttl):
-            return self._voice_config_stt_cache
-
-        try:
-            url = f"{self.admin_url}/api/voice-config/internal/stt"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                config = response.json()
-                self._voice_config_stt_cache = config
-                self._voice_config_stt_cache_time = now
-
-                logger.info(
-                    "voice_config_stt_loaded",
-                    model_id=config.get("model_id"),
-                    wyoming_url=config.get("wyoming_url")
-                )
-                return config
-            else:
-                logger.warning(
-                    "voice_config_stt_fetch_failed",
-                    status_code=response.status_code
-                )
-                return None
-
-        except Exception as e:
-            logger.warning(
-                "voice_config_stt_fetch_error",
-                error=str(e),
-                admin_url=self.admin_url
-            )
-            return None
+        return await self._snapshot_section("voice_stt")
 
     async def get_voice_config_tts(self) -> Optional[Dict[str, Any]]:
         """
-        Fetch TTS configuration from Admin API with caching.
+        Fetch TTS configuration from the config snapshot.
 
         Returns:
             Dict with TTS voice info and service connection details:
@@ -1435,45 +1297,11 @@ class AdminConfigClient:
                 "service_port": 10201
             }
         """
-        now = time.time()
-
-        # Check cache (60 second TTL)
-        if self._voice_config_tts_cache and (now - self._voice_config_tts_cache_time < self._cache_ttl):
-            return self._voice_config_tts_cache
-
-        try:
-            url = f"{self.admin_url}/api/voice-config/internal/tts"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                config = response.json()
-                self._voice_config_tts_cache = config
-                self._voice_config_tts_cache_time = now
-
-                logger.info(
-                    "voice_config_tts_loaded",
-                    voice_id=config.get("voice_id"),
-                    wyoming_url=config.get("wyoming_url")
-                )
-                return config
-            else:
-                logger.warning(
-                    "voice_config_tts_fetch_failed",
-                    status_code=response.status_code
-                )
-                return None
-
-        except Exception as e:
-            logger.warning(
-                "voice_config_tts_fetch_error",
-                error=str(e),
-                admin_url=self.admin_url
-            )
-            return None
+        return await self._snapshot_section("voice_tts")
 
     async def get_voice_config_all(self) -> Dict[str, Any]:
         """
-        Fetch complete voice configuration (STT + TTS) from Admin API with caching.
+        Fetch complete voice configuration (STT + TTS) from the config snapshot.
 
         Returns:
             Dict with both stt and tts configs:
@@ -1482,41 +1310,8 @@ class AdminConfigClient:
                 "tts": { ... TTS config ... }
             }
         """
-        now = time.time()
-
-        # Check cache (60 second TTL)
-        if self._voice_config_all_cache and (now - self._voice_config_all_cache_time < self._cache_ttl):
-            return self._voice_config_all_cache
-
-        try:
-            url = f"{self.admin_url}/api/voice-config/internal/all"
-            response = await self.client.get(url)
-
-            if response.status_code == 200:
-                config = response.json()
-                self._voice_config_all_cache = config
-                self._voice_config_all_cache_time = now
-
-                logger.info(
-                    "voice_config_all_loaded",
-                    stt_model=config.get("stt", {}).get("model_id"),
-                    tts_voice=config.get("tts", {}).get("voice_id")
-                )
-                return config
-            else:
-                logger.warning(
-                    "voice_config_all_fetch_failed",
-                    status_code=response.status_code
-                )
-                return {"stt": None, "tts": None}
-
-        except Exception as e:
-            logger.warning(
-                "voice_config_all_fetch_error",
-                error=str(e),
-                admin_url=self.admin_url
-            )
-            return {"stt": None, "tts": None}
+        config = await self._snapshot_section("voice_all")
+        return config if config is not None else {"stt": None, "tts": None}
 
     async def get_voice_interface_config(self, interface_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -1630,13 +1425,8 @@ class AdminConfigClient:
             }
 
     def invalidate_voice_config_cache(self):
-        """Invalidate all voice config caches to force refresh on next call."""
-        self._voice_config_stt_cache = None
-        self._voice_config_stt_cache_time = 0.0
-        self._voice_config_tts_cache = None
-        self._voice_config_tts_cache_time = 0.0
-        self._voice_config_all_cache = None
-        self._voice_config_all_cache_time = 0.0
+        """Refetch voice config in the background and drop interface overrides."""
+        self._schedule_snapshot_refresh(VOICE_SECTIONS)
         self._voice_interface_cache.clear()
         self._voice_interface_cache_time.clear()
         logger.info("voice_config_cache_invalidated")
@@ -2096,8 +1886,46 @@ class AdminConfigClient:
         self._ollama_url_cache_time = 0.0
         logger.info("ollama_url_cache_invalidated")
 
+    async def get_semantic_cache_categories(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the semantic cache category table override from Admin API.
+
+        Returns:
+            Ordered list of category definitions, or None if no override is
+            stored or the API is unavailable (use the built-in table)
+        """
+        try:
+            url = f"{self.admin_url}/api/settings/semantic-cache-categories/internal"
+            response = await self.client.get(url)
+
+            if response.status_code == 200:
+                categories = response.json().get("categories")
+                if categories:
+                    logger.info(
+                        "semantic_cache_categories_loaded_from_db",
+                        categories=len(categories)
+                    )
+                return categories
+            else:
+                logger.warning(
+                    "semantic_cache_categories_fetch_failed",
+                    status_code=response.status_code
+                )
+
+        except Exception as e:
+            logger.warning(
+                "semantic_cache_categories_fetch_error",
+                error=str(e),
+                admin_url=self.admin_url
+            )
+
+        return None
+
     async def close(self):
-        """Close the HTTP client."""
+        """Stop config snapshot sync and close the HTTP client."""
+        for task in [*self._snapshot_tasks, *self._snapshot_refreshes]:
+            task.cancel()
+        self._snapshot_tasks = []
         await self.client.aclose()
 
 
@@ -2148,8 +1976,6 @@ async def get_config(key: str, default: Any = None) -> Any:
 
 
 if __name__ == "__main__":
-    import asyncio
-
     async def test():
         """Test the admin configuration client."""
         client = AdminConfigClient()
@@ -6,17 +6,59 @@ No hardcoded defaults - configuration must come from admin or environment.
 
 import os
 import json
+import time
+import uuid
+import asyncio
+import enum
+import decimal
+import fnmatch
+import hashlib
+import inspect
+import datetime
+import dataclasses
+import zlib
 import httpx
 import redis.asyncio as redis
-from typing import Optional, Any
-from functools import wraps
+from redis.client import NEVER_DECODE
+from collections import OrderedDict
+from typing import Optional, Any, Dict, Iterable, Tuple, Callable, Awaitable, Union
+from functools import wraps, lru_cache
 import logging
 
+from shared.metrics import record_cache_operation, record_cache_lookup, record_cache_refresh
+
+# Optional fast serializers / compressor (stdlib json and zlib otherwise)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Admin backend URL for fetching configuration
 ADMIN_BACKEND_URL = os.getenv("ADMIN_BACKEND_URL", "http://localhost:8080")
 
+# Deletes a lock only if it still holds our token (never another holder's)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 # Cached Redis URL (fetched once from admin backend)
 _cached_redis_url: Optional[str] = None
 
@@ -92,19 +134,309 @@ def get_redis_url() -> str:
     )
 
 
+# =============================================================================
+# Value codec
+# =============================================================================
+#
+# Encoded values start with a 3-byte header: CODEC_MAGIC, a serializer id and
+# a compression id. JSON text can never start with NUL, so values written
+# before the codec existed (plain JSON, or raw strings) are still readable
+# and both formats coexist in Redis during a rollout. Writers default to the
+# legacy format so services not yet on this code can still read their values;
+# switch CACHE_CODEC to json or msgpack once every reader is upgraded.
+
+CODEC_MAGIC = b"\x00"
+
+
+def _json_dumps(value: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+# id -> (name, dumps, loads); loads may be used by any replica, so ids are
+# never reused once shipped
+SERIALIZERS = {
+    b"j": ("json", _json_dumps, _json_loads),
+    b"m": ("msgpack", _msgpack_dumps, _msgpack_loads),
+}
+
+# id -> (name, compress, decompress)
+COMPRESSORS = {
+    b"z": ("zstd", _zstd_compress, _zstd_decompress),
+    b"d": ("zlib", zlib.compress, zlib.decompress),
+}
+
+_UNCOMPRESSED = b"-"
+
+
+def _id_for(table: dict, name: str) -> bytes:
+    for codec_id, entry in table.items():
+        if entry[0] == name:
+            return codec_id
+    raise ValueError(f"Unknown cache codec: {name}")
+
+
+class CacheCodec:
+    """Serializes cache values to bytes with a self-describing header.
+
+    Args:
+        serializer: "legacy" (default) to keep writing headerless JSON text
+            that pre-codec readers understand, "json" (orjson when
+            installed), or "msgpack"; readers accept all of them
+        compress_min_bytes: Compress payloads at least this large; 0 disables
+        compression: "zstd" or "zlib"; defaults to zstd when installed
+    """
+
+    def __init__(
+        self,
+        serializer: str = "legacy",
+        compress_min_bytes: int = 4096,
+        compression: Optional[str] = None,
+    ):
+        if serializer == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack not installed, cache codec falling back to json")
+            serializer = "json"
+        self.legacy = serializer == "legacy"
+        self._serializer_id = None if self.legacy else _id_for(SERIALIZERS, serializer)
+        if compression is None:
+            compression = "zstd" if ZSTD_AVAILABLE else "zlib"
+        elif compression == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("zstandard not installed, cache codec falling back to zlib")
+            compression = "zlib"
+        self._compressor_id = _id_for(COMPRESSORS, compression)
+        self.compress_min_bytes = compress_min_bytes
+
+    @classmethod
+    def from_env(cls) -> "CacheCodec":
+        """Build from CACHE_CODEC / CACHE_COMPRESS_MIN_BYTES / CACHE_COMPRESSION."""
+        return cls(
+            serializer=os.getenv("CACHE_CODEC", "legacy"),
+            compress_min_bytes=int(os.getenv("CACHE_COMPRESS_MIN_BYTES", "4096")),
+            compression=os.getenv("CACHE_COMPRESSION") or None,
+        )
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a value. Raises TypeError for values the serializer can't handle."""
+        if self.legacy:
+            text = value if isinstance(value, str) else json.dumps(value)
+            return text.encode("utf-8")
+        _, dumps, _ = SERIALIZERS[self._serializer_id]
+        payload = dumps(value)
+        compressor_id = _UNCOMPRESSED
+        if self.compress_min_bytes and len(payload) >= self.compress_min_bytes:
+            compressor_id = self._compressor_id
+            payload = COMPRESSORS[compressor_id][1](payload)
+        return CODEC_MAGIC + self._serializer_id + compressor_id + payload
+
+    @staticmethod
+    def decode(raw: Union[bytes, str]) -> Any:
+        """Decode any value written by any codec configuration (or pre-codec).
+
+        Raises ValueError if the header names a serializer or compressor that
+        isn't available in this process.
+        """
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8", "surrogateescape")
+        if not raw.startswith(CODEC_MAGIC):
+            # Written before the codec: JSON text, or a raw string
+            try:
+                return json.loads(raw)
+            except ValueError:
+                return raw.decode("utf-8", "replace")
+        serializer_id, compressor_id, payload = raw[1:2], raw[2:3], raw[3:]
+        try:
+            if compressor_id != _UNCOMPRESSED:
+                payload = COMPRESSORS[compressor_id][2](payload)
+            return SERIALIZERS[serializer_id][2](payload)
+        except (KeyError, NameError) as e:
+            raise ValueError(f"Unsupported cache encoding {raw[:3]!r}") from e
+
+
+_default_codec: Optional[CacheCodec] = None
+
+
+def get_codec() -> CacheCodec:
+    """Process-wide codec configured from the environment."""
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = CacheCodec.from_env()
+    return _default_codec
+
+
+def encode_value(value: Any) -> bytes:
+    """Encode a value for Redis with the process-wide codec."""
+    return get_codec().encode(value)
+
+
+def decode_value(raw: Union[bytes, str]) -> Any:
+    """Decode a value read from Redis (any codec, or pre-codec JSON)."""
+    return CacheCodec.decode(raw)
+
+
+async def get_encoded(client, key: str) -> Optional[bytes]:
+    """GET a codec-encoded value as bytes, even on a decode_responses client."""
+    return await client.execute_command("GET", key, **{NEVER_DECODE: True})
+
+
+# Pub/sub channel used to keep L1 caches coherent across replicas
+L1_INVALIDATION_CHANNEL = "athena:cache:l1_invalidate"
+
+
+class LocalLRUCache:
+    """Bounded in-process LRU with per-entry expiry (the L1 tier).
+
+    Stores serialized values so callers always receive a fresh object, exactly
+    as they would from Redis.
+
+    Every write or eviction bumps the key's version. A value read from Redis
+    is stored with ``fill``, which is skipped if the version moved while the
+    read was in flight, so a reply racing an invalidation can't refill L1.
+    """
+
+    def __init__(self, max_entries: int, max_ttl: float):
+        self.max_entries = max_entries
+        self.max_ttl = max_ttl
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        # Per-key invalidation counters; the epoch covers pattern evictions
+        # and is bumped (dropping the counters) when they grow too many
+        self._versions: Dict[str, int] = {}
+        self._epoch = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the raw value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, raw = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return raw
+
+    def version(self, key: str) -> Tuple[int, int]:
+        """Invalidation version of ``key``; pass it to ``fill``."""
+        return self._epoch, self._versions.get(key, 0)
+
+    def _bump(self, key: str):
+        if len(self._versions) >= 4 * self.max_entries:
+            self._bump_all()
+        else:
+            self._versions[key] = self._versions.get(key, 0) + 1
+
+    def _bump_all(self):
+        self._epoch += 1
+        self._versions.clear()
+
+    def fill(self, key: str, raw: bytes, ttl: Optional[float], version: Tuple[int, int]) -> bool:
+        """Store a value read from Redis unless ``key`` was invalidated since ``version``."""
+        if self.version(key) != version:
+            return False
+        self._store(key, raw, ttl)
+        return True
+
+    def set(self, key: str, raw: bytes, ttl: Optional[float] = None):
+        """Store a value for ``min(ttl, max_ttl)`` seconds."""
+        self._bump(key)
+        self._store(key, raw, ttl)
+
+    def _store(self, key: str, raw: bytes, ttl: Optional[float]):
+        ttl = self.max_ttl if ttl is None else min(ttl, self.max_ttl)
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (time.monotonic() + ttl, raw)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, *keys: str):
+        for key in keys:
+            self._bump(key)
+            self._entries.pop(key, None)
+
+    def delete_matching(self, pattern: str):
+        """Evict every key matching a Redis-style glob pattern."""
+        # Matching keys being read right now are not in _entries yet
+        self._bump_all()
+        for key in [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]:
+            del self._entries[key]
+
+    def clear(self):
+        self._bump_all()
+        self._entries.clear()
+
+
 class CacheClient:
     """Redis cache client with async support.
 
     Fetches Redis URL from admin backend with fallback to REDIS_URL env var.
+
+    Optionally fronts Redis with an in-process LRU (L1) for hot keys. L1
+    entries never outlive the Redis TTL and are capped at ``l1_ttl`` seconds.
+    Writes and deletes are broadcast on a Redis pub/sub channel so every
+    replica evicts its L1 copy; L1 is bypassed whenever that subscription is
+    down.
     """
 
-    def __init__(self, url: Optional[str] = None):
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        l1_max_entries: Optional[int] = None,
+        l1_ttl: Optional[float] = None,
+        service_name: Optional[str] = None,
+        codec: Optional[CacheCodec] = None,
+    ):
         """Initialize Redis client.
 
         Args:
             url: Optional Redis URL. If not provided, fetches from admin backend
                  or REDIS_URL environment variable.
+            l1_max_entries: Size of the in-process L1 cache (defaults to
+                 CACHE_L1_MAX_ENTRIES env var; 0 disables L1)
+            l1_ttl: Maximum L1 entry lifetime in seconds (defaults to
+                 CACHE_L1_TTL_SECONDS env var, 30s)
+            service_name: Service label for cache metrics (defaults to
+                 SERVICE_NAME env var)
+            codec: Value codec (defaults to the CACHE_CODEC env configuration)
         """
+        if l1_max_entries is None:
+            l1_max_entries = int(os.getenv("CACHE_L1_MAX_ENTRIES", "0"))
+        if l1_ttl is None:
+            l1_ttl = float(os.getenv("CACHE_L1_TTL_SECONDS", "30"))
+        self.service_name = service_name or os.getenv("SERVICE_NAME", "athena")
+        self.codec = codec or get_codec()
+        self.l1: Optional[LocalLRUCache] = LocalLRUCache(l1_max_entries, l1_ttl) if l1_max_entries > 0 else None
+        self._instance_id = uuid.uuid4().hex
+        self._l1_listener: Optional[asyncio.Task] = None
+        self._l1_coherent = False
+
         if url:
             self.url = url
         else:
@@ -119,45 +451,221 @@ class CacheClient:
 
         self.client = redis.from_url(self.url, decode_responses=True)
 
+    # -------------------------------------------------------------------------
+    # L1 coherence
+    # -------------------------------------------------------------------------
+
+    def _l1_active(self) -> bool:
+        """Whether L1 may be used; starts the invalidation listener on demand."""
+        if self.l1 is None:
+            return False
+        if self._l1_listener is None or self._l1_listener.done():
+            self._l1_coherent = False
+            self._l1_listener = asyncio.create_task(self._listen_for_invalidations())
+        return self._l1_coherent
+
+    async def _listen_for_invalidations(self):
+        """Evict L1 entries changed by other replicas. Reconnects on failure."""
+        backoff = 1.0
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(L1_INVALIDATION_CHANNEL)
+                # Anything could have changed while we were not subscribed
+                self.l1.clear()
+                self._l1_coherent = True
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    self._apply_invalidation(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"L1 invalidation listener error, L1 bypassed: {e}")
+            finally:
+                self._l1_coherent = False
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def _apply_invalidation(self, data: Optional[str]):
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self._instance_id:
+            return
+        if payload.get("keys"):
+            self.l1.delete(*payload["keys"])
+        if payload.get("pattern"):
+            self.l1.delete_matching(payload["pattern"])
+
+    def _invalidation_message(self, keys: Iterable[str] = (), pattern: Optional[str] = None) -> str:
+        return json.dumps({"origin": self._instance_id, "keys": list(keys), "pattern": pattern})
+
+    async def _broadcast_invalidation(self, keys: Iterable[str] = (), pattern: Optional[str] = None):
+        if self.l1 is None:
+            return
+        try:
+            await self.client.publish(L1_INVALIDATION_CHANNEL, self._invalidation_message(keys, pattern))
+        except Exception:
+            pass
+
+    def _record(self, tier: str, hit: bool):
+        record_cache_operation(self.service_name, "get", hit, tier=tier)
+
+    def _decode(self, value: bytes) -> Any:
+        return self.codec.decode(value)
+
+    # -------------------------------------------------------------------------
+    # Cache operations
+    # -------------------------------------------------------------------------
+
     async def get(self, key: str) -> Optional[Any]:
-        """Get value from cache. Returns None on connection errors."""
+        """Get value from cache. Returns None on connection errors or undecodable values."""
         if not self.client:
             return None
+        use_l1 = self._l1_active()
+        if use_l1:
+            raw = self.l1.get(key)
+            self._record("l1", raw is not None)
+            if raw is not None:
+                return self._decode(raw)
         try:
-            value = await self.client.get(key)
+            if use_l1:
+                version = self.l1.version(key)
+                # Fetch remaining TTL in the same round-trip so L1 never outlives Redis
+                pipe = self.client.pipeline(transaction=False)
+                pipe.execute_command("GET", key, **{NEVER_DECODE: True})
+                pipe.pttl(key)
+                value, pttl = await pipe.execute()
+                if value and pttl != -2:
+                    self.l1.fill(key, value, None if pttl == -1 else pttl / 1000.0, version)
+            else:
+                value = await get_encoded(self.client, key)
+            self._record("redis", bool(value))
             if value:
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return value
+                return self._decode(value)
             return None
         except Exception:
             # Redis unavailable - return None gracefully
             return None
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None):
-        """Set value in cache with optional TTL (seconds). Silently fails on connection errors."""
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[Iterable[str]] = None):
+        """Set value in cache with optional TTL (seconds). Silently fails on connection errors.
+
+        Args:
+            tags: Optional tag set keys to record ``key`` in, for bulk
+                  invalidation via ``invalidate_tags``. Each tag set's expiry is
+                  refreshed to ``ttl`` so it outlives members written with the
+                  same TTL.
+        """
         if not self.client:
             return
         try:
-            serialized = json.dumps(value) if not isinstance(value, str) else value
+            serialized = self.codec.encode(value)
+            if not tags and self.l1 is None:
+                if ttl:
+                    await self.client.setex(key, ttl, serialized)
+                else:
+                    await self.client.set(key, serialized)
+                return
+
+            # Value, tag membership and L1 invalidation in one round-trip
+            pipe = self.client.pipeline(transaction=False)
             if ttl:
-                await self.client.setex(key, ttl, serialized)
+                pipe.setex(key, ttl, serialized)
             else:
-                await self.client.set(key, serialized)
+                pipe.set(key, serialized)
+            for tag in tags or ():
+                pipe.sadd(tag, key)
+                if ttl:
+                    pipe.expire(tag, ttl)
+            if self.l1 is not None:
+                pipe.publish(L1_INVALIDATION_CHANNEL, self._invalidation_message([key]))
+            await pipe.execute()
+            if self.l1 is not None:
+                self.l1.set(key, serialized, ttl)
         except Exception:
             # Redis unavailable - silently continue
-            pass
+            if self.l1 is not None:
+                self.l1.delete(key)
 
     async def delete(self, key: str):
         """Delete key from cache. Silently fails on connection errors."""
+        if self.l1 is not None:
+            self.l1.delete(key)
         if not self.client:
             return
         try:
             await self.client.delete(key)
+            await self._broadcast_invalidation([key])
         except Exception:
             pass
 
+    async def invalidate_tags(self, *tags: str, batch_size: int = 500) -> int:
+        """Delete every key recorded under the given tag sets.
+
+        Members are read with SSCAN and removed with UNLINK in batches of
+        ``batch_size``, yielding to the event loop between batches so large
+        tags never block other requests. Returns the number of keys removed
+        (0 on connection errors).
+        """
+        if not self.client:
+            return 0
+        removed = 0
+        try:
+            for tag in tags:
+                cursor = 0
+                while True:
+                    cursor, members = await self.client.sscan(tag, cursor=cursor, count=batch_size)
+                    if members:
+                        pipe = self.client.pipeline(transaction=False)
+                        pipe.unlink(*members)
+                        pipe.srem(tag, *members)
+                        if self.l1 is not None:
+                            self.l1.delete(*members)
+                            pipe.publish(L1_INVALIDATION_CHANNEL, self._invalidation_message(members))
+                        results = await pipe.execute()
+                        removed += results[0]
+                    await asyncio.sleep(0)
+                    if cursor == 0:
+                        break
+        except Exception as e:
+            logger.warning(f"Tag invalidation failed after removing {removed} keys: {e}")
+        return removed
+
+    async def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Delete every key matching a glob pattern.
+
+        Uses incremental SCAN (never KEYS) and batched UNLINK, yielding to the
+        event loop between batches. Returns the number of keys removed (0 on
+        connection errors).
+        """
+        if self.l1 is not None:
+            self.l1.delete_matching(pattern)
+        if not self.client:
+            return 0
+        removed = 0
+        batch = []
+        try:
+            async for key in self.client.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    removed += await self.client.unlink(*batch)
+                    batch = []
+                    await asyncio.sleep(0)
+            if batch:
+                removed += await self.client.unlink(*batch)
+            await self._broadcast_invalidation(pattern=pattern)
+        except Exception as e:
+            logger.warning(f"Pattern delete failed after removing {removed} keys: {e}")
+        return removed
+
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache. Returns False on connection errors."""
         if not self.client:
@@ -167,6 +675,32 @@ class CacheClient:
         except Exception:
             return False
 
+    async def acquire_lock(self, name: str, ttl: float) -> Optional[str]:
+        """Try to take a short-lived cross-replica lock (SET NX PX).
+
+        Returns a token to pass to ``release_lock``, or None if another
+        holder has the lock. When Redis is unavailable there is nothing to
+        coordinate with, so a token is returned and the caller proceeds.
+        """
+        token = uuid.uuid4().hex
+        if not self.client:
+            return token
+        try:
+            acquired = await self.client.set(name, token, nx=True, px=max(1, int(ttl * 1000)))
+            return token if acquired else None
+        except Exception:
+            return token
+
+    async def release_lock(self, name: str, token: str):
+        """Release a lock taken with ``acquire_lock`` if we still hold it."""
+        if not self.client:
+            return
+        try:
+            await self.client.eval(_RELEASE_LOCK_SCRIPT, 1, name, token)
+        except Exception:
+            # Lock expires on its own
+            pass
+
     async def ping(self) -> bool:
         """Check if Redis is available. Returns False on connection errors."""
         if not self.client:
@@ -188,6 +722,9 @@ class CacheClient:
 
     async def close(self):
         """Close Redis connection"""
+        if self._l1_listener:
+            self._l1_listener.cancel()
+            self._l1_listener = None
         if self.client:
             await self.client.aclose()
 
@@ -214,41 +751,362 @@ def reset_cache_client():
     _cached_redis_url = None
 
 
-def cached(ttl: int = 3600, key_prefix: str = "athena"):
+# In-flight cache misses, keyed by cache key (single-flight)
+_inflight: dict = {}
+
+
+def _canonical_default(value: Any) -> Any:
+    """JSON fallback for argument types json can't encode natively.
+
+    Every branch must produce the same output in every process, so anything
+    whose only representation is ``repr()`` (which may embed an id() address)
+    is rejected rather than guessed at.
+    """
+    if isinstance(value, (set, frozenset)):
+        items = [_canonical_json(item) for item in value]
+        return {"__set__": sorted(items)}
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return {"__dt__": value.isoformat()}
+    if isinstance(value, enum.Enum):
+        return {"__enum__": f"{type(value).__qualname__}.{value.name}"}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": bytes(value).hex()}
+    if isinstance(value, decimal.Decimal):
+        return {"__decimal__": str(value)}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"Cannot build a stable cache key from {type(value).__name__}")
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_canonical_default,
+    )
+
+
+@lru_cache(maxsize=None)
+def _signature(func) -> inspect.Signature:
+    return inspect.signature(func)
+
+
+def make_cache_key(func, args: tuple, kwargs: dict,
+                   key_prefix: str = "athena", version: int = 1) -> str:
+    """Build a process-independent cache key for a call to ``func``.
+
+    Arguments are bound to the function signature (with defaults applied) so
+    ``f("x")``, ``f(query="x")`` and ``f("x", count=5)`` share one key, then
+    serialized to canonical JSON and hashed with BLAKE2b. Unlike ``hash()``
+    the digest does not depend on PYTHONHASHSEED, so every replica and every
+    restart agrees on the key.
+
+    Args:
+        func: The undecorated function being called
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        key_prefix: Key namespace
+        version: Bump to orphan entries written by an older result format
+
+    Returns:
+        Key of the form ``{key_prefix}:v{version}:{func name}:{digest}``
+
+    Raises:
+        TypeError: If the arguments don't match the signature or contain a
+            value with no stable serialization
+    """
+    bound = _signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    payload = _canonical_json(bound.arguments)
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{key_prefix}:v{version}:{func.__name__}:{digest}"
+
+
+async def single_flight(key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``call`` once for concurrent callers in this process sharing ``key``.
+
+    The first caller runs ``call``; callers arriving while it is in flight
+    await the same result (or exception) instead of repeating the work.
+    Same idea as ``request_dedup.deduplicated_call``, without the result
+    cache - callers cache results themselves.
+    """
+    future = _inflight.get(key)
+    if future is not None:
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # The leader was cancelled, not us - do the work ourselves
+            return await call()
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await call()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        # Mark retrieved so a miss with no followers doesn't log a warning
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+async def distributed_single_flight(
+    cache: CacheClient,
+    key: str,
+    call: Callable[[], Awaitable[Any]],
+    lock_ttl: float = 10.0,
+    poll_interval: float = 0.05,
+) -> Any:
+    """Run ``call`` once across replicas for a miss on cache key ``key``.
+
+    The replica that wins ``lock:{key}`` runs ``call`` (which is expected to
+    write ``key``); the others poll ``key`` until it appears. If the lock is
+    released or expires without a value (the holder failed or is slow),
+    waiters fall back to running ``call`` themselves, so a lost lock costs
+    at most ``lock_ttl`` of extra latency, never a failed request.
+
+    Args:
+        cache: Cache client holding the value and the lock
+        key: Cache key being filled
+        call: Loads the value and writes it to ``key``
+        lock_ttl: Lock expiry in seconds; should exceed the upstream timeout
+        poll_interval: Seconds between polls while waiting
+    """
+    lock_key = f"lock:{key}"
+    token = await cache.acquire_lock(lock_key, lock_ttl)
+    if token is None:
+        deadline = time.monotonic() + lock_ttl
+        while time.monotonic() < deadline:
+            await asyncio.sleep(poll_interval)
+            value = await cache.get(key)
+            if value is not None:
+                return value
+            if not await cache.exists(lock_key):
+                break
+        logger.debug(f"Lock holder for {key} did not fill it, loading locally")
+        return await call()
+
+    try:
+        return await call()
+    finally:
+        await cache.release_lock(lock_key, token)
+
+
+# Marks values written by @cached(soft_ttl=...) with their freshness deadline
+_SWR_MARKER = "__swr_fresh_until__"
+
+# Keys with a background refresh scheduled in this process
+_refreshing: set = set()
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected
+_background_tasks: set = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _swr_wrap(value: Any, soft_ttl: int) -> dict:
+    return {_SWR_MARKER: time.time() + soft_ttl, "value": value}
+
+
+def _swr_unwrap(stored: Any) -> Tuple[Any, float]:
+    """Split a stored entry into (value, fresh_until).
+
+    Entries written without soft_ttl (e.g. before it was enabled) report a
+    freshness deadline of 0 so they are served once and then refreshed.
+    """
+    if isinstance(stored, dict) and _SWR_MARKER in stored:
+        return stored.get("value"), stored[_SWR_MARKER]
+    return stored, 0.0
+
+
+class _Popularity:
+    """Bounded per-window call counts for one cached function.
+
+    Remembers the arguments of each key so the hottest ones can be reloaded
+    by the pre-warm loop. New keys are ignored once ``max_keys`` are tracked
+    in the current window.
+    """
+
+    def __init__(self, max_keys: int = 1000):
+        self.max_keys = max_keys
+        self._calls: dict = {}
+
+    def record(self, key: str, args: tuple, kwargs: dict):
+        entry = self._calls.get(key)
+        if entry is not None:
+            entry[0] += 1
+        elif len(self._calls) < self.max_keys:
+            self._calls[key] = [1, args, kwargs]
+
+    def drain_top(self, n: int) -> list:
+        """Return the ``n`` most-called (key, args, kwargs) and start a new window."""
+        calls, self._calls = self._calls, {}
+        top = sorted(calls.items(), key=lambda item: item[1][0], reverse=True)[:n]
+        return [(key, args, kwargs) for key, (_, args, kwargs) in top]
+
+
+def cached(
+    ttl: int = 3600,
+    key_prefix: str = "athena",
+    version: int = 1,
+    distributed: bool = False,
+    lock_ttl: float = 10.0,
+    soft_ttl: Optional[int] = None,
+    prewarm_top: int = 0,
+):
     """Decorator to cache async function results
 
+    Keys are stable across processes (see make_cache_key), and concurrent
+    misses on the same key are collapsed into a single call.
+
+    With ``soft_ttl`` the entry is fresh for ``soft_ttl`` seconds and kept
+    until ``ttl`` (the hard TTL). Between the two, callers get the stale
+    value immediately while one background task (per key, across replicas)
+    refreshes it; only a miss past the hard TTL waits on upstream.
+
     Args:
-        ttl: Time to live in seconds
+        ttl: Time to live in seconds (hard TTL when soft_ttl is set)
         key_prefix: Prefix for cache keys
+        version: Key namespace version; bump when the result format changes
+        distributed: Also coalesce misses across replicas with a Redis lock
+        lock_ttl: Cross-replica lock expiry in seconds (distributed misses
+            and background refreshes)
+        soft_ttl: Seconds a value is served as fresh; enables
+            stale-while-revalidate
+        prewarm_top: With soft_ttl, refresh this many of the most-called
+            keys on a schedule (every soft_ttl / 2) before they go stale
     """
+    if soft_ttl is not None and not 0 < soft_ttl <= ttl:
+        raise ValueError("soft_ttl must be between 0 and ttl")
+
     def decorator(func):
+        cache_name = f"{key_prefix}:{func.__name__}"
+        popularity = _Popularity() if soft_ttl and prewarm_top > 0 else None
+        prewarm_task: Optional[asyncio.Task] = None
+
+        async def load(cache: CacheClient, cache_key: str, args: tuple, kwargs: dict):
+            # Call function and cache result
+            result = await func(*args, **kwargs)
+
+            try:
+                stored = _swr_wrap(result, soft_ttl) if soft_ttl else result
+                await cache.set(cache_key, stored, ttl)
+            except Exception:
+                # Cache write error, return result anyway
+                pass
+
+            return result
+
+        async def refresh(cache: CacheClient, cache_key: str, args: tuple, kwargs: dict, trigger: str):
+            # One refresh per key across replicas; losers keep serving stale
+            lock_key = f"refresh:{cache_key}"
+            token = await cache.acquire_lock(lock_key, lock_ttl)
+            if token is None:
+                record_cache_refresh(cache.service_name, cache_name, trigger, "skipped")
+                return
+            start = time.monotonic()
+            try:
+                await load(cache, cache_key, args, kwargs)
+                status = "success"
+            except Exception as e:
+                status = "error"
+                logger.warning(f"Background refresh of {cache_name} failed: {e}")
+            finally:
+                await cache.release_lock(lock_key, token)
+            record_cache_refresh(cache.service_name, cache_name, trigger, status, time.monotonic() - start)
+
+        def schedule_refresh(cache: CacheClient, cache_key: str, args: tuple, kwargs: dict, trigger: str):
+            if cache_key in _refreshing:
+                return
+
+            async def run():
+                try:
+                    await refresh(cache, cache_key, args, kwargs, trigger)
+                finally:
+                    _refreshing.discard(cache_key)
+
+            _refreshing.add(cache_key)
+            _spawn(run())
+
+        async def prewarm_loop(cache: CacheClient):
+            interval = soft_ttl / 2
+            while True:
+                await asyncio.sleep(interval)
+                for cache_key, args, kwargs in popularity.drain_top(prewarm_top):
+                    stored = await cache.get(cache_key)
+                    _, fresh_until = _swr_unwrap(stored)
+                    # Reload anything that would go stale before the next pass
+                    if stored is None or fresh_until - time.time() < interval:
+                        schedule_refresh(cache, cache_key, args, kwargs, "prewarm")
+
+        def ensure_prewarm(cache: CacheClient):
+            nonlocal prewarm_task
+            if prewarm_task is None or prewarm_task.done() or \
+                    prewarm_task.get_loop() is not asyncio.get_running_loop():
+                prewarm_task = _spawn(prewarm_loop(cache))
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Generate cache key from function name and args
-            cache_key = f"{key_prefix}:{func.__name__}:{hash(str(args) + str(kwargs))}"
+            try:
+                cache_key = make_cache_key(func, args, kwargs, key_prefix, version)
+            except TypeError as e:
+                # Unhashable arguments (or a bad call) - skip the cache
+                logger.debug(f"Cache bypass for {func.__name__}: {e}")
+                return await func(*args, **kwargs)
 
             # OPTIMIZATION: Reuse global cache client
             cache = get_cache_client()
 
+            if popularity is not None:
+                popularity.record(cache_key, args, kwargs)
+                ensure_prewarm(cache)
+
             try:
                 # Try to get from cache
                 cached_result = await cache.get(cache_key)
-
-                if cached_result is not None:
-                    return cached_result
             except Exception:
                 # Cache read error, continue to function call
-                pass
-
-            # Call function and cache result
-            result = await func(*args, **kwargs)
+                cached_result = None
 
-            try:
-                await cache.set(cache_key, result, ttl)
-            except Exception:
-                # Cache write error, return result anyway
-                pass
+            if cached_result is not None:
+                if not soft_ttl:
+                    record_cache_lookup(cache.service_name, cache_name, "fresh")
+                    return cached_result
+                value, fresh_until = _swr_unwrap(cached_result)
+                if fresh_until > time.time():
+                    record_cache_lookup(cache.service_name, cache_name, "fresh")
+                else:
+                    record_cache_lookup(cache.service_name, cache_name, "stale")
+                    schedule_refresh(cache, cache_key, args, kwargs, "stale")
+                return value
 
-            return result
+            record_cache_lookup(cache.service_name, cache_name, "miss")
+            call = lambda: load(cache, cache_key, args, kwargs)  # noqa: E731
+            if distributed:
+                result = await single_flight(
+                    cache_key,
+                    lambda: distributed_single_flight(cache, cache_key, call, lock_ttl),
+                )
+                # Waiters read the entry another replica stored
+                return _swr_unwrap(result)[0] if soft_ttl else result
+            return await single_flight(cache_key, call)
         return wrapper
     return decorator
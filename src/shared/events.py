@@ -450,6 +450,21 @@ async def emit_stt_complete(
         }, interface)
 
 
+async def emit_stt_progress(
+    session_id: str,
+    text: str,
+    stable: bool,
+    interface: Optional[str] = None
+):
+    """Emit partial transcript event (streaming STT)."""
+    emitter = EventEmitterFactory.get()
+    if emitter:
+        await emitter.emit(EventType.STT_PROGRESS, session_id, {
+            'text': text,
+            'stable': stable,
+        }, interface)
+
+
 async def emit_intent_classified(
     session_id: str,
     intent: str,
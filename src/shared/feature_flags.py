@@ -0,0 +1,234 @@
+"""
+In-process Feature Flag Store
+
+Holds every feature flag in memory so a request evaluates flags with a dict
+lookup instead of an admin API call. The store is loaded from the admin
+backend's /api/features/snapshot endpoint and kept current by:
+
+- pushed changes: the admin backend posts changed flag states to each
+  service's /admin/invalidate-feature-cache endpoint, which calls
+  apply_changes()
+- config change notifications: AdminConfigClient's Redis listener calls
+  refresh() when the features table changes
+- a periodic conditional refresh (If-None-Match), which costs a 304 when
+  nothing changed
+
+Usage:
+    store = get_flag_store()
+    await store.ensure_loaded()
+    if store.is_enabled("llm_based_routing"):
+        ...
+"""
+import asyncio
+import time
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+# Conditional refresh interval; pushed changes normally arrive well before
+REFRESH_INTERVAL_SECONDS = 60.0
+
+
+class FeatureFlagStore:
+    """Feature flags evaluated from memory."""
+
+    def __init__(
+        self,
+        admin_url: str,
+        client: Optional[httpx.AsyncClient] = None,
+        refresh_interval: float = REFRESH_INTERVAL_SECONDS
+    ):
+        """
+        Initialize the flag store.
+
+        Args:
+            admin_url: Admin API URL
+            client: HTTP client to reuse (defaults to a new one with a 3s timeout)
+            refresh_interval: Seconds between conditional background refreshes
+        """
+        self.admin_url = admin_url
+        self.client = client or httpx.AsyncClient(timeout=3.0)
+        self.refresh_interval = refresh_interval
+        # Replaced wholesale on every change and never mutated in place, so
+        # a reference taken with flags() is a consistent view
+        self._flags: Dict[str, Dict[str, Any]] = {}
+        self._etag: Optional[str] = None
+        self._loaded = False
+        self._attempted = False
+        self._loaded_at = 0.0
+        self._attempted_at = 0.0  # last fetch, successful or not
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    # -------------------------------------------------------------------------
+    # Evaluation (synchronous, in-memory)
+    # -------------------------------------------------------------------------
+
+    def is_enabled(self, name: str, default: bool = False) -> bool:
+        """Whether a flag is enabled; ``default`` if it is unknown."""
+        flag = self._flags.get(name)
+        if flag is None:
+            return default
+        return flag["enabled"]
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """A flag's {"enabled": bool, "config": dict}, or None if unknown."""
+        return self._flags.get(name)
+
+    def get_config(self, name: str) -> Dict[str, Any]:
+        """A flag's config dict ({} if unknown or unset)."""
+        flag = self._flags.get(name)
+        return flag["config"] if flag else {}
+
+    def evaluate(self, names: Iterable[str], default: bool = False) -> Dict[str, bool]:
+        """Evaluate several flags against the same snapshot."""
+        flags = self._flags
+        return {
+            name: flags[name]["enabled"] if name in flags else default
+            for name in names
+        }
+
+    def flags(self) -> Dict[str, Dict[str, Any]]:
+        """The current flag snapshot (do not mutate)."""
+        return self._flags
+
+    def stats(self) -> Dict[str, Any]:
+        """Store state for debug endpoints."""
+        return {
+            "loaded": self._loaded,
+            "etag": self._etag,
+            "age_seconds": round(time.time() - self._loaded_at, 2) if self._loaded_at else None,
+            "refresh_interval_seconds": self.refresh_interval,
+            "total_flags": len(self._flags),
+        }
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    async def ensure_loaded(self):
+        """
+        Load the flags if no load was attempted yet and start background refresh.
+
+        Only the first call waits on the admin API; later calls return
+        immediately even if that load failed (flags then evaluate to their
+        defaults until a background refresh succeeds).
+        """
+        if not self._attempted:
+            async with self._lock:
+                if not self._attempted:
+                    await self._fetch()
+                    self._attempted = True
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def refresh(self) -> bool:
+        """
+        Conditionally refetch the flags.
+
+        Returns:
+            True if the admin API answered (changed or not)
+        """
+        async with self._lock:
+            return await self._fetch()
+
+    async def _fetch(self) -> bool:
+        headers = {"If-None-Match": self._etag} if self._etag else None
+        self._attempted_at = time.time()
+        try:
+            response = await self.client.get(f"{self.admin_url}/api/features/snapshot", headers=headers)
+        except Exception as e:
+            logger.warning("feature_flag_snapshot_error", error=str(e), admin_url=self.admin_url)
+            return False
+
+        self._loaded_at = time.time()
+        if response.status_code == 304:
+            return True
+        if response.status_code != 200:
+            logger.warning("feature_flag_snapshot_failed", status_code=response.status_code)
+            return False
+
+        data = response.json()
+        self._flags = {
+            name: {"enabled": bool(flag.get("enabled", False)), "config": flag.get("config") or {}}
+            for name, flag in data.get("flags", {}).items()
+        }
+        self._etag = response.headers.get("ETag") or data.get("etag")
+        self._loaded = True
+        logger.info(
+            "feature_flags_loaded",
+            count=len(self._flags),
+            enabled_count=sum(1 for f in self._flags.values() if f["enabled"]),
+            etag=self._etag
+        )
+        return True
+
+    async def _refresh_loop(self):
+        while True:
+            # Measured from the last attempt, so an admin outage does not become a tight retry loop
+            await asyncio.sleep(max(0.0, self._attempted_at + self.refresh_interval - time.time()))
+            if time.time() - self._attempted_at >= self.refresh_interval:
+                await self.refresh()
+
+    def apply_changes(self, changes: Dict[str, Dict[str, Any]], etag: Optional[str] = None):
+        """
+        Apply flag states pushed by the admin backend.
+
+        Args:
+            changes: {name: {"enabled": bool, "config": dict}}
+            etag: ETag of the admin snapshot after the change
+        """
+        flags = dict(self._flags)
+        for name, flag in changes.items():
+            flags[name] = {"enabled": bool(flag.get("enabled", False)), "config": flag.get("config") or {}}
+        self._flags = flags
+        if etag:
+            self._etag = etag
+        logger.info("feature_flags_changed", flags=sorted(changes), etag=etag)
+
+    async def handle_push(self, payload: Any):
+        """
+        Apply a body posted to /admin/invalidate-feature-cache.
+
+        The admin backend sends {"flags": [...], "changes": {...}, "etag": ...};
+        a payload without changes (or from an older sender) triggers a refetch.
+        """
+        changes = payload.get("changes") if isinstance(payload, dict) else None
+        if changes:
+            self.apply_changes(changes, payload.get("etag"))
+        else:
+            await self.refresh()
+
+    async def close(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+
+# Singleton instance
+_flag_store: Optional[FeatureFlagStore] = None
+
+
+def get_flag_store() -> FeatureFlagStore:
+    """
+    Get or create the flag store singleton.
+
+    Shares the admin configuration client's URL and HTTP connection pool.
+
+    Returns:
+        FeatureFlagStore instance
+    """
+    global _flag_store
+    if _flag_store is None:
+        from shared.admin_config import get_admin_client
+
+        admin_client = get_admin_client()
+        _flag_store = FeatureFlagStore(admin_client.admin_url, client=admin_client.client)
+    return _flag_store
@@ -1,9 +1,14 @@
 """Home Assistant API client for Project Athena"""
 
+import asyncio
+import json
 import os
+import time
 import httpx
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+
+from shared.ha_websocket import HAWebSocket, HAWebSocketError, HAWebSocketSendError
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +18,52 @@ class HomeAssistantNotConfiguredError(Exception):
     pass
 
 
+class HomeAssistantServiceError(Exception):
+    """Raised by call_services(raise_on_error=True) when some calls failed."""
+
+    def __init__(self, results: List[Dict[str, Any]]):
+        self.results = results
+        failed = [str(index) for index, result in enumerate(results) if not result["success"]]
+        super().__init__(f"{len(failed)} of {len(results)} service calls failed (calls {', '.join(failed[:5])})")
+
+
+# (domain, service, service_data)
+ServiceCall = Tuple[str, str, Dict[str, Any]]
+
+# Seconds to stay on REST after the service WebSocket fails to connect
+WEBSOCKET_RETRY_SECONDS = 30.0
+
+
+def _entity_ids(service_data: Optional[Dict[str, Any]]) -> List[str]:
+    entity_ids = (service_data or {}).get("entity_id")
+    if entity_ids is None:
+        return []
+    return [entity_ids] if isinstance(entity_ids, str) else list(entity_ids)
+
+
+def merge_service_calls(calls: List[ServiceCall]) -> List[Tuple[str, str, Dict[str, Any], List[str], List[int]]]:
+    """
+    Merge calls that differ only in entity_id into one multi-entity call.
+
+    Returns (domain, service, service_data without entity_id, entity_ids,
+    indexes of the merged calls) in first-seen order. Calls without an
+    entity_id are never merged.
+    """
+    merged: Dict[Any, Tuple[str, str, Dict[str, Any], List[str], List[int]]] = {}
+    for index, (domain, service, service_data) in enumerate(calls):
+        data = dict(service_data or {})
+        if data.pop("entity_id", None) is None:
+            merged[("single", index)] = (domain, service, data, [], [index])
+            continue
+        key = (domain, service, json.dumps(data, sort_keys=True, default=str))
+        if key not in merged:
+            merged[key] = (domain, service, data, [], [])
+        targets = merged[key][3]
+        targets.extend(e for e in _entity_ids(service_data) if e not in targets)
+        merged[key][4].append(index)
+    return list(merged.values())
+
+
 class HomeAssistantClient:
     """Client for interacting with Home Assistant API.
 
@@ -21,7 +72,24 @@ class HomeAssistantClient:
     HomeAssistantNotConfiguredError with a helpful message.
     """
 
-    def __init__(self, url: Optional[str] = None, token: Optional[str] = None):
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        token: Optional[str] = None,
+        state_mirror=None,
+        ws_connect=None
+    ):
+        # Optional HAStateMirror (shared.ha_state_mirror) serving get_state from memory
+        self.state_mirror = state_mirror
+
+        # Batched service calls (call_services) are pipelined over one WebSocket
+        self.use_websocket = os.getenv("HA_SERVICE_WEBSOCKET", "true").lower() == "true"
+        self.batch_concurrency = int(os.getenv("HA_BATCH_CONCURRENCY", "16"))
+        self._ws_connect = ws_connect  # WebSocket factory (see HAWebSocket), for tests
+        self._ws: Optional[HAWebSocket] = None
+        self._ws_lock = asyncio.Lock()
+        self._ws_failed_at: Optional[float] = None
+
         # Get URL from parameter, env var, or leave empty (no hardcoded default)
         self.url = url or os.getenv("HA_URL", "")
         self.token = token or os.getenv("HA_TOKEN", "")
@@ -63,8 +131,12 @@ class HomeAssistantClient:
         return not self._disabled
     
     async def get_state(self, entity_id: str) -> Dict[str, Any]:
-        """Get the state of an entity."""
+        """Get the state of an entity (from the state mirror while it is live)."""
         self._check_configured()
+        if self.state_mirror is not None and self.state_mirror.is_live:
+            state = self.state_mirror.get_state(entity_id)
+            if state is not None:
+                return state
         response = await self.client.get(f"/api/states/{entity_id}")
         response.raise_for_status()
         return response.json()
@@ -109,6 +181,138 @@ class HomeAssistantClient:
             )
             raise
     
+    async def call_services(
+        self,
+        calls: List[ServiceCall],
+        raise_on_error: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute many service calls as few round-trips as possible.
+
+        Calls that differ only in entity_id are merged into one multi-entity
+        call (e.g. 40 ``light.turn_off`` calls become one). The remaining
+        calls are pipelined over a single WebSocket connection with at most
+        HA_BATCH_CONCURRENCY (default 16) in flight, falling back to REST if
+        the WebSocket is unavailable. A multi-entity call that Home Assistant
+        rejected is retried per entity so each entity gets its own outcome.
+
+        Args:
+            calls: (domain, service, service_data) tuples
+            raise_on_error: Raise HomeAssistantServiceError after all calls
+                finish if any call failed
+
+        Returns:
+            One {"success": bool, "error": str or None} per call, in the
+            order of ``calls``
+        """
+        self._check_configured()
+
+        started = time.perf_counter()
+        merged = merge_service_calls(calls)
+        semaphore = asyncio.Semaphore(max(1, self.batch_concurrency))
+        # (position in merged, entity_id or None) -> error message or None
+        outcomes: Dict[Tuple[int, Optional[str]], Optional[str]] = {}
+
+        async def run(position: int, domain: str, service: str, data: Dict[str, Any], entity_ids: List[str]):
+            async with semaphore:
+                error, answered = await self._dispatch_service(domain, service, data, entity_ids)
+            if error is not None and answered and len(entity_ids) > 1:
+                # Attribute the failure: retry each entity on its own. Not after
+                # a timeout, where the call may still have run.
+                await asyncio.gather(*[run(position, domain, service, data, [e]) for e in entity_ids])
+                return
+            for entity_id in entity_ids or [None]:
+                outcomes[(position, entity_id)] = error
+
+        await asyncio.gather(*[
+            run(position, domain, service, data, entity_ids)
+            for position, (domain, service, data, entity_ids, _) in enumerate(merged)
+        ])
+
+        results: List[Dict[str, Any]] = [{}] * len(calls)
+        for position, (_, _, _, _, indexes) in enumerate(merged):
+            for index in indexes:
+                errors = [outcomes[(position, e)] for e in _entity_ids(calls[index][2]) or [None]]
+                error = next((e for e in errors if e is not None), None)
+                results[index] = {"success": error is None, "error": error}
+
+        failed = sum(1 for result in results if not result["success"])
+        logger.info(
+            "ha_call_services",
+            extra={
+                "calls": len(calls),
+                "merged_calls": len(merged),
+                "failed": failed,
+                "transport": "websocket" if self._ws is not None and self._ws.connected else "rest",
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1)
+            }
+        )
+        if failed and raise_on_error:
+            raise HomeAssistantServiceError(results)
+        return results
+
+    async def _dispatch_service(
+        self,
+        domain: str,
+        service: str,
+        data: Dict[str, Any],
+        entity_ids: List[str]
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Run one (possibly multi-entity) call.
+
+        Returns (error message or None on success, whether Home Assistant
+        answered). REST is only used when the WebSocket command was never
+        sent: once sent, a lost answer may still mean the service ran, and
+        running it again could repeat a non-idempotent action.
+        """
+        ws = await self._websocket()
+        if ws is not None:
+            payload: Dict[str, Any] = {"type": "call_service", "domain": domain, "service": service, "service_data": data}
+            if entity_ids:
+                payload["target"] = {"entity_id": entity_ids}
+            try:
+                await ws.call(payload)
+                return None, True
+            except HAWebSocketError as e:
+                return str(e), True
+            except HAWebSocketSendError:
+                pass  # never reached Home Assistant: REST below
+            except asyncio.TimeoutError:
+                return f"timed out after {ws.call_timeout:.0f}s waiting for Home Assistant", False
+            except ConnectionError as e:
+                return f"connection lost before Home Assistant answered: {e}", False
+        service_data = {**data, "entity_id": entity_ids if len(entity_ids) > 1 else entity_ids[0]} if entity_ids else data
+        try:
+            await self.call_service(domain, service, service_data)
+            return None, True
+        except httpx.HTTPStatusError as e:
+            return str(e), True
+        except Exception as e:
+            return str(e), False
+
+    async def _websocket(self) -> Optional[HAWebSocket]:
+        """The shared service WebSocket, connected on first use (None means use REST)."""
+        if not self.use_websocket:
+            return None
+        if self._ws is not None and self._ws.connected:
+            return self._ws
+        async with self._ws_lock:
+            if self._ws is not None and self._ws.connected:
+                return self._ws
+            if self._ws_failed_at is not None and time.monotonic() - self._ws_failed_at < WEBSOCKET_RETRY_SECONDS:
+                return None
+            ws = HAWebSocket(self.url, self.token, connect=self._ws_connect, call_timeout=10.0)
+            try:
+                await ws.connect()
+            except Exception as e:
+                logger.warning("ha_service_websocket_unavailable", extra={"error": str(e)})
+                self._ws_failed_at = time.monotonic()
+                return None
+            self._ws = ws
+            self._ws_failed_at = None
+            return ws
+
     async def health_check(self) -> bool:
         """Check if Home Assistant is reachable.
 
@@ -222,6 +426,9 @@ class HomeAssistantClient:
             return False
 
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client and the service WebSocket."""
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
         if self.client:
             await self.client.aclose()
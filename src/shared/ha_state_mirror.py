@@ -0,0 +1,331 @@
+"""
+Event-driven Home Assistant state mirror.
+
+Keeps every entity's state in memory, updated from ``state_changed``
+events on a long-lived WebSocket subscription (shared.ha_websocket), with
+per-domain, per-area and per-room indexes maintained incrementally. Reads
+are plain dict lookups with no I/O, replacing periodic ``/api/states``
+downloads and per-call ``/api/states/<id>`` requests.
+
+On every (re)connect the mirror subscribes first and then fetches
+``get_states``, applying only the differences (resync-by-diff). Entities
+changed by events while the snapshot was in flight keep their event state,
+so the snapshot never rolls them back.
+
+Areas come from the area/device/entity registries. They are refetched when
+HA reports a registry change. If the token cannot read the registries, the
+area and room indexes stay empty and everything else works.
+
+Usage:
+    mirror = HAStateMirror(ha_url, ha_token)
+    await mirror.start()
+    await mirror.wait_ready(timeout=5)
+    mirror.get_state("light.kitchen")
+    mirror.domain("lock")
+    mirror.room("living room")
+"""
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import structlog
+
+from shared.ha_websocket import HAWebSocket
+
+logger = structlog.get_logger()
+
+StateListener = Callable[[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]], None]
+
+REGISTRY_EVENTS = ("area_registry_updated", "device_registry_updated", "entity_registry_updated")
+
+
+def normalize_room(name: str) -> str:
+    """'Living Room' / 'living_room' -> 'living room'"""
+    return " ".join(name.lower().replace("_", " ").split())
+
+
+class HAStateMirror:
+    """In-memory Home Assistant state kept current over the WebSocket API."""
+
+    def __init__(
+        self,
+        ha_url: str,
+        ha_token: str,
+        connect: Optional[Callable[[str], Awaitable[Any]]] = None,
+        reconnect_min: Optional[float] = None,
+        reconnect_max: Optional[float] = None
+    ):
+        """
+        Args:
+            ha_url: Home Assistant base URL (http/https)
+            ha_token: Long-lived access token
+            connect: WebSocket factory (see HAWebSocket), for tests
+            reconnect_min: First reconnect delay (HA_MIRROR_RECONNECT_MIN, default 1s)
+            reconnect_max: Reconnect delay cap (HA_MIRROR_RECONNECT_MAX, default 30s)
+        """
+        self.ha_url = ha_url
+        self.ha_token = ha_token
+        self._connect = connect
+        self.reconnect_min = reconnect_min or float(os.getenv("HA_MIRROR_RECONNECT_MIN", "1"))
+        self.reconnect_max = reconnect_max or float(os.getenv("HA_MIRROR_RECONNECT_MAX", "30"))
+
+        self.states: Dict[str, Dict[str, Any]] = {}
+        self._by_domain: Dict[str, Set[str]] = {}
+        self._by_area: Dict[str, Set[str]] = {}
+        self._entity_area: Dict[str, str] = {}
+        self._area_names: Dict[str, str] = {}
+        self._rooms: Dict[str, Set[str]] = {}  # normalized area name/id -> area ids
+        self.registry_version = 0  # bumped whenever the area data is replaced
+
+        self._listeners: List[StateListener] = []
+        self._ws: Optional[HAWebSocket] = None
+        self._task: Optional[asyncio.Task] = None
+        self._registry_task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+        self._live = False
+        self._touched: Optional[Set[str]] = None  # entities changed by events during a resync
+
+        self.events_applied = 0
+        self.resyncs = 0
+        self.reconnects = 0
+        self.last_event_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self):
+        """Start the background connection task (returns immediately)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the first full sync. Returns False on timeout."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    @property
+    def is_live(self) -> bool:
+        """Synced and currently connected, so reads are current."""
+        return self._live
+
+    async def close(self):
+        for task in (self._task, self._registry_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._task = None
+        self._registry_task = None
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+        self._live = False
+
+    async def _run(self):
+        delay = self.reconnect_min
+        while True:
+            ws = HAWebSocket(self.ha_url, self.ha_token, connect=self._connect)
+            try:
+                await ws.connect()
+                self._ws = ws
+                await self._sync(ws)
+                delay = self.reconnect_min
+                await ws.wait_closed()
+                logger.warning("ha_mirror_disconnected")
+            except asyncio.CancelledError:
+                await ws.close()
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("ha_mirror_connection_failed", error=str(e), retry_in=delay)
+            self._live = False
+            await ws.close()
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.reconnect_max)
+
+    async def _sync(self, ws: HAWebSocket):
+        """Subscribe, then reconcile the mirror against a full snapshot."""
+        self._touched = set()
+        try:
+            await ws.subscribe_events("state_changed", self._on_state_changed)
+            for event_type in REGISTRY_EVENTS:
+                await ws.subscribe_events(event_type, self._on_registry_changed)
+            await self._load_registries(ws)
+
+            snapshot = {state["entity_id"]: state for state in await ws.call({"type": "get_states"})}
+            changed = 0
+            for entity_id, state in snapshot.items():
+                if entity_id in self._touched:
+                    continue  # an event already delivered a newer state
+                if self.states.get(entity_id) != state:
+                    self._apply(entity_id, state)
+                    changed += 1
+            for entity_id in [e for e in self.states if e not in snapshot and e not in self._touched]:
+                self._apply(entity_id, None)
+                changed += 1
+        finally:
+            self._touched = None
+
+        self.resyncs += 1
+        self._live = True
+        self._ready.set()
+        logger.info("ha_mirror_synced", entities=len(self.states), changed=changed, resyncs=self.resyncs)
+
+    # =========================================================================
+    # Events
+    # =========================================================================
+
+    def _on_state_changed(self, event: Dict[str, Any]):
+        data = event.get("data", {})
+        entity_id = data.get("entity_id")
+        if not entity_id:
+            return
+        if self._touched is not None:
+            self._touched.add(entity_id)
+        self._apply(entity_id, data.get("new_state"))
+        self.events_applied += 1
+        self.last_event_at = time.time()
+
+    def _on_registry_changed(self, event: Dict[str, Any]):
+        # Registry edits come in bursts (e.g. renaming a device's entities)
+        if self._registry_task is None or self._registry_task.done():
+            self._registry_task = asyncio.create_task(self._reload_registries())
+
+    async def _reload_registries(self):
+        await asyncio.sleep(1.0)
+        if self._ws is not None and self._ws.connected:
+            await self._load_registries(self._ws)
+
+    async def _load_registries(self, ws: HAWebSocket):
+        try:
+            areas = await ws.call({"type": "config/area_registry/list"})
+            devices = await ws.call({"type": "config/device_registry/list"})
+            entities = await ws.call({"type": "config/entity_registry/list"})
+        except Exception as e:
+            logger.info("ha_mirror_registries_unavailable", error=str(e))
+            return
+
+        device_area = {d["id"]: d.get("area_id") for d in devices}
+        entity_area = {}
+        for entry in entities:
+            area_id = entry.get("area_id") or device_area.get(entry.get("device_id"))
+            if area_id:
+                entity_area[entry["entity_id"]] = area_id
+        self.set_areas({a["area_id"]: a.get("name", a["area_id"]) for a in areas}, entity_area)
+
+    def set_areas(self, area_names: Dict[str, str], entity_area: Dict[str, str]):
+        """Replace the area registry data and rebuild the area/room indexes."""
+        self._area_names = dict(area_names)
+        self._entity_area = dict(entity_area)
+        self._rooms = {}
+        for area_id, name in self._area_names.items():
+            for key in {normalize_room(name), normalize_room(area_id)}:
+                self._rooms.setdefault(key, set()).add(area_id)
+        self._by_area = {}
+        for entity_id in self.states:
+            area_id = self._entity_area.get(entity_id)
+            if area_id:
+                self._by_area.setdefault(area_id, set()).add(entity_id)
+        self.registry_version += 1
+
+    # =========================================================================
+    # Incremental indexing
+    # =========================================================================
+
+    def _apply(self, entity_id: str, new_state: Optional[Dict[str, Any]]):
+        old_state = self.states.get(entity_id)
+        domain = entity_id.split(".", 1)[0]
+        area_id = self._entity_area.get(entity_id)
+        if new_state is None:
+            if old_state is None:
+                return
+            del self.states[entity_id]
+            self._discard(self._by_domain, domain, entity_id)
+            if area_id:
+                self._discard(self._by_area, area_id, entity_id)
+        else:
+            self.states[entity_id] = new_state
+            if old_state is None:
+                self._by_domain.setdefault(domain, set()).add(entity_id)
+                if area_id:
+                    self._by_area.setdefault(area_id, set()).add(entity_id)
+        for listener in self._listeners:
+            try:
+                listener(entity_id, old_state, new_state)
+            except Exception as e:
+                logger.warning("ha_mirror_listener_failed", entity_id=entity_id, error=str(e))
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, entity_id: str):
+        members = index.get(key)
+        if members is not None:
+            members.discard(entity_id)
+            if not members:
+                del index[key]
+
+    def add_listener(self, listener: StateListener):
+        """Call ``listener(entity_id, old_state, new_state)`` on every change (new_state None = removed)."""
+        self._listeners.append(listener)
+
+    # =========================================================================
+    # Zero-I/O reads
+    # =========================================================================
+
+    def get_state(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        return self.states.get(entity_id)
+
+    def domain(self, *domains: str) -> Dict[str, Dict[str, Any]]:
+        """States of every entity in ``domains``."""
+        return {
+            entity_id: self.states[entity_id]
+            for domain in domains
+            for entity_id in self._by_domain.get(domain, ())
+        }
+
+    def area(self, area_id: str, domain: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """States of the entities assigned to ``area_id`` (optionally one domain)."""
+        return {
+            entity_id: self.states[entity_id]
+            for entity_id in self._by_area.get(area_id, ())
+            if domain is None or entity_id.startswith(f"{domain}.")
+        }
+
+    def room(self, name: str, domain: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """States in the area(s) named ``name`` (matched by normalized area name or id)."""
+        result: Dict[str, Dict[str, Any]] = {}
+        for area_id in self._rooms.get(normalize_room(name), ()):
+            result.update(self.area(area_id, domain))
+        return result
+
+    def areas(self) -> Dict[str, str]:
+        """Area id -> name."""
+        return dict(self._area_names)
+
+    def area_of(self, entity_id: str) -> Optional[str]:
+        return self._entity_area.get(entity_id)
+
+    def entity_areas(self) -> Dict[str, str]:
+        """Entity id -> area id."""
+        return dict(self._entity_area)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "live": self._live,
+            "entities": len(self.states),
+            "domains": len(self._by_domain),
+            "areas": len(self._area_names),
+            "events_applied": self.events_applied,
+            "resyncs": self.resyncs,
+            "reconnects": self.reconnects,
+            "last_event_age_seconds": round(time.time() - self.last_event_at, 1) if self.last_event_at else None,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,214 @@
+"""
+Home Assistant WebSocket API connection.
+
+One authenticated connection to ``/api/websocket`` that multiplexes
+commands (matched to their ``result`` by message id) and event
+subscriptions. Used by HAStateMirror (shared.ha_state_mirror) to follow
+``state_changed`` events instead of polling ``/api/states``.
+
+Usage:
+    ws = HAWebSocket("https://ha.local:8123", token)
+    await ws.connect()
+    states = await ws.call({"type": "get_states"})
+    await ws.subscribe_events("state_changed", on_event)
+    await ws.wait_closed()
+"""
+import asyncio
+import json
+import ssl
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+import structlog
+
+logger = structlog.get_logger()
+
+EventCallback = Callable[[Dict[str, Any]], Union[None, Awaitable[None]]]
+
+
+class HAWebSocketError(Exception):
+    """Authentication failure or an unsuccessful command result."""
+
+
+class HAWebSocketSendError(ConnectionError):
+    """A command was never sent (not connected, or the send failed), so it did not run."""
+
+
+def websocket_url(ha_url: str) -> str:
+    """http(s)://host:8123 -> ws(s)://host:8123/api/websocket"""
+    url = ha_url.rstrip("/")
+    if url.startswith("https://"):
+        url = "wss://" + url[len("https://"):]
+    elif url.startswith("http://"):
+        url = "ws://" + url[len("http://"):]
+    return f"{url}/api/websocket"
+
+
+async def _default_connect(url: str):
+    import websockets
+
+    ssl_context = None
+    if url.startswith("wss://"):
+        # Same as the REST clients: HA commonly runs with a self-signed cert
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    # get_states on a large install is several MB
+    return await websockets.connect(url, ssl=ssl_context, max_size=None, open_timeout=10)
+
+
+class HAWebSocket:
+    """
+    Authenticated Home Assistant WebSocket connection.
+
+    ``connect`` is a coroutine factory returning a websocket-like object
+    with ``send``, ``recv``, ``close`` and async iteration (the
+    ``websockets`` package by default; tests pass a fake).
+    """
+
+    def __init__(
+        self,
+        ha_url: str,
+        token: str,
+        connect: Optional[Callable[[str], Awaitable[Any]]] = None,
+        call_timeout: float = 30.0
+    ):
+        self.url = websocket_url(ha_url)
+        self.token = token
+        self.call_timeout = call_timeout
+        self._connect = connect or _default_connect
+        self._ws = None
+        self._next_id = 1
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._subscriptions: Dict[int, EventCallback] = {}
+        self._reader: Optional[asyncio.Task] = None
+        self._closed = asyncio.Event()
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and not self._closed.is_set()
+
+    async def connect(self):
+        """Open the connection and authenticate."""
+        self._closed.clear()
+        self._ws = await self._connect(self.url)
+        try:
+            hello = json.loads(await self._ws.recv())
+            if hello.get("type") != "auth_required":
+                raise HAWebSocketError(f"unexpected handshake message: {hello.get('type')}")
+            await self._ws.send(json.dumps({"type": "auth", "access_token": self.token}))
+            reply = json.loads(await self._ws.recv())
+            if reply.get("type") != "auth_ok":
+                raise HAWebSocketError(f"authentication failed: {reply.get('message', reply.get('type'))}")
+        except BaseException:
+            await self.close()
+            raise
+        self._reader = asyncio.create_task(self._read_loop())
+        logger.info("ha_websocket_connected", url=self.url, ha_version=reply.get("ha_version"))
+
+    async def _read_loop(self):
+        try:
+            async for raw in self._ws:
+                payload = json.loads(raw)
+                # HA may coalesce several messages into one JSON array
+                for message in payload if isinstance(payload, list) else [payload]:
+                    await self._dispatch(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("ha_websocket_read_failed", error=str(e))
+        finally:
+            self._closed.set()
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Home Assistant WebSocket closed"))
+            self._pending.clear()
+
+    async def _dispatch(self, message: Dict[str, Any]):
+        message_type = message.get("type")
+        if message_type == "event":
+            callback = self._subscriptions.get(message.get("id"))
+            if callback is not None:
+                try:
+                    result = callback(message.get("event", {}))
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    logger.warning("ha_websocket_event_callback_failed", error=str(e))
+        elif message_type in ("result", "pong"):
+            future = self._pending.pop(message.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+
+    async def _send(self, payload: Dict[str, Any]) -> asyncio.Future:
+        if not self.connected:
+            raise HAWebSocketSendError("Home Assistant WebSocket is not connected")
+        message_id = self._next_id
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self._ws.send(json.dumps({**payload, "id": message_id}))
+        except Exception as e:
+            self._pending.pop(message_id, None)
+            raise HAWebSocketSendError(f"Home Assistant WebSocket send failed: {e}") from e
+        except BaseException:
+            self._pending.pop(message_id, None)
+            raise
+        return future
+
+    async def call(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Send a command and return its ``result``.
+
+        Raises:
+            HAWebSocketError: Home Assistant answered with success=false
+            HAWebSocketSendError: The command was never sent
+            ConnectionError: The connection closed before the answer
+        """
+        future = await self._send(payload)
+        message = await asyncio.wait_for(future, timeout or self.call_timeout)
+        if message.get("type") == "result" and not message.get("success", False):
+            error = message.get("error") or {}
+            raise HAWebSocketError(f"{error.get('code', 'error')}: {error.get('message', 'command failed')}")
+        return message.get("result")
+
+    async def subscribe_events(self, event_type: Optional[str], callback: EventCallback) -> int:
+        """
+        Subscribe ``callback`` to ``event_type`` (all events if None).
+
+        Returns:
+            The subscription id
+        """
+        payload: Dict[str, Any] = {"type": "subscribe_events"}
+        if event_type:
+            payload["event_type"] = event_type
+        # Register before sending so no event can arrive unrouted
+        subscription_id = self._next_id
+        self._subscriptions[subscription_id] = callback
+        try:
+            await self.call(payload)
+        except BaseException:
+            self._subscriptions.pop(subscription_id, None)
+            raise
+        return subscription_id
+
+    async def wait_closed(self):
+        """Return when the connection drops."""
+        await self._closed.wait()
+
+    async def close(self):
+        self._closed.set()
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reader = None
+        if self._ws is not None:
+            try:
+                await self._ws.close()
+            except Exception:
+                pass
+            self._ws = None
+        self._subscriptions.clear()
@@ -8,8 +8,10 @@ fallback.
 Open Source Compatible - No vendor lock-in.
 """
 import os
+import asyncio
 import httpx
 import time
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional, List
 from enum import Enum
 from collections import deque
@@ -17,9 +19,17 @@ import structlog
 
 # Import admin_config for centralized Ollama URL
 from shared.admin_config import get_admin_client
+from shared.metric_batcher import MetricBatcher
+from shared.metrics import LATENCY_SKETCHES, record_latency
 
 logger = structlog.get_logger()
 
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
 
 class BackendType(str, Enum):
     """Supported LLM backend types."""
@@ -61,6 +71,185 @@ DEFAULT_CLOUD_PRICING = {
 }
 
 
+class BackendClientPool:
+    """
+    Long-lived HTTP clients, one per backend origin (scheme://host:port).
+
+    Generation calls reuse keep-alive connections instead of paying TCP setup
+    on every request. Per-request timeouts are passed to each call, so one
+    client serves all models on an endpoint.
+
+    HTTP/2 is negotiated (via ALPN) for https endpoints when the ``h2``
+    package is installed; plain-http backends such as a local Ollama stay on
+    HTTP/1.1.
+
+    A client whose requests fail at the transport level ``evict_after_errors``
+    times in a row is evicted and rebuilt on next use, dropping connections a
+    restarted backend no longer knows about. It is closed once its in-flight
+    requests finish.
+    """
+
+    # Transport-level failures that indicate a bad connection pool (timeouts
+    # waiting on a slow generation do not)
+    UNHEALTHY_ERRORS = (httpx.NetworkError, httpx.RemoteProtocolError, httpx.ConnectTimeout)
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        evict_after_errors: Optional[int] = None,
+        timeout: float = 120.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize the pool. Unset limits are read from the environment.
+
+        Args:
+            max_connections: Max connections per endpoint (LLM_POOL_MAX_CONNECTIONS, default 20)
+            max_keepalive_connections: Idle connections kept per endpoint (LLM_POOL_MAX_KEEPALIVE, default 10)
+            keepalive_expiry: Seconds an idle connection is kept (LLM_POOL_KEEPALIVE_EXPIRY, default 60)
+            http2: Negotiate HTTP/2 on https endpoints (LLM_POOL_HTTP2, default true; needs h2)
+            evict_after_errors: Consecutive transport errors before a client is rebuilt (LLM_POOL_EVICT_AFTER_ERRORS, default 3)
+            timeout: Default timeout for requests that do not pass one
+            transport: Transport for every client (tests and benchmarks)
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections or int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "20")),
+            max_keepalive_connections=max_keepalive_connections or int(os.getenv("LLM_POOL_MAX_KEEPALIVE", "10")),
+            keepalive_expiry=keepalive_expiry if keepalive_expiry is not None else float(os.getenv("LLM_POOL_KEEPALIVE_EXPIRY", "60"))
+        )
+        if http2 is None:
+            http2 = os.getenv("LLM_POOL_HTTP2", "true").lower() == "true"
+        self.http2 = http2 and H2_AVAILABLE
+        self.evict_after_errors = evict_after_errors or int(os.getenv("LLM_POOL_EVICT_AFTER_ERRORS", "3"))
+        self.timeout = timeout
+        self._transport = transport
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._in_flight: Dict[httpx.AsyncClient, int] = {}
+        self._retired: set = set()
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        parsed = httpx.URL(url)
+        port = f":{parsed.port}" if parsed.port else ""
+        return f"{parsed.scheme}://{parsed.host}{port}"
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """The pooled client for ``url``'s origin, created on first use."""
+        origin = self._origin(url)
+        client = self._clients.get(origin)
+        if client is None:
+            http2 = self.http2 and origin.startswith("https://")
+            kwargs = {"transport": self._transport} if self._transport is not None else {}
+            client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits, http2=http2, **kwargs)
+            self._clients[origin] = client
+            stats = self._stats.setdefault(origin, {
+                "requests": 0,
+                "errors": 0,
+                "consecutive_errors": 0,
+                "evictions": 0,
+                "clients_created": 0,
+            })
+            stats["clients_created"] += 1
+            stats["http2"] = http2
+            logger.info("llm_pool_client_created", origin=origin, http2=http2)
+        return client
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request on the pooled client for ``url``."""
+        async with self._track(url) as client:
+            return await client.request(method, url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs):
+        """Stream a response on the pooled client for ``url``."""
+        async with self._track(url) as client:
+            async with client.stream(method, url, **kwargs) as response:
+                yield response
+
+    @asynccontextmanager
+    async def _track(self, url: str):
+        origin = self._origin(url)
+        client = self.get_client(url)
+        stats = self._stats[origin]
+        stats["requests"] += 1
+        self._in_flight[client] = self._in_flight.get(client, 0) + 1
+        try:
+            yield client
+        except self.UNHEALTHY_ERRORS as e:
+            stats["errors"] += 1
+            stats["consecutive_errors"] += 1
+            if stats["consecutive_errors"] >= self.evict_after_errors and self._clients.get(origin) is client:
+                self._evict(origin, error=e)
+            raise
+        else:
+            stats["consecutive_errors"] = 0
+        finally:
+            remaining = self._in_flight.get(client, 1) - 1
+            if remaining:
+                self._in_flight[client] = remaining
+            else:
+                self._in_flight.pop(client, None)
+                if client in self._retired:
+                    self._retired.discard(client)
+                    await client.aclose()
+
+    def _evict(self, origin: str, error: Exception):
+        client = self._clients.pop(origin)
+        stats = self._stats[origin]
+        stats["evictions"] += 1
+        stats["consecutive_errors"] = 0
+        self._retired.add(client)
+        logger.warning(
+            "llm_pool_client_evicted",
+            origin=origin,
+            error=str(error),
+            error_type=type(error).__name__
+        )
+
+    @staticmethod
+    def _open_connections(client: httpx.AsyncClient) -> Optional[int]:
+        # httpcore internals; best effort, reporting only
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        return len(connections) if connections is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-endpoint pool state for report_metrics()."""
+        endpoints = {}
+        for origin, stats in self._stats.items():
+            client = self._clients.get(origin)
+            endpoints[origin] = {
+                **stats,
+                "active": client is not None,
+                "in_flight": self._in_flight.get(client, 0) if client is not None else 0,
+                "open_connections": self._open_connections(client) if client is not None else 0,
+            }
+        return {
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+            "http2_available": H2_AVAILABLE,
+            "http2_enabled": self.http2,
+            "evict_after_errors": self.evict_after_errors,
+            "endpoints": endpoints,
+        }
+
+    async def aclose(self):
+        """Close every client, including evicted ones still draining."""
+        clients = list(self._clients.values()) + list(self._retired)
+        self._clients.clear()
+        self._retired.clear()
+        self._in_flight.clear()
+        await asyncio.gather(*(c.aclose() for c in clients), return_exceptions=True)
+
+
 class LLMRouter:
     """
     Routes LLM requests to configured backends.
@@ -79,7 +268,8 @@ class LLMRouter:
         admin_url: Optional[str] = None,
         cache_ttl: int = 60,
         metrics_window_size: int = 100,
-        persist_metrics: bool = True
+        persist_metrics: bool = True,
+        pool: Optional[BackendClientPool] = None
     ):
         """
         Initialize LLM Router.
@@ -89,6 +279,9 @@ class LLMRouter:
             cache_ttl: Cache TTL in seconds for backend configs
             metrics_window_size: Number of recent requests to track for metrics
             persist_metrics: Whether to persist metrics to database via Admin API
+                (batched in the background, see MetricBatcher)
+            pool: Connection pool for backend and metrics calls (defaults to one
+                configured from LLM_POOL_* environment variables)
         """
         self.admin_url = admin_url or os.getenv(
             "ADMIN_API_URL",
@@ -96,6 +289,12 @@ class LLMRouter:
         )
         self._admin_url_base = self.admin_url
         self.client = httpx.AsyncClient(timeout=120.0)
+        # Keep-alive clients for Ollama/MLX endpoints and metric persistence
+        self._pool = pool or BackendClientPool()
+        self._metric_batcher = MetricBatcher(
+            f"{self._admin_url_base}/api/llm-backends/metrics/batch",
+            client=self._pool
+        )
         self._backend_cache: Dict[str, Dict[str, Any]] = {}
         self._cache_expiry: Dict[str, float] = {}
         self._cache_ttl = cache_ttl
@@ -484,11 +683,10 @@ class LLMRouter:
                     "intent": intent
                 }
                 self._metrics.append(metric)
+                record_latency(f"llm.{kwargs.get('stage') or 'generate'}", duration * 1000, model)
 
-                # Persist metric to database asynchronously
-                import asyncio
-                stage = kwargs.get("stage")
-                asyncio.create_task(self._persist_metric(metric, source="orchestrator", stage=stage))
+                # Queue metric for batched persistence (non-blocking)
+                self._persist_metric(metric, source="orchestrator", stage=kwargs.get("stage"))
 
                 logger.info(
                     "llm_request_completed",
@@ -625,11 +823,10 @@ class LLMRouter:
                     "intent": kwargs.get("intent")
                 }
                 self._metrics.append(metric)
+                record_latency(f"llm.{kwargs.get('stage', 'tool_calling')}", duration * 1000, model)
 
-                # Persist metric to database asynchronously
-                import asyncio
-                stage = kwargs.get("stage", "tool_calling")
-                asyncio.create_task(self._persist_metric(metric, source="tool_calling", stage=stage))
+                # Queue metric for batched persistence (non-blocking)
+                self._persist_metric(metric, source="tool_calling", stage=kwargs.get("stage", "tool_calling"))
 
             logger.info(
                 "tool_calling_request_completed",
@@ -936,7 +1133,6 @@ class LLMRouter:
         Uses Ollama's native tool calling support (for models like llama3.1:8b).
         """
         endpoint_url = await self._get_ollama_url()
-        client = httpx.AsyncClient(base_url=endpoint_url, timeout=60.0)
 
         # Build payload
         payload = {
@@ -965,7 +1161,7 @@ class LLMRouter:
 
         try:
             # Call Ollama with tools
-            response = await client.post("/api/chat", json=payload)
+            response = await self._pool.post(f"{endpoint_url.rstrip('/')}/api/chat", json=payload, timeout=60.0)
 
             response.raise_for_status()
             data = response.json()
@@ -1004,8 +1200,6 @@ class LLMRouter:
                 request_id=request_id
             )
             raise
-        finally:
-            await client.aclose()
 
     async def _generate_ollama(
         self,
@@ -1031,8 +1225,6 @@ class LLMRouter:
             keep_alive: How long to keep model loaded (-1=forever)
             ollama_options: Additional Ollama options (num_ctx, num_batch, mirostat, etc.)
         """
-        client = httpx.AsyncClient(base_url=endpoint_url, timeout=timeout)
-
         # Build base options
         options = {
             "temperature": temperature,
@@ -1070,34 +1262,30 @@ class LLMRouter:
             payload["prompt"] = "/no_think\n" + payload["prompt"]
             logger.debug("ollama_generate_think_disabled", model=model)
 
-        try:
-            response = await client.post("/api/generate", json=payload)
-
-            response.raise_for_status()
-            data = response.json()
+        response = await self._pool.post(f"{endpoint_url.rstrip('/')}/api/generate", json=payload, timeout=timeout)
 
-            response_text = data.get("response", "")
+        response.raise_for_status()
+        data = response.json()
 
-            # Strip thinking content from qwen3 models
-            # The model may output thinking before </think> token
-            if "qwen3" in model.lower() and "</think>" in response_text:
-                # Extract content after </think> tag
-                parts = response_text.split("</think>", 1)
-                if len(parts) > 1:
-                    response_text = parts[1].strip()
-                    logger.debug("stripped_qwen3_thinking", model=model, original_len=len(data.get("response", "")), stripped_len=len(response_text))
+        response_text = data.get("response", "")
 
-            return {
-                "response": response_text,
-                "backend": "ollama",
-                "model": model,
-                "done": data.get("done", True),
-                "total_duration": data.get("total_duration"),
-                "eval_count": data.get("eval_count")
-            }
+        # Strip thinking content from qwen3 models
+        # The model may output thinking before </think> token
+        if "qwen3" in model.lower() and "</think>" in response_text:
+            # Extract content after </think> tag
+            parts = response_text.split("</think>", 1)
+            if len(parts) > 1:
+                response_text = parts[1].strip()
+                logger.debug("stripped_qwen3_thinking", model=model, original_len=len(data.get("response", "")), stripped_len=len(response_text))
 
-        finally:
-            await client.aclose()
+        return {
+            "response": response_text,
+            "backend": "ollama",
+            "model": model,
+            "done": data.get("done", True),
+            "total_duration": data.get("total_duration"),
+            "eval_count": data.get("eval_count")
+        }
 
     async def _generate_ollama_stream(
         self,
@@ -1157,40 +1345,39 @@ class LLMRouter:
             # Prepend /no_think tag to prompt to prevent extended reasoning output
             payload["prompt"] = "/no_think\n" + payload["prompt"]
 
-        async with httpx.AsyncClient(base_url=endpoint_url, timeout=timeout) as client:
-            async with client.stream("POST", "/api/generate", json=payload) as response:
-                response.raise_for_status()
+        async with self._pool.stream("POST", f"{endpoint_url.rstrip('/')}/api/generate", json=payload, timeout=timeout) as response:
+            response.raise_for_status()
 
-                async for line in response.aiter_lines():
-                    if not line:
-                        continue
-                    try:
-                        data = json_lib.loads(line)
-                        token = data.get("response", "")
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                try:
+                    data = json_lib.loads(line)
+                    token = data.get("response", "")
 
-                        if token:
-                            yield {
-                                "token": token,
-                                "done": data.get("done", False),
-                                "model": model,
-                                "backend": "ollama"
-                            }
+                    if token:
+                        yield {
+                            "token": token,
+                            "done": data.get("done", False),
+                            "model": model,
+                            "backend": "ollama"
+                        }
 
-                        if data.get("done"):
-                            # Final stats
-                            yield {
-                                "token": "",
-                                "done": True,
-                                "total_duration": data.get("total_duration"),
-                                "eval_count": data.get("eval_count"),
-                                "model": model,
-                                "backend": "ollama"
-                            }
-                            break
+                    if data.get("done"):
+                        # Final stats
+                        yield {
+                            "token": "",
+                            "done": True,
+                            "total_duration": data.get("total_duration"),
+                            "eval_count": data.get("eval_count"),
+                            "model": model,
+                            "backend": "ollama"
+                        }
+                        break
 
-                    except json_lib.JSONDecodeError:
-                        logger.warning("ollama_stream_json_error", line=line[:100])
-                        continue
+                except json_lib.JSONDecodeError:
+                    logger.warning("ollama_stream_json_error", line=line[:100])
+                    continue
 
     async def generate_stream(
         self,
@@ -1344,8 +1531,6 @@ class LLMRouter:
             timeout: Request timeout
             mlx_options: Additional MLX options (max_kv_size, quantization, etc.)
         """
-        client = httpx.AsyncClient(base_url=endpoint_url, timeout=timeout)
-
         # Build request payload
         payload = {
             "model": model,
@@ -1365,26 +1550,22 @@ class LLMRouter:
                 options=list(mlx_options.keys())
             )
 
-        try:
-            # MLX server uses OpenAI-compatible API
-            response = await client.post("/v1/completions", json=payload)
-
-            response.raise_for_status()
-            data = response.json()
+        # MLX server uses OpenAI-compatible API
+        response = await self._pool.post(f"{endpoint_url.rstrip('/')}/v1/completions", json=payload, timeout=timeout)
 
-            choice = data["choices"][0]
+        response.raise_for_status()
+        data = response.json()
 
-            return {
-                "response": choice["text"],
-                "backend": "mlx",
-                "model": model,
-                "done": True,
-                "total_duration": None,  # MLX doesn't provide this
-                "eval_count": data.get("usage", {}).get("completion_tokens")
-            }
+        choice = data["choices"][0]
 
-        finally:
-            await client.aclose()
+        return {
+            "response": choice["text"],
+            "backend": "mlx",
+            "model": model,
+            "done": True,
+            "total_duration": None,  # MLX doesn't provide this
+            "eval_count": data.get("usage", {}).get("completion_tokens")
+        }
 
     # =========================================================================
     # Cloud Provider Methods - Open Source Compatible
@@ -1853,14 +2034,13 @@ class LLMRouter:
                 "fallback_reason": fallback_reason
             }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, timeout=5.0)
-                if response.status_code not in (200, 201):
-                    logger.warning(
-                        "failed_to_track_cloud_usage",
-                        status=response.status_code,
-                        error=response.text[:100]
-                    )
+            response = await self._pool.post(url, json=payload, timeout=5.0)
+            if response.status_code not in (200, 201):
+                logger.warning(
+                    "failed_to_track_cloud_usage",
+                    status=response.status_code,
+                    error=response.text[:100]
+                )
         except Exception as e:
             logger.error("cloud_usage_tracking_error", error=str(e))
 
@@ -2183,9 +2363,12 @@ class LLMRouter:
             # OpenAI format - already normalized
             return response
 
-    async def _persist_metric(self, metric: Dict[str, Any], source: Optional[str] = None, stage: Optional[str] = None):
+    def _persist_metric(self, metric: Dict[str, Any], source: Optional[str] = None, stage: Optional[str] = None):
         """
-        Persist metric to database via Admin API.
+        Queue metric for persistence to the database via Admin API.
+
+        Metrics are shipped in batches by a background task; this only adds
+        the row to a bounded in-memory queue.
 
         Args:
             metric: Metric data to persist
@@ -2193,30 +2376,19 @@ class LLMRouter:
             stage: Optional pipeline stage (classify, summarize, tool_selection, validation, synthesize, etc.)
 
         Note:
-            Failures are logged but don't raise exceptions to avoid
-            impacting LLM request processing.
+            Failures (including a full queue) are counted in
+            report_metrics()["metric_shipping"] and never raise.
         """
         if not self._persist_metrics:
             return
 
-        try:
-            # Add source and stage to metric payload if provided
-            if source:
-                metric["source"] = source
-            if stage:
-                metric["stage"] = stage
-
-            url = f"{self._admin_url_base}/api/llm-backends/metrics"
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=metric, timeout=5.0)
-                if response.status_code != 201:
-                    logger.warning(
-                        "failed_to_persist_metric",
-                        status_code=response.status_code,
-                        error=response.text
-                    )
-        except Exception as e:
-            logger.error("metric_persistence_error", error=str(e))
+        # Add source and stage to metric payload if provided
+        if source:
+            metric["source"] = source
+        if stage:
+            metric["stage"] = stage
+
+        self._metric_batcher.submit(metric)
 
     def report_metrics(self) -> Dict[str, Any]:
         """
@@ -2229,6 +2401,10 @@ class LLMRouter:
             - total_requests: Number of requests tracked
             - by_model: Per-model breakdown
             - by_backend: Per-backend breakdown
+            - connection_pool: Per-endpoint HTTP connection pool state
+            - metric_shipping: Batched metric persistence counters
+            - latency_quantiles: p50/p95/p99 per stage and model from the
+              process-wide latency sketches (see shared.metrics)
         """
         if not self._metrics:
             return {
@@ -2236,7 +2412,10 @@ class LLMRouter:
                 "avg_latency_seconds": 0.0,
                 "avg_tokens_per_second": 0.0,
                 "by_model": {},
-                "by_backend": {}
+                "by_backend": {},
+                "connection_pool": self._pool.stats(),
+                "metric_shipping": self._metric_batcher.stats(),
+                "latency_quantiles": LATENCY_SKETCHES.snapshot("llm.", include_sketches=False)
             }
 
         # Overall metrics
@@ -2314,12 +2493,17 @@ class LLMRouter:
             "avg_tokens_per_second": round(avg_tokens_per_sec, 2),
             "by_model": by_model,
             "by_backend": by_backend,
-            "window_size": self._metrics_window_size
+            "window_size": self._metrics_window_size,
+            "connection_pool": self._pool.stats(),
+            "metric_shipping": self._metric_batcher.stats(),
+            "latency_quantiles": LATENCY_SKETCHES.snapshot("llm.", include_sketches=False)
         }
 
     async def close(self):
-        """Close HTTP client."""
+        """Flush queued metrics and close HTTP clients."""
+        await self._metric_batcher.close()
         await self.client.aclose()
+        await self._pool.aclose()
 
 
 # Singleton instance
@@ -0,0 +1,199 @@
+"""
+Batched Metric Shipping
+
+Queues metric rows in memory and posts them to an admin bulk ingest endpoint
+from a background task, so recording a metric on the request path is a
+non-blocking queue put instead of an HTTP round-trip.
+
+- A batch is sent when ``max_batch`` rows are queued or ``flush_interval``
+  seconds after the first queued row, whichever comes first.
+- The queue is bounded; rows submitted while it is full are dropped and
+  counted rather than applying backpressure to requests.
+- Against an admin backend without the bulk endpoint (404), rows are posted
+  one by one to the single-row endpoint.
+
+Usage:
+    batcher = MetricBatcher(f"{admin_url}/api/llm-backends/metrics/batch")
+    batcher.submit({"model": "qwen3:4b", ...})
+    ...
+    await batcher.close()  # flushes what is queued
+"""
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+
+class MetricBatcher:
+    """Background batcher for metric rows."""
+
+    def __init__(
+        self,
+        batch_url: str,
+        single_url: Optional[str] = None,
+        client: Optional[Any] = None,
+        max_batch: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_queue: Optional[int] = None,
+        timeout: float = 5.0
+    ):
+        """
+        Initialize the batcher. Unset limits are read from the environment.
+
+        Args:
+            batch_url: Bulk ingest endpoint taking {"metrics": [...]}
+            single_url: Single-row endpoint used if the bulk one is missing
+                (defaults to batch_url without its trailing /batch)
+            client: httpx.AsyncClient (or anything with a compatible async
+                post(), such as the LLM router's BackendClientPool) to send
+                with; defaults to a new client closed by close()
+            max_batch: Rows per request (METRIC_BATCH_SIZE, default 100)
+            flush_interval: Max seconds a row waits before sending (METRIC_FLUSH_INTERVAL, default 1.0)
+            max_queue: Queued rows before new ones are dropped (METRIC_QUEUE_SIZE, default 10000)
+            timeout: Request timeout in seconds
+        """
+        self.batch_url = batch_url
+        self.single_url = single_url or batch_url.rsplit("/batch", 1)[0]
+        self.client = client or httpx.AsyncClient(timeout=timeout)
+        self._owns_client = client is None
+        self.max_batch = max_batch or int(os.getenv("METRIC_BATCH_SIZE", "100"))
+        self.flush_interval = flush_interval if flush_interval is not None else float(os.getenv("METRIC_FLUSH_INTERVAL", "1.0"))
+        self.max_queue = max_queue or int(os.getenv("METRIC_QUEUE_SIZE", "10000"))
+        self.timeout = timeout
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._pending: List[Dict[str, Any]] = []
+        self._sending: Optional[asyncio.Future] = None
+        self._bulk_supported = True
+        self._closed = False
+
+        self._submitted = 0
+        self._sent = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_flush_at = 0.0
+        self._last_error: Optional[str] = None
+
+    def submit(self, metric: Dict[str, Any]) -> bool:
+        """
+        Queue a metric row without blocking.
+
+        Must be called from a running event loop (the sender task is started
+        on first use).
+
+        Returns:
+            False if the row was dropped because the queue is full or closed
+        """
+        if self._closed:
+            self._dropped += 1
+            return False
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+        try:
+            self._queue.put_nowait(metric)
+        except asyncio.QueueFull:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 1000 == 0:
+                logger.warning("metric_queue_full", dropped=self._dropped, max_queue=self.max_queue)
+            return False
+        self._submitted += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return True
+
+    async def _run(self):
+        while True:
+            self._pending.append(await self._queue.get())
+            deadline = time.monotonic() + self.flush_interval
+            while len(self._pending) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    self._pending.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            batch, self._pending = self._pending, []
+            # Shielded so close() lets an in-flight batch finish instead of
+            # losing it
+            self._sending = asyncio.ensure_future(self._send(batch))
+            await asyncio.shield(self._sending)
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        rows, self._pending = self._pending, []
+        while self._queue is not None and not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        return rows
+
+    async def flush(self):
+        """Send everything currently queued."""
+        rows = self._drain()
+        for i in range(0, len(rows), self.max_batch):
+            await self._send(rows[i:i + self.max_batch])
+
+    async def _send(self, batch: List[Dict[str, Any]]):
+        try:
+            if self._bulk_supported:
+                response = await self.client.post(self.batch_url, json={"metrics": batch}, timeout=self.timeout)
+                if response.status_code == 404:
+                    self._bulk_supported = False
+                    logger.info("metric_bulk_endpoint_unavailable", url=self.batch_url)
+            if not self._bulk_supported:
+                response = None
+                for row in batch:
+                    response = await self.client.post(self.single_url, json=row, timeout=self.timeout)
+                    if response.status_code not in (200, 201):
+                        break
+            if response.status_code not in (200, 201):
+                raise httpx.HTTPStatusError(
+                    f"metric ingest returned {response.status_code}: {response.text[:200]}",
+                    request=response.request,
+                    response=response
+                )
+            self._sent += len(batch)
+            self._batches += 1
+            self._last_flush_at = time.time()
+        except Exception as e:
+            self._failed += len(batch)
+            self._last_error = str(e)
+            logger.warning("metric_batch_failed", rows=len(batch), error=str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        """Shipping counters for metrics endpoints."""
+        return {
+            "queued": (self._queue.qsize() if self._queue is not None else 0) + len(self._pending),
+            "submitted": self._submitted,
+            "sent": self._sent,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "batches": self._batches,
+            "bulk_endpoint": self._bulk_supported,
+            "max_batch": self.max_batch,
+            "flush_interval": self.flush_interval,
+            "max_queue": self.max_queue,
+            "last_flush_at": self._last_flush_at or None,
+            "last_error": self._last_error,
+        }
+
+    async def close(self):
+        """Stop the sender and flush queued rows."""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._sending is not None:
+            await self._sending
+        await self.flush()
+        if self._owns_client:
+            await self.client.aclose()
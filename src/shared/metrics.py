@@ -19,9 +19,19 @@ Usage:
         latency_seconds=0.5,
         guest_mode=False,
     )
+
+Latency quantiles (mergeable across replicas):
+    from shared.metrics import record_latency, setup_quantiles_endpoint
+
+    record_latency("llm.classify", 412.0, model="qwen2.5:3b")
+    setup_quantiles_endpoint(app, "orchestrator")  # GET /metrics/quantiles
 """
+import math
+import os
+import socket
+import threading
 import time
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from contextlib import contextmanager
 import structlog
 
@@ -152,6 +162,8 @@ else:
             pass
         def set(self, *args, **kwargs):
             pass
+        def remove(self, *args, **kwargs):
+            pass
 
     TOOL_EXECUTION_COUNT = StubMetric()
     TOOL_EXECUTION_LATENCY = StubMetric()
@@ -323,6 +335,9 @@ def record_timing_metrics(timing_data: dict):
             stage_name = key[:-3]
             POST_GRAPH_DURATION.labels(stage=stage_name).observe(value / 1000.0)
 
+    # Stage quantile sketches (LLM calls are recorded by LLMRouter)
+    _record_timing_sketches(timing_data)
+
     # Record LLM call timings
     llm_calls = timing_data.get("llm_calls", [])
     for call in llm_calls:
@@ -451,7 +466,28 @@ if PROMETHEUS_AVAILABLE:
     CACHE_OPERATIONS_TOTAL = Counter(
         'athena_cache_operations_total',
         'Total cache operations',
-        ['service', 'operation', 'result']
+        ['service', 'operation', 'result', 'tier']
+    )
+
+    # @cached lookups by freshness: "miss" is the only state where the
+    # caller waited on upstream
+    CACHE_LOOKUPS_TOTAL = Counter(
+        'athena_cache_lookups_total',
+        'Cached function lookups by entry state (fresh, stale, miss)',
+        ['service', 'cache', 'state']
+    )
+
+    CACHE_REFRESH_TOTAL = Counter(
+        'athena_cache_refresh_total',
+        'Background cache refreshes',
+        ['service', 'cache', 'trigger', 'status']
+    )
+
+    CACHE_REFRESH_DURATION = Histogram(
+        'athena_cache_refresh_duration_seconds',
+        'Background cache refresh duration in seconds',
+        ['service', 'cache', 'trigger'],
+        buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
     )
 
     # Service info
@@ -468,9 +504,61 @@ else:
     EXTERNAL_API_DURATION = StubMetric()
     EXTERNAL_API_CALLS_TOTAL = StubMetric()
     CACHE_OPERATIONS_TOTAL = StubMetric()
+    CACHE_LOOKUPS_TOTAL = StubMetric()
+    CACHE_REFRESH_TOTAL = StubMetric()
+    CACHE_REFRESH_DURATION = StubMetric()
     SERVICE_INFO = StubMetric()
 
 
+# =============================================================================
+# Voice Gateway Metrics
+# =============================================================================
+# Defined here rather than in gateway/main.py: the gateway runs as the
+# top-level module ``main`` (uvicorn main:app), so importing ``gateway.main``
+# from gateway modules would execute it again and re-register its metrics.
+
+if PROMETHEUS_AVAILABLE:
+    VOICE_TIME_TO_FIRST_AUDIO = Histogram(
+        'athena_voice_time_to_first_audio_seconds',
+        'Time from transcript to first response audio played (mode: streaming or full)',
+        ['interface', 'mode'],
+        buckets=[0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0]
+    )
+
+    # Wake word inference worker (gateway.wake_word_worker); stream = room/session
+    WAKE_WORD_QUEUE_DEPTH = Gauge(
+        'athena_wake_word_queue_depth',
+        'Audio chunks waiting for wake word inference',
+        ['stream']
+    )
+
+    WAKE_WORD_LATENCY = Histogram(
+        'athena_wake_word_latency_seconds',
+        'Time from chunk submit to wake word scores',
+        ['stream'],
+        buckets=[0.005, 0.01, 0.02, 0.04, 0.08, 0.16, 0.32, 0.64]
+    )
+
+    WAKE_WORD_INFERENCE_DURATION = Histogram(
+        'athena_wake_word_inference_seconds',
+        'Wake word model time per batch',
+        buckets=[0.001, 0.0025, 0.005, 0.01, 0.02, 0.04, 0.08, 0.16]
+    )
+
+    WAKE_WORD_BATCH_SIZE = Histogram(
+        'athena_wake_word_batch_size',
+        'Streams scored per wake word batch',
+        buckets=[1, 2, 4, 8, 16, 32, 64]
+    )
+
+else:
+    VOICE_TIME_TO_FIRST_AUDIO = StubMetric()
+    WAKE_WORD_QUEUE_DEPTH = StubMetric()
+    WAKE_WORD_LATENCY = StubMetric()
+    WAKE_WORD_INFERENCE_DURATION = StubMetric()
+    WAKE_WORD_BATCH_SIZE = StubMetric()
+
+
 # =============================================================================
 # Service Metrics Helper Functions
 # =============================================================================
@@ -552,7 +640,7 @@ def record_external_api_call(
     )
 
 
-def record_cache_operation(service: str, operation: str, hit: bool):
+def record_cache_operation(service: str, operation: str, hit: bool, tier: str = "redis"):
     """
     Record a cache operation.
 
@@ -560,15 +648,64 @@ def record_cache_operation(service: str, operation: str, hit: bool):
         service: Service name
         operation: Cache operation (get, set, delete)
         hit: Whether it was a cache hit
+        tier: Cache tier that served the lookup ("l1" in-process or "redis")
     """
     result = "hit" if hit else "miss"
     CACHE_OPERATIONS_TOTAL.labels(
         service=service,
         operation=operation,
-        result=result
+        result=result,
+        tier=tier
     ).inc()
 
 
+def record_cache_lookup(service: str, cache: str, state: str):
+    """
+    Record a cached function lookup.
+
+    Args:
+        service: Service name
+        cache: Cached function ("{key_prefix}:{function}")
+        state: "fresh", "stale" (served while refreshing) or "miss" (waited on upstream)
+    """
+    CACHE_LOOKUPS_TOTAL.labels(
+        service=service,
+        cache=cache,
+        state=state
+    ).inc()
+
+
+def record_cache_refresh(
+    service: str,
+    cache: str,
+    trigger: str,
+    status: str,
+    duration_seconds: Optional[float] = None
+):
+    """
+    Record a background cache refresh.
+
+    Args:
+        service: Service name
+        cache: Cached function ("{key_prefix}:{function}")
+        trigger: "stale" (served past soft TTL) or "prewarm" (scheduled)
+        status: "success", "error" or "skipped" (another replica holds the refresh)
+        duration_seconds: Refresh duration, if it ran
+    """
+    CACHE_REFRESH_TOTAL.labels(
+        service=service,
+        cache=cache,
+        trigger=trigger,
+        status=status
+    ).inc()
+    if duration_seconds is not None:
+        CACHE_REFRESH_DURATION.labels(
+            service=service,
+            cache=cache,
+            trigger=trigger
+        ).observe(duration_seconds)
+
+
 def register_service(service: str, version: str = "1.0.0", port: int = 0):
     """
     Register a service in metrics.
@@ -666,6 +803,247 @@ def timed_external_api(service: str, api_name: str):
     return decorator
 
 
+# =============================================================================
+# Latency Quantile Sketches (mergeable across replicas)
+# =============================================================================
+
+class LatencySketch:
+    """
+    DDSketch-style latency sketch with bounded relative error.
+
+    Values are counted in log-scale bins: bin i holds (gamma^(i-1), gamma^i]
+    with gamma = (1 + relative_accuracy) / (1 - relative_accuracy), so any
+    quantile is reported within ``relative_accuracy`` of a true sample.
+    Sketches with the same accuracy merge exactly by adding bin counts,
+    which is what lets the admin backend combine replicas. The binning
+    matches the admin analytics rollups (app.utils.latency_rollups).
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_bins = max_bins
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float, count: int = 1):
+        """Add ``count`` observations of ``value`` (ms; values <= 0 count as zero)."""
+        if value > 0:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[index] = self.bins.get(index, 0) + count
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        else:
+            value = 0.0
+            self.zero_count += count
+        self.count += count
+        self.sum += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def _collapse(self):
+        # Fold the lowest bins together; only the smallest quantiles lose accuracy
+        indexes = sorted(self.bins)
+        excess = len(indexes) - self.max_bins + 1
+        folded = sum(self.bins.pop(i) for i in indexes[:excess])
+        target = indexes[excess]
+        self.bins[target] = self.bins.get(target, 0) + folded
+
+    def merge(self, other: "LatencySketch"):
+        """Add another sketch's observations into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                f"cannot merge sketches with relative accuracy {other.relative_accuracy} "
+                f"into {self.relative_accuracy}"
+            )
+        for index, n in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + n
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        for field, pick in (("min", min), ("max", max)):
+            value = getattr(other, field)
+            if value is not None:
+                current = getattr(self, field)
+                setattr(self, field, value if current is None else pick(current, value))
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at quantile ``q`` (0..1), or None if the sketch is empty."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen > rank:
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form (bin indexes as strings)."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "zero_count": self.zero_count,
+            "bins": {str(index): n for index, n in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencySketch":
+        sketch = cls(relative_accuracy=data.get("relative_accuracy", 0.01))
+        sketch.bins = {int(index): n for index, n in data.get("bins", {}).items()}
+        sketch.zero_count = data.get("zero_count", 0)
+        sketch.count = data.get("count", 0)
+        sketch.sum = data.get("sum", 0.0)
+        sketch.min = data.get("min")
+        sketch.max = data.get("max")
+        return sketch
+
+
+class LatencySketchRegistry:
+    """
+    Per-(stage, model) latency sketches over a sliding window.
+
+    Observations go into the sketch for the current interval; the last
+    ``intervals`` intervals are kept and merged on read, so quantiles cover
+    roughly ``interval_seconds * intervals`` seconds without storing samples.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: Optional[float] = None,
+        intervals: Optional[int] = None,
+        relative_accuracy: float = 0.01
+    ):
+        self.interval_seconds = interval_seconds or float(os.getenv("LATENCY_SKETCH_INTERVAL_SECONDS", "60"))
+        self.intervals = intervals or int(os.getenv("LATENCY_SKETCH_INTERVALS", "15"))
+        self.relative_accuracy = relative_accuracy
+        # interval number -> {(stage, model): sketch}
+        self._windows: Dict[int, Dict[Tuple[str, str], LatencySketch]] = {}
+        self._lock = threading.Lock()
+
+    def _interval(self, now: Optional[float] = None) -> int:
+        return int((now if now is not None else time.time()) // self.interval_seconds)
+
+    def record(self, stage: str, latency_ms: float, model: Optional[str] = None, now: Optional[float] = None):
+        """Record one latency observation for ``stage`` (and ``model``, if any)."""
+        interval = self._interval(now)
+        key = (stage, model or "-")
+        with self._lock:
+            window = self._windows.get(interval)
+            if window is None:
+                window = self._windows[interval] = {}
+                for old in [i for i in self._windows if i <= interval - self.intervals]:
+                    del self._windows[old]
+            sketch = window.get(key)
+            if sketch is None:
+                sketch = window[key] = LatencySketch(self.relative_accuracy)
+            sketch.add(latency_ms)
+
+    def merged(self, stage_prefix: Optional[str] = None, now: Optional[float] = None) -> Dict[Tuple[str, str], LatencySketch]:
+        """Sketches merged over the window, keyed by (stage, model)."""
+        oldest = self._interval(now) - self.intervals + 1
+        merged: Dict[Tuple[str, str], LatencySketch] = {}
+        with self._lock:
+            for interval, window in self._windows.items():
+                if interval < oldest:
+                    continue
+                for key, sketch in window.items():
+                    if stage_prefix and not key[0].startswith(stage_prefix):
+                        continue
+                    if key not in merged:
+                        merged[key] = LatencySketch(self.relative_accuracy)
+                    merged[key].merge(sketch)
+        return merged
+
+    def snapshot(self, stage_prefix: Optional[str] = None, include_sketches: bool = True) -> Dict[str, Any]:
+        """
+        Quantile summary for the window.
+
+        Returns:
+            Dict with window_seconds, relative_accuracy and a ``sketches``
+            list of {stage, model, count, avg_ms, p50_ms, p95_ms, p99_ms,
+            max_ms, sketch}. ``sketch`` (LatencySketch.to_dict()) is what
+            other processes merge.
+        """
+        entries = []
+        for (stage, model), sketch in sorted(self.merged(stage_prefix).items()):
+            entry = {
+                "stage": stage,
+                "model": model,
+                "count": sketch.count,
+                "avg_ms": round(sketch.sum / sketch.count, 1) if sketch.count else None,
+                "p50_ms": _round_ms(sketch.quantile(0.5)),
+                "p95_ms": _round_ms(sketch.quantile(0.95)),
+                "p99_ms": _round_ms(sketch.quantile(0.99)),
+                "max_ms": _round_ms(sketch.max),
+            }
+            if include_sketches:
+                entry["sketch"] = sketch.to_dict()
+            entries.append(entry)
+        return {
+            "window_seconds": self.interval_seconds * self.intervals,
+            "relative_accuracy": self.relative_accuracy,
+            "sketches": entries,
+        }
+
+
+def _round_ms(value: Optional[float]) -> Optional[float]:
+    return round(value, 1) if value is not None else None
+
+
+LATENCY_SKETCHES = LatencySketchRegistry()
+
+
+def record_latency(stage: str, latency_ms: float, model: Optional[str] = None):
+    """Record a stage latency (ms) in the process-wide quantile sketches."""
+    LATENCY_SKETCHES.record(stage, latency_ms, model)
+
+
+def _record_timing_sketches(timing_data: dict):
+    """Record TimingTracker.finalize() stage timings in the quantile sketches."""
+    if isinstance(timing_data.get("total_ms"), (int, float)):
+        record_latency("request", timing_data["total_ms"])
+    for category in ("pre_graph", "graph", "post_graph"):
+        for key, value in timing_data.get(category, {}).items():
+            if key == "total_ms":
+                continue
+            if isinstance(value, dict):
+                # Nested graph node: record the node total
+                if isinstance(value.get("total_ms"), (int, float)):
+                    record_latency(f"{category}.{key}", value["total_ms"])
+            elif key.endswith("_ms") and isinstance(value, (int, float)):
+                record_latency(f"{category}.{key[:-3]}", value)
+
+
+def setup_quantiles_endpoint(app, service_name: str):
+    """
+    Add GET /metrics/quantiles serving this process's latency sketches.
+
+    The admin backend merges the sketches from every replica.
+    """
+    instance = socket.gethostname()
+
+    @app.get("/metrics/quantiles", include_in_schema=False)
+    async def quantiles_endpoint(stage_prefix: Optional[str] = None, include_sketches: bool = True):
+        snapshot = LATENCY_SKETCHES.snapshot(stage_prefix, include_sketches)
+        snapshot["service"] = service_name
+        snapshot["instance"] = instance
+        return snapshot
+
+
 # =============================================================================
 # FastAPI Integration
 # =============================================================================
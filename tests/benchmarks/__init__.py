@@ -0,0 +1 @@
+"""Micro-benchmarks for Project Athena hot paths (run directly, not via pytest)."""
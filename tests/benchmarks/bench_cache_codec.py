@@ -0,0 +1,84 @@
+"""
+Benchmark for the Redis value codec.
+
+Compares stored size and encode/decode time of the legacy ``json.dumps`` /
+``json.loads`` path against each CacheCodec configuration, over the
+representative payloads in tests/fixtures/cache_payloads.json.
+
+Usage:
+    python tests/benchmarks/bench_cache_codec.py
+"""
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from shared.cache import (  # noqa: E402
+    MSGPACK_AVAILABLE,
+    ORJSON_AVAILABLE,
+    ZSTD_AVAILABLE,
+    CacheCodec,
+)
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "fixtures", "cache_payloads.json")
+
+
+def _time_us(func, arg, rounds: int = 7, number: int = 200):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(arg)
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return statistics.median(samples)
+
+
+def _configs():
+    configs = [("legacy json", CacheCodec("legacy"))]
+    configs.append(("json" + (" (orjson)" if ORJSON_AVAILABLE else ""), CacheCodec("json", compress_min_bytes=0)))
+    if MSGPACK_AVAILABLE:
+        configs.append(("msgpack", CacheCodec("msgpack", compress_min_bytes=0)))
+    compression = "zstd" if ZSTD_AVAILABLE else "zlib"
+    configs.append((f"json + {compression} >=4K", CacheCodec("json", compress_min_bytes=4096)))
+    if MSGPACK_AVAILABLE:
+        configs.append((f"msgpack + {compression} >=4K", CacheCodec("msgpack", compress_min_bytes=4096)))
+    return configs
+
+
+def main():
+    with open(FIXTURE) as f:
+        payloads = {k: v for k, v in json.load(f).items() if not k.startswith("_")}
+
+    print(f"orjson={ORJSON_AVAILABLE} msgpack={MSGPACK_AVAILABLE} zstd={ZSTD_AVAILABLE}")
+    print(f"{'payload':<22}{'codec':<24}{'bytes':>9}{'ratio':>7}{'enc us':>9}{'dec us':>9}")
+    totals = {}
+    for name, value in payloads.items():
+        baseline = None
+        for label, codec in _configs():
+            encoded = codec.encode(value)
+            assert CacheCodec.decode(encoded) == json.loads(json.dumps(value))
+            size = len(encoded)
+            baseline = baseline or size
+            enc = _time_us(codec.encode, value)
+            dec = _time_us(CacheCodec.decode, encoded)
+            total = totals.setdefault(label, [0, 0.0, 0.0])
+            total[0] += size
+            total[1] += enc
+            total[2] += dec
+            print(f"{name:<22}{label:<24}{size:>9}{size / baseline:>7.2f}{enc:>9.1f}{dec:>9.1f}")
+        print()
+
+    base_size, base_enc, base_dec = totals["legacy json"]
+    print("all payloads")
+    for label, (size, enc, dec) in totals.items():
+        print(
+            f"  {label:<24}{size:>9} bytes ({size / base_size:.2f}x)  "
+            f"encode {enc:8.1f}us ({enc / base_enc:.2f}x)  decode {dec:8.1f}us ({dec / base_dec:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
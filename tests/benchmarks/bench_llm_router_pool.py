@@ -0,0 +1,105 @@
+"""
+Benchmark for the LLMRouter backend connection pool.
+
+Measures per-call HTTP overhead against a local stub Ollama server (which
+answers instantly, so the timing is pure client + connection cost) for the
+old pattern - a new httpx.AsyncClient per generation - and for
+LLMRouter._generate_ollama on the pooled client.
+
+Usage:
+    python tests/benchmarks/bench_llm_router_pool.py [calls]
+"""
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import structlog
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from shared.llm_router import BackendClientPool, LLMRouter  # noqa: E402
+
+BODY = json.dumps({"response": "Hello", "done": True, "eval_count": 1}).encode()
+
+
+class StubOllama(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def _payload():
+    return {"model": "qwen3:4b", "prompt": "hi", "stream": False, "options": {"temperature": 0.1, "num_predict": 10}}
+
+
+async def per_call_client(url: str):
+    client = httpx.AsyncClient(base_url=url, timeout=30)
+    try:
+        response = await client.post("/api/generate", json=_payload())
+        response.raise_for_status()
+        return response.json()
+    finally:
+        await client.aclose()
+
+
+async def _measure(call, n: int):
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "p50": statistics.median(samples),
+        "p99": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        "mean": statistics.fmean(samples),
+    }
+
+
+async def main(n: int):
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubOllama)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    router = LLMRouter(admin_url=url, persist_metrics=False, pool=BackendClientPool())
+    try:
+        results = {}
+        for label, call in [
+            ("per-call AsyncClient", lambda: per_call_client(url)),
+            ("pooled client", lambda: router._generate_ollama(url, "qwen3:4b", "hi", 0.1, 10, timeout=30)),
+        ]:
+            await _measure(call, 20)  # warm up
+            results[label] = await _measure(call, n)
+
+        print(f"{n} sequential calls against {url}")
+        print(f"{'client':<24}{'p50 ms':>9}{'p99 ms':>9}{'mean ms':>9}")
+        for label, r in results.items():
+            print(f"{label:<24}{r['p50']:>9.3f}{r['p99']:>9.3f}{r['mean']:>9.3f}")
+        base, pooled = results["per-call AsyncClient"], results["pooled client"]
+        print(f"\npooled speedup: p50 {base['p50'] / pooled['p50']:.1f}x, p99 {base['p99'] / pooled['p99']:.1f}x")
+        print("pool:", json.dumps(router.report_metrics()["connection_pool"]["endpoints"], indent=2))
+    finally:
+        await router.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
@@ -0,0 +1,72 @@
+"""
+Micro-benchmark for semantic cache rule checks.
+
+Compares the compiled UncacheableRuleSet against the original linear
+``re.search`` loop over UNCACHEABLE_PATTERNS (target: < 50us per check),
+and times uncached SemanticIntentTable classification.
+
+Usage:
+    python tests/benchmarks/bench_semantic_cache.py
+"""
+import os
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from orchestrator.semantic_cache import (  # noqa: E402
+    SEMANTIC_INTENT_CATEGORIES,
+    UNCACHEABLE_PATTERNS,
+    SemanticIntentTable,
+    UncacheableRuleSet,
+)
+from tests.benchmarks.queries import build_corpus  # noqa: E402
+
+
+def _linear_match(query_lower: str):
+    for pattern in UNCACHEABLE_PATTERNS:
+        if re.search(pattern, query_lower):
+            return pattern
+    return None
+
+
+def _time_per_call(func, corpus, rounds: int = 5):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for query in corpus:
+            func(query)
+        samples.append((time.perf_counter() - start) / len(corpus) * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    corpus = [q.lower() for q in build_corpus()]
+    rules = UncacheableRuleSet(UNCACHEABLE_PATTERNS)
+
+    mismatches = [
+        q for q in corpus
+        if _linear_match(q) != (rules.match(q).pattern if rules.match(q) else None)
+    ]
+
+    linear_us = _time_per_call(_linear_match, corpus)
+    compiled_us = _time_per_call(rules.match, corpus)
+    uncacheable = sum(1 for q in corpus if rules.match(q))
+    intent_us = _time_per_call(SemanticIntentTable(SEMANTIC_INTENT_CATEGORIES).extract, corpus)
+
+    print(f"queries:            {len(corpus)} ({uncacheable} uncacheable)")
+    print(f"rules:              {len(rules.patterns)} "
+          f"({rules.indexed_count} indexed, {rules.fallback_count} fallback)")
+    print(f"linear re.search:   {linear_us:8.1f} us/query")
+    print(f"UncacheableRuleSet: {compiled_us:8.1f} us/query")
+    print(f"speedup:            {linear_us / compiled_us:8.1f}x")
+    print(f"mismatches:         {len(mismatches)}")
+    print(f"intent extraction:  {intent_us:8.1f} us/query")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Micro-benchmark for SentenceBuffer boundary detection.
+
+Streams one long first sentence (the worst case for time-to-first-audio)
+token by token and reports the mean per-token cost at several sentence
+lengths, for the incremental scanner and for the original full-rescan
+loop. The incremental cost should stay flat as the sentence grows.
+
+Usage:
+    python tests/benchmarks/bench_sentence_buffer.py
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+
+import structlog
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from orchestrator.sentence_buffer import SentenceBuffer  # noqa: E402
+
+WORDS = "the forecast for tomorrow calls for Dr. Smith and 3.14 inches of rain in the U.S. east".split()
+
+
+class RescanSentenceBuffer(SentenceBuffer):
+    """The original boundary check: rescan the whole buffer on every token."""
+
+    def _find_sentence_boundary(self):
+        for i, char in enumerate(self.buffer):
+            if char in '.!?':
+                pos = i + 1
+                if pos < self.min_length:
+                    continue
+                if pos < len(self.buffer) and self.buffer[pos] in '"\'"':
+                    pos += 1
+                if pos >= len(self.buffer) or self.buffer[pos].isspace():
+                    return pos
+        return None
+
+
+def _tokens(chars: int):
+    tokens, size, i = [], 0, 0
+    while size < chars:
+        token = " " + WORDS[i % len(WORDS)]
+        tokens.append({"token": token})
+        size += len(token)
+        i += 1
+    tokens.append({"token": ".", "done": True})
+    return tokens
+
+
+async def _run(buffer_cls, tokens) -> float:
+    async def stream():
+        for token in tokens:
+            yield token
+
+    # Large min_length keeps the whole stream in one sentence, like a long
+    # first sentence; max_buffer is raised so it is never force-split
+    buffer = buffer_cls(min_length=10 ** 9, max_buffer=10 ** 9)
+    start = time.perf_counter()
+    async for _ in buffer.process(stream()):
+        pass
+    return (time.perf_counter() - start) / len(tokens) * 1e6
+
+
+def main():
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    print(f"{'sentence chars':>15}{'tokens':>8}{'incremental us/token':>23}{'rescan us/token':>18}")
+    for chars in (100, 500, 2000, 8000):
+        tokens = _tokens(chars)
+        incremental = min(asyncio.run(_run(SentenceBuffer, tokens)) for _ in range(5))
+        rescan = min(asyncio.run(_run(RescanSentenceBuffer, tokens)) for _ in range(5))
+        print(f"{chars:>15}{len(tokens):>8}{incremental:>23.2f}{rescan:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
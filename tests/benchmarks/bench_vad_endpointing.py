@@ -0,0 +1,167 @@
+"""
+Endpointing benchmark: adaptive VAD vs the old fixed RMS thresholds.
+
+Runs every detector over each fixture and reports when speech start and
+end-of-turn were detected relative to the labelled speech, for a given
+trailing-silence timeout:
+
+    start ms  detection delay after speech began (- = false start in noise)
+    end ms    endpoint delay after speech ended (ideal: the timeout;
+              "cut" = ended mid-utterance, "never" = no endpoint)
+
+Fixtures are 16 kHz mono 16-bit WAV recordings, each with a JSON label
+file of the same name: {"speech_start_ms": 1500, "speech_end_ms": 2900}.
+Without a fixture directory, synthetic rooms (quiet, normal, fan, HVAC)
+are generated with a deterministic seed.
+
+Usage:
+    python tests/benchmarks/bench_vad_endpointing.py [timeout_ms] [fixture_dir]
+"""
+import glob
+import json
+import logging
+import os
+import sys
+import time
+import wave
+
+import numpy as np
+import structlog
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from gateway.vad import WEBRTCVAD_AVAILABLE, VoiceActivityDetector, create_classifier  # noqa: E402
+
+SAMPLE_RATE = 16000
+FRAME_MS = 20
+
+# (name, noise kind, noise dBFS, speech dBFS)
+SYNTHETIC_ROOMS = [
+    ("quiet, soft voice", "white", -65, -42),
+    ("normal room", "white", -55, -28),
+    ("fan", "white", -32, -20),
+    ("HVAC rumble", "pink", -40, -26),
+]
+
+
+class FixedThreshold:
+    """The old gateway VADs: speech when frame RMS exceeds a constant."""
+
+    def __init__(self, rms):
+        self.rms = rms
+        self.in_speech = False
+        self.heard_speech = False
+        self.silence_ms = 0.0
+
+    def process(self, samples):
+        x = samples.astype(np.float32)
+        self.in_speech = float(np.sqrt(np.mean(x ** 2))) > self.rms
+        if self.in_speech:
+            self.heard_speech = True
+            self.silence_ms = 0.0
+        else:
+            self.silence_ms += len(samples) * 1000 / SAMPLE_RATE
+
+    def endpoint(self, silence_timeout_ms):
+        return self.heard_speech and self.silence_ms >= silence_timeout_ms
+
+
+def detectors():
+    yield "fixed rms 2000 (livekit)", lambda: FixedThreshold(2000)
+    yield "fixed rms 655 (wyoming)", lambda: FixedThreshold(0.02 * 32768)
+    yield "fixed rms 500 (processor)", lambda: FixedThreshold(500)
+    yield "adaptive energy+spectral", lambda: VoiceActivityDetector(classifier=create_classifier("energy"))
+    if WEBRTCVAD_AVAILABLE:
+        yield "adaptive webrtc", lambda: VoiceActivityDetector(classifier=create_classifier("webrtc"))
+
+
+def _speech(seconds, level_db, rng):
+    """Voiced, syllable-modulated harmonic signal with a short pause mid-way."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    f0 = 120 + 40 * rng.random() + 20 * np.sin(2 * np.pi * 1.3 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / SAMPLE_RATE
+    x = sum(np.sin(k * phase) / k for k in range(1, 25))
+    x *= 0.5 + 0.5 * np.abs(np.sin(2 * np.pi * 2.5 * t))
+    pause = (t > seconds * 0.45) & (t < seconds * 0.45 + 0.2)
+    x[pause] = 0.0
+    x /= np.sqrt(np.mean(x[~pause] ** 2))
+    return x * 10 ** (level_db / 20)
+
+
+def _noise(samples, kind, level_db, rng):
+    n = rng.standard_normal(samples)
+    if kind == "pink":
+        spectrum = np.fft.rfft(n) / np.sqrt(np.maximum(np.arange(samples // 2 + 1), 1))
+        n = np.fft.irfft(spectrum, samples)
+    return n / np.sqrt(np.mean(n ** 2)) * 10 ** (level_db / 20)
+
+
+def synthetic_fixtures():
+    rng = np.random.default_rng(7)
+    for name, kind, noise_db, speech_db in SYNTHETIC_ROOMS:
+        lead, speech, tail = 1.5, 1.6, 3.5
+        utterance = np.concatenate([np.zeros(int(lead * SAMPLE_RATE)), _speech(speech, speech_db, rng),
+                                    np.zeros(int(tail * SAMPLE_RATE))])
+        audio = utterance + _noise(len(utterance), kind, noise_db, rng)
+        pcm = (np.clip(audio, -1, 1) * 32767).astype(np.int16)
+        yield name, pcm, {"speech_start_ms": lead * 1000, "speech_end_ms": (lead + speech) * 1000}
+
+
+def recorded_fixtures(directory):
+    for path in sorted(glob.glob(os.path.join(directory, "*.wav"))):
+        with wave.open(path, "rb") as wav:
+            assert wav.getframerate() == SAMPLE_RATE and wav.getnchannels() == 1 and wav.getsampwidth() == 2, path
+            pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+        with open(os.path.splitext(path)[0] + ".json") as f:
+            labels = json.load(f)
+        yield os.path.basename(path), pcm, labels
+
+
+def run(make_detector, pcm, labels, timeout_ms):
+    detector = make_detector()
+    frame = SAMPLE_RATE * FRAME_MS // 1000
+    start = end = None
+    elapsed = 0.0
+    frames = 0
+    now_ms = 0.0
+    for i in range(0, len(pcm) - frame + 1, frame):
+        t0 = time.perf_counter()
+        detector.process(pcm[i:i + frame])
+        elapsed += time.perf_counter() - t0
+        frames += 1
+        now_ms += FRAME_MS
+        if start is None and detector.in_speech:
+            start = now_ms
+        if end is None and detector.endpoint(timeout_ms):
+            end = now_ms
+            break
+
+    if start is None:
+        start_text = "missed"
+    else:
+        start_text = f"{start - labels['speech_start_ms']:.0f}"
+    if end is None:
+        end_text = "never"
+    elif end < labels["speech_end_ms"]:
+        end_text = "cut"
+    else:
+        end_text = f"{end - labels['speech_end_ms']:.0f}"
+    return start_text, end_text, elapsed / max(frames, 1) * 1e6
+
+
+def main():
+    timeout_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 500.0
+    fixture_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    fixtures = list(recorded_fixtures(fixture_dir) if fixture_dir else synthetic_fixtures())
+    print(f"{len(fixtures)} fixtures ({fixture_dir or 'synthetic'}), {FRAME_MS}ms frames, timeout {timeout_ms:.0f}ms")
+    print(f"{'fixture':>22}{'detector':>28}{'start ms':>10}{'end ms':>10}{'us/frame':>10}")
+    for name, pcm, labels in fixtures:
+        for detector_name, make_detector in detectors():
+            start, end, cost = run(make_detector, pcm, labels, timeout_ms)
+            print(f"{name:>22}{detector_name:>28}{start:>10}{end:>10}{cost:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Load test for wake word inference with many concurrent rooms.
+
+Simulates ROOMS rooms each streaming an 80 ms chunk in real time, scored
+either inline on the event loop (the old LiveKitService behaviour) or
+through WakeWordInferenceWorker. The stand-in model spends MODEL_MS per
+chunk plus MODEL_BATCH_MS per call, like an ONNX model with per-call
+overhead. An event-loop probe measures how late a 10 ms sleep wakes up,
+which is the delay every other gateway request sees.
+
+Usage:
+    python tests/benchmarks/bench_wake_word_worker.py [rooms] [seconds]
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import structlog
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from gateway.wake_word_worker import SharedModelBackend, WakeWordInferenceWorker  # noqa: E402
+
+CHUNK_SECONDS = 0.08
+MODEL_MS = 1.5  # per chunk
+MODEL_BATCH_MS = 2.0  # per model call
+
+
+class StandInModel:
+    """Blocks like a model call (time.sleep stands in for GIL-releasing ONNX)."""
+
+    def predict(self, samples):
+        time.sleep((MODEL_MS + MODEL_BATCH_MS) / 1000)
+        return {"hey_jarvis": 0.0}
+
+
+class StandInBatchBackend:
+    """One model call per batch: fixed overhead plus per-chunk cost."""
+
+    def predict_batch(self, items):
+        time.sleep((MODEL_BATCH_MS + MODEL_MS * len(items)) / 1000)
+        return [{"hey_jarvis": 0.0} for _ in items]
+
+    def remove_stream(self, stream_id):
+        pass
+
+
+def _pct(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] * 1000 if values else 0.0
+
+
+async def _probe(lags, stop):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(time.perf_counter() - start - 0.01)
+
+
+async def _room(room, score, seconds, latencies):
+    chunk = np.zeros(1280, dtype=np.int16)
+    next_at = time.perf_counter() + (hash(room) % 80) / 1000  # rooms out of phase
+    end = time.perf_counter() + seconds
+    while next_at < end:
+        await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+        start = time.perf_counter()
+        await score(room, chunk)
+        latencies.append(time.perf_counter() - start)
+        next_at += CHUNK_SECONDS
+
+
+async def _run(mode, rooms, seconds):
+    model = StandInModel()
+    worker = None
+    if mode == "inline":
+        async def score(room, chunk):
+            return model.predict(chunk)
+    else:
+        backend = SharedModelBackend(model) if mode == "worker" else StandInBatchBackend()
+        worker = WakeWordInferenceWorker(backend)
+        score = worker.predict
+
+    lags, latencies, stop = [], [], asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    await asyncio.gather(*(_room(f"room{i}", score, seconds, latencies) for i in range(rooms)))
+    stop.set()
+    await probe
+
+    expected = rooms * seconds / CHUNK_SECONDS
+    stats = worker.stats() if worker else {}
+    if worker:
+        await worker.stop()
+    return {
+        "chunks/s": len(latencies) / seconds,
+        "kept up": len(latencies) / expected,
+        "loop lag p50 ms": _pct(lags, 0.5),
+        "loop lag p99 ms": _pct(lags, 0.99),
+        "score p50 ms": _pct(latencies, 0.5),
+        "score p99 ms": _pct(latencies, 0.99),
+        "avg batch": stats.get("avg_batch_size", 1.0),
+    }
+
+
+def main():
+    rooms = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    print(f"{rooms} rooms, {seconds:.0f}s, model {MODEL_BATCH_MS}ms/call + {MODEL_MS}ms/chunk")
+    columns = ["chunks/s", "kept up", "loop lag p50 ms", "loop lag p99 ms", "score p50 ms", "score p99 ms", "avg batch"]
+    print(f"{'mode':>14}" + "".join(f"{c:>17}" for c in columns))
+    for mode in ("inline", "worker", "worker+batch"):
+        result = asyncio.run(_run(mode, rooms, seconds))
+        print(f"{mode:>14}" + "".join(f"{result[c]:>17.2f}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
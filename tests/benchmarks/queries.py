@@ -0,0 +1,79 @@
+"""
+Synthetic voice query corpus shared by the micro-benchmarks.
+
+Queries are expanded from templates modeled on real voice traffic
+(weather, sports, dining, smart home, music, follow-ups, small talk)
+so the mix of cacheable and uncacheable phrasing is representative.
+"""
+import itertools
+from typing import List
+
+TEMPLATES = [
+    "what's the weather {when}",
+    "what's the weather in {city} {when}",
+    "is it going to rain {when}",
+    "how cold is it outside {when}",
+    "what's the forecast for {city}",
+    "did the {team} win {when}",
+    "when do the {team} play next",
+    "what's the score of the {team} game",
+    "{league} standings",
+    "find a good {cuisine} restaurant near {city}",
+    "where should we eat {cuisine} {when}",
+    "any {cuisine} places open {when}",
+    "turn {onoff} the {room} lights",
+    "set the {room} lights to {color}",
+    "make the {room} {adj}",
+    "is anyone in the {room}",
+    "lock the {room} door",
+    "play some {genre} music in the {room}",
+    "skip this song",
+    "what's that song",
+    "turn it up",
+    "what's happening in {city} {when}",
+    "any concerts {when}",
+    "what's the news {when}",
+    "how is the stock market doing {when}",
+    "how do i get to {city}",
+    "how far is {city}",
+    "what time is it",
+    "what's on netflix {when}",
+    "how tall is the empire state building",
+    "who wrote pride and prejudice",
+    "tell me more about that",
+    "what about parking",
+    "are they open {when}",
+    "my {device} is not working",
+    "the {device} keeps turning off",
+    "good morning",
+    "thanks that's all",
+]
+
+# Wake phrases and politeness prefixes seen in front of real commands
+LEADS = ["", "hey jarvis ", "jarvis ", "can you tell me ", "quick question "]
+
+SLOTS = {
+    "when": ["today", "tonight", "tomorrow", "this weekend", "right now", ""],
+    "city": ["baltimore", "towson", "philly", "new york", "annapolis", "dc", "ocean city"],
+    "team": ["ravens", "orioles", "eagles", "capitals", "wizards", "commanders"],
+    "league": ["nfl", "nba", "mlb", "nhl"],
+    "cuisine": ["italian", "thai", "sushi", "mexican", "greek", "indian", "pizza"],
+    "onoff": ["on", "off"],
+    "room": ["kitchen", "office", "living room", "bedroom", "basement", "dining room"],
+    "color": ["blue", "warm white", "sunset", "red"],
+    "adj": ["brighter", "dimmer", "cozy"],
+    "genre": ["jazz", "rock", "lofi"],
+    "device": ["tv", "thermostat", "dishwasher"],
+}
+
+
+def build_corpus(limit: int = 5000) -> List[str]:
+    """Expand TEMPLATES with SLOTS into up to ``limit`` distinct queries."""
+    corpus = []
+    for lead in LEADS:
+        for template in TEMPLATES:
+            names = [name for name in SLOTS if "{" + name + "}" in template]
+            for values in itertools.product(*(SLOTS[name] for name in names)):
+                query = lead + template.format(**dict(zip(names, values)))
+                corpus.append(" ".join(query.split()))
+    return corpus[:limit]
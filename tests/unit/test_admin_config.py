@@ -0,0 +1,229 @@
+"""
+Unit tests for the AdminConfigClient config snapshot.
+
+Serves the admin API from an httpx.MockTransport and uses fakeredis for the
+config-changed pub/sub channel.
+"""
+import asyncio
+import json
+
+import fakeredis
+import httpx
+import pytest
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, 'src')
+
+from shared import admin_config
+from shared.admin_config import CONFIG_CHANNEL, AdminConfigClient
+
+
+def _sections():
+    return {
+        "intent_routing": [{"intent_category": "weather", "use_rag": True, "priority": 10}],
+        "provider_routing": [
+            {"intent_category": "search", "provider_name": "brave", "priority": 2},
+            {"intent_category": "search", "provider_name": "duckduckgo", "priority": 1},
+        ],
+        "llm_backends": [
+            {"model_name": "b", "enabled": True, "priority": 2},
+            {"model_name": "a", "enabled": True, "priority": 1},
+            {"model_name": "off", "enabled": False, "priority": 0},
+        ],
+        "tool_calling_settings": {"enabled": True, "llm_model": "qwen"},
+        "enabled_tools": [
+            {"tool_name": "weather", "guest_mode_allowed": True},
+            {"tool_name": "locks", "guest_mode_allowed": False},
+        ],
+        "fallback_triggers": [{"trigger_name": "low", "priority": 1}, {"trigger_name": "high", "priority": 9}],
+        "component_models": [{"component_name": "intent_classifier", "model_name": "qwen3:4b"}],
+        "gateway_config": {"orchestrator_url": "http://orchestrator:8001"},
+        "voice_stt": {"configured": True, "enabled": True},
+        "voice_tts": {"configured": True, "enabled": True},
+        "voice_all": {"stt": {"enabled": True}, "tts": {"enabled": True}},
+    }
+
+
+class FakeAdmin:
+    """Admin backend serving /api/config-snapshot/public."""
+
+    def __init__(self, snapshot_endpoint: bool = True):
+        self.sections = _sections()
+        self.version = 1
+        self.snapshot_endpoint = snapshot_endpoint
+        self.requests = []
+        self.up = True
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if not self.up:
+            raise httpx.ConnectError("admin down")
+        if request.url.path == "/api/config-snapshot/public" and self.snapshot_endpoint:
+            names = request.url.params.get("sections")
+            names = names.split(",") if names else list(self.sections)
+            return httpx.Response(200, json={
+                "version": self.version,
+                "sections": {n: self.sections[n] for n in names},
+            })
+        for name, path in admin_config.SNAPSHOT_SECTIONS.items():
+            if not self.snapshot_endpoint and request.url.path == path.split("?")[0]:
+                return httpx.Response(200, json=self.sections[name])
+        return httpx.Response(404)
+
+
+def _client(admin: FakeAdmin, redis_url=None) -> AdminConfigClient:
+    client = AdminConfigClient(admin_url="http://admin", redis_url=redis_url or "redis://fake")
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(admin.handler))
+    return client
+
+
+async def _eventually(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def fake_redis():
+    server = fakeredis.FakeServer()
+    with patch("redis.asyncio.from_url", lambda *a, **kw: fakeredis.FakeAsyncRedis(server=server, **kw)):
+        yield fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+
+
+class TestConfigSnapshot:
+    """Tests for the snapshot-backed getters."""
+
+    @pytest.mark.asyncio
+    async def test_single_request_serves_all_getters(self, fake_redis):
+        admin = FakeAdmin()
+        client = _client(admin)
+        try:
+            assert await client.get_intent_routing() == {"weather": {
+                "use_rag": True, "rag_service_url": None, "use_web_search": False, "use_llm": True, "priority": 10
+            }}
+            assert await client.get_provider_routing() == {"search": ["duckduckgo", "brave"]}
+            assert [b["model_name"] for b in await client.get_llm_backends()] == ["a", "b"]
+            assert (await client.get_tool_calling_settings())["llm_model"] == "qwen"
+            assert [t["tool_name"] for t in await client.get_enabled_tools(guest_mode=True)] == ["weather"]
+            assert [t["trigger_name"] for t in await client.get_fallback_triggers()] == ["high", "low"]
+            assert (await client.get_component_model("intent_classifier"))["model_name"] == "qwen3:4b"
+            assert await client.get_component_model("missing") is None
+            assert (await client.get_gateway_config())["orchestrator_url"] == "http://orchestrator:8001"
+            assert (await client.get_voice_config_all())["stt"]["enabled"] is True
+            assert len(admin.requests) == 1
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_version_bump_refetches_changed_sections(self, fake_redis):
+        admin = FakeAdmin()
+        client = _client(admin)
+        try:
+            assert await client.get_gateway_config()
+            await _eventually(lambda: client._snapshot_live)
+
+            admin.sections["gateway_config"]["orchestrator_url"] = "http://new:8001"
+            admin.version = 2
+            await fake_redis.publish(CONFIG_CHANNEL, json.dumps({"version": 2, "sections": ["gateway_config"]}))
+            await _eventually(lambda: client._snapshot_version == 2)
+
+            assert (await client.get_gateway_config())["orchestrator_url"] == "http://new:8001"
+            assert admin.requests[-1].url.params["sections"] == "gateway_config"
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_missed_version_triggers_full_refresh(self, fake_redis):
+        admin = FakeAdmin()
+        client = _client(admin)
+        try:
+            await client.get_gateway_config()
+            await _eventually(lambda: client._snapshot_live)
+
+            admin.version = 5
+            await fake_redis.publish(CONFIG_CHANNEL, json.dumps({"version": 5, "sections": ["gateway_config"]}))
+            await _eventually(lambda: client._snapshot_version == 5)
+
+            assert "sections" not in admin.requests[-1].url.params
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_delta_refetch_is_retried(self, fake_redis):
+        admin = FakeAdmin()
+        client = _client(admin)
+        try:
+            await client.get_gateway_config()
+            await _eventually(lambda: client._snapshot_live)
+
+            # The admin backend is briefly down when the bump arrives
+            admin.sections["gateway_config"]["orchestrator_url"] = "http://new:8001"
+            admin.version = 2
+            admin.up = False
+            requests = len(admin.requests)
+            await fake_redis.publish(CONFIG_CHANNEL, json.dumps({"version": 2, "sections": ["gateway_config"]}))
+            await _eventually(lambda: len(admin.requests) > requests)
+            await asyncio.sleep(0.01)
+            assert client._snapshot_version == 1
+
+            # The next bump refetches everything, including the missed change
+            admin.up = True
+            admin.version = 3
+            await fake_redis.publish(CONFIG_CHANNEL, json.dumps({"version": 3, "sections": ["intent_routing"]}))
+            await _eventually(lambda: client._snapshot_version == 3)
+            assert (await client.get_gateway_config())["orchestrator_url"] == "http://new:8001"
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_admin_unavailable_only_first_read_waits(self, fake_redis):
+        admin = FakeAdmin()
+        admin.up = False
+        client = _client(admin)
+        try:
+            assert await client.get_gateway_config() is None
+            assert await client.get_intent_routing() == {}
+            assert (await client.get_tool_calling_settings())["enabled"] is True
+            assert await client.get_voice_config_all() == {"stt": None, "tts": None}
+            assert len(admin.requests) == 1
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_admin_unavailable_resync_waits_between_retries(self, fake_redis):
+        admin = FakeAdmin()
+        admin.up = False
+        client = _client(admin)
+        try:
+            await client.get_gateway_config()
+            await asyncio.sleep(0.2)
+            # Next retry is SNAPSHOT_RETRY_SECONDS after the failed attempt
+            assert len(admin.requests) == 1
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_assembled_from_public_endpoints_without_snapshot_endpoint(self, fake_redis):
+        admin = FakeAdmin(snapshot_endpoint=False)
+        client = _client(admin)
+        try:
+            assert await client.get_provider_routing() == {"search": ["duckduckgo", "brave"]}
+            assert (await client.get_gateway_config())["orchestrator_url"] == "http://orchestrator:8001"
+            assert len(admin.requests) == 1 + len(admin_config.SNAPSHOT_SECTIONS)
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_catches_up_on_bumps_missed_before_subscribing(self, fake_redis):
+        admin = FakeAdmin()
+        client = _client(admin)
+        await fake_redis.set(admin_config.CONFIG_VERSION_KEY, 3)
+        try:
+            await client.get_gateway_config()
+            admin.version = 3
+            await _eventually(lambda: client._snapshot_version == 3)
+            assert len(admin.requests) == 2
+        finally:
+            await client.close()
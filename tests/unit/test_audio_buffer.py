@@ -0,0 +1,74 @@
+"""
+Unit tests for the gateway PCM ring buffer.
+"""
+import numpy as np
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from gateway.audio_buffer import PCMRingBuffer
+from gateway.livekit_service import LiveKitSession
+
+
+def _frame(start, samples=160):
+    return np.arange(start, start + samples, dtype=np.int16).tobytes()
+
+
+class TestPCMRingBuffer:
+    """Tests for PCMRingBuffer."""
+
+    def test_tail_is_contiguous_across_wrap(self):
+        ring = PCMRingBuffer(1000)
+        stream = b""
+        for i in range(20):
+            frame = _frame(i * 160)
+            ring.write(memoryview(frame))
+            stream += frame
+            assert bytes(ring.tail()) == stream[-1000:]
+        assert len(ring) == 1000
+        assert bytes(ring.tail(320)) == stream[-320:]
+        # NumPy view without copying
+        samples = ring.samples(ring.tail(320))
+        assert samples.base is not None
+        assert samples[-1] == 20 * 160 - 1
+
+    def test_marks_survive_wrap(self):
+        ring = PCMRingBuffer.for_duration(0.1)  # 3200 bytes
+        ring.write(_frame(0, 1000))
+        mark = ring.mark()
+        utterance = _frame(5000, 1200)
+        for i in range(0, len(utterance), 320):
+            ring.write(utterance[i:i + 320])
+        assert bytes(ring.since(mark)) == utterance
+        assert not ring.overflowed(mark)
+
+        ring.write(_frame(0, 500))
+        assert ring.overflowed(mark)
+        assert len(ring.since(mark)) == ring.capacity
+
+    def test_oversized_write_keeps_newest(self):
+        ring = PCMRingBuffer(100)
+        data = _frame(0, 80)
+        ring.write(data)
+        assert bytes(ring.tail()) == data[-100:]
+        ring.clear()
+        assert len(ring) == 0 and bytes(ring.tail()) == b""
+
+    def test_rejects_empty_capacity(self):
+        with pytest.raises(ValueError):
+            PCMRingBuffer(1)
+
+
+class TestLiveKitSessionAudio:
+    """Tests for the LiveKit session's view into its ring."""
+
+    def test_utterance_view_starts_at_mark(self):
+        session = LiveKitSession(session_id="s", room_name="r", participant_id="p",
+                                 audio=PCMRingBuffer.for_duration(1.0))
+        session.audio.write(_frame(0, 3200))
+        session.query_start = session.audio.mark()
+        assert len(session.audio_buffer) == 0
+
+        session.audio.write(_frame(0, 800))
+        assert bytes(session.audio_buffer) == _frame(0, 800)
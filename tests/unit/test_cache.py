@@ -0,0 +1,647 @@
+"""
+Unit tests for the shared Redis cache client.
+
+Uses fakeredis for an in-process Redis.
+"""
+import asyncio
+import json
+import os
+import subprocess
+import time
+import pytest
+import fakeredis
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, 'src')
+
+from shared.cache import (
+    CacheClient, CacheCodec, LocalLRUCache, cached, make_cache_key, distributed_single_flight, _swr_wrap,
+)
+
+
+@pytest.fixture
+def cache():
+    """CacheClient backed by fakeredis."""
+    client = CacheClient(url="redis://localhost:6379")
+    client.client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return client
+
+
+def _l1_client(server, **kwargs):
+    client = CacheClient(url="redis://localhost:6379", l1_max_entries=100, **kwargs)
+    client.client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    return client
+
+
+async def _wait_coherent(*clients):
+    for client in clients:
+        client._l1_active()
+    for _ in range(100):
+        if all(c._l1_coherent for c in clients):
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("L1 listener never subscribed")
+
+
+# =============================================================================
+# Test LocalLRUCache
+# =============================================================================
+
+class TestLocalLRUCache:
+    """Tests for the in-process L1 tier."""
+
+    def test_size_bound_evicts_least_recent(self):
+        """Oldest untouched entry is evicted first."""
+        l1 = LocalLRUCache(max_entries=2, max_ttl=60)
+        l1.set("a", "1")
+        l1.set("b", "2")
+        l1.get("a")
+        l1.set("c", "3")
+        assert l1.get("b") is None
+        assert l1.get("a") == "1"
+        assert len(l1) == 2
+
+    def test_ttl_capped_by_max_ttl(self):
+        """Entries live for min(ttl, max_ttl)."""
+        l1 = LocalLRUCache(max_entries=10, max_ttl=0.05)
+        l1.set("a", "1", ttl=3600)
+        time.sleep(0.06)
+        assert l1.get("a") is None
+
+    def test_zero_ttl_not_stored(self):
+        """Already-expired values are never cached."""
+        l1 = LocalLRUCache(max_entries=10, max_ttl=60)
+        l1.set("a", "1", ttl=0)
+        assert l1.get("a") is None
+
+    def test_delete_matching(self):
+        """Glob eviction mirrors Redis patterns."""
+        l1 = LocalLRUCache(max_entries=10, max_ttl=60)
+        l1.set("geo:1", "1")
+        l1.set("weather:1", "2")
+        l1.delete_matching("geo:*")
+        assert l1.get("geo:1") is None
+        assert l1.get("weather:1") == "2"
+
+    def test_fill_skipped_after_invalidation(self):
+        """A fill started before a delete, pattern eviction or write is dropped."""
+        l1 = LocalLRUCache(max_entries=2, max_ttl=60)
+        for invalidate in (lambda: l1.delete("a"), lambda: l1.delete_matching("a*"), lambda: l1.set("a", "new")):
+            l1.delete("a")
+            version = l1.version("a")
+            invalidate()
+            assert not l1.fill("a", "old", None, version)
+            assert l1.get("a") != "old"
+        assert l1.fill("a", "fresh", None, l1.version("a"))
+
+        # Counters stay bounded; overflowing them conservatively fails in-flight fills
+        version = l1.version("a")
+        l1.delete(*[f"k{i}" for i in range(20)])
+        assert len(l1._versions) <= 8
+        assert not l1.fill("a", "old", None, version)
+
+
+# =============================================================================
+# Test two-tier CacheClient
+# =============================================================================
+
+class TestTwoTierCache:
+    """Tests for the optional L1 in front of Redis."""
+
+    @pytest.mark.asyncio
+    async def test_l1_disabled_by_default(self, cache):
+        """Without configuration every get goes to Redis."""
+        assert cache.l1 is None
+        await cache.set("k", {"a": 1}, ttl=60)
+        assert await cache.get("k") == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_hit_served_from_l1(self):
+        """After one Redis read the key is served in-process."""
+        client = _l1_client(fakeredis.FakeServer())
+        await _wait_coherent(client)
+        await client.client.set("k", '{"a": 1}', ex=60)
+
+        with patch("shared.cache.record_cache_operation") as record:
+            assert await client.get("k") == {"a": 1}
+            await client.client.delete("k")
+            assert await client.get("k") == {"a": 1}
+        tiers = [(c.kwargs["tier"], c.args[2]) for c in record.call_args_list]
+        assert tiers == [("l1", False), ("redis", True), ("l1", True)]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_l1_never_outlives_redis_ttl(self):
+        """L1 entry lifetime is bounded by the remaining Redis TTL."""
+        client = _l1_client(fakeredis.FakeServer(), l1_ttl=60)
+        await _wait_coherent(client)
+        await client.client.set("k", "v", px=50)
+        assert await client.get("k") == "v"
+        expires_at, _ = client.l1._entries["k"]
+        assert expires_at - time.monotonic() <= 0.05
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_l1_returns_independent_copies(self):
+        """Mutating a returned value does not corrupt L1."""
+        client = _l1_client(fakeredis.FakeServer())
+        await _wait_coherent(client)
+        await client.set("k", {"a": 1}, ttl=60)
+        (await client.get("k"))["a"] = 2
+        assert await client.get("k") == {"a": 1}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_other_replicas(self):
+        """A write on one replica evicts the stale L1 copy on another."""
+        server = fakeredis.FakeServer()
+        replica_a, replica_b = _l1_client(server), _l1_client(server)
+        await _wait_coherent(replica_a, replica_b)
+
+        await replica_a.set("k", "old", ttl=60)
+        assert await replica_b.get("k") == "old"
+
+        await replica_a.set("k", "new", ttl=60)
+        for _ in range(100):
+            if replica_b.l1.get("k") is None:
+                break
+            await asyncio.sleep(0.01)
+        assert await replica_b.get("k") == "new"
+
+        await replica_a.delete("k")
+        for _ in range(100):
+            if replica_b.l1.get("k") is None:
+                break
+            await asyncio.sleep(0.01)
+        assert await replica_b.get("k") is None
+
+        await replica_a.close()
+        await replica_b.close()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_read_skips_l1_fill(self):
+        """A Redis reply in flight when a peer's invalidation arrives is not cached in L1."""
+        server = fakeredis.FakeServer()
+        replica_a, replica_b = _l1_client(server), _l1_client(server)
+        await _wait_coherent(replica_a, replica_b)
+        await replica_a.set("k", "old", ttl=60)
+
+        pipeline = replica_b.client.pipeline
+
+        def racing_pipeline(**kwargs):
+            pipe = pipeline(**kwargs)
+            execute = pipe.execute
+
+            async def execute_then_invalidate():
+                reply = await execute()
+                # Peer's write lands and is announced before the reply is used
+                await replica_a.set("k", "new", ttl=60)
+                replica_b._apply_invalidation(replica_a._invalidation_message(["k"]))
+                return reply
+
+            pipe.execute = execute_then_invalidate
+            return pipe
+
+        with patch.object(replica_b.client, "pipeline", racing_pipeline):
+            assert await replica_b.get("k") == "old"
+        assert replica_b.l1.get("k") is None
+        assert await replica_b.get("k") == "new"
+
+        await replica_a.close()
+        await replica_b.close()
+
+    @pytest.mark.asyncio
+    async def test_l1_bypassed_until_subscribed(self):
+        """L1 is not consulted while coherence is not guaranteed."""
+        client = _l1_client(fakeredis.FakeServer())
+        client.l1.set("k", '"stale"')
+        await client.client.set("k", '"fresh"')
+        assert await client.get("k") == "fresh"
+        await client.close()
+
+
+# =============================================================================
+# Test tagged writes and invalidation
+# =============================================================================
+
+class TestTagInvalidation:
+    """Tests for tag sets, invalidate_tags and delete_pattern."""
+
+    @pytest.mark.asyncio
+    async def test_set_records_tag_membership(self, cache):
+        """Tagged writes add the key to each tag set with the entry TTL."""
+        await cache.set("k1", {"a": 1}, ttl=60, tags=["tag:weather"])
+        assert await cache.get("k1") == {"a": 1}
+        assert await cache.client.smembers("tag:weather") == {"k1"}
+        assert 0 < await cache.client.ttl("tag:weather") <= 60
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_removes_members(self, cache):
+        """All tagged keys are deleted and counted; other keys survive."""
+        for i in range(1200):
+            await cache.set(f"w{i}", i, ttl=60, tags=["tag:weather"])
+        await cache.set("s1", 1, ttl=60, tags=["tag:sports"])
+
+        removed = await cache.invalidate_tags("tag:weather", batch_size=100)
+
+        assert removed == 1200
+        assert await cache.get("w5") is None
+        assert await cache.get("s1") == 1
+        assert await cache.client.scard("tag:weather") == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_skips_expired_members(self, cache):
+        """Members that already expired are not counted."""
+        await cache.set("k1", 1, ttl=60, tags=["tag:x"])
+        await cache.client.sadd("tag:x", "gone")
+        assert await cache.invalidate_tags("tag:x") == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_pattern(self, cache):
+        """SCAN-based deletion removes only matching keys."""
+        for i in range(250):
+            await cache.set(f"athena_semantic:weather_{i}", i)
+        await cache.set("athena_semantic:news_current", 1)
+
+        removed = await cache.delete_pattern("athena_semantic:weather_*", batch_size=50)
+
+        assert removed == 250
+        assert await cache.exists("athena_semantic:news_current")
+
+    @pytest.mark.asyncio
+    async def test_no_client(self):
+        """Invalidation degrades to 0 without Redis."""
+        client = CacheClient(url="redis://localhost:6379")
+        client.client = None
+        assert await client.invalidate_tags("tag:x") == 0
+        assert await client.delete_pattern("*") == 0
+
+
+# =============================================================================
+# Test @cached keys and single-flight
+# =============================================================================
+
+
+async def search(query: str, count: int = 5, filters=None):
+    return {"query": query, "count": count}
+
+
+_KEY_SCRIPT = """
+import sys
+sys.path.insert(0, 'src')
+from datetime import date
+from shared.cache import make_cache_key
+def search(query, count=5, filters=None):
+    pass
+print(make_cache_key(search, ("pizza",), {"filters": {"b": {"x", "y", "z"}, "a": (1, date(2025, 1, 2))}}))
+"""
+
+
+class TestCachedDecorator:
+    """Tests for stable keys and miss de-duplication in @cached."""
+
+    def test_key_independent_of_hash_seed(self):
+        """Two processes with different hash seeds produce the same key."""
+        keys = set()
+        for seed in ("1", "2"):
+            env = {**os.environ, "PYTHONHASHSEED": seed}
+            out = subprocess.run(
+                [sys.executable, "-c", _KEY_SCRIPT],
+                env=env, capture_output=True, text=True, check=True,
+            )
+            keys.add(out.stdout.strip())
+        assert len(keys) == 1
+        assert keys.pop().startswith("athena:v1:search:")
+
+    def test_equivalent_calls_share_key(self):
+        """Positional, keyword and defaulted forms normalize to one key."""
+        a = make_cache_key(search, ("pizza",), {})
+        b = make_cache_key(search, (), {"query": "pizza", "count": 5})
+        c = make_cache_key(search, ("pizza", 6), {})
+        assert a == b
+        assert a != c
+
+    def test_version_namespaces_keys(self):
+        v1 = make_cache_key(search, ("pizza",), {}, version=1)
+        v2 = make_cache_key(search, ("pizza",), {}, version=2)
+        assert v1 != v2
+        assert v1.rsplit(":", 1)[1] == v2.rsplit(":", 1)[1]
+
+    def test_unserializable_argument_rejected(self):
+        with pytest.raises(TypeError):
+            make_cache_key(search, (object(),), {})
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_collapse(self, cache):
+        """Concurrent misses on one key run the function once."""
+        calls = 0
+
+        @cached(ttl=60)
+        async def slow(query: str):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"query": query}
+
+        with patch("shared.cache.get_cache_client", return_value=cache):
+            results = await asyncio.gather(*(slow("pizza") for _ in range(10)))
+            assert calls == 1
+            assert all(r == {"query": "pizza"} for r in results)
+
+            # Subsequent call is a cache hit
+            assert await slow(query="pizza") == {"query": "pizza"}
+            assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_miss_shared_and_not_cached(self, cache):
+        """Followers see the leader's exception and nothing is cached."""
+        calls = 0
+
+        @cached(ttl=60)
+        async def broken(query: str):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        with patch("shared.cache.get_cache_client", return_value=cache):
+            results = await asyncio.gather(
+                *(broken("x") for _ in range(3)), return_exceptions=True
+            )
+            assert calls == 1
+            assert all(isinstance(r, RuntimeError) for r in results)
+            with pytest.raises(RuntimeError):
+                await broken("x")
+            assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_unkeyable_call_bypasses_cache(self, cache):
+        @cached(ttl=60)
+        async def echo(value):
+            return "ok"
+
+        with patch("shared.cache.get_cache_client", return_value=cache):
+            assert await echo(object()) == "ok"
+        assert await cache.client.dbsize() == 0
+
+
+class TestDistributedSingleFlight:
+    """Tests for cross-replica miss coalescing via a Redis lock."""
+
+    @pytest.mark.asyncio
+    async def test_lock_is_exclusive_and_token_checked(self, cache):
+        token = await cache.acquire_lock("lock:k", ttl=5)
+        assert token
+        assert await cache.acquire_lock("lock:k", ttl=5) is None
+
+        # A stale token can't release someone else's lock
+        await cache.release_lock("lock:k", "not-the-token")
+        assert await cache.exists("lock:k")
+
+        await cache.release_lock("lock:k", token)
+        assert not await cache.exists("lock:k")
+
+    @pytest.mark.asyncio
+    async def test_misses_coalesce_across_replicas(self):
+        """N replicas missing the same key make one upstream call."""
+        server = fakeredis.FakeServer()
+        replicas = []
+        for _ in range(3):
+            client = CacheClient(url="redis://localhost:6379")
+            client.client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+            replicas.append(client)
+        calls = 0
+
+        def loader(client):
+            async def load():
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.05)
+                await client.set("weather:k", {"temp": 70}, ttl=60)
+                return {"temp": 70}
+            return load
+
+        results = await asyncio.gather(*(
+            distributed_single_flight(c, "weather:k", loader(c), poll_interval=0.01)
+            for c in replicas
+        ))
+
+        assert calls == 1
+        assert results == [{"temp": 70}] * 3
+        assert not await replicas[0].exists("lock:weather:k")
+
+    @pytest.mark.asyncio
+    async def test_waiters_fall_back_when_holder_fails(self, cache):
+        """If the lock is released without a value, waiters load themselves."""
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            raise RuntimeError("upstream down")
+
+        async def working():
+            nonlocal calls
+            calls += 1
+            return "ok"
+
+        leader = asyncio.create_task(distributed_single_flight(cache, "k", failing))
+        await asyncio.sleep(0)
+        result = await distributed_single_flight(cache, "k", working, poll_interval=0.01)
+
+        assert result == "ok"
+        assert calls == 2
+        with pytest.raises(RuntimeError):
+            await leader
+
+    @pytest.mark.asyncio
+    async def test_proceeds_without_redis(self):
+        client = CacheClient(url="redis://localhost:6379")
+        client.client = None
+
+        async def load():
+            return 1
+
+        assert await distributed_single_flight(client, "k", load) == 1
+
+
+class TestStaleWhileRevalidate:
+    """Tests for @cached(soft_ttl=...) stale serving and background refresh."""
+
+    def test_soft_ttl_must_not_exceed_ttl(self):
+        with pytest.raises(ValueError):
+            cached(ttl=60, soft_ttl=120)
+
+    @pytest.mark.asyncio
+    async def test_stale_served_while_refreshing(self, cache):
+        """Past the soft TTL the old value returns at once; one refresh runs."""
+        calls = 0
+        release = asyncio.Event()
+
+        @cached(ttl=60, soft_ttl=10)
+        async def quote(symbol: str):
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                await release.wait()
+            return {"price": calls}
+
+        with patch("shared.cache.get_cache_client", return_value=cache):
+            assert await quote("ACME") == {"price": 1}
+
+            with patch("shared.cache.time.time", return_value=time.time() + 11):
+                # Stale hits don't wait on the (blocked) refresh
+                results = await asyncio.gather(*(quote("ACME") for _ in range(5)))
+                assert results == [{"price": 1}] * 5
+
+            release.set()
+            for _ in range(50):
+                if calls == 2 and await quote("ACME") == {"price": 2}:
+                    break
+                await asyncio.sleep(0.01)
+            assert calls == 2
+            assert await quote("ACME") == {"price": 2}
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self, cache):
+        calls = 0
+
+        @cached(ttl=60, soft_ttl=10)
+        async def quote(symbol: str):
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                raise RuntimeError("upstream down")
+            return {"price": 1}
+
+        with patch("shared.cache.get_cache_client", return_value=cache):
+            await quote("ACME")
+            with patch("shared.cache.time.time", return_value=time.time() + 11):
+                assert await quote("ACME") == {"price": 1}
+                await asyncio.sleep(0.05)
+                assert await quote("ACME") == {"price": 1}
+        assert calls >= 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_skipped_when_other_replica_holds_it(self, cache):
+        calls = 0
+
+        @cached(ttl=60, soft_ttl=10)
+        async def quote(symbol: str):
+            nonlocal calls
+            calls += 1
+            return {"price": calls}
+
+        with patch("shared.cache.get_cache_client", return_value=cache):
+            await quote("ACME")
+            key = make_cache_key(quote.__wrapped__, ("ACME",), {})
+            assert await cache.acquire_lock(f"refresh:{key}", ttl=60)
+            with patch("shared.cache.time.time", return_value=time.time() + 11):
+                await quote("ACME")
+                await asyncio.sleep(0.05)
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_legacy_entry_treated_as_stale(self, cache):
+        """Values written before soft_ttl was enabled are served, then refreshed."""
+        @cached(ttl=60, soft_ttl=10)
+        async def quote(symbol: str):
+            return {"price": 2}
+
+        key = make_cache_key(quote.__wrapped__, ("ACME",), {})
+        await cache.set(key, {"price": 1}, ttl=60)
+        with patch("shared.cache.get_cache_client", return_value=cache):
+            assert await quote("ACME") == {"price": 1}
+            await asyncio.sleep(0.05)
+            assert await quote("ACME") == {"price": 2}
+
+    @pytest.mark.asyncio
+    async def test_prewarm_refreshes_popular_keys(self, cache):
+        """The pre-warm loop reloads hot keys before they go stale."""
+        calls = {"hot": 0, "cold": 0}
+
+        @cached(ttl=4, soft_ttl=1, prewarm_top=1)
+        async def quote(symbol: str):
+            calls[symbol] += 1
+            return calls[symbol]
+
+        with patch("shared.cache.get_cache_client", return_value=cache):
+            for _ in range(3):
+                await quote("hot")
+            await quote("cold")
+            # Nearly stale, so the first pass (after soft_ttl / 2) must reload
+            # it; at the full soft_ttl it would sit right on the reload threshold
+            await cache.set(make_cache_key(quote.__wrapped__, ("hot",), {}), _swr_wrap(1, 0.2), ttl=4)
+            await asyncio.sleep(0.7)
+
+        assert calls == {"hot": 2, "cold": 1}
+
+
+class TestCacheCodec:
+    """Tests for the self-describing value codec."""
+
+    VALUE = {"team": "Ravens", "events": [{"id": i, "name": "game " * 50} for i in range(50)]}
+
+    @pytest.mark.parametrize("serializer", ["json", "msgpack", "legacy"])
+    def test_round_trip(self, serializer):
+        codec = CacheCodec(serializer, compress_min_bytes=0)
+        assert CacheCodec.decode(codec.encode(self.VALUE)) == self.VALUE
+
+    def test_compresses_above_threshold_only(self):
+        codec = CacheCodec("json", compress_min_bytes=1024)
+        small = codec.encode({"a": 1})
+        large = codec.encode(self.VALUE)
+        assert small[2:3] == b"-"
+        assert large[2:3] != b"-"
+        assert len(large) < len(CacheCodec("json", compress_min_bytes=0).encode(self.VALUE))
+        assert CacheCodec.decode(large) == self.VALUE
+
+    def test_zlib_compression(self):
+        codec = CacheCodec("json", compress_min_bytes=1, compression="zlib")
+        encoded = codec.encode(self.VALUE)
+        assert encoded[:3] == b"\x00jd"
+        assert CacheCodec.decode(encoded) == self.VALUE
+
+    def test_reads_pre_codec_values(self):
+        """Plain JSON text and raw strings written by older code still decode."""
+        assert CacheCodec.decode('{"a": [1, 2]}') == {"a": [1, 2]}
+        assert CacheCodec.decode(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        assert CacheCodec.decode("plain text") == "plain text"
+
+    def test_default_writes_pre_codec_format(self, monkeypatch):
+        """Until CACHE_CODEC is switched, values stay readable by pre-codec services."""
+        monkeypatch.delenv("CACHE_CODEC", raising=False)
+        codec = CacheCodec.from_env()
+        assert codec.encode({"a": 1}) == b'{"a": 1}'
+        assert json.loads(codec.encode(self.VALUE)) == self.VALUE
+
+    def test_unknown_header_rejected(self):
+        with pytest.raises(ValueError):
+            CacheCodec.decode(b"\x00?-payload")
+
+    @pytest.mark.asyncio
+    async def test_client_round_trip_binary(self):
+        """Compressed bytes survive a decode_responses client, with and without L1."""
+        server = fakeredis.FakeServer()
+        codec = CacheCodec("json", compress_min_bytes=1)
+        plain = CacheCodec("legacy")
+        for client in (
+            CacheClient(url="redis://localhost:6379", codec=codec),
+            CacheClient(url="redis://localhost:6379", codec=codec, l1_max_entries=10),
+        ):
+            client.client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+            if client.l1 is not None:
+                await _wait_coherent(client)
+            await client.set("k", self.VALUE, ttl=60)
+            assert await client.get("k") == self.VALUE
+
+        # Old and new values coexist: a legacy writer's value reads back too
+        legacy = CacheClient(url="redis://localhost:6379", codec=plain)
+        legacy.client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        await legacy.set("old", {"a": 1}, ttl=60)
+        assert await legacy.client.get("old") == '{"a": 1}'
+        reader = CacheClient(url="redis://localhost:6379", codec=codec)
+        reader.client = legacy.client
+        assert await reader.get("old") == {"a": 1}
@@ -0,0 +1,192 @@
+"""
+Unit tests for the in-process feature flag store.
+
+Serves /api/features/snapshot (with ETag handling) from an httpx.MockTransport.
+"""
+import asyncio
+import hashlib
+import json
+import time
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, 'src')
+
+from shared import admin_config
+from shared.feature_flags import FeatureFlagStore
+
+
+class FakeFlagAdmin:
+    """Admin backend serving the flag snapshot with ETag validation."""
+
+    def __init__(self):
+        self.flags = {
+            "llm_based_routing": {"enabled": True, "config": {}},
+            "automation_system_mode": {"enabled": True, "config": {"mode": "dynamic_agent"}},
+            "post_synthesis_fallback": {"enabled": False, "config": {}},
+        }
+        self.requests = []
+        self.up = True
+
+    def etag(self) -> str:
+        return '"%s"' % hashlib.sha256(json.dumps(self.flags, sort_keys=True).encode()).hexdigest()[:16]
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if not self.up:
+            raise httpx.ConnectError("admin down")
+        assert request.url.path == "/api/features/snapshot"
+        etag = self.etag()
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json={"etag": etag, "flags": self.flags}, headers={"ETag": etag})
+
+
+def _store(admin: FakeFlagAdmin) -> FeatureFlagStore:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(admin.handler))
+    return FeatureFlagStore("http://admin", client=client)
+
+
+class TestFeatureFlagStore:
+
+    @pytest.mark.asyncio
+    async def test_flags_evaluated_from_memory(self):
+        admin = FakeFlagAdmin()
+        store = _store(admin)
+        try:
+            await store.ensure_loaded()
+            assert store.is_enabled("llm_based_routing")
+            assert not store.is_enabled("post_synthesis_fallback", default=True)
+            assert store.is_enabled("unknown", default=True)
+            assert store.get_config("automation_system_mode") == {"mode": "dynamic_agent"}
+            assert store.evaluate(["llm_based_routing", "post_synthesis_fallback", "unknown"]) == {
+                "llm_based_routing": True, "post_synthesis_fallback": False, "unknown": False
+            }
+
+            for _ in range(100):
+                await store.ensure_loaded()
+                store.is_enabled("llm_based_routing")
+            assert len(admin.requests) == 1
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_refresh_is_conditional(self):
+        admin = FakeFlagAdmin()
+        store = _store(admin)
+        try:
+            await store.ensure_loaded()
+            view = store.flags()
+
+            assert await store.refresh()
+            assert admin.requests[-1].headers["If-None-Match"] == admin.etag()
+            assert store.flags() is view
+
+            admin.flags["post_synthesis_fallback"]["enabled"] = True
+            assert await store.refresh()
+            assert store.is_enabled("post_synthesis_fallback")
+            # Earlier views are never mutated
+            assert view["post_synthesis_fallback"]["enabled"] is False
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_pushed_changes_applied_without_fetch(self):
+        admin = FakeFlagAdmin()
+        store = _store(admin)
+        try:
+            await store.ensure_loaded()
+            admin.flags["llm_based_routing"]["enabled"] = False
+
+            await store.handle_push({
+                "flags": ["llm_based_routing"],
+                "changes": {"llm_based_routing": admin.flags["llm_based_routing"]},
+                "etag": admin.etag(),
+            })
+            assert not store.is_enabled("llm_based_routing")
+            assert len(admin.requests) == 1
+
+            # The pushed ETag makes the next refresh a 304
+            await store.refresh()
+            assert admin.requests[-1].headers["If-None-Match"] == admin.etag()
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_push_without_changes_refetches(self):
+        admin = FakeFlagAdmin()
+        store = _store(admin)
+        try:
+            await store.ensure_loaded()
+            admin.flags["post_synthesis_fallback"]["enabled"] = True
+            await store.handle_push(["post_synthesis_fallback"])
+            assert store.is_enabled("post_synthesis_fallback")
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_admin_unavailable_uses_defaults_without_waiting(self):
+        admin = FakeFlagAdmin()
+        admin.up = False
+        store = _store(admin)
+        try:
+            await store.ensure_loaded()
+            await store.ensure_loaded()
+            assert not store.loaded
+            assert store.is_enabled("llm_based_routing", default=True)
+            assert len(admin.requests) == 1
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_refresh_loop_waits_after_failed_fetch(self):
+        admin = FakeFlagAdmin()
+        admin.up = False
+        store = _store(admin)
+        try:
+            await store.ensure_loaded()
+            await asyncio.sleep(0.2)
+            # Next attempt is refresh_interval after the failed one
+            assert len(admin.requests) == 1
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_admin_client_delegates_to_store(self):
+        admin = FakeFlagAdmin()
+        store = _store(admin)
+        client = admin_config.AdminConfigClient(admin_url="http://admin")
+        try:
+            with patch.object(admin_config, "get_flag_store", return_value=store):
+                assert await client.get_feature_flags() == {
+                    "llm_based_routing": True, "automation_system_mode": True, "post_synthesis_fallback": False
+                }
+                assert await client.is_feature_enabled("post_synthesis_fallback") is False
+                assert await client.is_feature_enabled("unknown") is None
+                assert (await client.get_feature("automation_system_mode"))["config"]["mode"] == "dynamic_agent"
+
+                # A config version bump for the features table refreshes the store
+                admin.flags["post_synthesis_fallback"]["enabled"] = True
+                await client._apply_config_change(json.dumps({"version": 1, "sections": ["features"]}))
+                assert store.is_enabled("post_synthesis_fallback")
+                assert client._snapshot_version == 1
+        finally:
+            await store.close()
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_evaluation_is_microseconds(self):
+        admin = FakeFlagAdmin()
+        store = _store(admin)
+        try:
+            await store.ensure_loaded()
+            n = 10000
+            start = time.perf_counter()
+            for _ in range(n):
+                store.is_enabled("llm_based_routing")
+            assert (time.perf_counter() - start) / n < 50e-6
+        finally:
+            await store.close()
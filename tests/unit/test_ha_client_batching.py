@@ -0,0 +1,208 @@
+"""
+Unit tests for batched Home Assistant service calls (HomeAssistantClient.call_services).
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from shared.ha_client import HomeAssistantClient, HomeAssistantServiceError, merge_service_calls
+
+
+class FakeServiceSocket:
+    """Minimal HA WebSocket answering call_service; entities in ``broken`` fail, ``silent`` never answer."""
+
+    def __init__(self, broken=(), silent=()):
+        self.broken = set(broken)
+        self.silent = set(silent)
+        self.send_error = None
+        self.calls = []
+        self.inbox = asyncio.Queue()
+        self.inbox.put_nowait({"type": "auth_required"})
+
+    async def connect(self, url):
+        return self
+
+    async def recv(self):
+        return json.dumps(await self.inbox.get())
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self.inbox.get()
+        if message is None:
+            raise StopAsyncIteration
+        return json.dumps(message)
+
+    async def send(self, raw):
+        message = json.loads(raw)
+        if message["type"] == "auth":
+            self.inbox.put_nowait({"type": "auth_ok"})
+            return
+        if self.send_error is not None:
+            raise self.send_error
+        self.calls.append(message)
+        targets = message.get("target", {}).get("entity_id", [])
+        if self.silent.intersection(targets):
+            return
+        if self.broken.intersection(targets):
+            reply = {"id": message["id"], "type": "result", "success": False,
+                     "error": {"code": "home_assistant_error", "message": "unavailable"}}
+        else:
+            reply = {"id": message["id"], "type": "result", "success": True, "result": {}}
+        self.inbox.put_nowait(reply)
+
+    async def close(self):
+        self.inbox.put_nowait(None)
+
+
+def _client(ws_connect=None, handler=None):
+    client = HomeAssistantClient(url="http://ha:8123", token="token", ws_connect=ws_connect)
+    client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler or (lambda request: httpx.Response(200, json=[]))),
+        base_url="http://ha:8123"
+    )
+    return client
+
+
+class TestMergeServiceCalls:
+    """Tests for merge_service_calls."""
+
+    def test_merges_calls_differing_only_in_entity(self):
+        merged = merge_service_calls([
+            ("light", "turn_on", {"entity_id": "light.a", "hs_color": [0, 100]}),
+            ("light", "turn_on", {"entity_id": "light.b", "hs_color": [120, 100]}),
+            ("light", "turn_on", {"entity_id": ["light.c", "light.a"], "hs_color": [0, 100]}),
+            ("scene", "turn_on", {}),
+            ("scene", "turn_on", {}),
+        ])
+        assert merged == [
+            ("light", "turn_on", {"hs_color": [0, 100]}, ["light.a", "light.c"], [0, 2]),
+            ("light", "turn_on", {"hs_color": [120, 100]}, ["light.b"], [1]),
+            ("scene", "turn_on", {}, [], [3]),
+            ("scene", "turn_on", {}, [], [4]),
+        ]
+
+
+class TestCallServices:
+    """Tests for HomeAssistantClient.call_services."""
+
+    @pytest.mark.asyncio
+    async def test_whole_house_off_is_one_websocket_call(self):
+        ws = FakeServiceSocket()
+        client = _client(ws_connect=ws.connect)
+        lights = [f"light.l{i}" for i in range(40)]
+
+        results = await client.call_services([("light", "turn_off", {"entity_id": light}) for light in lights])
+
+        assert len(ws.calls) == 1
+        assert ws.calls[0]["target"] == {"entity_id": lights}
+        assert results == [{"success": True, "error": None}] * 40
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_per_entity(self):
+        ws = FakeServiceSocket(broken={"light.b"})
+        client = _client(ws_connect=ws.connect)
+        calls = [("light", "turn_on", {"entity_id": e, "brightness": 255}) for e in ("light.a", "light.b", "light.c")]
+
+        results = await client.call_services(calls)
+        assert results[0]["success"] and results[2]["success"]
+        assert not results[1]["success"]
+        assert "unavailable" in results[1]["error"]
+        # 1 merged call + 3 per-entity retries
+        assert len(ws.calls) == 4
+
+        with pytest.raises(HomeAssistantServiceError) as excinfo:
+            await client.call_services(calls, raise_on_error=True)
+        assert excinfo.value.results[0]["success"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_results_follow_call_order_when_entities_repeat(self):
+        ws = FakeServiceSocket(broken={"light.b"})
+        client = _client(ws_connect=ws.connect)
+
+        results = await client.call_services([
+            ("light", "turn_on", {"entity_id": "light.a", "hs_color": [0, 100]}),
+            ("light", "turn_on", {"entity_id": "light.a", "hs_color": [120, 100]}),
+            ("light", "turn_on", {"entity_id": ["light.c", "light.b"], "hs_color": [0, 100]}),
+            ("scene", "turn_on", {"entity_id": "scene.movie"}),
+        ])
+
+        assert [result["success"] for result in results] == [True, True, False, True]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_an_error_not_a_rest_retry(self):
+        ws = FakeServiceSocket(silent={"lock.front_door"})
+        posted = []
+
+        def handler(request):
+            posted.append(request.url.path)
+            return httpx.Response(200, json=[])
+
+        client = _client(ws_connect=ws.connect, handler=handler)
+        await client.call_services([("light", "turn_on", {"entity_id": "light.a"})])
+        client._ws.call_timeout = 0.05
+
+        results = await client.call_services([
+            ("lock", "unlock", {"entity_id": "lock.front_door"}),
+            ("lock", "unlock", {"entity_id": "lock.back_door"}),
+        ])
+
+        # Outcome unknown for both: reported, not retried per entity or over REST
+        assert [result["success"] for result in results] == [False, False]
+        assert "timed out" in results[0]["error"]
+        assert [call["target"] for call in ws.calls[1:]] == [{"entity_id": ["lock.front_door", "lock.back_door"]}]
+        assert posted == []
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_unsent_call_falls_back_to_rest(self):
+        ws = FakeServiceSocket()
+        posted = []
+
+        def handler(request):
+            posted.append(request.url.path)
+            return httpx.Response(200, json=[])
+
+        client = _client(ws_connect=ws.connect, handler=handler)
+        await client.call_services([("light", "turn_on", {"entity_id": "light.a"})])
+        ws.send_error = OSError("broken pipe")
+
+        results = await client.call_services([("light", "turn_off", {"entity_id": "light.a"})])
+
+        assert results == [{"success": True, "error": None}]
+        assert posted == ["/api/services/light/turn_off"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_rest_fallback_posts_merged_calls(self):
+        async def refuse(url):
+            raise OSError("connection refused")
+
+        posted = []
+
+        def handler(request):
+            posted.append((request.url.path, json.loads(request.content)))
+            return httpx.Response(200, json=[])
+
+        client = _client(ws_connect=refuse, handler=handler)
+        results = await client.call_services([
+            ("light", "turn_on", {"entity_id": "light.a", "hs_color": [0, 100]}),
+            ("light", "turn_on", {"entity_id": "light.b", "hs_color": [0, 100]}),
+            ("light", "turn_on", {"entity_id": "light.c", "hs_color": [120, 100]}),
+        ])
+
+        assert sorted(posted, key=str) == sorted([
+            ("/api/services/light/turn_on", {"hs_color": [0, 100], "entity_id": ["light.a", "light.b"]}),
+            ("/api/services/light/turn_on", {"hs_color": [120, 100], "entity_id": "light.c"}),
+        ], key=str)
+        assert len(results) == 3 and all(result["success"] for result in results)
+        await client.close()
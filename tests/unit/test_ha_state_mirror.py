@@ -0,0 +1,269 @@
+"""
+Unit tests for the event-driven Home Assistant state mirror.
+
+Runs against an in-memory fake of the HA WebSocket API.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from shared.ha_client import HomeAssistantClient
+from shared.ha_state_mirror import HAStateMirror
+from orchestrator.ha_entity_manager import HAEntityManager
+
+
+def _state(entity_id, state, members=None, **attributes):
+    if members is not None:
+        attributes["entity_id"] = members
+    return {"entity_id": entity_id, "state": state, "attributes": attributes}
+
+
+class FakeConnection:
+    """One client connection to FakeHA."""
+
+    def __init__(self, server):
+        self.server = server
+        self.inbox = asyncio.Queue()
+        self.inbox.put_nowait({"type": "auth_required"})
+        self.subscriptions = {}
+
+    async def recv(self):
+        message = await self.inbox.get()
+        if message is None:
+            raise ConnectionError("closed")
+        return json.dumps(message)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self.inbox.get()
+        if message is None:
+            raise StopAsyncIteration
+        return json.dumps(message)
+
+    async def send(self, raw):
+        await self.server.handle(self, json.loads(raw))
+
+    async def close(self):
+        self.inbox.put_nowait(None)
+
+
+class FakeHA:
+    """In-memory Home Assistant WebSocket API."""
+
+    def __init__(self, states, areas=None, entity_areas=None):
+        self.states = {s["entity_id"]: s for s in states}
+        self.areas = areas or {}
+        self.entity_areas = entity_areas or {}
+        self.connections = []
+        self.get_states_calls = 0
+        self.before_snapshot = None  # hook run while get_states is "in flight"
+
+    async def connect(self, url):
+        connection = FakeConnection(self)
+        self.connections.append(connection)
+        return connection
+
+    async def handle(self, connection, message):
+        message_type = message["type"]
+        if message_type == "auth":
+            connection.inbox.put_nowait({"type": "auth_ok", "ha_version": "2025.1"})
+            return
+        result = None
+        if message_type == "subscribe_events":
+            connection.subscriptions[message["id"]] = message.get("event_type")
+        elif message_type == "get_states":
+            self.get_states_calls += 1
+            if self.before_snapshot:
+                snapshot = [dict(s) for s in self.states.values()]
+                self.before_snapshot()
+                self.before_snapshot = None
+                connection.inbox.put_nowait({"id": message["id"], "type": "result", "success": True, "result": snapshot})
+                return
+            result = list(self.states.values())
+        elif message_type == "config/area_registry/list":
+            result = [{"area_id": a, "name": n} for a, n in self.areas.items()]
+        elif message_type == "config/device_registry/list":
+            result = []
+        elif message_type == "config/entity_registry/list":
+            result = [{"entity_id": e, "area_id": a, "device_id": None} for e, a in self.entity_areas.items()]
+        connection.inbox.put_nowait({"id": message["id"], "type": "result", "success": True, "result": result})
+
+    def set_state(self, entity_id, new_state):
+        """Change a state and fire state_changed to live subscribers."""
+        if new_state is None:
+            self.states.pop(entity_id, None)
+        else:
+            self.states[entity_id] = new_state
+        for connection in self.connections:
+            for sub_id, event_type in connection.subscriptions.items():
+                if event_type == "state_changed":
+                    connection.inbox.put_nowait({"id": sub_id, "type": "event", "event": {
+                        "event_type": "state_changed",
+                        "data": {"entity_id": entity_id, "new_state": new_state},
+                    }})
+
+    def drop(self):
+        for connection in self.connections:
+            connection.inbox.put_nowait(None)
+        self.connections = []
+
+
+async def _settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def _house():
+    return FakeHA(
+        [
+            _state("light.kitchen", "on", friendly_name="Kitchen"),
+            _state("light.downstairs", "off", friendly_name="Downstairs", members=["light.kitchen"]),
+            _state("lock.front_door", "locked"),
+            _state("binary_sensor.office_motion", "off"),
+        ],
+        areas={"kitchen": "Kitchen", "office": "Home Office"},
+        entity_areas={"light.kitchen": "kitchen", "binary_sensor.office_motion": "office"},
+    )
+
+
+class TestHAStateMirror:
+    """Tests for HAStateMirror."""
+
+    @pytest.mark.asyncio
+    async def test_initial_sync_builds_indexes(self):
+        ha = _house()
+        mirror = HAStateMirror("http://ha:8123", "token", connect=ha.connect, reconnect_min=0.01)
+        await mirror.start()
+        assert await mirror.wait_ready(timeout=1)
+
+        assert mirror.is_live
+        assert mirror.get_state("lock.front_door")["state"] == "locked"
+        assert set(mirror.domain("light")) == {"light.kitchen", "light.downstairs"}
+        assert set(mirror.area("kitchen")) == {"light.kitchen"}
+        assert set(mirror.room("home office")) == {"binary_sensor.office_motion"}
+        assert set(mirror.room("Home_Office", domain="light")) == set()
+        await mirror.close()
+
+    @pytest.mark.asyncio
+    async def test_state_changed_applied_incrementally(self):
+        ha = _house()
+        mirror = HAStateMirror("http://ha:8123", "token", connect=ha.connect, reconnect_min=0.01)
+        changes = []
+        mirror.add_listener(lambda entity_id, old, new: changes.append((entity_id, new and new["state"])))
+        await mirror.start()
+        await mirror.wait_ready(timeout=1)
+        changes.clear()
+
+        ha.set_state("light.kitchen", _state("light.kitchen", "off", friendly_name="Kitchen"))
+        ha.set_state("fan.office", _state("fan.office", "on"))
+        ha.set_state("lock.front_door", None)
+        await _settle()
+
+        assert mirror.get_state("light.kitchen")["state"] == "off"
+        assert set(mirror.domain("fan")) == {"fan.office"}
+        assert mirror.domain("lock") == {}
+        assert changes == [("light.kitchen", "off"), ("fan.office", "on"), ("lock.front_door", None)]
+        assert ha.get_states_calls == 1
+        await mirror.close()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_resyncs_by_diff(self):
+        """Changes missed while disconnected are reconciled against a fresh snapshot."""
+        ha = _house()
+        mirror = HAStateMirror("http://ha:8123", "token", connect=ha.connect, reconnect_min=0.01)
+        changes = []
+        await mirror.start()
+        await mirror.wait_ready(timeout=1)
+        mirror.add_listener(lambda entity_id, old, new: changes.append(entity_id))
+
+        ha.drop()
+        await _settle()
+        assert not mirror.is_live
+        # Changes while nobody is subscribed
+        ha.states["lock.front_door"] = _state("lock.front_door", "unlocked")
+        del ha.states["binary_sensor.office_motion"]
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if mirror.is_live:
+                break
+
+        assert mirror.is_live
+        assert mirror.resyncs == 2
+        assert mirror.get_state("lock.front_door")["state"] == "unlocked"
+        assert mirror.get_state("binary_sensor.office_motion") is None
+        # Only the differences were applied
+        assert sorted(changes) == ["binary_sensor.office_motion", "lock.front_door"]
+        await mirror.close()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_does_not_roll_back_newer_events(self):
+        """An event delivered while get_states is in flight wins over the snapshot."""
+        ha = _house()
+        ha.before_snapshot = lambda: ha.set_state("lock.front_door", _state("lock.front_door", "unlocked"))
+        mirror = HAStateMirror("http://ha:8123", "token", connect=ha.connect, reconnect_min=0.01)
+        await mirror.start()
+        await mirror.wait_ready(timeout=1)
+
+        assert mirror.get_state("lock.front_door")["state"] == "unlocked"
+        await mirror.close()
+
+
+class TestMirrorConsumers:
+    """Tests for the zero-I/O read path through the existing clients."""
+
+    @staticmethod
+    def _no_rest(request):
+        raise AssertionError(f"unexpected REST call: {request.url}")
+
+    @pytest.mark.asyncio
+    async def test_entity_manager_reads_from_mirror(self):
+        ha = _house()
+        mirror = HAStateMirror("http://ha:8123", "token", connect=ha.connect, reconnect_min=0.01)
+        await mirror.start()
+        await mirror.wait_ready(timeout=1)
+
+        manager = HAEntityManager("http://ha:8123", "token", state_mirror=mirror)
+        manager.client = httpx.AsyncClient(transport=httpx.MockTransport(self._no_rest), base_url="http://ha:8123")
+
+        assert set(await manager.get_entities_by_domain("lock")) == {"lock.front_door"}
+        groups = await manager.get_all_light_groups()
+        assert [g["entity_id"] for g in groups] == ["light.downstairs"]
+
+        # Light group membership follows state_changed events
+        ha.set_state("light.downstairs", _state("light.downstairs", "on", friendly_name="Downstairs", members=["light.kitchen", "light.hall"]))
+        await _settle()
+        groups = await manager.get_all_light_groups()
+        assert groups[0]["members"] == ["light.kitchen", "light.hall"]
+        assert groups[0]["state"] == "on"
+        assert (await manager.get_state("light.kitchen"))["state"] == "on"
+
+        await manager.client.aclose()
+        await mirror.close()
+
+    @pytest.mark.asyncio
+    async def test_ha_client_get_state_uses_mirror_when_live(self):
+        ha = _house()
+        mirror = HAStateMirror("http://ha:8123", "token", connect=ha.connect, reconnect_min=0.01)
+        client = HomeAssistantClient(url="http://ha:8123", token="token", state_mirror=mirror)
+        client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=_state("lock.front_door", "from_rest"))),
+            base_url="http://ha:8123"
+        )
+
+        # Not synced yet: REST
+        assert (await client.get_state("lock.front_door"))["state"] == "from_rest"
+
+        await mirror.start()
+        await mirror.wait_ready(timeout=1)
+        assert (await client.get_state("lock.front_door"))["state"] == "locked"
+
+        await client.close()
+        await mirror.close()
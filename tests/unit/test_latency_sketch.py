@@ -0,0 +1,133 @@
+"""
+Unit tests for mergeable latency quantile sketches.
+"""
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import sys
+sys.path.insert(0, 'src')
+
+from shared.metrics import (
+    LATENCY_SKETCHES,
+    LatencySketch,
+    LatencySketchRegistry,
+    _record_timing_sketches,
+    setup_quantiles_endpoint,
+)
+
+
+def _exact(values, q):
+    values = sorted(values)
+    return values[int(q * (len(values) - 1))]
+
+
+class TestLatencySketch:
+    """Tests for LatencySketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Quantiles stay within the configured relative error."""
+        rng = random.Random(3)
+        values = [rng.lognormvariate(5, 1.0) for _ in range(20000)]
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.9, 0.95, 0.99):
+            exact = _exact(values, q)
+            assert abs(sketch.quantile(q) - exact) / exact <= 0.011
+        assert sketch.count == 20000
+        assert sketch.max == max(values)
+
+    def test_merge_equals_single_sketch(self):
+        """Merging per-replica sketches gives the same result as one sketch."""
+        rng = random.Random(5)
+        values = [rng.uniform(1, 2000) for _ in range(3000)]
+        whole = LatencySketch()
+        replicas = [LatencySketch() for _ in range(3)]
+        for i, value in enumerate(values):
+            whole.add(value)
+            replicas[i % 3].add(value)
+
+        merged = LatencySketch()
+        for replica in replicas:
+            # Round-trip through the wire format
+            merged.merge(LatencySketch.from_dict(replica.to_dict()))
+
+        assert merged.bins == whole.bins
+        assert merged.count == whole.count
+        assert merged.quantile(0.99) == whole.quantile(0.99)
+
+    def test_zero_latencies(self):
+        """0ms observations (common with int ms timings) are counted, not dropped."""
+        sketch = LatencySketch()
+        for _ in range(9):
+            sketch.add(0)
+        sketch.add(50)
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(50, rel=0.01)
+
+    def test_merge_rejects_other_accuracy(self):
+        with pytest.raises(ValueError):
+            LatencySketch(0.01).merge(LatencySketch(0.02))
+
+    def test_bins_are_bounded(self):
+        """Past max_bins the lowest bins are folded together."""
+        sketch = LatencySketch(max_bins=64)
+        for i in range(1, 10000):
+            sketch.add(i * 0.37)
+        assert len(sketch.bins) <= 64
+        assert sketch.quantile(0.99) == pytest.approx(_exact([i * 0.37 for i in range(1, 10000)], 0.99), rel=0.01)
+
+
+class TestLatencySketchRegistry:
+    """Tests for the windowed per-(stage, model) registry."""
+
+    def test_window_expires_old_intervals(self):
+        """Only the last ``intervals`` intervals are merged."""
+        registry = LatencySketchRegistry(interval_seconds=10, intervals=3)
+        registry.record("llm.classify", 100, "qwen", now=0)
+        registry.record("llm.classify", 200, "qwen", now=15)
+        registry.record("llm.classify", 300, "qwen", now=25)
+
+        assert registry.merged(now=25)[("llm.classify", "qwen")].count == 3
+        assert registry.merged(now=35)[("llm.classify", "qwen")].count == 2
+
+    def test_snapshot_keys_and_prefix(self):
+        registry = LatencySketchRegistry(interval_seconds=60, intervals=2)
+        registry.record("llm.classify", 120, "qwen")
+        registry.record("llm.synthesize", 900, "llama")
+        registry.record("graph.retrieve", 40)
+
+        snapshot = registry.snapshot("llm.")
+        assert [(e["stage"], e["model"]) for e in snapshot["sketches"]] == [
+            ("llm.classify", "qwen"), ("llm.synthesize", "llama")
+        ]
+        assert snapshot["sketches"][0]["p50_ms"] == pytest.approx(120, rel=0.01)
+        assert "sketch" in snapshot["sketches"][0]
+        assert "sketch" not in registry.snapshot(include_sketches=False)["sketches"][0]
+
+
+class TestQuantilesEndpoint:
+    """Tests for /metrics/quantiles and timing integration."""
+
+    def test_timing_data_recorded_and_served(self):
+        """TimingTracker stages show up at /metrics/quantiles."""
+        _record_timing_sketches({
+            "total_ms": 850,
+            "pre_graph": {"session_management_ms": 3, "total_ms": 3},
+            "graph": {"classify": {"llm_inference_ms": 300, "total_ms": 320}, "total_ms": 320},
+            "post_graph": {"memory_creation_ms": 0, "total_ms": 0},
+        })
+        app = FastAPI()
+        setup_quantiles_endpoint(app, "orchestrator")
+        response = TestClient(app).get("/metrics/quantiles")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["service"] == "orchestrator"
+        stages = {e["stage"] for e in body["sketches"]}
+        assert {"request", "pre_graph.session_management", "graph.classify", "post_graph.memory_creation"} <= stages
+        LATENCY_SKETCHES._windows.clear()
@@ -0,0 +1,126 @@
+"""
+Unit tests for the LLMRouter backend connection pool.
+
+Serves Ollama, MLX and the admin metrics endpoint from an httpx.MockTransport.
+"""
+import json
+
+import httpx
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from shared.llm_router import BackendClientPool, LLMRouter
+
+
+class FakeBackends:
+    """Ollama, MLX and admin endpoints."""
+
+    def __init__(self):
+        self.requests = []
+        self.down = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.down:
+            raise httpx.ConnectError("connection refused")
+        if request.url.path == "/api/generate":
+            if json.loads(request.content)["stream"]:
+                lines = [
+                    {"response": "Hel", "done": False},
+                    {"response": "lo", "done": False},
+                    {"response": "", "done": True, "eval_count": 2},
+                ]
+                return httpx.Response(200, content="\n".join(json.dumps(line) for line in lines))
+            return httpx.Response(200, json={"response": "Hello", "done": True, "eval_count": 1})
+        if request.url.path == "/v1/completions":
+            return httpx.Response(200, json={"choices": [{"text": "Hi"}], "usage": {"completion_tokens": 1}})
+        if request.url.path == "/api/llm-backends/metrics/batch":
+            return httpx.Response(201, json={})
+        return httpx.Response(404)
+
+
+def _router(backends: FakeBackends, **pool_kwargs) -> LLMRouter:
+    pool = BackendClientPool(transport=httpx.MockTransport(backends.handler), **pool_kwargs)
+    return LLMRouter(admin_url="http://admin:8080", pool=pool)
+
+
+async def _generate(router: LLMRouter, url: str = "http://ollama:11434"):
+    return await router._generate_ollama(url, "qwen3:4b", "hi", 0.1, 10, timeout=30)
+
+
+class TestBackendClientPool:
+
+    @pytest.mark.asyncio
+    async def test_one_client_per_endpoint_reused_across_calls(self):
+        backends = FakeBackends()
+        router = _router(backends)
+        try:
+            for _ in range(5):
+                assert (await _generate(router))["response"] == "Hello"
+            tokens = [c["token"] async for c in router._generate_ollama_stream(
+                "http://ollama:11434/", "llama3", "hi", 0.1, 10, timeout=30
+            )]
+            assert "".join(tokens) == "Hello"
+            assert (await router._generate_mlx("http://mlx:8080", "m", "hi", 0.1, 10, timeout=30))["response"] == "Hi"
+            router._persist_metric({"model": "qwen3:4b"})
+            await router._metric_batcher.flush()
+
+            pool = router.report_metrics()["connection_pool"]
+            ollama = pool["endpoints"]["http://ollama:11434"]
+            assert ollama["clients_created"] == 1
+            assert ollama["requests"] == 6
+            assert ollama["in_flight"] == 0
+            assert ollama["http2"] is False
+            assert pool["endpoints"]["http://mlx:8080"]["requests"] == 1
+            assert pool["endpoints"]["http://admin:8080"]["requests"] == 1
+        finally:
+            await router.close()
+
+    @pytest.mark.asyncio
+    async def test_per_request_timeout(self):
+        backends = FakeBackends()
+        router = _router(backends)
+        try:
+            await _generate(router)
+            assert backends.requests[-1].extensions["timeout"]["read"] == 30
+        finally:
+            await router.close()
+
+    @pytest.mark.asyncio
+    async def test_client_evicted_after_consecutive_transport_errors(self):
+        backends = FakeBackends()
+        router = _router(backends, evict_after_errors=2)
+        try:
+            await _generate(router)
+            first = router._pool.get_client("http://ollama:11434")
+
+            backends.down = True
+            for _ in range(2):
+                with pytest.raises(httpx.ConnectError):
+                    await _generate(router)
+            assert first.is_closed
+
+            backends.down = False
+            await _generate(router)
+            stats = router.report_metrics()["connection_pool"]["endpoints"]["http://ollama:11434"]
+            assert stats["evictions"] == 1
+            assert stats["clients_created"] == 2
+            assert stats["errors"] == 2
+            assert stats["consecutive_errors"] == 0
+        finally:
+            await router.close()
+
+    @pytest.mark.asyncio
+    async def test_http_errors_do_not_evict(self):
+        backends = FakeBackends()
+        router = _router(backends, evict_after_errors=1)
+        try:
+            response = await router._pool.post("http://ollama:11434/missing")
+            assert response.status_code == 404
+            stats = router._pool.stats()["endpoints"]["http://ollama:11434"]
+            assert stats["evictions"] == 0
+            assert stats["errors"] == 0
+        finally:
+            await router.close()
@@ -0,0 +1,131 @@
+"""
+Unit tests for batched metric shipping.
+
+Serves the admin metric endpoints from an httpx.MockTransport.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from shared.llm_router import BackendClientPool, LLMRouter
+from shared.metric_batcher import MetricBatcher
+
+BATCH_URL = "http://admin/api/llm-backends/metrics/batch"
+
+
+class FakeMetricsAdmin:
+    """Admin backend with the bulk (and single-row) metric endpoints."""
+
+    def __init__(self, bulk: bool = True):
+        self.bulk = bulk
+        self.batches = []
+        self.single = []
+        self.status = 201
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path == "/api/llm-backends/metrics/batch" and self.bulk:
+            if self.status == 201:
+                self.batches.append(body["metrics"])
+            return httpx.Response(self.status, json={"inserted": len(body["metrics"])})
+        if request.url.path == "/api/llm-backends/metrics":
+            self.single.append(body)
+            return httpx.Response(201, json={"id": len(self.single)})
+        return httpx.Response(404)
+
+
+def _batcher(admin: FakeMetricsAdmin, **kwargs) -> MetricBatcher:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(admin.handler))
+    return MetricBatcher(BATCH_URL, client=client, **kwargs)
+
+
+async def _eventually(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+class TestMetricBatcher:
+
+    @pytest.mark.asyncio
+    async def test_flushes_full_batches_by_size(self):
+        admin = FakeMetricsAdmin()
+        batcher = _batcher(admin, max_batch=10, flush_interval=60)
+        try:
+            for i in range(25):
+                assert batcher.submit({"model": "m", "i": i})
+            await _eventually(lambda: len(admin.batches) == 2)
+            assert [len(b) for b in admin.batches] == [10, 10]
+        finally:
+            await batcher.close()
+        # close() sends the remainder
+        assert [len(b) for b in admin.batches] == [10, 10, 5]
+        assert batcher.stats()["sent"] == 25
+
+    @pytest.mark.asyncio
+    async def test_flushes_partial_batch_after_interval(self):
+        admin = FakeMetricsAdmin()
+        batcher = _batcher(admin, max_batch=100, flush_interval=0.05)
+        try:
+            batcher.submit({"model": "m"})
+            batcher.submit({"model": "m"})
+            await _eventually(lambda: admin.batches)
+            assert len(admin.batches[0]) == 2
+        finally:
+            await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_drops_when_queue_full(self):
+        admin = FakeMetricsAdmin()
+        batcher = _batcher(admin, max_batch=100, flush_interval=60, max_queue=5)
+        try:
+            results = [batcher.submit({"i": i}) for i in range(8)]
+            assert results == [True] * 5 + [False] * 3
+            stats = batcher.stats()
+            assert stats["dropped"] == 3
+            assert stats["submitted"] == 5
+        finally:
+            await batcher.close()
+        assert sum(len(b) for b in admin.batches) == 5
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_row_endpoint(self):
+        admin = FakeMetricsAdmin(bulk=False)
+        batcher = _batcher(admin, flush_interval=60)
+        for i in range(3):
+            batcher.submit({"i": i})
+        await batcher.close()
+        assert [m["i"] for m in admin.single] == [0, 1, 2]
+        assert batcher.stats()["bulk_endpoint"] is False
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_are_counted(self):
+        admin = FakeMetricsAdmin()
+        admin.status = 500
+        batcher = _batcher(admin, flush_interval=60)
+        for i in range(4):
+            batcher.submit({"i": i})
+        await batcher.close()
+        stats = batcher.stats()
+        assert stats["failed"] == 4
+        assert stats["sent"] == 0
+        assert "500" in stats["last_error"]
+
+    @pytest.mark.asyncio
+    async def test_router_queues_metrics_off_the_request_path(self):
+        admin = FakeMetricsAdmin()
+        pool = BackendClientPool(transport=httpx.MockTransport(admin.handler))
+        router = LLMRouter(admin_url="http://admin", pool=pool)
+        for stage in ("classify", "tool_selection", "synthesize", "validation"):
+            router._persist_metric({"model": "m"}, source="orchestrator", stage=stage)
+        assert not admin.batches
+        assert router.report_metrics()["metric_shipping"]["queued"] == 4
+
+        await router.close()
+        assert [m["stage"] for m in admin.batches[0]] == ["classify", "tool_selection", "synthesize", "validation"]
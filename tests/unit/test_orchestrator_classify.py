@@ -0,0 +1,119 @@
+"""
+Unit tests for the orchestrator's classify_node pre-classification path.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from orchestrator import main
+from orchestrator import search_preclassifier
+from orchestrator.search_preclassifier import IntentMatch
+
+
+class StandInPreClassifier:
+    """Embedding pre-classifier stand-in returning a confident match."""
+
+    def __init__(self, intent):
+        self.intent = intent
+        self.queries = []
+
+    async def classify(self, query, feature_config=None):
+        self.queries.append(query)
+        return IntentMatch(intent=self.intent, confidence=0.97, matched_template=query, skip_llm=True)
+
+
+class TestClassifyPreclassify:
+    """Tests for classify_node reaching the search pre-classifier."""
+
+    def test_endpoint_does_not_shadow_preclassifier(self):
+        assert main.preclassify_query is search_preclassifier.preclassify_query
+
+    @pytest.mark.asyncio
+    async def test_confident_match_skips_llm(self, monkeypatch):
+        preclassifier = StandInPreClassifier("dining")
+
+        async def get_feature_config(flag_name):
+            return {"enabled": True, "config": {}}
+
+        async def llm_not_called(*args, **kwargs):
+            raise AssertionError("LLM classification should be skipped")
+
+        monkeypatch.setattr(search_preclassifier, "_preclassifier", preclassifier)
+        monkeypatch.setattr(main, "get_feature_config", get_feature_config)
+        monkeypatch.setattr(main, "cache_client", None)
+        monkeypatch.setattr(main, "llm_router", None)
+
+        state = await main.classify_node(main.OrchestratorState(query="recommend a good restaurant nearby"))
+
+        assert preclassifier.queries == ["recommend a good restaurant nearby"]
+        assert state.intent == main.IntentCategory.DINING
+        assert state.confidence == 0.97
+
+
+class StandInCache:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.values[key] = value
+
+
+class TestSpeculativeClassify:
+    """Tests for classify_node on partial transcripts."""
+
+    @pytest.fixture
+    def side_effects(self, monkeypatch):
+        calls = {"discover": [], "metric": []}
+
+        class LowConfidenceRouter:
+            async def generate(self, **kwargs):
+                return {"response": json.dumps({"intent": "general_info", "confidence": 0.3, "entities": {}})}
+
+        async def discover_intent(**kwargs):
+            calls["discover"].append(kwargs["query"])
+            return SimpleNamespace(is_novel=False)
+
+        async def record_intent_metric(**kwargs):
+            calls["metric"].append(kwargs["raw_query"])
+
+        async def get_feature_config(flag_name):
+            return {"enabled": False, "config": {}}
+
+        async def get_model_for_component(component):
+            return "classifier"
+
+        monkeypatch.setattr(main, "llm_router", LowConfidenceRouter())
+        monkeypatch.setattr(main, "discover_intent", discover_intent)
+        monkeypatch.setattr(main, "record_intent_metric", record_intent_metric)
+        monkeypatch.setattr(main, "get_feature_config", get_feature_config)
+        monkeypatch.setattr(main, "get_model_for_component", get_model_for_component)
+        monkeypatch.setattr(main, "cache_client", StandInCache())
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_partial_skips_discovery_metrics_and_cache(self, side_effects):
+        query = "how tall is the tallest tree in the"
+        state = await main.classify_node(main.OrchestratorState(query=query, speculative=True))
+        await asyncio.sleep(0)
+
+        assert state.intent == main.IntentCategory.GENERAL_INFO
+        assert side_effects == {"discover": [], "metric": []}
+        # Left uncached so the final query still runs intent discovery
+        assert main.cache_client.values == {}
+
+    @pytest.mark.asyncio
+    async def test_final_query_runs_discovery_and_metrics(self, side_effects):
+        query = "how tall is the tallest tree in the"
+        await main.classify_node(main.OrchestratorState(query=query))
+        await asyncio.sleep(0)
+
+        assert side_effects == {"discover": [query], "metric": [query]}
+        assert len(main.cache_client.values) == 1
@@ -0,0 +1,86 @@
+"""
+Unit tests for the orchestrator's /query/stream/v2 conversation handling.
+"""
+import json
+
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from orchestrator import main
+from orchestrator.session_manager import ConversationSession
+
+
+class StandInSessionManager:
+    """Session store stand-in holding one session with prior turns."""
+
+    def __init__(self, session):
+        self.session = session
+        self.saved = []
+        self.history_limit = None
+
+    async def get_or_create_session(self, session_id=None, user_id=None, zone=None, history_limit=None):
+        self.history_limit = history_limit
+        return self.session
+
+    async def add_message(self, session_id, role, content, metadata=None):
+        self.saved.append((session_id, role, content))
+
+
+class StandInConfig:
+    async def get_conversation_settings(self):
+        return {"enabled": True, "use_context": True, "history_mode": "full", "max_llm_history_messages": 6}
+
+
+class StandInGraph:
+    def __init__(self):
+        self.states = []
+
+    async def ainvoke(self, state):
+        self.states.append(state)
+        return {"intent": main.IntentCategory.GENERAL_INFO, "answer": "It was eighty degrees yesterday."}
+
+
+async def _events(response):
+    body = "".join([chunk async for chunk in response.body_iterator])
+    return [json.loads(line[len("data: "):]) for line in body.split("\n\n") if line.startswith("data: ")]
+
+
+class TestQueryStreamV2:
+    """Tests for process_query_stream_v2."""
+
+    @pytest.mark.asyncio
+    async def test_uses_and_saves_conversation_state(self, monkeypatch):
+        session = ConversationSession("voice-1")
+        session.add_message("user", "what's the weather today")
+        session.add_message("assistant", "Sunny and seventy-five.")
+        sessions = StandInSessionManager(session)
+        graph = StandInGraph()
+
+        async def get_config():
+            return StandInConfig()
+
+        async def get_current_mode():
+            return {"mode": "owner", "permissions": {}}
+
+        monkeypatch.setattr(main, "session_manager", sessions)
+        monkeypatch.setattr(main, "orchestrator_graph", graph)
+        monkeypatch.setattr(main, "get_config", get_config)
+        monkeypatch.setattr(main, "get_current_mode", get_current_mode)
+
+        interruption = {"previous_query": "tell me a story", "interrupted_response": "Once upon", "audio_position_ms": 800}
+        request = main.QueryRequest(
+            query="and yesterday?", session_id="voice-1", room="kitchen", interruption_context=interruption
+        )
+        events = await _events(await main.process_query_stream_v2(request))
+
+        assert events[-1]["stage"] == "complete"
+        state = graph.states[0]
+        assert [m["content"] for m in state.conversation_history] == ["what's the weather today", "Sunny and seventy-five."]
+        assert state.interruption_context == interruption
+        assert sessions.history_limit == 6
+        assert sessions.saved == [
+            ("voice-1", "user", "and yesterday?"),
+            ("voice-1", "assistant", "It was eighty degrees yesterday."),
+        ]
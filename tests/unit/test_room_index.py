@@ -0,0 +1,178 @@
+"""
+Unit tests for the precomputed room index used for room-to-entity resolution.
+"""
+import httpx
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from shared.ha_state_mirror import HAStateMirror
+from orchestrator.ha_entity_manager import HAEntityManager
+from orchestrator.room_index import RoomIndex
+from orchestrator.smart_home_controller import SmartHomeController
+
+
+def _state(entity_id, state="off", members=None, **attributes):
+    if members is not None:
+        attributes["entity_id"] = members
+    return {"entity_id": entity_id, "state": state, "attributes": attributes}
+
+
+STATES = {s["entity_id"]: s for s in [
+    _state("light.hallway_lights", friendly_name="Hallway Lights", members=["light.hall_1"]),
+    _state("light.living_room", friendly_name="Lounge"),
+    _state("light.pendant_1", friendly_name="Pendant 1"),
+    _state("lock.front_door", "locked", friendly_name="Front Door"),
+    _state("lock.back_porch", "locked", friendly_name="Back Porch"),
+    _state("fan.work_bench", friendly_name="Work Bench"),
+    _state("fan.master_bedroom_ceiling", friendly_name="Master Bedroom Ceiling Fan"),
+    _state("climate.upstairs", friendly_name="Upstairs Thermostat"),
+    _state("climate.den_thermostat", friendly_name="Den Thermostat"),
+    _state("binary_sensor.master_bath_motion", friendly_name="Master Bath Motion"),
+    _state("binary_sensor.presence_sensor_1", friendly_name="Presence Sensor 1"),
+]}
+
+AREAS = {"den": "Den", "kitchen": "Kitchen"}
+ENTITY_AREAS = {"light.pendant_1": "kitchen", "binary_sensor.presence_sensor_1": "den"}
+
+
+class TestRoomIndex:
+    """Tests for RoomIndex."""
+
+    def _index(self):
+        index = RoomIndex(HAEntityManager.ROOM_SYNONYMS)
+        index.rebuild(STATES, AREAS, ENTITY_AREAS)
+        return index
+
+    def test_names_and_synonyms(self):
+        index = self._index()
+        assert index.entities("hall", "light") == {"light.hallway_lights"}
+        assert index.entities("Living_Room", "light") == {"light.living_room"}
+        # Compound names and synonyms expand to the same terms as before
+        assert "lounge" in index.expand("living room")
+        assert index.entities("hall and living room", "light") == {"light.hallway_lights", "light.living_room"}
+        assert index.entities("master bedroom", "fan") == {"fan.master_bedroom_ceiling"}
+        assert index.entities("front door", "lock") == {"lock.front_door"}
+        assert index.entities("attic") == set()
+
+    def test_literal_lookup_skips_synonyms(self):
+        index = self._index()
+        # 'front' and 'office' have porch/work synonyms; literal lookups ignore them
+        assert index.entities("front", "lock") == {"lock.front_door", "lock.back_porch"}
+        assert index.entities("front", "lock", expand_synonyms=False) == {"lock.front_door"}
+        assert index.entities("office", "fan", expand_synonyms=False) == set()
+        assert index.entities("Front_Door", "lock", expand_synonyms=False) == {"lock.front_door"}
+
+    def test_area_registry_fills_unmatched_domains(self):
+        index = self._index()
+        assert index.entities("kitchen", "light") == {"light.pendant_1"}
+        # A name match wins over area membership for that domain
+        assert index.entities("den", "climate") == {"climate.den_thermostat"}
+        assert index.entities("den", "binary_sensor") == {"binary_sensor.presence_sensor_1"}
+
+    def test_resolution_is_cached_until_rebuild(self):
+        index = self._index()
+        first = index.resolve("hall")
+        assert index.resolve("HALL") is first
+        index.rebuild(STATES, AREAS, ENTITY_AREAS)
+        assert index.resolve("hall") is not first
+
+    def test_query_text_cache_is_bounded(self):
+        index = RoomIndex(HAEntityManager.ROOM_SYNONYMS, cache_size=4)
+        index.rebuild(STATES, AREAS, ENTITY_AREAS)
+        hall = index.resolve("hall")
+        for n in range(20):
+            index.resolve(f"room {n}")
+            index.resolve("hall")
+        assert len(index._rooms) <= 4 and len(index._terms) <= 4
+        # Recently used rooms and the known vocabulary survive eviction
+        assert index.resolve("hall") is hall
+        assert index.entities("kitchen", "light") == {"light.pendant_1"}
+
+    def test_room_labels(self):
+        index = self._index()
+        assert index.room_of("binary_sensor.master_bath_motion") == "Master Bathroom"
+        # No pattern: falls back to the HA area name
+        assert index.room_of("binary_sensor.presence_sensor_1") == "Den"
+        assert index.room_of("binary_sensor.unknown_thing", "Garage Motion") is None
+
+
+class TestEntityManagerRoomIndex:
+    """Tests for the entity manager's use of the room index."""
+
+    @pytest.mark.asyncio
+    async def test_find_lights_by_room_keeps_result_shape(self):
+        manager = HAEntityManager("http://ha:8123", "token")
+        manager.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=list(STATES.values()))),
+            base_url="http://ha:8123"
+        )
+        matches = await manager.find_lights_by_room("hallway")
+        assert matches == [{
+            "entity_id": "light.hallway_lights",
+            "friendly_name": "Hallway Lights",
+            "members": ["light.hall_1"],
+            "state": "off",
+            "type": "group",
+        }]
+        assert (await manager.get_climate_state(room="den"))["entity_id"] == "climate.den_thermostat"
+        assert set(await manager.get_room_entities("front door", "lock")) == {"lock.front_door"}
+        await manager.client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_only_on_name_or_registry_change(self):
+        mirror = HAStateMirror("http://ha:8123", "token")
+        for entity_id, state in STATES.items():
+            mirror._apply(entity_id, state)
+        mirror._live = True
+        manager = HAEntityManager("http://ha:8123", "token", state_mirror=mirror)
+
+        assert manager.room_of("binary_sensor.presence_sensor_1") is None
+        assert manager.room_index.builds == 1
+
+        # Plain state changes keep the index
+        mirror._apply("lock.front_door", _state("lock.front_door", "unlocked", friendly_name="Front Door"))
+        await manager.get_room_entities("front door", "lock")
+        assert manager.room_index.builds == 1
+        assert (await manager.get_room_entities("front door", "lock"))["lock.front_door"]["state"] == "unlocked"
+
+        # Area registry change
+        mirror.set_areas(AREAS, ENTITY_AREAS)
+        assert manager.room_of("binary_sensor.presence_sensor_1") == "Den"
+        assert manager.room_index.builds == 2
+
+        # Renamed entity
+        mirror._apply("light.pendant_1", _state("light.pendant_1", friendly_name="Office Pendant"))
+        assert [m["entity_id"] for m in await manager.find_lights_by_room("office")] == ["light.pendant_1"]
+        assert manager.room_index.builds == 3
+        await manager.client.aclose()
+
+
+class RecordingHAClient:
+    """Records service calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def call_service(self, domain, service, data):
+        self.calls.append((domain, service, data["entity_id"]))
+
+
+class TestLockRoomMatching:
+    """Tests for room matching in SmartHomeController lock control."""
+
+    @pytest.mark.asyncio
+    async def test_front_door_does_not_unlock_back_porch(self):
+        manager = HAEntityManager("http://ha:8123", "token")
+        manager.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=list(STATES.values()))),
+            base_url="http://ha:8123"
+        )
+        ha_client = RecordingHAClient()
+        controller = SmartHomeController(manager, llm_router=None)
+
+        response = await controller._handle_lock_intent("unlock", "front", ha_client, "unlock the front door")
+        assert ha_client.calls == [("lock", "unlock", "lock.front_door")]
+        assert "Back Porch" not in response
+        await manager.client.aclose()
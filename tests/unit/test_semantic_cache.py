@@ -0,0 +1,280 @@
+"""
+Unit tests for Semantic Cache.
+
+Tests the compiled uncacheable rule engine, the table-driven intent
+extractor, and cacheability checks.
+"""
+import json
+import os
+import re
+import pytest
+import fakeredis
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, 'src')
+
+from orchestrator.semantic_cache import (
+    UNCACHEABLE_PATTERNS,
+    KeywordIndex,
+    SemanticIntentTable,
+    SEMANTIC_INTENT_CATEGORIES,
+    UncacheableRule,
+    UncacheableRuleSet,
+    cache_response,
+    extract_semantic_intent,
+    get_cached_response,
+    invalidate_cache,
+    is_cacheable,
+    match_uncacheable_rule,
+    set_semantic_intent_categories,
+)
+from shared.cache import CacheClient
+
+REGRESSION_CORPUS = os.path.join(
+    os.path.dirname(__file__), "..", "fixtures", "semantic_intent_regression.json"
+)
+
+
+SAMPLE_QUERIES = [
+    "what's the weather in baltimore tomorrow",
+    "who won the ravens game last night",
+    "find me a good italian restaurant near towson",
+    "how tall is the empire state building",
+    "turn on the kitchen lights",
+    "i can't see anything in here",
+    "good morning",
+    "what should we do this weekend",
+    "if it rains tomorrow should i bring an umbrella",
+    "my tv keeps turning off",
+    "what's their phone number",
+    "skip",
+    "whats that song",
+]
+
+
+def _linear_match(query_lower):
+    for index, pattern in enumerate(UNCACHEABLE_PATTERNS):
+        if re.search(pattern, query_lower):
+            return index
+    return None
+
+
+# =============================================================================
+# Test UncacheableRuleSet
+# =============================================================================
+
+class TestUncacheableRuleSet:
+    """Tests for the compiled uncacheable rule engine."""
+
+    @pytest.mark.parametrize("query", SAMPLE_QUERIES)
+    def test_matches_linear_scan(self, query):
+        """Reports the same first rule as a linear re.search loop."""
+        rules = UncacheableRuleSet(UNCACHEABLE_PATTERNS)
+        rule = rules.match(query)
+        assert (rule.index if rule else None) == _linear_match(query)
+
+    def test_reports_fired_rule(self):
+        """Match carries the rule index and pattern text."""
+        rules = UncacheableRuleSet([r"\bweather\b", r"\bturn (on|off)\b"])
+        assert rules.match("turn off the lights") == UncacheableRule(
+            index=1, pattern=r"\bturn (on|off)\b"
+        )
+
+    def test_first_rule_in_list_order_wins(self):
+        """Earlier rules win even when a later rule matches earlier in the text."""
+        rules = UncacheableRuleSet([r"\blights\b", r"\bturn\b"])
+        assert rules.match("turn on the lights").index == 0
+
+    def test_no_match(self):
+        """Returns None when nothing fires."""
+        rules = UncacheableRuleSet([r"\bturn (on|off)\b"])
+        assert rules.match("what's the weather") is None
+
+    def test_anchored_literals_are_indexed(self):
+        """Word-anchored literal patterns go through the prefix index."""
+        rules = UncacheableRuleSet([
+            r"\bwhats?\s+that\b",
+            r"^good\s+(morning|night)$",
+            r"\b(blue|red)\b",
+            r"\bcan'?t\s+see\b",
+        ])
+        assert rules.indexed_count == 4
+        assert rules.fallback_count == 0
+        assert rules.match("whats that").index == 0
+        assert rules.match("good night").index == 1
+        assert rules.match("make it red").index == 2
+        assert rules.match("i cant see").index == 3
+
+    def test_unanchored_patterns_fall_back(self):
+        """Patterns without a leading anchor are always evaluated."""
+        rules = UncacheableRuleSet([r"what\s+should\s+we\s+do\b", r"\b(the\s+)?lights\b"])
+        assert rules.fallback_count == 2
+        assert rules.match("somewhat should we do").index == 0
+        assert rules.match("lights").index == 1
+
+    def test_prefix_longer_than_token(self):
+        """A literal prefix never matches a shorter token."""
+        rules = UncacheableRuleSet([r"\bturning\b"])
+        assert rules.match("turn it") is None
+
+
+# =============================================================================
+# Test KeywordIndex
+# =============================================================================
+
+class TestKeywordIndex:
+    """Tests for the single-pass keyword automaton."""
+
+    def test_substring_semantics(self):
+        """Finds keywords inside larger words, like `in`."""
+        index = KeywordIndex(["hot", "rain"])
+        assert index.find("show me photos of the train") == {"hot", "rain"}
+
+    def test_overlapping_and_nested(self):
+        """Reports overlapping and nested keywords."""
+        index = KeywordIndex(["how to make", "to make", "make", "ma"])
+        assert index.find("how to make") == {"how to make", "to make", "make", "ma"}
+
+    def test_no_hits(self):
+        """Returns an empty set when nothing matches."""
+        assert KeywordIndex(["weather"]).find("hello there") == set()
+
+
+# =============================================================================
+# Test SemanticIntentTable
+# =============================================================================
+
+class TestSemanticIntentTable:
+    """Tests for table-driven semantic intent extraction."""
+
+    def test_regression_corpus(self):
+        """Default table reproduces the recorded (category, normalized_query) outputs."""
+        with open(REGRESSION_CORPUS) as f:
+            corpus = json.load(f)
+        table = SemanticIntentTable(SEMANTIC_INTENT_CATEGORIES)
+        mismatches = [
+            (row["query"], table.extract(row["query"]))
+            for row in corpus
+            if table.extract(row["query"]) != (row["category"], row["normalized_query"])
+        ]
+        assert len(corpus) > 500
+        assert mismatches == []
+
+    def test_first_category_wins(self):
+        """Categories are evaluated in table order."""
+        table = SemanticIntentTable([
+            {"category": "recipes", "keywords": ["dinner"], "key": "recipe_{dish}"},
+            {"category": "dining", "keywords": ["dinner"], "key": "dining_{location}_x"},
+        ])
+        assert table.extract("make dinner with tofu") == ("recipes", "recipe_tofu")
+
+    def test_slots_and_co_keywords(self):
+        """Slots pick the first option in table order; co-keyword groups must all hit."""
+        table = SemanticIntentTable([{
+            "category": "dining",
+            "keywords": ["restaurant"],
+            "co_keywords": [["thai", "greek"], ["spot"]],
+            "key": "dining_{cuisine}",
+            "slots": {"cuisine": {"default": "general", "options": ["greek", "thai"]}},
+        }])
+        assert table.extract("thai or greek spot") == ("dining", "dining_greek")
+        assert table.extract("a restaurant") == ("dining", "dining_general")
+        assert table.extract("thai food")[0] == "general"
+
+    def test_never_cache_category_has_empty_key(self):
+        """Categories with an empty key template return an empty normalized query."""
+        table = SemanticIntentTable([{"category": "time", "keywords": ["time"], "key": ""}])
+        assert table.extract("what time is it") == ("time", "")
+
+    def test_unknown_key_field_rejected(self):
+        """Key templates may only reference slots or built-in extractors."""
+        with pytest.raises(ValueError):
+            SemanticIntentTable([{"category": "x", "keywords": ["x"], "key": "x_{nope}"}])
+
+    def test_set_categories_swaps_and_restores(self):
+        """Admin-provided tables replace the default until reset."""
+        try:
+            assert set_semantic_intent_categories(
+                [{"category": "news", "keywords": ["weather"], "key": "news_custom"}]
+            )
+            assert extract_semantic_intent("weather today") == ("news", "news_custom")
+        finally:
+            set_semantic_intent_categories(None)
+        assert extract_semantic_intent("weather today") == ("weather", "weather_baltimore_md")
+
+    def test_invalid_categories_keep_current_table(self):
+        """Malformed admin tables are rejected."""
+        assert set_semantic_intent_categories([{"keywords": ["x"]}]) is False
+        assert extract_semantic_intent("weather today")[0] == "weather"
+
+
+# =============================================================================
+# Test cacheability
+# =============================================================================
+
+class TestIsCacheable:
+    """Tests for is_cacheable."""
+
+    def test_uncacheable_category(self):
+        """Zero-TTL categories are never cached."""
+        assert is_cacheable("time", "what's the weather") is False
+
+    def test_uncacheable_pattern(self):
+        """Queries matching a rule are not cached."""
+        assert is_cacheable("weather", "what's the weather in here") is False
+
+    def test_cacheable_query(self):
+        """Plain informational queries are cacheable."""
+        assert is_cacheable("weather", "What's the weather in Baltimore") is True
+
+    def test_match_uncacheable_rule_is_case_insensitive(self):
+        """Queries are lowercased before matching."""
+        assert match_uncacheable_rule("TURN ON the lights") is not None
+
+
+# =============================================================================
+# Test invalidation
+# =============================================================================
+
+class TestInvalidateCache:
+    """Tests for category and pattern invalidation."""
+
+    @pytest.fixture
+    def cache(self):
+        client = CacheClient(url="redis://localhost:6379")
+        client.client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        with patch("orchestrator.semantic_cache.get_cache_client", return_value=client):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_category_invalidation_uses_tags(self, cache):
+        """cache_response tags entries so a category can be dropped."""
+        assert await cache_response("what's the weather in towson", {"answer": "sunny"})
+        assert await cache_response("recipe for pancakes", {"answer": "mix"})
+
+        assert await invalidate_cache(category="weather") == 1
+        assert await get_cached_response("what's the weather in towson") is None
+        assert await get_cached_response("recipe for pancakes") is not None
+
+    @pytest.mark.asyncio
+    async def test_category_scan_fallback_for_untagged_keys(self, cache):
+        """Keys written without tags are found via the category key prefix."""
+        await cache.set("athena_semantic:recipe_pancakes", {"answer": "mix"}, ttl=60)
+        assert await invalidate_cache(category="recipes") == 1
+
+    @pytest.mark.asyncio
+    async def test_pattern_invalidation(self, cache):
+        """Explicit glob patterns are deleted via SCAN."""
+        await cache.set("athena_semantic:sports_nfl_scores_ravens", {}, ttl=60)
+        await cache.set("athena_semantic:sports_nba_scores_all", {}, ttl=60)
+        assert await invalidate_cache(pattern="athena_semantic:sports_nfl_*") == 1
+
+    @pytest.mark.asyncio
+    async def test_pattern_outside_namespace_rejected(self, cache):
+        """Patterns can't reach keys outside the semantic cache namespace."""
+        await cache.set("session:abc", {}, ttl=60)
+        for pattern in ("*", "session:*", "athena_semantic*"):
+            with pytest.raises(ValueError):
+                await invalidate_cache(pattern=pattern)
+        assert await cache.exists("session:abc")
@@ -0,0 +1,109 @@
+"""
+Unit tests for the streaming SentenceBuffer.
+"""
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from orchestrator.sentence_buffer import SentenceBuffer
+
+
+async def _stream(tokens):
+    for token in tokens:
+        yield {"token": token}
+    yield {"token": "", "done": True}
+
+
+async def _sentences(tokens, **kwargs):
+    buffer = SentenceBuffer(**kwargs)
+    return [s async for s in buffer.process(_stream(tokens))]
+
+
+def _chars(text):
+    """Worst case tokenization: one character per token."""
+    return list(text)
+
+
+class TestSentenceBoundaries:
+
+    @pytest.mark.asyncio
+    async def test_splits_sentences(self):
+        text = "The weather today is sunny and warm. Tomorrow brings rain in the afternoon!"
+        assert await _sentences(_chars(text)) == [
+            "The weather today is sunny and warm.",
+            "Tomorrow brings rain in the afternoon!",
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text", [
+        "You have an appointment with Dr. Smith at noon tomorrow.",
+        "The value of pi is roughly 3.14 for most purposes.",
+        "The U.S. economy grew faster than expected this quarter.",
+        "Bring snacks, drinks, etc. and we will sort out the rest.",
+        "The book was written by J. R. R. Tolkien many years ago.",
+        "The speech was given by John F. Kennedy in Berlin.",
+    ])
+    async def test_abbreviations_and_decimals_not_split(self, text):
+        assert await _sentences(_chars(text)) == [text]
+        assert await _sentences(text.split(" ")[:1] + [" " + w for w in text.split(" ")[1:]]) == [text]
+
+    @pytest.mark.asyncio
+    async def test_abbreviation_at_sentence_end(self):
+        text = "The team is based in the U.S. They play on Sundays all season."
+        assert await _sentences(_chars(text)) == [
+            "The team is based in the U.S.",
+            "They play on Sundays all season.",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_single_letter_word_at_sentence_end(self):
+        text = "Nobody else wanted to go, so did I. Then the rain started. In the end we went with plan b. It worked out fine."
+        assert await _sentences(_chars(text)) == [
+            "Nobody else wanted to go, so did I.",
+            "Then the rain started.",
+            "In the end we went with plan b.",
+            "It worked out fine.",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_closing_quote_kept(self):
+        text = 'The sign on the door said "closed." We went home instead.'
+        assert await _sentences(_chars(text)) == [
+            'The sign on the door said "closed."',
+            "We went home instead.",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_short_sentences_merged(self):
+        assert await _sentences(_chars("Sure. The lights are now on in the kitchen.")) == [
+            "Sure. The lights are now on in the kitchen.",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_several_sentences_in_one_token(self):
+        text = "This is the first sentence here. This is the second sentence here. Tail"
+        assert await _sentences([text]) == [
+            "This is the first sentence here.",
+            "This is the second sentence here.",
+            "Tail",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_language_rules(self):
+        text = "Das ist z.B. ein Beispiel für Sie. Heute ist es sonnig und warm."
+        assert await _sentences(_chars(text), language="de") == [
+            "Das ist z.B. ein Beispiel für Sie.",
+            "Heute ist es sonnig und warm.",
+        ]
+        assert await _sentences(_chars("今天天气很好，适合出去散步。明天会下雨。"), language="zh", min_length=5) == [
+            "今天天气很好，适合出去散步。",
+            "明天会下雨。",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_force_yield_on_max_buffer(self):
+        text = "word, " * 30
+        sentences = await _sentences(_chars(text), max_buffer=50)
+        assert all(len(s) <= 50 for s in sentences)
+        assert " ".join(sentences).replace("  ", " ").strip() == text.strip()
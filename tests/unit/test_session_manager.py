@@ -0,0 +1,145 @@
+"""
+Unit tests for the orchestrator session manager's Redis layout.
+
+Uses fakeredis for an in-process Redis.
+"""
+import pytest
+import fakeredis
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import sys
+sys.path.insert(0, 'src')
+
+from orchestrator import session_manager as sm
+from orchestrator.session_manager import ConversationSession, SessionManager
+from shared.cache import encode_value
+
+
+SETTINGS = {
+    "max_messages": 6,
+    "timeout_seconds": 1800,
+    "session_ttl_seconds": 3600,
+    "max_llm_history_messages": 4,
+}
+
+
+@pytest.fixture
+def config():
+    cfg = MagicMock()
+    cfg.get_conversation_settings = AsyncMock(return_value=dict(SETTINGS))
+    cfg.log_analytics_event = AsyncMock()
+    with patch.object(sm, "get_config", AsyncMock(return_value=cfg)):
+        yield cfg
+
+
+@pytest.fixture
+def manager(config):
+    manager = SessionManager()
+    manager.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return manager
+
+
+class TestAppendOnlySessions:
+    """Tests for the hash + list session layout."""
+
+    @pytest.mark.asyncio
+    async def test_messages_appended_and_trimmed(self, manager):
+        session = await manager.create_session(session_id="s1", user_id="jay", zone="office")
+        for i in range(10):
+            await manager.add_message(session.session_id, "user", f"message {i}")
+
+        assert await manager.redis_client.llen("athena:session:s1:messages") == SETTINGS["max_messages"]
+        loaded = await manager.get_session("s1")
+        assert [m["content"] for m in loaded.messages] == [f"message {i}" for i in range(4, 10)]
+        assert loaded.user_id == "jay"
+        assert loaded.zone == "office"
+
+    @pytest.mark.asyncio
+    async def test_append_does_not_read_history(self, manager):
+        """add_message never loads or rewrites the existing messages."""
+        await manager.create_session(session_id="s1")
+        await manager.add_message("s1", "user", "first")
+
+        with patch.object(manager, "get_session", AsyncMock(side_effect=AssertionError)), \
+                patch.object(manager, "_write_redis_session", AsyncMock(side_effect=AssertionError)):
+            await manager.add_message("s1", "assistant", "second")
+
+        assert await manager.redis_client.llen("athena:session:s1:messages") == 2
+
+    @pytest.mark.asyncio
+    async def test_settings_lookup_cached(self, manager, config):
+        await manager.create_session(session_id="s1")
+        for _ in range(5):
+            await manager.add_message("s1", "user", "hi")
+        assert config.get_conversation_settings.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_llm_context_reads_only_recent(self, manager):
+        await manager.create_session(session_id="s1")
+        for i in range(6):
+            await manager.add_message("s1", "user", f"m{i}")
+
+        history = await manager.get_llm_context("s1")
+        assert history == [{"role": "user", "content": f"m{i}"} for i in range(2, 6)]
+
+        partial = await manager.get_session("s1", history_limit=2)
+        assert len(partial.messages) == 2
+        assert partial.message_count == 6
+
+        meta_only = await manager.get_session("s1", history_limit=0)
+        assert meta_only.messages == []
+        assert meta_only.message_count == 6
+
+    @pytest.mark.asyncio
+    async def test_add_to_missing_session_is_ignored(self, manager):
+        await manager.add_message("nope", "user", "hi")
+        assert not await manager.redis_client.exists("athena:session:nope:messages")
+
+    @pytest.mark.asyncio
+    async def test_legacy_blob_migrated(self, manager):
+        legacy = ConversationSession("old", user_id="jay")
+        legacy.add_message("user", "before the migration")
+        await manager.redis_client.setex("athena:session:old", 600, encode_value(legacy.to_dict()))
+
+        await manager.add_message("old", "assistant", "after")
+
+        assert not await manager.redis_client.exists("athena:session:old")
+        session = await manager.get_session("old")
+        assert [m["content"] for m in session.messages] == ["before the migration", "after"]
+        assert session.user_id == "jay"
+
+    @pytest.mark.asyncio
+    async def test_metadata_saved_without_history(self, manager):
+        await manager.create_session(session_id="s1")
+        await manager.add_message("s1", "user", "hi")
+
+        session = await manager.get_session("s1", history_limit=0)
+        session.set_precomputed_summary("talked about the weather", session.message_count)
+        await manager.save_metadata(session)
+
+        loaded = await manager.get_session("s1")
+        assert loaded.get_precomputed_summary() == "talked about the weather"
+        assert len(loaded.messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_session(self, manager):
+        await manager.create_session(session_id="s1")
+        await manager.add_message("s1", "user", "hi")
+        await manager.delete_session("s1")
+        assert await manager.get_session("s1") is None
+
+
+class TestMemoryFallback:
+
+    @pytest.mark.asyncio
+    async def test_memory_append_and_trim(self, config):
+        manager = SessionManager()
+        await manager.create_session(session_id="mem")
+        try:
+            for i in range(8):
+                await manager.add_message("mem", "user", f"m{i}")
+            session = await manager.get_session("mem", history_limit=2)
+            assert [m["content"] for m in session.messages] == ["m6", "m7"]
+            assert session.message_count == SETTINGS["max_messages"]
+        finally:
+            await manager.delete_session("mem")
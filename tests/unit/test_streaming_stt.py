@@ -0,0 +1,205 @@
+"""
+Unit tests for streaming STT (gateway.streaming_stt) against a stand-in STT server.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from gateway.streaming_stt import StreamingSTTError, StreamingTranscriber, preclassify
+from gateway.livekit_service import LiveKitService, LiveKitSession
+
+BYTES_PER_WORD = 16000 * 2 // 4  # one word per 250ms of speech
+SPEECH = b"\x10\x00" * 1600  # 100ms frames
+SILENCE = b"\x00\x00" * 1600
+
+
+class StandInSTTServer:
+    """
+    Stand-in for the STT service's streaming endpoints.
+
+    Reveals one word of ``script`` per 250ms of non-silent audio received;
+    silent audio leaves the partial unchanged.
+    """
+
+    def __init__(self, script, fail_audio=False):
+        self.words = script.split()
+        self.fail_audio = fail_audio
+        self.streams = {}
+        self.requests = []
+        self.preclassified = []
+
+    def partial(self, stream_id):
+        return " ".join(self.words[:self.streams[stream_id] // BYTES_PER_WORD])
+
+    def handler(self, request):
+        path = request.url.path
+        self.requests.append((request.method, path))
+        if path == "/query/preclassify":
+            self.preclassified.append(json.loads(request.content)["query"])
+            return httpx.Response(200, json={"status": "classified", "intent": "control"})
+        if path == "/stt/stream":
+            stream_id = f"s{len(self.streams)}"
+            self.streams[stream_id] = 0
+            return httpx.Response(200, json={"stream_id": stream_id})
+        stream_id = path.split("/")[3]
+        if request.method == "DELETE":
+            self.streams.pop(stream_id, None)
+            return httpx.Response(204)
+        if path.endswith("/audio"):
+            if self.fail_audio:
+                return httpx.Response(500)
+            self.streams[stream_id] += sum(1 for i in range(0, len(request.content), 2) if request.content[i:i + 2] != b"\x00\x00") * 2
+            return httpx.Response(200, json={"partial": self.partial(stream_id)})
+        if path.endswith("/finalize"):
+            return httpx.Response(200, json={"text": self.partial(stream_id) + "."})
+        return httpx.Response(404)
+
+    def client(self):
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+async def _feed(transcriber, frames):
+    for frame in frames:
+        transcriber.feed(frame)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+
+class TestStreamingTranscriber:
+    """Tests for StreamingTranscriber."""
+
+    @pytest.mark.asyncio
+    async def test_partials_while_speaking_and_short_finalize(self):
+        server = StandInSTTServer("turn off the kitchen lights")
+        partials = []
+
+        async def on_partial(text, stable):
+            partials.append((text, stable))
+
+        transcriber = StreamingTranscriber("http://stt", on_partial=on_partial, client=server.client(), chunk_ms=200)
+        await transcriber.start()
+        await _feed(transcriber, [SPEECH] * 13)
+
+        # Audio went up in chunks while speaking, not one frame per request
+        uploads = [r for r in server.requests if r[1].endswith("/audio")]
+        assert 3 <= len(uploads) <= 7
+        assert transcriber.partial.startswith("turn off")
+
+        requests_before = len(server.requests)
+        text = await transcriber.finalize()
+        assert text == "turn off the kitchen lights."
+        # Only the unsent tail and the finalize call remain at end-of-speech
+        assert len(server.requests) - requests_before <= 2
+        assert ("turn off", False) in partials
+
+    @pytest.mark.asyncio
+    async def test_partial_stabilizes_over_silence(self):
+        server = StandInSTTServer("lights off")
+        stable = []
+
+        async def on_partial(text, is_stable):
+            if is_stable:
+                stable.append(text)
+
+        transcriber = StreamingTranscriber("http://stt", on_partial=on_partial, client=server.client(),
+                                           chunk_ms=200, stable_partials=2)
+        await transcriber.start()
+        await _feed(transcriber, [SPEECH] * 6)
+        assert not transcriber.stable
+        await _feed(transcriber, [SILENCE] * 6)
+        await asyncio.sleep(0)
+
+        assert transcriber.stable
+        # Reported once per distinct stable partial
+        assert stable == ["lights off"]
+        await transcriber.abort()
+
+    @pytest.mark.asyncio
+    async def test_finalize_during_upload_sends_tail(self):
+        server = StandInSTTServer("turn off the kitchen lights")
+        release = asyncio.Event()
+        uploaded = []
+
+        async def slow_handler(request):
+            if request.url.path.endswith("/audio"):
+                uploaded.append(len(request.content))
+                await release.wait()
+            return server.handler(request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(slow_handler))
+        transcriber = StreamingTranscriber("http://stt", client=client, chunk_ms=200)
+        await transcriber.start()
+        transcriber.feed(SPEECH * 3 + SPEECH[:640])
+        await asyncio.sleep(0.01)
+        assert uploaded == [10240]
+
+        # The rest of the utterance arrives mid-upload, then speech ends
+        transcriber.feed(SPEECH)
+        finalizing = asyncio.create_task(transcriber.finalize())
+        await asyncio.sleep(0.01)
+        release.set()
+        await finalizing
+
+        assert uploaded == [10240, 3200]
+        assert transcriber.audio_bytes_sent == 13440
+        assert server.requests[-1] == ("POST", "/stt/stream/s0/finalize")
+
+    @pytest.mark.asyncio
+    async def test_upload_failure_raises_on_finalize(self):
+        server = StandInSTTServer("hello there", fail_audio=True)
+        transcriber = StreamingTranscriber("http://stt", client=server.client(), chunk_ms=100)
+        await transcriber.start()
+        await _feed(transcriber, [SPEECH] * 3)
+        with pytest.raises(StreamingSTTError):
+            await transcriber.finalize()
+
+    @pytest.mark.asyncio
+    async def test_open_failure_raises(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(404)))
+        with pytest.raises(StreamingSTTError):
+            await StreamingTranscriber("http://stt", client=client).start()
+
+
+class TestPreclassify:
+    """Tests for preclassify."""
+
+    @pytest.mark.asyncio
+    async def test_posts_partial_and_skips_single_words(self):
+        server = StandInSTTServer("")
+        client = server.client()
+        assert (await preclassify("http://orch", "turn off the lights", client=client))["intent"] == "control"
+        assert await preclassify("http://orch", "turn", client=client) is None
+        assert server.preclassified == ["turn off the lights"]
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_none(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(500)))
+        assert await preclassify("http://orch", "what is the weather", client=client) is None
+
+
+class TestLiveKitTranscribe:
+    """Tests for LiveKitService._transcribe."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_batch_upload(self):
+        server = StandInSTTServer("what time is it", fail_audio=True)
+
+        class BatchSTT:
+            async def transcribe(self, audio):
+                return f"batch {len(audio)}"
+
+        service = LiveKitService(stt_client=BatchSTT())
+        session = LiveKitSession(session_id="s", room_name="r", participant_id="p")
+        session.audio.write(SPEECH)
+        session.transcriber = StreamingTranscriber("http://stt", client=server.client(), chunk_ms=100)
+        await session.transcriber.start()
+        session.transcriber.feed(SPEECH)
+        await asyncio.sleep(0.01)
+
+        assert await service._transcribe(session) == f"batch {len(SPEECH)}"
+        assert session.transcriber is None
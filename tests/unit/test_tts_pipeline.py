@@ -0,0 +1,206 @@
+"""
+Unit tests for sentence-pipelined TTS (gateway.tts_pipeline).
+"""
+import asyncio
+import io
+import json
+import wave
+
+import httpx
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from gateway.livekit_service import LiveKitService, LiveKitSession
+from gateway.tts_pipeline import (
+    QueryStreamError, iter_sentences, observe_time_to_first_audio, split_sentences,
+    stream_query_sentences, synthesize_ahead, wav_to_pcm
+)
+from shared.metrics import VOICE_TIME_TO_FIRST_AUDIO
+
+
+def _sse(*events):
+    return "".join(f"data: {json.dumps(event)}\n\n" for event in events)
+
+
+def _wav(pcm):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+class TestSentences:
+    """Tests for sentence splitting and the orchestrator stream parser."""
+
+    def test_split_matches_stream_boundaries(self):
+        text = "Yes. It is 72 degrees in Baltimore. Expect rain later tonight! Ok"
+        # Short fragments stay with the following sentence; the tail is flushed
+        assert split_sentences(text) == [
+            "Yes. It is 72 degrees in Baltimore.",
+            "Expect rain later tonight!",
+            "Ok",
+        ]
+        assert split_sentences("Done.") == ["Done."]
+        assert split_sentences("   ") == []
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_sentences_and_records_result(self):
+        body = _sse(
+            {"stage": "classifying"},
+            {"stage": "classified", "intent": "weather"},
+            {"stage": "streaming", "sentence": "First sentence here."},
+            {"stage": "streaming", "sentence": " "},
+            {"stage": "streaming", "sentence": "Second sentence here."},
+            {"stage": "complete", "full_response": "First sentence here. Second sentence here."},
+        )
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+        ))
+        result = {}
+        sentences = [s async for s in stream_query_sentences(client, "http://orch/query/stream/v2", {"query": "q"}, result)]
+
+        assert sentences == ["First sentence here.", "Second sentence here."]
+        assert result["intent"] == "weather"
+        assert result["full_response"] == "First sentence here. Second sentence here."
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stream_error_stage_raises(self):
+        body = _sse({"stage": "error", "message": "boom"})
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, text=body)))
+        with pytest.raises(QueryStreamError):
+            async for _ in stream_query_sentences(client, "http://orch/query/stream/v2", {}):
+                pass
+        await client.aclose()
+
+
+class TestSynthesizeAhead:
+    """Tests for synthesize_ahead."""
+
+    @pytest.mark.asyncio
+    async def test_next_sentence_synthesized_while_current_plays(self):
+        started = []
+
+        async def synthesize(sentence):
+            started.append(sentence)
+            return sentence.encode()
+
+        text = "The first sentence is here. The second sentence is here. The third sentence is here."
+        audio = synthesize_ahead(iter_sentences(text), synthesize, prefetch=1)
+        sentence, pcm = await audio.__anext__()
+        assert pcm == sentence.encode()
+        await asyncio.sleep(0.01)
+        # Sentence 2 was rendered before playback asked for it
+        assert started[:2] == split_sentences(text)[:2]
+        rest = [s async for s, _ in audio]
+        assert [sentence] + rest == split_sentences(text)
+
+    @pytest.mark.asyncio
+    async def test_prefetch_is_bounded(self):
+        synthesized = []
+
+        async def synthesize(sentence):
+            synthesized.append(sentence)
+            return b""
+
+        async def sentences():
+            for i in range(10):
+                yield f"sentence {i}"
+
+        audio = synthesize_ahead(sentences(), synthesize, prefetch=2)
+        await audio.__anext__()
+        await asyncio.sleep(0.01)
+        # One handed out, two queued, one waiting for queue space
+        assert len(synthesized) == 4
+        await audio.aclose()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_synthesis_and_source(self):
+        cancelled = asyncio.Event()
+        source_closed = asyncio.Event()
+
+        async def synthesize(sentence):
+            if sentence == "slow":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return b"\x00\x00"
+
+        async def sentences():
+            try:
+                yield "fast"
+                yield "slow"
+            finally:
+                source_closed.set()
+
+        audio = synthesize_ahead(sentences(), synthesize)
+        assert (await audio.__anext__())[0] == "fast"
+        await asyncio.sleep(0.01)
+        # Barge-in
+        await audio.aclose()
+        assert cancelled.is_set()
+        assert source_closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_synthesis_error_propagates(self):
+        async def synthesize(sentence):
+            raise RuntimeError("tts down")
+
+        with pytest.raises(RuntimeError):
+            async for _ in synthesize_ahead(iter_sentences("Hello there."), synthesize):
+                pass
+
+
+class TestWavToPcm:
+    """Tests for wav_to_pcm."""
+
+    def test_strips_header(self):
+        pcm = b"\x01\x02" * 100
+        assert wav_to_pcm(_wav(pcm)) == pcm
+        assert wav_to_pcm(pcm) == pcm
+
+
+class TestTimeToFirstAudio:
+    """Tests for observe_time_to_first_audio."""
+
+    def test_records_shared_histogram_without_gateway_main(self):
+        before = set(sys.modules)
+        observe_time_to_first_audio("test", "streaming", 0.4)
+
+        samples = {s.name: s.value for metric in VOICE_TIME_TO_FIRST_AUDIO.collect() for s in metric.samples
+                   if s.labels.get("interface") == "test"}
+        assert samples["athena_voice_time_to_first_audio_seconds_count"] == 1
+        # gateway.main runs as the top-level ``main`` module in the container
+        assert "gateway.main" not in set(sys.modules) - before
+
+
+class TestLiveKitPlayback:
+    """Tests for LiveKitService._play_tts_sentences."""
+
+    @pytest.mark.asyncio
+    async def test_closes_sentences_when_room_is_gone(self):
+        closed = []
+
+        async def sentences():
+            try:
+                yield "Hello there."
+            finally:
+                closed.append(True)
+
+        class StandInTTS:
+            async def synthesize(self, text):
+                return b""
+
+        service = LiveKitService(tts_client=StandInTTS())
+        session = LiveKitSession(session_id="s", room_name="missing", participant_id="p")
+        stream = sentences()
+        await stream.__anext__()  # orchestrator stream is open
+        await service._play_tts_sentences(session, stream)
+        assert closed == [True]
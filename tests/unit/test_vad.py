@@ -0,0 +1,232 @@
+"""
+Unit tests for the shared voice activity detector (gateway.vad).
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from gateway import livekit_service
+from gateway import vad as vad_module
+from gateway.vad import EnergySpectralClassifier, VoiceActivityDetector, create_classifier, frame_features
+from gateway.wake_word_detector import AudioStreamProcessor
+from gateway.wyoming_bridge import vad_room_key
+
+SAMPLE_RATE = 16000
+FRAME = 320  # 20ms
+
+
+def speech(seconds, level_db):
+    """Harmonic, syllable-modulated stand-in for voiced speech."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    phase = 2 * np.pi * np.cumsum(140 + 20 * np.sin(2 * np.pi * 1.3 * t)) / SAMPLE_RATE
+    x = sum(np.sin(k * phase) / k for k in range(1, 25))
+    x *= 0.5 + 0.5 * np.abs(np.sin(2 * np.pi * 2.5 * t))
+    return x / np.sqrt(np.mean(x ** 2)) * 10 ** (level_db / 20)
+
+
+def noise(seconds, level_db, seed=0):
+    n = np.random.default_rng(seed).standard_normal(int(seconds * SAMPLE_RATE))
+    return n / np.sqrt(np.mean(n ** 2)) * 10 ** (level_db / 20)
+
+
+def pcm(*parts):
+    return (np.clip(np.concatenate(parts), -1, 1) * 32767).astype(np.int16)
+
+
+def run(vad, audio, frame=FRAME):
+    """Feed frames; returns per-frame is_speech."""
+    return [vad.process(audio[i:i + frame]).is_speech for i in range(0, len(audio) - frame + 1, frame)]
+
+
+class TestFrameFeatures:
+    """Tests for frame_features."""
+
+    def test_energy_and_flatness(self):
+        tone = pcm(speech(0.02, -20))
+        features = frame_features(tone)
+        assert features.energy_db == pytest.approx(-20, abs=0.5)
+        assert features.flatness < 0.3
+        assert features.duration_ms == 20
+
+        assert frame_features(pcm(noise(0.02, -20))).flatness > 0.45
+
+
+class TestVoiceActivityDetector:
+    """Tests for VoiceActivityDetector."""
+
+    def test_soft_speech_in_quiet_room(self):
+        # -42 dBFS is below every old fixed threshold
+        vad = VoiceActivityDetector(classifier=EnergySpectralClassifier())
+        flags = run(vad, pcm(noise(1.0, -65), speech(1.0, -42), noise(1.0, -65, seed=1)))
+
+        assert not any(flags[:50])
+        assert all(flags[55:100])
+        assert vad.endpoint(500)
+
+    def test_endpoint_in_noisy_room(self):
+        # Fan noise louder than the old 500/655 RMS thresholds
+        vad = VoiceActivityDetector(classifier=EnergySpectralClassifier())
+        audio = pcm(noise(1.0, -32), speech(1.0, -20) + noise(1.0, -32, seed=1), noise(2.0, -32, seed=2))
+        endpoint_frame = None
+        for i, start in enumerate(range(0, len(audio) - FRAME + 1, FRAME)):
+            vad.process(audio[start:start + FRAME])
+            if vad.endpoint(500):
+                endpoint_frame = i
+                break
+
+        assert endpoint_frame is not None
+        # Speech ends at frame 100: endpoint once the timeout has passed, not before
+        assert 100 + 500 // 20 - 2 <= endpoint_frame <= 100 + 500 // 20 + 2
+        assert vad.noise_floor_db == pytest.approx(-32, abs=2)
+
+    def test_hangover_bridges_short_pause(self):
+        vad = VoiceActivityDetector(classifier=EnergySpectralClassifier(), noise_floor_db=-65, hangover_ms=300)
+        flags = run(vad, pcm(speech(0.5, -30), np.zeros(int(0.2 * SAMPLE_RATE)), speech(0.5, -30)))
+        assert all(flags[2:])
+
+        flags = run(vad, pcm(np.zeros(int(0.4 * SAMPLE_RATE))))
+        assert flags[:15] == [True] * 15 and not flags[-1]
+
+    def test_onset_ignores_clicks(self):
+        vad = VoiceActivityDetector(classifier=EnergySpectralClassifier(), noise_floor_db=-65, onset_ms=40)
+        assert run(vad, pcm(speech(0.02, -20), np.zeros(SAMPLE_RATE // 2))) == [False] * 26
+        assert not vad.heard_speech
+
+    def test_broadband_noise_burst_is_not_speech(self):
+        vad = VoiceActivityDetector(classifier=EnergySpectralClassifier(), noise_floor_db=-65)
+        assert not any(run(vad, pcm(noise(0.5, -20))))
+
+    def test_room_noise_floor_is_remembered(self):
+        vad = VoiceActivityDetector.for_room("test-garage", engine="energy")
+        run(vad, pcm(noise(2.0, -35)))
+
+        again = VoiceActivityDetector.for_room("test-garage", engine="energy")
+        assert again.noise_floor_db == pytest.approx(-35, abs=2)
+        # No calibration period: speech is detected straight away
+        assert run(again, pcm(speech(0.1, -20)))[-1]
+        assert VoiceActivityDetector.for_room("test-attic").noise_floor_db == vad_module.DEFAULT_NOISE_FLOOR_DB
+
+    def test_unavailable_engine_falls_back(self, monkeypatch):
+        monkeypatch.setattr(vad_module, "WEBRTCVAD_AVAILABLE", False)
+        assert isinstance(create_classifier("webrtc"), EnergySpectralClassifier)
+        assert isinstance(create_classifier("nonsense"), EnergySpectralClassifier)
+
+    def test_frozen_noise_floor_still_detects_speech(self):
+        vad = VoiceActivityDetector(classifier=EnergySpectralClassifier(), noise_floor_db=-60)
+        # TTS echo in the mic while we play must not raise the floor
+        for i in range(0, 2 * SAMPLE_RATE, FRAME):
+            vad.process(pcm(noise(0.02, -30, seed=i)), adapt_noise_floor=False)
+        assert vad.noise_floor_db == -60
+        assert run(vad, pcm(speech(0.2, -25)))[-1]
+
+    def test_room_noise_floors_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(vad_module, "VAD_MAX_ROOMS", 3)
+        monkeypatch.setattr(vad_module, "_room_noise_floors", vad_module.OrderedDict())
+        for room in ["a", "b", "c", "a", "d"]:
+            VoiceActivityDetector.for_room(f"test-{room}", engine="energy").process(pcm(noise(0.02, -40)))
+        # The least recently updated room is forgotten
+        assert list(vad_module.room_noise_floors()) == ["test-c", "test-a", "test-d"]
+
+    def test_silero_model_is_loaded_once(self, monkeypatch):
+        loads = []
+        monkeypatch.setattr(vad_module, "load_silero_vad", lambda: loads.append(1) or {"weights": []}, raising=False)
+        monkeypatch.setattr(vad_module, "_silero_model", None)
+        first, second = vad_module.SileroClassifier(), vad_module.SileroClassifier()
+        assert len(loads) == 1
+        # Each stream keeps its own copy for the model's recurrent state
+        assert first._model == second._model and first._model is not second._model
+
+
+class StandInDetector:
+    """Wake word on the sixth chunk."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def detect(self, audio, stream_id="default"):
+        self.calls += 1
+        return "jarvis" if self.calls == 6 else None
+
+    def reset(self, stream_id=None):
+        pass
+
+
+class TestAudioStreamProcessorEndpointing:
+    """Tests for AudioStreamProcessor speech end detection through the VAD."""
+
+    @pytest.mark.asyncio
+    async def test_emits_speech_after_trailing_silence(self):
+        ended = []
+        processor = AudioStreamProcessor(StandInDetector(), on_speech_end=ended.append, stream_id="test-office")
+        processor._silence_timeout_ms = 800
+
+        # Room noise while scanning for the wake word calibrates the VAD
+        for seed in range(6):
+            await processor.process_chunk(pcm(noise(0.08, -65, seed=seed)).tobytes())
+        await processor.process_chunk(pcm(speech(1.0, -30), noise(0.6, -65)).tobytes())
+        assert not ended
+        await processor.process_chunk(pcm(noise(0.4, -65, seed=9)).tobytes())
+
+        assert len(ended) == 1
+        assert len(ended[0]) >= int(1.8 * SAMPLE_RATE) * 2
+
+
+class StandInAudioStream:
+    """rtc.AudioStream stand-in yielding the given PCM frames."""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def __call__(self, track, sample_rate, num_channels):
+        return self
+
+    async def __aiter__(self):
+        for frame in self.frames:
+            yield SimpleNamespace(frame=SimpleNamespace(data=memoryview(frame)))
+
+
+class TestLiveKitSpeechStart:
+    """Tests for where a LiveKit utterance starts without a wake word."""
+
+    @pytest.mark.asyncio
+    async def test_utterance_includes_first_speech_frame(self, monkeypatch):
+        audio = pcm(noise(0.5, -65), speech(1.0, -30) + noise(1.0, -65, seed=1))
+        frames = [audio[i:i + FRAME].tobytes() for i in range(0, len(audio), FRAME)]
+        first_speech = frames[25]
+        monkeypatch.setattr(livekit_service, "rtc", SimpleNamespace(AudioStream=StandInAudioStream(frames)))
+
+        service = livekit_service.LiveKitService()
+        service._last_feature_flag_check = float("inf")
+        await service._process_audio_track("test-hallway", track=None, participant_id="p")
+
+        session = next(iter(service._sessions.values()))
+        assert session.state == livekit_service.SessionState.LISTENING
+        captured = bytes(session.audio_buffer)
+        # The onset frames the VAD needed before reporting speech are not cut
+        assert first_speech in captured
+        assert len(captured) <= (50 + livekit_service.SPEECH_PREROLL_MS // 20) * FRAME * 2
+
+
+
+class TestWyomingSatelliteNoiseFloor:
+    """Tests for per-satellite noise floors in the Wyoming bridge."""
+
+    def test_room_key_prefers_satellite_id(self):
+        assert vad_room_key("home_assistant", ("10.0.0.5", 40000), {"device_id": "kitchen-sat"}) == "home_assistant:kitchen-sat"
+        assert vad_room_key("home_assistant", ("10.0.0.5", 40000)) == "home_assistant@10.0.0.5"
+        assert vad_room_key("home_assistant") == "home_assistant"
+
+    def test_noisy_satellite_does_not_move_quiet_one(self):
+        kitchen = VoiceActivityDetector.for_room(vad_room_key("home_assistant", ("10.0.0.5", 40000)), engine="energy")
+        bedroom = VoiceActivityDetector.for_room(vad_room_key("home_assistant", ("10.0.0.6", 40001)), engine="energy")
+        run(kitchen, pcm(noise(2.0, -30)))
+
+        assert kitchen.noise_floor_db == pytest.approx(-30, abs=2)
+        assert bedroom.noise_floor_db == vad_module.DEFAULT_NOISE_FLOOR_DB
+        # A later connection from the kitchen satellite starts from its floor
+        again = VoiceActivityDetector.for_room(vad_room_key("home_assistant", ("10.0.0.5", 40002)), engine="energy")
+        assert again.noise_floor_db == pytest.approx(-30, abs=2)
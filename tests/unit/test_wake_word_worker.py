@@ -0,0 +1,174 @@
+"""
+Unit tests for the batched, off-loop wake word inference worker.
+"""
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import sys
+sys.path.insert(0, 'src')
+
+from gateway import wake_word_detector
+from gateway.livekit_service import WAKE_WORD_CHUNK_BYTES, LiveKitService, LiveKitSession
+from gateway.wake_word_worker import OpenWakeWordBackend, WakeWordInferenceWorker
+from shared.metrics import WAKE_WORD_BATCH_SIZE
+
+CHUNK = np.zeros(1280, dtype=np.int16)
+
+
+class RecordingBackend:
+    """Scores each chunk with its first sample; records batches and threads."""
+
+    def __init__(self, cost_seconds=0.0):
+        self.cost_seconds = cost_seconds
+        self.batches = []
+        self.threads = set()
+        self.removed = []
+
+    def predict_batch(self, items):
+        self.threads.add(threading.get_ident())
+        self.batches.append([stream_id for stream_id, _ in items])
+        time.sleep(self.cost_seconds)
+        return [{"hey_jarvis": float(samples[0]) / 100} for _, samples in items]
+
+    def remove_stream(self, stream_id):
+        self.removed.append(stream_id)
+
+
+class CountingModel:
+    """Streaming model stand-in: score rises with chunks seen by this instance."""
+
+    created = 0
+
+    def __init__(self):
+        CountingModel.created += 1
+        self.seen = 0
+
+    def predict(self, samples):
+        self.seen += 1
+        return {"hey_jarvis_v0.1": [0.0, self.seen / 10]}
+
+
+class TestWakeWordInferenceWorker:
+    """Tests for WakeWordInferenceWorker."""
+
+    @pytest.mark.asyncio
+    async def test_twenty_rooms_share_one_batch_off_loop(self):
+        backend = RecordingBackend()
+        worker = WakeWordInferenceWorker(backend, batch_window_ms=5)
+
+        chunks = {f"room{i}": np.full(1280, i, dtype=np.int16) for i in range(20)}
+        scores = await asyncio.gather(*(worker.predict(room, chunk) for room, chunk in chunks.items()))
+
+        assert [s["hey_jarvis"] for s in scores] == [i / 100 for i in range(20)]
+        assert len(backend.batches) == 1 and len(backend.batches[0]) == 20
+        assert threading.get_ident() not in backend.threads
+        assert worker.stats()["max_batch_size"] == 20
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running_during_inference(self):
+        worker = WakeWordInferenceWorker(RecordingBackend(cost_seconds=0.2), batch_window_ms=0)
+        prediction = asyncio.create_task(worker.predict("room", CHUNK))
+
+        start = time.perf_counter()
+        await asyncio.sleep(0.02)
+        assert time.perf_counter() - start < 0.15
+        await prediction
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_per_stream_order_and_backlog_limit(self):
+        backend = RecordingBackend(cost_seconds=0.05)
+        worker = WakeWordInferenceWorker(backend, batch_window_ms=0, max_queue=2)
+
+        first = asyncio.create_task(worker.predict("room", np.full(1280, 1, dtype=np.int16)))
+        await asyncio.sleep(0.01)  # first chunk is being scored
+        backlog = [asyncio.create_task(worker.predict("room", np.full(1280, v, dtype=np.int16))) for v in (2, 3, 4)]
+        await asyncio.sleep(0)
+        assert worker.queue_depth("room") == 2
+
+        results = await asyncio.gather(first, *backlog)
+        # Oldest waiting chunk was skipped; the rest scored in order
+        assert results == [{"hey_jarvis": 0.01}, {}, {"hey_jarvis": 0.03}, {"hey_jarvis": 0.04}]
+        assert worker.dropped == 1
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_openwakeword_backend_keeps_model_per_stream(self):
+        CountingModel.created = 0
+        backend = OpenWakeWordBackend(CountingModel)
+        worker = WakeWordInferenceWorker(backend, batch_window_ms=0)
+
+        for _ in range(3):
+            await worker.predict("a", CHUNK)
+        assert (await worker.predict("b", CHUNK))["hey_jarvis_v0.1"] == pytest.approx(0.1)
+        assert (await worker.predict("a", CHUNK))["hey_jarvis_v0.1"] == pytest.approx(0.4)
+        assert CountingModel.created == 2
+
+        # Removing a stream resets its model state
+        worker.remove_stream("a")
+        assert (await worker.predict("a", CHUNK))["hey_jarvis_v0.1"] == pytest.approx(0.1)
+        assert CountingModel.created == 3
+        await worker.stop()
+
+
+    @pytest.mark.asyncio
+    async def test_records_shared_metrics(self):
+        def batches():
+            return next(s.value for m in WAKE_WORD_BATCH_SIZE.collect() for s in m.samples if s.name.endswith("_count"))
+
+        before = batches()
+        worker = WakeWordInferenceWorker(RecordingBackend(), batch_window_ms=0)
+        await worker.predict("metrics-room", CHUNK)
+        worker.remove_stream("metrics-room")
+        assert batches() == before + 1
+        await worker.stop()
+
+
+class TestWakeWordDetector:
+    """Tests for WakeWordDetector model loading."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_model_serves_first_stream(self, monkeypatch):
+        CountingModel.created = 0
+        monkeypatch.setattr(wake_word_detector, "OPENWAKEWORD_AVAILABLE", True)
+        monkeypatch.setattr(wake_word_detector, "OWWModel", lambda wakeword_models: CountingModel(), raising=False)
+        detector = wake_word_detector.WakeWordDetector()
+
+        assert await detector.initialize()
+        assert CountingModel.created == 1
+
+        await detector.detect(CHUNK.tobytes(), stream_id="a")
+        assert CountingModel.created == 1
+        await detector.detect(CHUNK.tobytes(), stream_id="b")
+        assert CountingModel.created == 2
+        await detector.close()
+
+
+class TestLiveKitWakeWordScan:
+    """Tests for LiveKitService wake word scanning through the worker."""
+
+    @pytest.mark.asyncio
+    async def test_scans_new_audio_in_chunks(self):
+        backend = RecordingBackend()
+        service = LiveKitService(wake_word_worker=WakeWordInferenceWorker(backend, batch_window_ms=0))
+        session = LiveKitSession(session_id="s1", room_name="r", participant_id="p")
+
+        session.audio.write(np.zeros(1280 + 640, dtype=np.int16).tobytes())
+        assert not await service._scan_for_wake_word(session)
+        assert session.wake_start == WAKE_WORD_CHUNK_BYTES
+
+        # Chunk 2 starts quiet (score 0.0), chunk 3 is loud (0.6 > 0.5)
+        session.audio.write(np.full(640, 60, dtype=np.int16).tobytes())
+        session.audio.write(np.full(1280, 60, dtype=np.int16).tobytes())
+        assert await service._scan_for_wake_word(session)
+        assert len(backend.batches) == 3
+        assert session.wake_start == 3 * WAKE_WORD_CHUNK_BYTES
+
+        await asyncio.sleep(0.01)
+        await service.wake_word_worker.stop()
+        assert "s1" in backend.removed